@@ -17,14 +17,23 @@
 from typing import (TYPE_CHECKING,
                     Any,
                     Awaitable,
+                    Dict,
+                    List,
                     Union)
 
-from couchbase.result import CounterResult, MutationResult
+from couchbase.result import (CounterResult,
+                              MultiCounterResult,
+                              MultiMutationResult,
+                              MutationResult)
 
 if TYPE_CHECKING:
-    from couchbase.options import (AppendOptions,
+    from couchbase.options import (AppendMultiOptions,
+                                   AppendOptions,
+                                   DecrementMultiOptions,
                                    DecrementOptions,
+                                   IncrementMultiOptions,
                                    IncrementOptions,
+                                   PrependMultiOptions,
                                    PrependOptions)
 
 
@@ -240,3 +249,130 @@ class BinaryCollection:
 
         """
         return self._collection._prepend(key, value, *opts, **kwargs)
+
+    def increment_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: IncrementMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiCounterResult]:
+        """For each key in the provided list, increments the ASCII value of the document, specified by the key,
+        by the amount indicated in the delta option (defaults to 1).
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple increment operations.
+            opts (:class:`~couchbase.options.IncrementMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.IncrementMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiCounterResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiCounterResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        return self._collection._increment_multi(keys, *opts, **kwargs)
+
+    def decrement_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: DecrementMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiCounterResult]:
+        """For each key in the provided list, decrements the ASCII value of the document, specified by the key,
+        by the amount indicated in the delta option (defaults to 1).
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple decrement operations.
+            opts (:class:`~couchbase.options.DecrementMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.DecrementMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiCounterResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiCounterResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        return self._collection._decrement_multi(keys, *opts, **kwargs)
+
+    def append_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: AppendMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiMutationResult]:
+        """For each key-value pair, appends the specified value to the end of the document specified by the key.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_values (Dict[str, Union[str,bytes,bytearray]]): The key-value pairs to use for the multiple
+                append operations.  Each key should correspond to the document to append to and each value should
+                correspond to the value to append to the document.
+            opts (:class:`~couchbase.options.AppendMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.AppendMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        return self._collection._append_multi(keys_and_values, *opts, **kwargs)
+
+    def prepend_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: PrependMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiMutationResult]:
+        """For each key-value pair, prepends the specified value to the beginning of the document specified
+        by the key.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_values (Dict[str, Union[str,bytes,bytearray]]): The key-value pairs to use for the multiple
+                prepend operations.  Each key should correspond to the document to prepend to and each value should
+                correspond to the value to prepend to the document.
+            opts (:class:`~couchbase.options.PrependMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.PrependMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on
+                the server and the return_exceptions options is False.  Otherwise the exception is returned
+                as a match to the key, but is not raised.
+
+        """
+        return self._collection._prepend_multi(keys_and_values, *opts, **kwargs)
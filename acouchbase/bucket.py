@@ -61,6 +61,13 @@ class AsyncBucket(BucketLogic):
         """
         return self._cluster.loop
 
+    @property
+    def streaming_executor(self):
+        """
+        **INTERNAL**
+        """
+        return self._cluster.streaming_executor
+
     # def _connect_bucket(self):
     #     """
     #     **INTERNAL**
@@ -226,10 +233,14 @@ class AsyncBucket(BucketLogic):
 
         """
         request_args = dict(default_serialize=self.default_serializer,
+                            executor=self.streaming_executor,
                             streaming_timeout=self.streaming_timeouts.get('view_timeout', None))
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
 
         query = ViewQuery.create_view_query_object(self.name, design_doc, view_name, *view_options, **kwargs)
         return ViewResult(AsyncViewRequest.generate_view_request(self.connection,
@@ -22,12 +22,16 @@ from time import perf_counter
 from typing import (TYPE_CHECKING,
                     Any,
                     Awaitable,
-                    Dict)
+                    Dict,
+                    Iterable,
+                    List,
+                    Tuple)
 
 from acouchbase import get_event_loop
 from acouchbase.analytics import AnalyticsQuery, AsyncAnalyticsRequest
 from acouchbase.bucket import AsyncBucket
 from acouchbase.logic import AsyncWrapper
+from acouchbase.logic.streaming import StreamingExecutor
 from acouchbase.management.analytics import AnalyticsIndexManager
 from acouchbase.management.buckets import BucketManager
 from acouchbase.management.eventing import EventingFunctionManager
@@ -35,11 +39,14 @@ from acouchbase.management.queries import QueryIndexManager
 from acouchbase.management.search import SearchIndexManager
 from acouchbase.management.users import UserManager
 from acouchbase.n1ql import AsyncN1QLRequest, N1QLQuery
-from acouchbase.search import AsyncFullTextSearchRequest, SearchQueryBuilder
+from acouchbase.search import (AsyncFullTextSearchRequest,
+                               SearchQueryBuilder,
+                               _search_many)
 from acouchbase.transactions import Transactions
 from couchbase.diagnostics import ClusterState, ServiceType
 from couchbase.exceptions import UnAmbiguousTimeoutException
 from couchbase.logic.cluster import ClusterLogic
+from couchbase.logic.search import _get_search_many_args
 from couchbase.options import PingOptions, forward_args
 from couchbase.result import (AnalyticsResult,
                               ClusterInfoResult,
@@ -53,9 +60,12 @@ if TYPE_CHECKING:
                                    ClusterOptions,
                                    DiagnosticsOptions,
                                    QueryOptions,
+                                   SearchManyOptions,
                                    SearchOptions,
                                    WaitUntilReadyOptions)
-    from couchbase.search import SearchQuery, SearchRequest
+    from couchbase.search import (SearchQuery,
+                                  SearchRequest,
+                                  SearchRow)
 
 
 class AsyncCluster(ClusterLogic):
@@ -100,6 +110,8 @@ class AsyncCluster(ClusterLogic):
         self._loop = self._get_loop(kwargs.pop("loop", None))
         super().__init__(connstr, *options, **kwargs)
 
+        self._streaming_executor_max_workers = self._cluster_opts.pop('streaming_executor_max_workers', None)
+        self._streaming_executor = None
         self._close_ftr = None
         self._connect_ftr = self._connect()
 
@@ -119,6 +131,27 @@ class AsyncCluster(ClusterLogic):
 
         return loop
 
+    @property
+    def streaming_executor(self) -> StreamingExecutor:
+        """
+        **INTERNAL**
+        """
+        if self._streaming_executor is None:
+            self._streaming_executor = StreamingExecutor(self._streaming_executor_max_workers)
+        return self._streaming_executor
+
+    def streaming_executor_metrics(self) -> Dict[str, int]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Returns the current utilization of the executor shared by the cluster's streaming (query, analytics,
+        search, view and range scan) requests.
+
+        Returns:
+            Dict[str, int]: The executor's ``max_workers``, ``active_workers``, ``queue_depth`` (tasks waiting for
+            a worker) and ``completed_tasks``.
+        """
+        return self.streaming_executor.metrics()
+
     @property
     def transactions(self) -> Transactions:
         """
@@ -178,6 +211,10 @@ class AsyncCluster(ClusterLogic):
 
         await self._close_ftr
         super()._destroy_connection()
+        if self._streaming_executor is not None:
+            # do not block the event loop on workers that might still be waiting on a stream to time out
+            self._streaming_executor.shutdown(wait=False)
+            self._streaming_executor = None
 
     def bucket(self, bucket_name) -> AsyncBucket:
         """Creates a Bucket instance to a specific bucket.
@@ -428,10 +465,14 @@ class AsyncCluster(ClusterLogic):
         """
 
         request_args = dict(default_serialize=self.default_serializer,
+                            executor=self.streaming_executor,
                             streaming_timeout=self.streaming_timeouts.get('query_timeout', None))
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
         query = N1QLQuery.create_query_object(statement, *options, **kwargs)
         return QueryResult(AsyncN1QLRequest.generate_n1ql_request(self.connection,
                                                                   self.loop,
@@ -513,10 +554,14 @@ class AsyncCluster(ClusterLogic):
         """  # noqa: E501
 
         request_args = dict(default_serialize=self.default_serializer,
+                            executor=self.streaming_executor,
                             streaming_timeout=self.streaming_timeouts.get('analytics_timeout', None))
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
         query = AnalyticsQuery.create_query_object(statement, *options, **kwargs)
         return AnalyticsResult(AsyncAnalyticsRequest.generate_analytics_request(self.connection,
                                                                                 self.loop,
@@ -617,10 +662,14 @@ class AsyncCluster(ClusterLogic):
 
         """
         request_args = dict(default_serialize=self.default_serializer,
+                            executor=self.streaming_executor,
                             streaming_timeout=self.streaming_timeouts.get('search_timeout', None))
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
         query = SearchQueryBuilder.create_search_query_object(index, query, *options, **kwargs)
         return SearchResult(AsyncFullTextSearchRequest.generate_search_request(self.connection,
                                                                                self.loop,
@@ -717,16 +766,81 @@ class AsyncCluster(ClusterLogic):
                     print(f'Found row: {row}')
         """  # noqa: E501
         request_args = dict(default_serialize=self.default_serializer,
+                            executor=self.streaming_executor,
                             streaming_timeout=self.streaming_timeouts.get('search_timeout', None))
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
         query = SearchQueryBuilder.create_search_query_from_request(index, request, *options, **kwargs)
         return SearchResult(AsyncFullTextSearchRequest.generate_search_request(self.connection,
                                                                                self.loop,
                                                                                query.as_encodable(),
                                                                                **request_args))
 
+    async def search_many(self,
+                          requests,  # type: Iterable[Tuple[Any, ...]]
+                          *options,  # type: SearchManyOptions
+                          **kwargs,  # type: Dict[str, Any]
+                          ) -> List[SearchRow]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Executes several searches against the cluster concurrently and merges their rows.
+
+        The rows of each search are merged as they are streamed.  Once the top ``limit`` rows can no longer change,
+        the merged rows are returned without waiting for the remaining rows of each search.
+
+        .. note::
+            Merging by :attr:`~couchbase.search.SearchMergeStrategy.SORT` requires every search to use the same sort
+            and only supports sorting by score and by document ID, as the SDK does not receive the values of other
+            sort fields.  :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION` merges searches of
+            any sort by the rank of each row within its search.
+
+        Args:
+            requests (Iterable[Tuple[Any, ...]]): The searches to execute.  Each search is either an
+                ``(index, SearchRequest)`` or ``(index, SearchRequest, SearchOptions)`` tuple.
+            options (:class:`~couchbase.options.SearchManyOptions`): Optional parameters for merging the searches.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.SearchManyOptions`
+
+        Returns:
+            List[:class:`~couchbase.search.SearchRow`]: The top ``limit`` merged rows.  When merged by
+            :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION`, the score of each row is its fused
+            score over the rows received before the merge stopped.  The merge stops as soon as the rows' order is
+            settled, so the score is a lower bound of the row's fused score over every row of the searches.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the searches cannot be merged with the
+                provided merge strategy.
+
+        Examples:
+
+            Merge a text search and a vector search::
+
+                import couchbase.search as search
+                from couchbase.options import SearchManyOptions
+                from couchbase.vector_search import VectorQuery, VectorSearch
+
+                # ... other code ...
+
+                text_request = search.SearchRequest.create(search.MatchQuery('beach'))
+                vector_request = search.SearchRequest.create(VectorSearch.from_vector_query(VectorQuery('vector_field',
+                                                                                                        vector)))
+                rows = await cluster.search_many([('travel-sample-index', text_request),
+                                                  ('travel-sample-vector-index', vector_request)],
+                                                 SearchManyOptions(limit=10,
+                                                                   merge_strategy=search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION))
+
+                for row in rows:
+                    print(f'Found row: {row}')
+        """  # noqa: E501
+        searches, merge_args = _get_search_many_args(requests, *options, **kwargs)
+        results = [self.search(index, request, *search_opts, **search_kwargs)
+                   for index, request, search_opts, search_kwargs in searches]
+        return await _search_many(results, merge_args)
+
     def buckets(self) -> BucketManager:
         """
         Get a :class:`~acouchbase.management.buckets.BucketManager` which can be used to manage the buckets
@@ -15,11 +15,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Future, wait
 from typing import (TYPE_CHECKING,
                     Any,
+                    AsyncIterable,
+                    AsyncIterator,
                     Awaitable,
+                    Callable,
                     Dict,
                     Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Tuple,
                     Union)
 
 from acouchbase.binary_collection import BinaryCollection
@@ -30,6 +39,7 @@ from acouchbase.datastructures import (CouchbaseList,
 from acouchbase.kv_range_scan import AsyncRangeScanRequest
 from acouchbase.logic import AsyncWrapper
 from acouchbase.management.queries import CollectionQueryIndexManager
+from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.logic.collection import CollectionLogic
 from couchbase.options import forward_args
 from couchbase.result import (CounterResult,
@@ -38,6 +48,12 @@ from couchbase.result import (CounterResult,
                               GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiCounterResult,
+                              MultiExistsResult,
+                              MultiGetResult,
+                              MultiLookupInResult,
+                              MultiMutateInResult,
+                              MultiMutationResult,
                               MutateInResult,
                               MutationResult,
                               ScanResultIterable)
@@ -47,26 +63,41 @@ if TYPE_CHECKING:
 
     from couchbase._utils import JSONType
     from couchbase.kv_range_scan import ScanType
-    from couchbase.options import (AppendOptions,
+    from couchbase.near_cache import NearCache
+    from couchbase.options import (AppendMultiOptions,
+                                   AppendOptions,
+                                   DecrementMultiOptions,
                                    DecrementOptions,
+                                   ExistsMultiOptions,
                                    ExistsOptions,
                                    GetAllReplicasOptions,
+                                   GetAndLockMultiOptions,
                                    GetAndLockOptions,
                                    GetAndTouchOptions,
                                    GetAnyReplicaOptions,
+                                   GetMultiOptions,
                                    GetOptions,
+                                   IncrementMultiOptions,
                                    IncrementOptions,
+                                   InsertMultiOptions,
                                    InsertOptions,
                                    LookupInAllReplicasOptions,
                                    LookupInAnyReplicaOptions,
+                                   LookupInMultiOptions,
                                    LookupInOptions,
+                                   MutateInMultiOptions,
                                    MutateInOptions,
+                                   PrependMultiOptions,
                                    PrependOptions,
+                                   RemoveMultiOptions,
                                    RemoveOptions,
+                                   ReplaceMultiOptions,
                                    ReplaceOptions,
                                    ScanOptions,
+                                   TouchMultiOptions,
                                    TouchOptions,
                                    UnlockOptions,
+                                   UpsertMultiOptions,
                                    UpsertOptions)
     from couchbase.subdocument import Spec
 
@@ -84,6 +115,13 @@ class AsyncCollection(CollectionLogic):
         """
         return self._loop
 
+    @property
+    def streaming_executor(self):
+        """
+        **INTERNAL**
+        """
+        return self._scope.streaming_executor
+
     def get(self,
             key,  # type: str
             *opts,  # type: GetOptions
@@ -128,6 +166,10 @@ class AsyncCollection(CollectionLogic):
 
         """
         final_args = forward_args(kwargs, *opts)
+        near_cache = self._near_cache
+        if near_cache is not None and near_cache.is_cacheable(final_args):
+            return self._get_near_cached(near_cache, key, **final_args)
+
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -135,6 +177,37 @@ class AsyncCollection(CollectionLogic):
 
         return self._get_internal(key, **final_args)
 
+    def _get_near_cached(self,
+                         near_cache,  # type: NearCache
+                         key,  # type: str
+                         **kwargs,  # type: Dict[str, Any]
+                         ) -> Awaitable[GetResult]:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`AsyncCollection.get` instead.
+        """
+        res = near_cache.get(key)
+        if res is not None:
+            ft = self.loop.create_future()
+            ft.set_result(res)
+            return ft
+
+        token = near_cache.begin_load(key)
+        try:
+            ft = self._get_internal(key, transcoder=self.default_transcoder, **kwargs)
+        except Exception:
+            near_cache.end_load(key, token)
+            raise
+
+        def on_done(fut):
+            res = None
+            if not fut.cancelled() and fut.exception() is None:
+                res = fut.result()
+            near_cache.end_load(key, token, res)
+
+        ft.add_done_callback(on_done)
+        return ft
+
     @AsyncWrapper.inject_callbacks_and_decode(GetResult)
     def _get_internal(
         self,
@@ -147,6 +220,24 @@ class AsyncCollection(CollectionLogic):
         """
         super().get(key, **kwargs)
 
+    @AsyncWrapper.run_in_executor()
+    def refresh_near_cache(self) -> Awaitable[None]:
+        """Verifies the entries of the collection's near cache against the server.  Entries whose CAS is
+        unchanged have their staleness window extended, entries for documents that have changed are re-fetched
+        and entries for documents that no longer exist are dropped.
+
+        This is done periodically in the background if the near cache was created with a ``refresh_interval``.
+        If a near cache has not been enabled, this is a no-op.
+
+        Returns:
+            Awaitable[None]: A future that completes once the near cache has been refreshed.
+
+        Raises:
+            :class:`~couchbase.exceptions.CouchbaseException`: If the CAS of the cached documents could not be
+                verified.  Entries that could not be verified are left to expire.
+        """
+        self._refresh_near_cache()
+
     def get_any_replica(self,
                         key,  # type: str
                         *opts,  # type: GetAnyReplicaOptions
@@ -1145,6 +1236,561 @@ class AsyncCollection(CollectionLogic):
         """
         super().mutate_in(key, spec, *opts, **kwargs)
 
+    @AsyncWrapper.run_in_executor()
+    def get_multi(self,
+                  keys,  # type: List[str]
+                  *opts,  # type: GetMultiOptions
+                  **kwargs,  # type: Dict[str, Any]
+                  ) -> Awaitable[MultiGetResult]:
+        """For each key in the provided list, retrieve the document associated with the key.
+
+        The keys are submitted to the underlying client as a single batch, resolving a single future.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple get operations.
+            opts (:class:`~couchbase.options.GetMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiGetResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiGetResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        Examples:
+
+            Simple get-multi operation::
+
+                collection = bucket.default_collection()
+                keys = ['doc1', 'doc2', 'doc3']
+                res = await collection.get_multi(keys)
+                for k, v in res.results.items():
+                    print(f'Doc {k} has value: {v.content_as[dict]}')
+
+        """
+        return super().get_multi(keys, *opts, **kwargs)
+
+    def get_multi_iter(self,
+                       keys,  # type: Union[Iterable[str], AsyncIterable[str]]
+                       *opts,  # type: GetMultiOptions
+                       chunk_size=None,  # type: Optional[int]
+                       max_in_flight=None,  # type: Optional[int]
+                       **kwargs,  # type: Dict[str, Any]
+                       ) -> AsyncIterator[Tuple[str, Union[GetResult, CouchbaseBaseException]]]:
+        """For each key in the provided iterable, retrieve the document associated with the key.  Unlike
+        :meth:`.get_multi`, the keys are consumed lazily and submitted in chunks of ``chunk_size`` keys with at
+        most ``max_in_flight`` operations outstanding at once.  Results are yielded as each chunk completes, so
+        memory use is bounded by the window rather than by the number of keys.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (Union[Iterable[str], AsyncIterable[str]]): The keys to use for the multiple get operations.  Can
+                be any iterable or async iterable, including a (async) generator.
+            opts (:class:`~couchbase.options.GetMultiOptions`): Optional parameters for this operation.
+            chunk_size (int, optional): The number of keys submitted per chunk.  Defaults to 100.
+            max_in_flight (int, optional): The maximum number of operations outstanding at once.  Defaults to
+                1000.  Chunks beyond the window are not read from ``keys`` until a chunk completes.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetMultiOptions`
+
+        Returns:
+            AsyncIterator[Tuple[str, Union[:class:`~couchbase.result.GetResult`, Exception]]]: An async iterator
+            of ``(key, result)`` pairs.  Operations that fail yield the exception as the result (the
+            ``return_exceptions`` option is ignored).
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If ``chunk_size`` or ``max_in_flight`` is
+                not a positive int.
+
+        Examples:
+
+            Get every key produced by a generator::
+
+                collection = bucket.default_collection()
+                keys = (f'doc{i}' for i in range(1000000))
+                async for key, res in collection.get_multi_iter(keys, chunk_size=500, max_in_flight=5000):
+                    if isinstance(res, Exception):
+                        print(f'Failed to get {key}: {res}')
+                    else:
+                        print(f'Doc {key} has value: {res.content_as[dict]}')
+
+        """
+        chunk_size, max_chunks = self._get_multi_iter_window(chunk_size, max_in_flight)
+        chunks = self._iter_chunks(keys, chunk_size, self._iter_key_chunks)
+        kwargs['return_exceptions'] = True
+        return self._arun_multi_iter(lambda chunk: CollectionLogic.get_multi(self, chunk, *opts, **kwargs),
+                                     chunks,
+                                     max_chunks)
+
+    def _iter_chunks(self,
+                     items,  # type: Union[Iterable[Any], AsyncIterable[Any]]
+                     chunk_size,  # type: int
+                     make_chunks,  # type: Callable[[Iterable[Any], int], Iterator[Any]]
+                     ) -> Iterator[Any]:
+        """**INTERNAL**
+
+        Lazily splits *items* (an iterable or async iterable) into chunks using *make_chunks*.  The chunks are
+        read from the cluster's streaming executor, an async iterable is advanced on the event loop.
+        """
+        if not hasattr(items, '__aiter__'):
+            yield from make_chunks(items, chunk_size)
+            return
+
+        chunks = self._aiter_chunks(items, chunk_size, make_chunks)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(chunks.__anext__(), self.loop).result()
+            except StopAsyncIteration:
+                return
+
+    @staticmethod
+    async def _aiter_chunks(items,  # type: AsyncIterable[Any]
+                            chunk_size,  # type: int
+                            make_chunks,  # type: Callable[[Iterable[Any], int], Iterator[Any]]
+                            ) -> AsyncIterator[Any]:
+        """**INTERNAL**
+
+        Lazily splits the async iterable *items* into chunks using *make_chunks*.
+        """
+        buffer = []
+        async for item in items:
+            buffer.append(item)
+            if len(buffer) == chunk_size:
+                for chunk in make_chunks(buffer, chunk_size):
+                    yield chunk
+                buffer = []
+        if buffer:
+            for chunk in make_chunks(buffer, chunk_size):
+                yield chunk
+
+    async def _arun_multi_iter(self,
+                               multi_op,  # type: Callable[[Any], Any]
+                               chunks,  # type: Iterator[Any]
+                               max_chunks,  # type: int
+                               ) -> AsyncIterator[Tuple[str, Any]]:
+        """**INTERNAL**
+
+        Runs :meth:`~couchbase.logic.collection.CollectionLogic._run_multi_chunks` (shared with the blocking API)
+        on the cluster's streaming executor, yielding the results of each chunk as it completes.
+        """
+        if not self._connection:
+            await self._scope._connect_bucket()
+            self._scope._set_connection()
+            self._set_connection()
+
+        results = self._run_multi_chunks(multi_op, chunks, max_chunks)
+        next_ft = None
+        try:
+            while True:
+                next_ft = self.streaming_executor.submit(next, results, None)
+                res = await asyncio.wrap_future(next_ft, loop=self.loop)
+                if res is None:
+                    return
+                for item in self._iter_multi_results(res):
+                    yield item
+        finally:
+            await self.loop.run_in_executor(self.streaming_executor, self._close_multi_chunks, results, next_ft)
+
+    @staticmethod
+    def _close_multi_chunks(results,  # type: Iterator[Any]
+                            next_ft,  # type: Optional[Future]
+                            ) -> None:
+        """**INTERNAL**
+
+        Closes the chunk results generator once the worker advancing it (if any) is done.
+        """
+        if next_ft is not None:
+            wait([next_ft])
+        results.close()
+
+    @AsyncWrapper.run_in_executor()
+    def get_and_lock_multi(self,
+                           keys,  # type: List[str]
+                           lock_time,  # type: timedelta
+                           *opts,  # type: GetAndLockMultiOptions
+                           **kwargs,  # type: Dict[str, Any]
+                           ) -> Awaitable[MultiGetResult]:
+        """For each key in the provided list, lock the document associated with the key.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple lock operations.
+            lock_time (timedelta): The amount of time to lock the documents.
+            opts (:class:`~couchbase.options.GetAndLockMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetAndLockMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiGetResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiGetResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        return super().get_and_lock_multi(keys, lock_time, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def exists_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: ExistsMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Awaitable[MultiExistsResult]:
+        """For each key in the provided list, check if the document associated with the key exists.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple exists operations.
+            opts (:class:`~couchbase.options.ExistsMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.ExistsMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiExistsResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiExistsResult` if successful.
+
+        """
+        return super().exists_multi(keys, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def insert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: InsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Awaitable[MultiMutationResult]:
+        """For each key, value pair in the provided dict, inserts a new document to the collection,
+        failing if the document already exists.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_docs (Dict[str, JSONType]): The keys and values/docs to use for the multiple insert operations.
+            opts (:class:`~couchbase.options.InsertMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.InsertMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentExistsException`: If the key provided already exists on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        return super().insert_multi(keys_and_docs, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def upsert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: UpsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Awaitable[MultiMutationResult]:
+        """For each key, value pair in the provided dict, upserts a document to the collection. This operation
+        succeeds whether or not the document already exists.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_docs (Dict[str, JSONType]): The keys and values/docs to use for the multiple upsert operations.
+            opts (:class:`~couchbase.options.UpsertMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.UpsertMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Examples:
+
+            Simple upsert-multi operation::
+
+                collection = bucket.default_collection()
+                keys_and_docs = {
+                    'doc1': {'foo': 'bar', 'id': 'doc1'},
+                    'doc2': {'bar': 'baz', 'id': 'doc2'},
+                }
+                res = await collection.upsert_multi(keys_and_docs)
+                for k, v in res.results.items():
+                    print(f'Doc upserted: key={k}, cas={v.cas}')
+
+        """
+        return super().upsert_multi(keys_and_docs, *opts, **kwargs)
+
+    def upsert_multi_iter(self,
+                          keys_and_docs,  # type: Union[Dict[str, JSONType], Iterable[Any], AsyncIterable[Any]]
+                          *opts,  # type: UpsertMultiOptions
+                          chunk_size=None,  # type: Optional[int]
+                          max_in_flight=None,  # type: Optional[int]
+                          **kwargs,  # type: Dict[str, Any]
+                          ) -> AsyncIterator[Tuple[str, Union[MutationResult, CouchbaseBaseException]]]:
+        """For each key, value pair in the provided iterable, upsert the document into the collection.  Unlike
+        :meth:`.upsert_multi`, the documents are consumed lazily and submitted in chunks of ``chunk_size``
+        documents with at most ``max_in_flight`` operations outstanding at once.  Results are yielded as each
+        chunk completes, so memory use is bounded by the window rather than by the number of documents.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_docs (Union[Dict[str, JSONType], Iterable[Tuple[str, JSONType]], AsyncIterable[Tuple[str, JSONType]]]):
+                The keys and values/docs to use for the multiple upsert operations.  Either a dict or any iterable
+                or async iterable (including a (async) generator) of ``(key, doc)`` pairs.
+            opts (:class:`~couchbase.options.UpsertMultiOptions`): Optional parameters for this operation.
+            chunk_size (int, optional): The number of documents submitted per chunk.  Defaults to 100.
+            max_in_flight (int, optional): The maximum number of operations outstanding at once.  Defaults to
+                1000.  Chunks beyond the window are not read from ``keys_and_docs`` until a chunk completes.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.UpsertMultiOptions`
+
+        Returns:
+            AsyncIterator[Tuple[str, Union[:class:`~couchbase.result.MutationResult`, Exception]]]: An async
+            iterator of ``(key, result)`` pairs.  Operations that fail yield the exception as the result (the
+            ``return_exceptions`` option is ignored).
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If ``chunk_size`` or ``max_in_flight`` is
+                not a positive int.
+
+        Examples:
+
+            Backfill documents produced by a generator::
+
+                collection = bucket.default_collection()
+                docs = ((f'doc{i}', {'id': i}) for i in range(1000000))
+                async for key, res in collection.upsert_multi_iter(docs, chunk_size=500, max_in_flight=5000):
+                    if isinstance(res, Exception):
+                        print(f'Failed to upsert {key}: {res}')
+
+        """  # noqa: E501
+        chunk_size, max_chunks = self._get_multi_iter_window(chunk_size, max_in_flight)
+        chunks = self._iter_chunks(keys_and_docs, chunk_size, self._iter_doc_chunks)
+        kwargs['return_exceptions'] = True
+        return self._arun_multi_iter(lambda chunk: CollectionLogic.upsert_multi(self, chunk, *opts, **kwargs),
+                                     chunks,
+                                     max_chunks)
+
+    @AsyncWrapper.run_in_executor()
+    def replace_multi(self,
+                      keys_and_docs,  # type: Dict[str, JSONType]
+                      *opts,  # type: ReplaceMultiOptions
+                      **kwargs,  # type: Dict[str, Any]
+                      ) -> Awaitable[MultiMutationResult]:
+        """For each key, value pair in the provided dict, replaces the value of a document in the collection.
+        This operation fails if the document does not exist.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_docs (Dict[str, JSONType]): The keys and values/docs to use for the multiple replace operations.
+            opts (:class:`~couchbase.options.ReplaceMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.ReplaceMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        return super().replace_multi(keys_and_docs, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def remove_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: RemoveMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Awaitable[MultiMutationResult]:
+        """For each key in the provided list, remove the existing document.  This operation fails
+        if the document does not exist.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple remove operations.
+            opts (:class:`~couchbase.options.RemoveMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.RemoveMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        return super().remove_multi(keys, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def touch_multi(self,
+                    keys,  # type: List[str]
+                    expiry,  # type: timedelta
+                    *opts,  # type: TouchMultiOptions
+                    **kwargs,  # type: Dict[str, Any]
+                    ) -> Awaitable[MultiMutationResult]:
+        """For each key in the provided list, update the expiry on an existing document. This operation fails
+        if the document does not exist.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys (List[str]): The keys to use for the multiple touch operations.
+            expiry (timedelta): The new expiry for the document.
+            opts (:class:`~couchbase.options.TouchMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TouchMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutationResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutationResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        """
+        return super().touch_multi(keys, expiry, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def lookup_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: LookupInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> Awaitable[MultiLookupInResult]:
+        """For each key provided, perform a lookup-in operation on the document associated with the key.
+
+        The specs can be provided per key (a dict of key to specs) or shared by all keys (a list of keys and a
+        *spec*).  When the specs are provided per key, *spec* can be omitted and the options passed in its place.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_specs (Union[Dict[str, Iterable[:class:`~couchbase.subdocument.Spec`]], List[str]]): Either
+                the specs to use for each key, or the keys to use with the shared *spec*.
+            spec (Iterable[:class:`~couchbase.subdocument.Spec`], optional): The specs used for every key, required
+                if *keys_and_specs* is a list of keys.
+            opts (:class:`~couchbase.options.LookupInMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.LookupInMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiLookupInResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiLookupInResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        Examples:
+
+            Simple lookup-in-multi operation with a shared spec::
+
+                import couchbase.subdocument as SD
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                keys = ['doc1', 'doc2', 'doc3']
+                res = await collection.lookup_in_multi(keys, (SD.get('name'),))
+                for k, v in res.results.items():
+                    print(f'Doc {k} has name: {v.content_as[str](0)}')
+
+        """
+        return super().lookup_in_multi(keys_and_specs, spec, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def mutate_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: MutateInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> Awaitable[MultiMutateInResult]:
+        """For each key provided, perform a mutate-in operation on the document associated with the key.
+
+        The specs can be provided per key (a dict of key to specs) or shared by all keys (a list of keys and a
+        *spec*).  When the specs are provided per key, *spec* can be omitted and the options passed in its place.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_specs (Union[Dict[str, Iterable[:class:`~couchbase.subdocument.Spec`]], List[str]]): Either
+                the specs to use for each key, or the keys to use with the shared *spec*.
+            spec (Iterable[:class:`~couchbase.subdocument.Spec`], optional): The specs used for every key, required
+                if *keys_and_specs* is a list of keys.
+            opts (:class:`~couchbase.options.MutateInMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.MutateInMultiOptions`
+
+        Returns:
+            Awaitable[:class:`~couchbase.result.MultiMutateInResult`]: A future that contains an instance
+            of :class:`~couchbase.result.MultiMutateInResult` if successful.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        Examples:
+
+            Update a single field on many documents::
+
+                import couchbase.subdocument as SD
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                keys = ['profile1', 'profile2', 'profile3']
+                res = await collection.mutate_in_multi(keys, (SD.upsert('verified', True),))
+                print(f'All updated: {res.all_ok}')
+
+        """
+        return super().mutate_in_multi(keys_and_specs, spec, *opts, **kwargs)
+
     def scan(self, scan_type,  # type: ScanType
              *opts,  # type: ScanOptions
              **kwargs,  # type: Dict[str, Any]
@@ -1191,11 +1837,15 @@ class AsyncCollection(CollectionLogic):
 
 
         """  # noqa: E501
+        row_batch_size = kwargs.pop('row_batch_size', None)
         final_args = forward_args(kwargs, *opts)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             final_args['transcoder'] = self.default_transcoder
         scan_args = super().build_scan_args(scan_type, **final_args)
+        if row_batch_size:
+            scan_args['row_batch_size'] = row_batch_size
+        scan_args['executor'] = self.streaming_executor
         range_scan_request = AsyncRangeScanRequest(self.loop, **scan_args)
         return ScanResultIterable(range_scan_request)
 
@@ -1270,6 +1920,62 @@ class AsyncCollection(CollectionLogic):
         """
         super().decrement(key, *opts, **kwargs)
 
+    @AsyncWrapper.run_in_executor()
+    def _append_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: AppendMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiMutationResult]:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`acouchbase.BinaryCollection.append_multi` instead.
+
+        """
+        return super().append_multi(keys_and_values, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def _prepend_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: PrependMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiMutationResult]:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`acouchbase.BinaryCollection.prepend_multi` instead.
+
+        """
+        return super().prepend_multi(keys_and_values, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def _increment_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: IncrementMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiCounterResult]:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`acouchbase.BinaryCollection.increment_multi` instead.
+
+        """
+        return super().increment_multi(keys, *opts, **kwargs)
+
+    @AsyncWrapper.run_in_executor()
+    def _decrement_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: DecrementMultiOptions
+        **kwargs,  # type: Any
+    ) -> Awaitable[MultiCounterResult]:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`acouchbase.BinaryCollection.decrement_multi` instead.
+
+        """
+        return super().decrement_multi(keys, *opts, **kwargs)
+
     def couchbase_list(self, key  # type: str
                        ) -> CouchbaseList:
         """Returns a CouchbaseList permitting simple list storage in a document.
@@ -15,9 +15,9 @@
 #
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
+from acouchbase.logic.streaming import AsyncStreamingRequestMixin
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
@@ -26,16 +26,19 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
 from couchbase.logic.kv_range_scan import RangeScanRequestLogic
 
 
-class AsyncRangeScanRequest(RangeScanRequestLogic):
+class AsyncRangeScanRequest(AsyncStreamingRequestMixin, RangeScanRequestLogic):
     def __init__(self,
                  loop,
                  **kwargs,  # type: Dict[str, Any]
                  ):
-        num_workers = kwargs.pop('num_workers', 2)
+        num_workers = kwargs.pop('num_workers', None)
+        executor = kwargs.pop('executor', None)
+        row_batch_size = kwargs.pop('row_batch_size', None)
         super().__init__(**kwargs)
         self._loop = loop
         self._result_ftr = None
-        self._tp_executor = ThreadPoolExecutor(num_workers)
+        self._init_executor(executor, num_workers)
+        self._init_row_batching(row_batch_size)
 
     @property
     def loop(self):
@@ -44,6 +47,11 @@ class AsyncRangeScanRequest(RangeScanRequestLogic):
         """
         return self._loop
 
+    def _has_buffered_rows(self) -> bool:
+        # the core's scan result does not expose its buffered items, scan items are delivered by the
+        # server in batches so the rest of the batch is read (blocking) as it was before
+        return True
+
     def __aiter__(self):
         if self.done_streaming:
             raise AlreadyQueriedException()
@@ -53,9 +61,9 @@ class AsyncRangeScanRequest(RangeScanRequestLogic):
 
         return self
 
-    async def __anext__(self):
+    async def _next_row_batch(self):
         try:
-            return await self._loop.run_in_executor(self._tp_executor, self._get_next_row)
+            return await self._fetch_rows()
         # We can stop iterator when we receive RangeScanCompletedException
         except asyncio.QueueEmpty:
             exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
@@ -0,0 +1,196 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import (Any,
+                    AsyncIterator,
+                    Dict,
+                    List,
+                    Optional)
+
+from couchbase.exceptions import InvalidArgumentException
+
+DEFAULT_ROW_BATCH_SIZE = 100
+
+
+class StreamingExecutor(ThreadPoolExecutor):
+    """
+    **INTERNAL**
+
+    A bounded thread pool shared by all of an :class:`~acouchbase.cluster.AsyncCluster`'s streaming requests and
+    (blocking) multi-operations.  Keeps track of the number of queued and running tasks so the pool's utilization
+    can be monitored.
+    """
+
+    def __init__(self, max_workers=None  # type: Optional[int]
+                 ):
+        if max_workers is None:
+            # same default as concurrent.futures.ThreadPoolExecutor (Python >= 3.8)
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+            raise InvalidArgumentException('streaming_executor_max_workers must be a positive int.')
+        super().__init__(max_workers=max_workers, thread_name_prefix='pycbc-streaming')
+        self._max_worker_count = max_workers
+        self._metrics_lock = Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+
+    def submit(self, fn, *args, **kwargs):
+        with self._metrics_lock:
+            self._queued += 1
+        try:
+            return super().submit(self._run, fn, *args, **kwargs)
+        except BaseException:
+            with self._metrics_lock:
+                self._queued -= 1
+            raise
+
+    def _run(self, fn, *args, **kwargs):
+        with self._metrics_lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._metrics_lock:
+                self._active -= 1
+                self._completed += 1
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        **INTERNAL**
+        """
+        with self._metrics_lock:
+            return {
+                'max_workers': self._max_worker_count,
+                'active_workers': self._active,
+                'queue_depth': self._queued,
+                'completed_tasks': self._completed,
+            }
+
+
+class AsyncStreamingRequestMixin:
+    """
+    **INTERNAL**
+
+    Drains rows from the underlying (blocking) streamed result in batches so that a single executor hop
+    is paid per batch instead of per row.
+
+    The class using the mixin must call :meth:`_init_executor` and :meth:`_init_row_batching` and provide
+    ``_get_next_row()`` (blocking, returns a single row) and ``_next_row_batch()`` (async, awaits
+    :meth:`_fetch_rows` and handles the end of the stream).  A batch holds the first row plus the rows already
+    buffered (:meth:`_has_buffered_rows`), so rows are not held back waiting for a full batch.
+    """
+
+    def _init_executor(self, executor=None, num_workers=None):
+        # requests share the cluster's executor; a dedicated executor is only created if one is not provided
+        # (or num_workers is explicitly requested) and is shut down once the request is done streaming
+        self._owns_executor = executor is None or num_workers is not None
+        if self._owns_executor:
+            self._tp_executor = ThreadPoolExecutor(num_workers or 2)
+        else:
+            self._tp_executor = executor
+
+    def _release_executor(self):
+        # getattr() as this is also called from __del__, possibly on a request that failed to initialize
+        if getattr(self, '_owns_executor', False) and self._tp_executor is not None:
+            self._tp_executor.shutdown(wait=False)
+            self._tp_executor = None
+
+    def __del__(self):
+        # the request was abandoned before it was done streaming (i.e. the caller broke out of the loop)
+        self._release_executor()
+
+    def _init_row_batching(self, row_batch_size=None):
+        if row_batch_size is None:
+            row_batch_size = DEFAULT_ROW_BATCH_SIZE
+        if not isinstance(row_batch_size, int) or isinstance(row_batch_size, bool) or row_batch_size < 1:
+            raise InvalidArgumentException('row_batch_size must be a positive int.')
+        self._row_batch_size = row_batch_size
+        self._row_buffer = deque()
+        self._pending_exc = None
+
+    @property
+    def row_batch_size(self) -> int:
+        """
+        **INTERNAL**
+        """
+        return self._row_batch_size
+
+    def _has_buffered_rows(self) -> bool:
+        # whether the next row can be read w/o blocking
+        return self._streaming_result.buffered_rows() > 0
+
+    def _get_next_rows(self) -> List[Any]:
+        # this is a blocking operation, executed w/in the request's executor; only the first row is waited on,
+        # the rest of the batch is whatever has already been buffered
+        rows = []
+        try:
+            rows.append(self._get_next_row())
+            while len(rows) < self._row_batch_size and self._has_buffered_rows():
+                rows.append(self._get_next_row())
+        except Exception as ex:
+            if not rows:
+                raise
+            # hand the rows we have back to the event loop; the exception (or end of stream) is
+            # raised on the next fetch
+            self._pending_exc = ex
+        return rows
+
+    async def _fetch_rows(self) -> List[Any]:
+        if self._pending_exc is not None:
+            exc = self._pending_exc
+            self._pending_exc = None
+            self._release_executor()
+            raise exc
+        return await self._loop.run_in_executor(self._tp_executor, self._get_next_rows)
+
+    async def __anext__(self):
+        if not self._row_buffer:
+            try:
+                self._row_buffer.extend(await self._next_row_batch())
+            except BaseException:
+                # the end of the stream, an error or the task being cancelled
+                self._release_executor()
+                raise
+        return self._row_buffer.popleft()
+
+    async def rows_batched(self) -> AsyncIterator[List[Any]]:
+        """Iterate over the rows of the request in lists of (at most) ``row_batch_size`` rows.
+
+        Returns:
+            AsyncIterator[List[Any]]: An async iterator that yields lists of rows.
+        """
+        self.__aiter__()
+        try:
+            while True:
+                if self._row_buffer:
+                    batch = list(self._row_buffer)
+                    self._row_buffer.clear()
+                else:
+                    try:
+                        batch = await self._next_row_batch()
+                    except StopAsyncIteration:
+                        return
+                yield batch
+        finally:
+            # also covers an error, the task being cancelled or the caller closing the iterator early
+            self._release_executor()
@@ -26,6 +26,7 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   MissingConnectionException,
                                   ServiceUnavailableException)
 from couchbase.logic import decode_replicas, decode_value
+from couchbase.transcoder import get_lazy_transcoder
 
 
 def call_async_fn(ft, self, fn, *args, **kwargs):
@@ -270,7 +271,7 @@ class AsyncWrapper:
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
                 ft = self.loop.create_future()
-                transcoder = kwargs.pop('transcoder')
+                transcoder = get_lazy_transcoder(kwargs.pop('transcoder'), kwargs.pop('lazy_decode', None))
 
                 def on_ok(res):
                     try:
@@ -331,6 +332,54 @@ class AsyncWrapper:
 
         return decorator
 
+    @classmethod   # noqa: C901
+    def run_in_executor(cls):   # noqa: C901
+        """
+        **INTERNAL**
+
+        Runs a blocking operation (i.e. a multi-op built on :func:`kv_multi_operation`) in the cluster's
+        streaming executor so that the whole batch resolves a single future.  The loop's default executor is
+        left to application code (and name resolution).
+        """
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapped_fn(self, *args, **kwargs):
+                ft = self.loop.create_future()
+
+                def on_done(exec_ft):
+                    if ft.done():
+                        return
+                    if exec_ft.cancelled():
+                        ft.cancel()
+                        return
+                    exc = exec_ft.exception()
+                    if exc is None:
+                        ft.set_result(exec_ft.result())
+                    elif isinstance(exc, (CouchbaseException, TypeError, ValueError)):
+                        ft.set_exception(exc)
+                    else:
+                        exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
+                        ft.set_exception(exc_cls(str(exc)))
+
+                def submit(self, *args, **kwargs):
+                    exec_ft = self.loop.run_in_executor(self.streaming_executor, partial(fn, self, *args, **kwargs))
+                    exec_ft.add_done_callback(on_done)
+
+                if not self._connection:
+                    bucket_conn_ft = self._scope._connect_bucket()
+                    kwargs["args"] = args
+                    bucket_conn_ft.add_done_callback(
+                        partial(cls.chain_futures, ft, self, submit, set_connection=True, **kwargs))
+                else:
+                    call_async_fn(ft, self, submit, *args, **kwargs)
+
+                return ft
+
+            return wrapped_fn
+
+        return decorator
+
     @classmethod
     def datastructure_op(cls, create_type=None):
         def decorator(fn):
@@ -15,9 +15,9 @@
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from typing import Awaitable
 
+from acouchbase.logic.streaming import AsyncStreamingRequestMixin
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
@@ -30,7 +30,7 @@ from couchbase.logic.n1ql import QueryRequestLogic
 logger = logging.getLogger(__name__)
 
 
-class AsyncN1QLRequest(QueryRequestLogic):
+class AsyncN1QLRequest(AsyncStreamingRequestMixin, QueryRequestLogic):
     def __init__(self,
                  connection,
                  loop,
@@ -38,10 +38,13 @@ class AsyncN1QLRequest(QueryRequestLogic):
                  row_factory=lambda x: x,
                  **kwargs
                  ):
-        num_workers = kwargs.pop('num_workers', 2)
+        num_workers = kwargs.pop('num_workers', None)
+        executor = kwargs.pop('executor', None)
+        row_batch_size = kwargs.pop('row_batch_size', None)
         super().__init__(connection, query_params, row_factory=row_factory, **kwargs)
         self._loop = loop
-        self._tp_executor = ThreadPoolExecutor(num_workers)
+        self._init_executor(executor, num_workers)
+        self._init_row_batching(row_batch_size)
 
     @property
     def loop(self):
@@ -93,9 +96,9 @@ class AsyncN1QLRequest(QueryRequestLogic):
             raise StopAsyncIteration
         return self.serializer.deserialize(row)
 
-    async def __anext__(self):
+    async def _next_row_batch(self):
         try:
-            return await self._loop.run_in_executor(self._tp_executor, self._get_next_row)
+            return await self._fetch_rows()
         except asyncio.QueueEmpty:
             exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
             excptn = exc_cls('Unexpected QueueEmpty exception caught when doing N1QL query.')
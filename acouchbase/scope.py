@@ -17,16 +17,23 @@ from typing import (TYPE_CHECKING,
                     Any,
                     Awaitable,
                     Dict,
-                    Optional)
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
 
 from acouchbase.analytics import AnalyticsQuery, AsyncAnalyticsRequest
 from acouchbase.collection import Collection
 from acouchbase.management.eventing import ScopeEventingFunctionManager
 from acouchbase.management.search import ScopeSearchIndexManager
 from acouchbase.n1ql import AsyncN1QLRequest, N1QLQuery
-from acouchbase.search import AsyncFullTextSearchRequest, SearchQueryBuilder
+from acouchbase.search import (AsyncFullTextSearchRequest,
+                               SearchQueryBuilder,
+                               _search_many)
+from couchbase.logic.search import SearchRow, _get_search_many_args
 from couchbase.options import (AnalyticsOptions,
                                QueryOptions,
+                               SearchManyOptions,
                                SearchOptions)
 from couchbase.result import (AnalyticsResult,
                               QueryResult,
@@ -69,6 +76,13 @@ class AsyncScope:
         """
         return self._bucket.loop
 
+    @property
+    def streaming_executor(self):
+        """
+        **INTERNAL**
+        """
+        return self._bucket.streaming_executor
+
     @property
     def default_serializer(self) -> Optional[Serializer]:
         return self._bucket.default_serializer
@@ -201,10 +215,13 @@ class AsyncScope:
                 opt = o
                 opts.remove(o)
 
-        request_args = dict()
+        request_args = dict(executor=self.streaming_executor)
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
 
         # set the query context as this bucket and scope if not provided
         if not ('query_context' in opt or 'query_context' in kwargs):
@@ -296,10 +313,13 @@ class AsyncScope:
                 opt = o
                 opts.remove(o)
 
-        request_args = dict()
+        request_args = dict(executor=self.streaming_executor)
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
 
         # set the query context as this bucket and scope if not provided
         if not ('query_context' in opt or 'query_context' in kwargs):
@@ -412,10 +432,13 @@ class AsyncScope:
                 opt = o
                 opts.remove(o)
 
-        request_args = dict()
+        request_args = dict(executor=self.streaming_executor)
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
+        row_batch_size = kwargs.pop('row_batch_size', None)
+        if row_batch_size:
+            request_args['row_batch_size'] = row_batch_size
 
         # set the scope_name as this scope if not provided
         if not ('scope_name' in opt or 'scope_name' in kwargs):
@@ -518,10 +541,72 @@ class AsyncScope:
                                                                  query.as_encodable(),
                                                                  default_serializer=self.default_serializer,
                                                                  streaming_timeout=streaming_timeout,
+                                                                 executor=self.streaming_executor,
                                                                  bucket_name=self.bucket_name,
                                                                  scope_name=self.name)
         return SearchResult(req)
 
+    async def search_many(self,
+                          requests,  # type: Iterable[Tuple[Any, ...]]
+                          *options,  # type: SearchManyOptions
+                          **kwargs,  # type: Dict[str, Any]
+                          ) -> List[SearchRow]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Executes several searches against the scope concurrently and merges their rows.
+
+        The rows of each search are merged as they are streamed.  Once the top ``limit`` rows can no longer change,
+        the merged rows are returned without waiting for the remaining rows of each search.
+
+        .. note::
+            Merging by :attr:`~couchbase.search.SearchMergeStrategy.SORT` requires every search to use the same sort
+            and only supports sorting by score and by document ID, as the SDK does not receive the values of other
+            sort fields.  :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION` merges searches of
+            any sort by the rank of each row within its search.
+
+        Args:
+            requests (Iterable[Tuple[Any, ...]]): The searches to execute.  Each search is either an
+                ``(index, SearchRequest)`` or ``(index, SearchRequest, SearchOptions)`` tuple.
+            options (:class:`~couchbase.options.SearchManyOptions`): Optional parameters for merging the searches.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.SearchManyOptions`
+
+        Returns:
+            List[:class:`~couchbase.search.SearchRow`]: The top ``limit`` merged rows.  When merged by
+            :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION`, the score of each row is its fused
+            score over the rows received before the merge stopped.  The merge stops as soon as the rows' order is
+            settled, so the score is a lower bound of the row's fused score over every row of the searches.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the searches cannot be merged with the
+                provided merge strategy.
+
+        Examples:
+
+            Merge a text search and a vector search::
+
+                import couchbase.search as search
+                from couchbase.options import SearchManyOptions
+                from couchbase.vector_search import VectorQuery, VectorSearch
+
+                # ... other code ...
+
+                text_request = search.SearchRequest.create(search.MatchQuery('beach'))
+                vector_request = search.SearchRequest.create(VectorSearch.from_vector_query(VectorQuery('vector_field',
+                                                                                                        vector)))
+                rows = await scope.search_many([('travel-sample-index', text_request),
+                                                ('travel-sample-vector-index', vector_request)],
+                                               SearchManyOptions(limit=10,
+                                                                 merge_strategy=search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION))
+
+                for row in rows:
+                    print(f'Found row: {row}')
+        """  # noqa: E501
+        searches, merge_args = _get_search_many_args(requests, *options, **kwargs)
+        results = [self.search(index, request, *search_opts, **search_kwargs)
+                   for index, request, search_opts, search_kwargs in searches]
+        return await _search_many(results, merge_args)
+
     def search_indexes(self) -> ScopeSearchIndexManager:
         """
         Get a :class:`~acouchbase.management.search.ScopeSearchIndexManager` which can be used to manage the search
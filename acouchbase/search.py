@@ -14,9 +14,13 @@
 #  limitations under the License.
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import Awaitable
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Awaitable,
+                    Dict,
+                    List)
 
+from acouchbase.logic.streaming import AsyncStreamingRequestMixin
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
@@ -24,20 +28,28 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   ExceptionMap)
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.logic.search import SearchQueryBuilder  # noqa: F401
-from couchbase.logic.search import FullTextSearchRequestLogic
+from couchbase.logic.search import (FullTextSearchRequestLogic,
+                                    SearchRow,
+                                    _SearchResultMerger)
 
+if TYPE_CHECKING:
+    from couchbase.result import SearchResult
 
-class AsyncFullTextSearchRequest(FullTextSearchRequestLogic):
+
+class AsyncFullTextSearchRequest(AsyncStreamingRequestMixin, FullTextSearchRequestLogic):
     def __init__(self,
                  connection,
                  loop,
                  encoded_query,
                  **kwargs
                  ):
-        num_workers = kwargs.pop('num_workers', 2)
+        num_workers = kwargs.pop('num_workers', None)
+        executor = kwargs.pop('executor', None)
+        row_batch_size = kwargs.pop('row_batch_size', None)
         super().__init__(connection, encoded_query, **kwargs)
         self._loop = loop
-        self._tp_executor = ThreadPoolExecutor(num_workers)
+        self._init_executor(executor, num_workers)
+        self._init_row_batching(row_batch_size)
 
     @property
     def loop(self):
@@ -89,9 +101,9 @@ class AsyncFullTextSearchRequest(FullTextSearchRequestLogic):
 
         return self._deserialize_row(row)
 
-    async def __anext__(self):
+    async def _next_row_batch(self):
         try:
-            return await self._loop.run_in_executor(self._tp_executor, self._get_next_row)
+            return await self._fetch_rows()
         except asyncio.QueueEmpty:
             exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
             excptn = exc_cls('Unexpected QueueEmpty exception caught when doing Search query.')
@@ -106,3 +118,35 @@ class AsyncFullTextSearchRequest(FullTextSearchRequestLogic):
             exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
             excptn = exc_cls(str(ex))
             raise excptn
+
+
+async def _search_many(results,  # type: List[SearchResult]
+                       merge_args,  # type: Dict[str, Any]
+                       ) -> List[SearchRow]:
+    """**INTERNAL**
+
+    Streams the rows of each search in its own task and merges them as they arrive.  Returns as soon as the merged
+    rows are settled, the tasks of searches that are still streaming are cancelled.
+    """
+    merger = _SearchResultMerger([r._request.encoded_query.get('sort_specs', None) for r in results], **merge_args)
+    queue = asyncio.Queue()
+
+    async def _stream(idx, result):
+        try:
+            async for row in result.rows():
+                queue.put_nowait((idx, row))
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            queue.put_nowait((idx, ex))
+            return
+        queue.put_nowait((idx, None))
+
+    tasks = [asyncio.ensure_future(_stream(idx, result)) for idx, result in enumerate(results)]
+    try:
+        while not merger.done:
+            merger.add(*(await queue.get()))
+        return merger.rows()
+    finally:
+        for task in tasks:
+            task.cancel()
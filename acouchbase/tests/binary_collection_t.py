@@ -22,7 +22,9 @@ from couchbase.options import (DecrementOptions,
                                DeltaValue,
                                IncrementOptions,
                                SignedInt64)
-from couchbase.result import CounterResult, MutationResult
+from couchbase.result import (CounterResult,
+                              MultiCounterResult,
+                              MutationResult)
 from couchbase.transcoder import RawBinaryTranscoder, RawStringTranscoder
 
 from ._test_utils import (CollectionType,
@@ -266,6 +268,30 @@ class BinaryCollectionTests:
         assert result.cas is not None
         assert result.content == value - 1
 
+    @pytest.mark.asyncio
+    async def test_counter_increment_multi(self, cb_env, counter_kvp):
+        cb = cb_env.collection
+        key = counter_kvp.key
+        value = counter_kvp.value
+
+        res = await cb.binary().increment_multi([key])
+        assert isinstance(res, MultiCounterResult)
+        assert res.all_ok is True
+        assert isinstance(res.results[key], CounterResult)
+        assert res.results[key].content == value + 1
+
+    @pytest.mark.asyncio
+    async def test_counter_decrement_multi(self, cb_env, counter_kvp):
+        cb = cb_env.collection
+        key = counter_kvp.key
+        value = counter_kvp.value
+
+        res = await cb.binary().decrement_multi([key])
+        assert isinstance(res, MultiCounterResult)
+        assert res.all_ok is True
+        assert isinstance(res.results[key], CounterResult)
+        assert res.results[key].content == value - 1
+
     @pytest.mark.asyncio
     async def test_counter_increment_non_default(self, cb_env, counter_kvp):
         cb = cb_env.collection
@@ -32,13 +32,17 @@ from couchbase.exceptions import (CasMismatchException,
                                   InvalidArgumentException,
                                   PathNotFoundException,
                                   TemporaryFailException)
-from couchbase.options import (GetOptions,
+from couchbase.options import (GetMultiOptions,
+                               GetOptions,
                                InsertOptions,
                                ReplaceOptions,
                                UpsertOptions)
 from couchbase.result import (ExistsResult,
                               GetReplicaResult,
                               GetResult,
+                              MultiExistsResult,
+                              MultiGetResult,
+                              MultiMutationResult,
                               MutationResult)
 from tests.mock_server import MockServerType
 
@@ -667,6 +671,50 @@ class CollectionTests:
         assert active_cnt == 1
         assert replica_cnt >= active_cnt
 
+    @pytest.mark.asyncio
+    async def test_multi_get(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        keys = [default_kvp.key]
+        res = await cb.get_multi(keys)
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is True
+        assert res.exceptions == {}
+        assert isinstance(res.results[default_kvp.key], GetResult)
+        assert res.results[default_kvp.key].content_as[dict] == default_kvp.value
+
+    @pytest.mark.asyncio
+    async def test_multi_get_fail(self, cb_env):
+        cb = cb_env.collection
+        res = await cb.get_multi([self.NO_KEY])
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is False
+        assert isinstance(res.exceptions[self.NO_KEY], DocumentNotFoundException)
+
+        with pytest.raises(DocumentNotFoundException):
+            await cb.get_multi([self.NO_KEY], GetMultiOptions(return_exceptions=False))
+
+    @pytest.mark.asyncio
+    async def test_multi_get_invalid_input(self, cb_env, default_kvp):
+        with pytest.raises(InvalidArgumentException):
+            await cb_env.collection.get_multi({default_kvp.key: default_kvp.value})
+
+    @pytest.mark.asyncio
+    async def test_multi_upsert_and_remove(self, cb_env, new_kvp):
+        cb = cb_env.collection
+        keys_and_docs = {new_kvp.key: new_kvp.value}
+        res = await cb.upsert_multi(keys_and_docs)
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+        assert all(map(lambda r: isinstance(r, MutationResult), res.results.values())) is True
+
+        res = await cb.exists_multi(list(keys_and_docs.keys()))
+        assert isinstance(res, MultiExistsResult)
+        assert res.results[new_kvp.key].exists is True
+
+        res = await cb.remove_multi(list(keys_and_docs.keys()))
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+
     # @TODO(jc): - should an expiry of -1 raise an InvalidArgumentException?
     @pytest.mark.usefixtures("check_xattr_supported")
     @pytest.mark.asyncio
@@ -194,6 +194,8 @@ class QueryTestSuite:
         'test_query_timeout',
         'test_query_with_metrics',
         'test_query_with_profile',
+        'test_rows_batched',
+        'test_shared_streaming_executor',
         'test_simple_query',
         'test_simple_query_explain',
         'test_simple_query_prepared',
@@ -203,6 +205,8 @@ class QueryTestSuite:
         'test_simple_query_with_positional_params_in_options',
         'test_simple_query_without_options_with_kwargs_named_params',
         'test_simple_query_without_options_with_kwargs_positional_params',
+        'test_streaming_executor_released_on_early_exit',
+        'test_streaming_executor_released_on_error',
     ]
 
     @pytest_asyncio.fixture(name='setup_udf')
@@ -422,6 +426,66 @@ class QueryTestSuite:
         await cb_env.assert_rows(result, 1)
         assert result.metadata().profile() is not None
 
+    @pytest.mark.asyncio
+    async def test_rows_batched(self, cb_env):
+        result = cb_env.cluster.query(f"SELECT * FROM `{cb_env.bucket.name}` LIMIT 5", row_batch_size=2)
+        batches = []
+        async for batch in result.rows_batched():
+            assert isinstance(batch, list)
+            batches.append(batch)
+        # a batch is the rows already buffered (at most row_batch_size), it does not wait for a full batch
+        assert all(map(lambda b: 0 < len(b) <= 2, batches)) is True
+        assert sum(map(len, batches)) == 5
+        assert result.metadata() is not None
+
+    @pytest.mark.asyncio
+    async def test_shared_streaming_executor(self, cb_env):
+        completed = cb_env.cluster.streaming_executor_metrics()['completed_tasks']
+        results = [cb_env.cluster.query(f"SELECT * FROM `{cb_env.bucket.name}` LIMIT 2") for _ in range(3)]
+        for result in results:
+            assert result._request._tp_executor is cb_env.cluster.streaming_executor
+        await asyncio.gather(*[cb_env.assert_rows(result, 2) for result in results])
+        metrics = cb_env.cluster.streaming_executor_metrics()
+        assert metrics['completed_tasks'] > completed
+        assert metrics['active_workers'] == 0
+        assert metrics['queue_depth'] == 0
+        assert 0 < metrics['max_workers']
+
+    @pytest.mark.asyncio
+    async def test_streaming_executor_released_on_early_exit(self, cb_env):
+        result = cb_env.cluster.query(f"SELECT * FROM `{cb_env.bucket.name}` LIMIT 5", num_workers=2, row_batch_size=1)
+        executor = result._request._tp_executor
+        assert executor is not cb_env.cluster.streaming_executor
+        batches = result.rows_batched()
+        async for _ in batches:
+            break
+        await batches.aclose()
+        assert result._request._tp_executor is None
+        assert executor._shutdown is True
+
+    @pytest.mark.asyncio
+    async def test_streaming_executor_released_on_error(self, cb_env):
+        result = cb_env.cluster.query(f"SELECT * FROM `{cb_env.bucket.name}` LIMIT 5", num_workers=2, row_batch_size=1)
+        request = result._request
+        executor = request._tp_executor
+        assert executor is not cb_env.cluster.streaming_executor
+        get_next_row = request._get_next_row
+        rows_read = []
+
+        def fail_after_first_row():
+            if rows_read:
+                raise CouchbaseException('Failed to read row.')
+            rows_read.append(get_next_row())
+            return rows_read[-1]
+
+        request._get_next_row = fail_after_first_row
+        with pytest.raises(CouchbaseException):
+            async for _ in result.rows():
+                pass
+        assert len(rows_read) == 1
+        assert request._tp_executor is None
+        assert executor._shutdown is True
+
     @pytest.mark.asyncio
     async def test_simple_query(self, cb_env):
         result = cb_env.cluster.query(f"SELECT * FROM `{cb_env.bucket.name}` LIMIT 2")
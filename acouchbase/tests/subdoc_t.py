@@ -35,6 +35,8 @@ from couchbase.options import (GetOptions,
 from couchbase.result import (GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiLookupInResult,
+                              MultiMutateInResult,
                               MutateInResult)
 from tests.environments import CollectionType
 from tests.environments.subdoc_environment import AsyncSubdocTestEnvironment
@@ -80,6 +82,7 @@ class SubDocumentTestSuite:
         'test_lookup_in_any_replica_get_full',
         'test_lookup_in_any_replica_multiple_specs',
         'test_lookup_in_any_replica_with_timeout',
+        'test_lookup_in_multi',
         'test_lookup_in_multiple_specs',
         'test_lookup_in_one_path_not_found',
         'test_lookup_in_simple_exists',
@@ -94,6 +97,7 @@ class SubDocumentTestSuite:
         'test_mutate_in_insert_semantics',
         'test_mutate_in_insert_semantics_fail',
         'test_mutate_in_insert_semantics_kwargs',
+        'test_mutate_in_multi',
         'test_mutate_in_preserve_expiry',
         'test_mutate_in_preserve_expiry_fails',
         'test_mutate_in_preserve_expiry_not_used',
@@ -527,6 +531,18 @@ class SubDocumentTestSuite:
         assert result.content_as[str](0) == value['batch']
         assert result.is_replica is not None
 
+    @pytest.mark.asyncio
+    async def test_lookup_in_multi(self, cb_env):
+        docs = dict(cb_env.get_existing_doc_by_type('vehicle') for _ in range(3))
+        missing_key = 'not-a-key'
+        result = await cb_env.collection.lookup_in_multi(list(docs.keys()) + [missing_key],
+                                                         (SD.get('manufacturer'),))
+        assert isinstance(result, MultiLookupInResult)
+        assert result.all_ok is False
+        assert isinstance(result.exceptions[missing_key], DocumentNotFoundException)
+        for k, v in result.results.items():
+            assert v.content_as[dict](0) == docs[k]['manufacturer']
+
     @pytest.mark.asyncio
     @pytest.mark.usefixtures("check_xattr_supported")
     async def test_lookup_in_multiple_specs(self, cb_env):
@@ -682,6 +698,19 @@ class SubDocumentTestSuite:
                                               (SD.insert('new_path', 'im new'),),
                                               insert_doc=True)
 
+    @pytest.mark.asyncio
+    async def test_mutate_in_multi(self, cb_env):
+        docs = dict(cb_env.get_existing_doc_by_type('vehicle') for _ in range(2))
+        key1, key2 = docs.keys()
+        result = await cb_env.collection.mutate_in_multi({key1: (SD.upsert('make', 'New Make'),),
+                                                          key2: (SD.replace('model', 'New Model'),)})
+        assert isinstance(result, MultiMutateInResult)
+        assert result.all_ok is True
+        res = await AsyncTestEnvironment.try_n_times(10, 3, cb_env.collection.get, key1)
+        assert res.content_as[dict]['make'] == 'New Make'
+        res = await AsyncTestEnvironment.try_n_times(10, 3, cb_env.collection.get, key2)
+        assert res.content_as[dict]['model'] == 'New Model'
+
     @pytest.mark.asyncio
     @pytest.mark.usefixtures('check_preserve_expiry_supported')
     async def test_mutate_in_preserve_expiry(self, cb_env):
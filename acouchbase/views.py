@@ -14,9 +14,9 @@
 #  limitations under the License.
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from typing import Awaitable
 
+from acouchbase.logic.streaming import AsyncStreamingRequestMixin
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
@@ -27,17 +27,20 @@ from couchbase.logic.views import ViewQuery  # noqa: F401
 from couchbase.logic.views import ViewRequestLogic, ViewRow
 
 
-class AsyncViewRequest(ViewRequestLogic):
+class AsyncViewRequest(AsyncStreamingRequestMixin, ViewRequestLogic):
     def __init__(self,
                  connection,
                  loop,
                  encoded_query,
                  **kwargs
                  ):
-        num_workers = kwargs.pop('num_workers', 2)
+        num_workers = kwargs.pop('num_workers', None)
+        executor = kwargs.pop('executor', None)
+        row_batch_size = kwargs.pop('row_batch_size', None)
         super().__init__(connection, encoded_query, **kwargs)
         self._loop = loop
-        self._tp_executor = ThreadPoolExecutor(num_workers)
+        self._init_executor(executor, num_workers)
+        self._init_row_batching(row_batch_size)
 
     @property
     def loop(self):
@@ -97,9 +100,9 @@ class AsyncViewRequest(ViewRequestLogic):
         else:
             return deserialized_row
 
-    async def __anext__(self):
+    async def _next_row_batch(self):
         try:
-            return await self._loop.run_in_executor(self._tp_executor, self._get_next_row)
+            return await self._fetch_rows()
         except asyncio.QueueEmpty:
             exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
             excptn = exc_cls('Unexpected QueueEmpty exception caught when doing Search query.')
@@ -13,8 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
 from datetime import timedelta
 from enum import Enum
+from importlib import import_module
 from inspect import (Parameter,
                      Signature,
                      signature)
@@ -38,6 +40,23 @@ JSONType = Union[str, int, float, bool,
 PyCapsuleType = TypeVar('PyCapsuleType')
 
 
+def lazy_import(module_name,  # type: str
+                attr,  # type: str
+                lazy_imports,  # type: Dict[str, str]
+                ) -> Any:
+    """**INTERNAL**
+
+    Implementation of a module level ``__getattr__``.  Names in *lazy_imports* (name -> module that defines the name)
+    are imported on first access and then set on the module, so later lookups do not come back here.
+    """
+    source = lazy_imports.get(attr, None)
+    if source is None:
+        raise AttributeError(f'module {module_name!r} has no attribute {attr!r}')
+    value = getattr(import_module(source), attr)
+    setattr(sys.modules[module_name], attr, value)
+    return value
+
+
 def is_null_or_empty(
     value  # type: str
 ) -> bool:
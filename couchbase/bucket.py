@@ -13,26 +13,43 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import annotations
+
 from typing import (TYPE_CHECKING,
                     Any,
                     Dict)
 
+from couchbase._utils import lazy_import
 from couchbase.collection import Collection
 from couchbase.exceptions import ErrorMapper
 from couchbase.exceptions import exception as BaseCouchbaseException
 from couchbase.logic import BlockingWrapper
 from couchbase.logic.bucket import BucketLogic
 from couchbase.logic.supportability import Supportability
-from couchbase.management.collections import CollectionManager
-from couchbase.management.views import ViewIndexManager
 from couchbase.result import PingResult, ViewResult
 from couchbase.scope import Scope
-from couchbase.views import ViewQuery, ViewRequest
 
 if TYPE_CHECKING:
     from couchbase.cluster import Cluster
+    from couchbase.management.collections import CollectionManager
+    from couchbase.management.views import ViewIndexManager
     from couchbase.options import PingOptions, ViewOptions
 
+# The management APIs and views are imported on first use, the names below remain importable from this module.
+_LAZY_IMPORTS = {
+    'CollectionManager': 'couchbase.management.collections',
+    'ViewErrorMode': 'couchbase.views',
+    'ViewIndexManager': 'couchbase.management.views',
+    'ViewOrdering': 'couchbase.views',
+    'ViewQuery': 'couchbase.views',
+    'ViewRequest': 'couchbase.views',
+    'ViewScanConsistency': 'couchbase.views',
+}
+
+
+def __getattr__(name):
+    return lazy_import(__name__, name, _LAZY_IMPORTS)
+
 
 class Bucket(BucketLogic):
     """Create a Couchbase Bucket instance.
@@ -196,6 +213,7 @@ class Bucket(BucketLogic):
         # also does not specify a view_timeout we set the streaming_timeout to
         # couchbase::core::timeout_defaults::view_timeout when the streaming object is created in the bindings.
         streaming_timeout = self.streaming_timeouts.get('view_timeout', None)
+        from couchbase.views import ViewQuery, ViewRequest
         query = ViewQuery.create_view_query_object(self.name, design_doc, view_name, *view_options, **kwargs)
         return ViewResult(ViewRequest.generate_view_request(self.connection,
                                                             query.as_encodable(),
@@ -210,6 +228,7 @@ class Bucket(BucketLogic):
         Returns:
             :class:`~couchbase.management.collections.CollectionManager`: A :class:`~couchbase.management.collections.CollectionManager` instance.
         """  # noqa: E501
+        from couchbase.management.collections import CollectionManager
         return CollectionManager(self.connection, self.name)
 
     def view_indexes(self) -> ViewIndexManager:
@@ -220,6 +239,7 @@ class Bucket(BucketLogic):
         Returns:
             :class:`~couchbase.management.views.ViewIndexManager`: A :class:`~couchbase.management.views.ViewIndexManager` instance.
         """  # noqa: E501
+        from couchbase.management.views import ViewIndexManager
         return ViewIndexManager(self.connection, self.name)
 
 
@@ -245,8 +265,3 @@ class PingOptions(PingOptionsBase):  # noqa: F811
 @Supportability.import_deprecated('couchbase.bucket', 'couchbase.options')  # noqa: F811
 class ViewOptions(ViewOptionsBase):  # noqa: F811
     pass
-
-
-from couchbase.views import ViewScanConsistency  # nopep8 # isort:skip # noqa: E402, F401
-from couchbase.views import ViewOrdering  # nopep8 # isort:skip # noqa: E402, F401
-from couchbase.views import ViewErrorMode  # nopep8 # isort:skip # noqa: E402, F401
@@ -0,0 +1,855 @@
+#  Copyright 2016-2023. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import logging
+import os
+from concurrent.futures import (FIRST_COMPLETED,
+                                ThreadPoolExecutor,
+                                wait)
+from datetime import timedelta
+from functools import partial
+from queue import Queue
+from threading import Thread
+from time import monotonic
+from typing import (TYPE_CHECKING,
+                    Any,
+                    BinaryIO,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
+
+from couchbase.collection import Collection
+from couchbase.constants import FMT_BYTES, FMT_JSON
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.kv_range_scan import (PrefixScan,
+                                     RangeScan,
+                                     SamplingScan)
+from couchbase.transcoder import Transcoder, get_decode_format
+
+if TYPE_CHECKING:
+    from couchbase.options import ScanOptions, UpsertMultiOptions
+    from couchbase.result import MultiMutationResult
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_NUM_PARTITIONS = 16
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_COMPRESS_LEVEL = 6
+DEFAULT_PROGRESS_INTERVAL = timedelta(seconds=5)
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# the layout of an exported JSON document, the raw JSON is copied into the line as-is
+_LINE_ID_PREFIX = b'{"id":"'
+_LINE_VALUE_SEP = b',"value":'
+
+
+class BulkProgress:
+    """Progress and throughput of an :func:`export_collection` or :func:`import_collection` run.
+
+    A snapshot is passed to the ``progress`` callback periodically and the final state is returned once the run
+    completes.  When a run is resumed from a checkpoint, the counters include the work done before the checkpoint.
+    """
+
+    def __init__(self,
+                 operation,  # type: str
+                 documents=0,  # type: int
+                 failed=0,  # type: int
+                 bytes=0,  # type: int
+                 partitions_completed=0,  # type: int
+                 num_partitions=0,  # type: int
+                 ):
+        self._operation = operation
+        self._started = monotonic()
+        self._done = False
+        self.documents = documents
+        self.failed = failed
+        self.bytes = bytes
+        self.partitions_completed = partitions_completed
+        self.num_partitions = num_partitions
+        # throughput is only measured over the work done by this run
+        self._start_documents = documents
+        self._start_bytes = bytes
+
+    @property
+    def operation(self) -> str:
+        """
+            str: Either ``export`` or ``import``.
+        """
+        return self._operation
+
+    @property
+    def done(self) -> bool:
+        """
+            bool: True once the run has completed.
+        """
+        return self._done
+
+    @property
+    def elapsed(self) -> timedelta:
+        """
+            timedelta: The time elapsed since the run started.
+        """
+        return timedelta(seconds=monotonic() - self._started)
+
+    @property
+    def docs_per_second(self) -> float:
+        """
+            float: The number of documents processed per second by this run.
+        """
+        elapsed = monotonic() - self._started
+        return (self.documents - self._start_documents) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """
+            float: The number of (uncompressed) NDJSON bytes processed per second by this run.
+        """
+        elapsed = monotonic() - self._started
+        return (self.bytes - self._start_bytes) / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the progress as a dict, i.e. for structured logging.
+
+        Returns:
+            Dict[str, Any]: The progress counters and throughput.
+        """
+        return {
+            'operation': self._operation,
+            'done': self._done,
+            'documents': self.documents,
+            'failed': self.failed,
+            'bytes': self.bytes,
+            'partitions_completed': self.partitions_completed,
+            'num_partitions': self.num_partitions,
+            'elapsed': self.elapsed.total_seconds(),
+            'docs_per_second': self.docs_per_second,
+            'bytes_per_second': self.bytes_per_second,
+        }
+
+    def __repr__(self):
+        return f'BulkProgress({self.as_dict()})'
+
+
+class _ProgressReporter:
+    """**INTERNAL**
+
+    Calls the progress callback (and logs) at most once per interval.
+    """
+
+    def __init__(self,
+                 progress,  # type: BulkProgress
+                 callback,  # type: Optional[Callable[[BulkProgress], None]]
+                 interval,  # type: Optional[timedelta]
+                 ):
+        if interval is None:
+            interval = DEFAULT_PROGRESS_INTERVAL
+        if not isinstance(interval, timedelta):
+            raise InvalidArgumentException('progress_interval must be a timedelta.')
+        if callback is not None and not callable(callback):
+            raise InvalidArgumentException('progress must be callable.')
+        self._progress = progress
+        self._callback = callback
+        self._interval = interval.total_seconds()
+        self._next_report = monotonic() + self._interval
+
+    def maybe_report(self) -> None:
+        now = monotonic()
+        if now >= self._next_report:
+            self._next_report = now + self._interval
+            self.report()
+
+    def report(self) -> None:
+        log.debug('%s', self._progress)
+        if self._callback is not None:
+            self._callback(self._progress)
+
+    def finish(self) -> BulkProgress:
+        self._progress._done = True
+        self.report()
+        return self._progress
+
+
+class _PassthroughTranscoder(Transcoder):
+    """**INTERNAL**
+
+    Scanned documents are exported as their raw bytes and flags, imported documents are stored as
+    ``(raw_bytes, flags)`` tuples.  No document is serialized or deserialized along the way.
+    """
+
+    def encode_value(self,
+                     value,  # type: Tuple[bytes, int]
+                     ) -> Tuple[bytes, int]:
+        return value
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags,  # type: int
+                     ) -> bytes:
+        return value
+
+
+_PASSTHROUGH_TRANSCODER = _PassthroughTranscoder()
+
+
+def _validate_positive_int(name,  # type: str
+                           value,  # type: Optional[int]
+                           default,  # type: int
+                           ) -> int:
+    if value is None:
+        return default
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise InvalidArgumentException(f'{name} must be a positive int.')
+    return value
+
+
+def _load_checkpoint(checkpoint_path,  # type: Optional[str]
+                     operation,  # type: str
+                     path,  # type: str
+                     ) -> Optional[Dict[str, Any]]:
+    if checkpoint_path is None or not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, 'r') as f:
+        state = json.load(f)
+    if state.get('operation') != operation or state.get('path') != path:
+        raise InvalidArgumentException(f'Checkpoint {checkpoint_path} is not for an {operation} of {path}.')
+    return state
+
+
+def _save_checkpoint(checkpoint_path,  # type: str
+                     state,  # type: Dict[str, Any]
+                     ) -> None:
+    # write + rename so that a crash never leaves a partially written checkpoint behind
+    tmp_path = f'{checkpoint_path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, checkpoint_path)
+
+
+def _export_line(key,  # type: str
+                 value,  # type: Optional[bytes]
+                 flags,  # type: Optional[int]
+                 ) -> bytes:
+    if value is None:
+        value = b''
+    if flags is None:
+        flags = 0
+    if value and get_decode_format(flags) == FMT_JSON:
+        # JSON documents are copied into the line as-is, newlines can only be whitespace in JSON
+        if b'\n' in value or b'\r' in value:
+            value = value.replace(b'\r', b' ').replace(b'\n', b' ')
+        return b''.join((b'{"id":', json.dumps(key).encode('ascii'), _LINE_VALUE_SEP, value, b'}\n'))
+
+    line = json.dumps({'id': key, 'flags': flags, 'value_base64': base64.b64encode(value).decode('ascii')})
+    return line.encode('ascii') + b'\n'
+
+
+def _find_string_end(line,  # type: bytes
+                     start,  # type: int
+                     ) -> int:
+    """**INTERNAL**
+
+    Returns the index of the quote that ends the JSON string starting at *start* (after the opening quote), or -1.
+    """
+    idx = line.find(b'"', start)
+    while idx != -1:
+        backslashes = 0
+        while line[idx - 1 - backslashes] == 0x5C:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return idx
+        idx = line.find(b'"', idx + 1)
+    return -1
+
+
+def _parse_line(line,  # type: bytes
+                ) -> Tuple[str, Tuple[bytes, int]]:
+    """**INTERNAL**
+
+    Returns the key and the ``(raw_bytes, flags)`` value of an NDJSON line.  Lines in the layout written by
+    :func:`export_collection` are sliced without parsing the document.
+    """
+    if line.startswith(_LINE_ID_PREFIX):
+        end = _find_string_end(line, len(_LINE_ID_PREFIX))
+        if end != -1 and line.startswith(_LINE_VALUE_SEP, end + 1):
+            value = line[end + 1 + len(_LINE_VALUE_SEP):].rstrip()
+            if value.endswith(b'}'):
+                return json.loads(line[len(_LINE_ID_PREFIX) - 1:end + 1]), (value[:-1], FMT_JSON)
+
+    doc = json.loads(line)
+    if not isinstance(doc, dict) or not isinstance(doc.get('id', None), str):
+        raise ValueError('Expected a JSON object with an "id" string.')
+    if 'value_base64' in doc:
+        return doc['id'], (base64.b64decode(doc['value_base64']), doc.get('flags', FMT_BYTES))
+    if 'value' not in doc:
+        raise ValueError('Expected a JSON object with a "value" or "value_base64".')
+    return doc['id'], (json.dumps(doc['value']).encode('utf-8'), FMT_JSON)
+
+
+def _open_for_read(path,  # type: str
+                   compress,  # type: Optional[bool]
+                   ) -> BinaryIO:
+    if compress is None:
+        with open(path, 'rb') as f:
+            compress = f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    if compress:
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+class _ExportWriter(Thread):
+    """**INTERNAL**
+
+    Owns the output file: writes (and optionally compresses) batches of lines off of the scanning thread.  Each
+    partition is written as its own gzip member, so the file can be truncated back to a partition boundary when an
+    export is resumed.
+    """
+
+    PARTITION_DONE = object()
+
+    def __init__(self,
+                 fileobj,  # type: BinaryIO
+                 compresslevel,  # type: Optional[int]
+                 on_partition_done,  # type: Callable[[Any, int], None]
+                 queue_size,  # type: int
+                 ):
+        super().__init__(name='pycbc-bulk-export-writer', daemon=True)
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._on_partition_done = on_partition_done
+        self.queue = Queue(maxsize=queue_size)
+        self.error = None
+        self._out = None
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self._close_member()
+                return
+            if self.error is not None:
+                # keep draining so the producer never blocks on a full queue
+                continue
+            try:
+                if isinstance(item, tuple) and item[0] is self.PARTITION_DONE:
+                    self._end_partition(item[1])
+                else:
+                    self._writer().write(item)
+            except Exception as ex:
+                self.error = ex
+
+    def _writer(self):
+        if self._out is None:
+            if self._compresslevel is None:
+                self._out = self._fileobj
+            else:
+                self._out = gzip.GzipFile(fileobj=self._fileobj, mode='wb', compresslevel=self._compresslevel,
+                                          mtime=0)
+        return self._out
+
+    def _close_member(self):
+        if self._out is not None and self._out is not self._fileobj:
+            # closing the GzipFile writes the member's trailer, the underlying file is left open
+            try:
+                self._out.close()
+            except Exception as ex:
+                if self.error is None:
+                    self.error = ex
+        self._out = None
+
+    def _end_partition(self, marker):
+        self._close_member()
+        if self.error is not None:
+            return
+        self._fileobj.flush()
+        os.fsync(self._fileobj.fileno())
+        self._on_partition_done(marker, self._fileobj.tell())
+
+
+def export_collection(collection,  # type: Collection
+                      path,  # type: str
+                      scan_type=None,  # type: Optional[Union[RangeScan, PrefixScan, SamplingScan]]
+                      scan_options=None,  # type: Optional[ScanOptions]
+                      batch_size=None,  # type: Optional[int]
+                      num_partitions=None,  # type: Optional[int]
+                      split_points=None,  # type: Optional[List[Union[str, bytes]]]
+                      compress=None,  # type: Optional[bool]
+                      compresslevel=None,  # type: Optional[int]
+                      checkpoint_path=None,  # type: Optional[str]
+                      progress=None,  # type: Optional[Callable[[BulkProgress], None]]
+                      progress_interval=None,  # type: Optional[timedelta]
+                      ) -> BulkProgress:
+    """Exports the documents of a collection to a newline-delimited JSON (NDJSON) file.
+
+    Each line holds one document.  JSON documents are written as ``{"id": <key>, "value": <document>}``, with the
+    document's JSON copied into the line without being deserialized.  Other documents (binary, strings, compressed
+    documents, etc.) are written as ``{"id": <key>, "flags": <flags>, "value_base64": <raw bytes>}`` so they are
+    imported unchanged.  Document expiry is not exported.
+
+    The scan is split into ``num_partitions`` key sub-ranges (see :meth:`~couchbase.kv_range_scan.RangeScan.partition`)
+    that are scanned in turn.  Scanned lines are handed to a writer thread in batches of ``batch_size`` documents
+    through a bounded queue, so file I/O and compression overlap the scan.  When a ``checkpoint_path`` is provided,
+    the checkpoint is updated once each partition is durably written and a later call with the same arguments
+    resumes the export after the last completed partition.
+
+    Args:
+        collection (:class:`~couchbase.collection.Collection`): The collection to export.
+        path (str): The file to write.  Overwritten unless the export is resumed from a checkpoint.
+        scan_type (Union[:class:`~couchbase.kv_range_scan.RangeScan`, :class:`~couchbase.kv_range_scan.PrefixScan`, :class:`~couchbase.kv_range_scan.SamplingScan`], optional):
+            The documents to export.  Defaults to the whole collection.  A SamplingScan cannot be partitioned, so it
+            is exported in one go and cannot be checkpointed.
+        scan_options (:class:`~couchbase.options.ScanOptions`, optional): Options for the scans.
+        batch_size (int, optional): The number of documents per batch handed to the writer.  Defaults to 1000.
+        num_partitions (int, optional): The number of key sub-ranges to split the scan into.  Defaults to 16.
+        split_points (List[Union[str, bytes]], optional): Explicit keys to split the scan at, instead of
+            num_partitions.
+        compress (bool, optional): Set to True to gzip-compress the file.  Defaults to True if the path ends with
+            ``.gz``.
+        compresslevel (int, optional): The gzip compression level.  Defaults to 6.
+        checkpoint_path (str, optional): A file to record the export's progress in, in order to resume it.
+        progress (Callable[[:class:`.BulkProgress`], None], optional): Called periodically, and once the export
+            completes, with the export's progress.
+        progress_interval (timedelta, optional): How often to call ``progress``.  Defaults to 5 seconds.
+
+    Returns:
+        :class:`.BulkProgress`: The final progress of the export.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If an argument is invalid or the checkpoint does
+            not match the export.
+
+    Examples:
+
+        Export a collection to a compressed file::
+
+            from couchbase.bulk import export_collection
+
+            collection = bucket.scope('inventory').collection('airline')
+            res = export_collection(collection, 'airline.ndjson.gz', checkpoint_path='airline.ckpt')
+            print(f'Exported {res.documents} documents at {res.docs_per_second:.0f} docs/s')
+
+    """  # noqa: E501
+    if not isinstance(collection, Collection):
+        raise InvalidArgumentException('collection must be a couchbase.collection.Collection.')
+    batch_size = _validate_positive_int('batch_size', batch_size, DEFAULT_BATCH_SIZE)
+    partitions = _get_export_partitions(scan_type, num_partitions, split_points, checkpoint_path)
+    compresslevel = _get_export_compresslevel(path, compress, compresslevel)
+    path = os.path.abspath(path)
+    state = _load_export_state(checkpoint_path, path, len(partitions))
+
+    result = BulkProgress('export',
+                          documents=state['documents'],
+                          bytes=state['bytes'],
+                          partitions_completed=state['completed'],
+                          num_partitions=len(partitions))
+    reporter = _ProgressReporter(result, progress, progress_interval)
+    # runs on the writer thread once a partition is durably written
+    on_partition_done = partial(_on_export_partition_done, state, result, checkpoint_path)
+
+    scan_opts = (scan_options,) if scan_options is not None else ()
+    with open(path, 'r+b' if state['offset'] else 'wb') as fileobj:
+        fileobj.seek(state['offset'])
+        fileobj.truncate()
+        writer = _ExportWriter(fileobj, compresslevel, on_partition_done, DEFAULT_QUEUE_SIZE)
+        writer.start()
+        try:
+            for idx in range(state['completed'], len(partitions)):
+                rows = collection.scan(partitions[idx], *scan_opts, transcoder=_PASSTHROUGH_TRANSCODER).rows()
+                _export_partition(rows, writer, batch_size, result, reporter)
+                writer.queue.put((_ExportWriter.PARTITION_DONE, (idx, result.documents, result.bytes)))
+                reporter.maybe_report()
+        finally:
+            writer.queue.put(None)
+            writer.join()
+        if writer.error is not None:
+            raise writer.error
+
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return reporter.finish()
+
+
+def _get_export_partitions(scan_type,  # type: Optional[Union[RangeScan, PrefixScan, SamplingScan]]
+                           num_partitions,  # type: Optional[int]
+                           split_points,  # type: Optional[List[Union[str, bytes]]]
+                           checkpoint_path,  # type: Optional[str]
+                           ) -> List[Union[RangeScan, PrefixScan, SamplingScan]]:
+    """**INTERNAL**
+
+    Returns the scans the export is split into.
+    """
+    if split_points is None:
+        num_partitions = _validate_positive_int('num_partitions', num_partitions, DEFAULT_NUM_PARTITIONS)
+    if scan_type is None:
+        scan_type = RangeScan()
+    if isinstance(scan_type, SamplingScan):
+        if checkpoint_path is not None:
+            raise InvalidArgumentException('A SamplingScan export cannot be checkpointed.')
+        return [scan_type]
+    if isinstance(scan_type, (RangeScan, PrefixScan)):
+        return scan_type.partition(num_partitions=num_partitions, split_points=split_points)
+    raise InvalidArgumentException('scan_type must be Union[RangeScan, PrefixScan, SamplingScan]')
+
+
+def _get_export_compresslevel(path,  # type: str
+                              compress,  # type: Optional[bool]
+                              compresslevel,  # type: Optional[int]
+                              ) -> Optional[int]:
+    """**INTERNAL**
+
+    Returns the gzip compression level of the export, None if the file is not compressed.
+    """
+    if compress is None:
+        compress = path.endswith('.gz')
+    if not compress:
+        return None
+    return DEFAULT_COMPRESS_LEVEL if compresslevel is None else compresslevel
+
+
+def _load_export_state(checkpoint_path,  # type: Optional[str]
+                       path,  # type: str
+                       num_partitions,  # type: int
+                       ) -> Dict[str, Any]:
+    """**INTERNAL**
+
+    Returns the state of the export, loaded from the checkpoint when resuming.
+    """
+    state = _load_checkpoint(checkpoint_path, 'export', path)
+    if state is None:
+        return {'operation': 'export', 'path': path, 'num_partitions': num_partitions,
+                'completed': 0, 'offset': 0, 'documents': 0, 'bytes': 0}
+    if state.get('num_partitions') != num_partitions:
+        raise InvalidArgumentException(f'Checkpoint {checkpoint_path} was created with a different partitioning.')
+    if os.path.getsize(path) < state['offset']:
+        raise InvalidArgumentException(f'{path} is shorter than its checkpoint, unable to resume the export.')
+    return state
+
+
+def _on_export_partition_done(state,  # type: Dict[str, Any]
+                              result,  # type: BulkProgress
+                              checkpoint_path,  # type: Optional[str]
+                              marker,  # type: Tuple[int, int, int]
+                              offset,  # type: int
+                              ) -> None:
+    idx, documents, num_bytes = marker
+    state.update(completed=idx + 1, offset=offset, documents=documents, bytes=num_bytes)
+    result.partitions_completed = idx + 1
+    if checkpoint_path is not None:
+        _save_checkpoint(checkpoint_path, state)
+
+
+def _export_partition(rows,  # type: Iterable[Any]
+                      writer,  # type: _ExportWriter
+                      batch_size,  # type: int
+                      result,  # type: BulkProgress
+                      reporter,  # type: _ProgressReporter
+                      ) -> None:
+    """**INTERNAL**
+
+    Hands the scanned rows of a partition to the writer in batches of ``batch_size`` lines.
+    """
+    batch = []
+    for row in rows:
+        batch.append(_export_line(row.id, row.value, row.flags))
+        if len(batch) == batch_size:
+            _put_export_batch(writer, batch, result)
+            batch = []
+            reporter.maybe_report()
+    if batch:
+        _put_export_batch(writer, batch, result)
+
+
+def _put_export_batch(writer,  # type: _ExportWriter
+                      batch,  # type: List[bytes]
+                      progress,  # type: BulkProgress
+                      ) -> None:
+    if writer.error is not None:
+        raise writer.error
+    data = b''.join(batch)
+    writer.queue.put(data)
+    progress.documents += len(batch)
+    progress.bytes += len(data)
+
+
+class _ImportReader(Thread):
+    """**INTERNAL**
+
+    Reads (and decompresses) the input file and parses it into batches off of the upserting thread.  Queues
+    ``(docs, num_lines, num_bytes, num_failed)`` tuples, ``None`` once the file is exhausted.
+    """
+
+    def __init__(self,
+                 fileobj,  # type: BinaryIO
+                 skip_lines,  # type: int
+                 batch_size,  # type: int
+                 queue_size,  # type: int
+                 ):
+        super().__init__(name='pycbc-bulk-import-reader', daemon=True)
+        self._fileobj = fileobj
+        self._skip_lines = skip_lines
+        self._batch_size = batch_size
+        self.queue = Queue(maxsize=queue_size)
+        self.error = None
+        self._stopped = False
+
+    def stop(self):
+        self._stopped = True
+        # unblock a pending put
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def run(self):
+        try:
+            self._read()
+        except Exception as ex:
+            self.error = ex
+        finally:
+            self.queue.put(None)
+
+    def _read(self):
+        lines = iter(self._fileobj)
+        for _ in range(self._skip_lines):
+            if next(lines, None) is None:
+                return
+
+        docs, num_lines, num_bytes, num_failed = {}, 0, 0, 0
+        for line in lines:
+            if self._stopped:
+                return
+            num_lines += 1
+            num_bytes += len(line)
+            if line.strip():
+                try:
+                    key, value = _parse_line(line)
+                    docs[key] = value
+                except (ValueError, TypeError) as ex:
+                    num_failed += 1
+                    log.warning('Unable to parse line %s of the import: %s', self._skip_lines + num_lines, ex)
+            if len(docs) + num_failed >= self._batch_size:
+                self.queue.put((docs, num_lines, num_bytes, num_failed))
+                self._skip_lines += num_lines
+                docs, num_lines, num_bytes, num_failed = {}, 0, 0, 0
+        if num_lines:
+            self.queue.put((docs, num_lines, num_bytes, num_failed))
+
+
+def import_collection(collection,  # type: Collection
+                      path,  # type: str
+                      upsert_options=None,  # type: Optional[UpsertMultiOptions]
+                      batch_size=None,  # type: Optional[int]
+                      max_in_flight=None,  # type: Optional[int]
+                      compress=None,  # type: Optional[bool]
+                      checkpoint_path=None,  # type: Optional[str]
+                      progress=None,  # type: Optional[Callable[[BulkProgress], None]]
+                      progress_interval=None,  # type: Optional[timedelta]
+                      ) -> BulkProgress:
+    """Imports the documents of a newline-delimited JSON (NDJSON) file, as written by :func:`export_collection`,
+    into a collection.
+
+    Each line must be a JSON object with an ``id`` and either a ``value`` (a JSON document) or a ``value_base64``
+    (the document's raw bytes) and ``flags``.  Lines in the layout written by :func:`export_collection` (starting
+    with the ``id`` immediately followed by the ``value`` as the last field) are sliced rather than parsed, so JSON
+    documents are stored without being deserialized and serialized again.  Lines that
+    cannot be parsed and documents that fail to be upserted are counted as failed (and logged) rather than stopping
+    the import.
+
+    A reader thread reads, decompresses and parses the file into batches of ``batch_size`` documents through a
+    bounded queue, each batch is upserted with :meth:`~couchbase.collection.Collection.upsert_multi` with at most
+    ``max_in_flight`` batches outstanding at once.  When a ``checkpoint_path`` is provided, the checkpoint records
+    the number of lines for which every earlier batch has completed and a later call with the same arguments resumes
+    the import after them.
+
+    Args:
+        collection (:class:`~couchbase.collection.Collection`): The collection to import into.
+        path (str): The file to read.
+        upsert_options (:class:`~couchbase.options.UpsertMultiOptions`, optional): Options for the upserts.  The
+            ``transcoder`` and ``return_exceptions`` options are ignored.
+        batch_size (int, optional): The number of documents per upsert_multi.  Defaults to 1000.
+        max_in_flight (int, optional): The maximum number of batches being upserted at once.  Defaults to 8.
+        compress (bool, optional): Whether the file is gzip-compressed.  Detected from the file's content if not
+            provided.
+        checkpoint_path (str, optional): A file to record the import's progress in, in order to resume it.
+        progress (Callable[[:class:`.BulkProgress`], None], optional): Called periodically, and once the import
+            completes, with the import's progress.
+        progress_interval (timedelta, optional): How often to call ``progress``.  Defaults to 5 seconds.
+
+    Returns:
+        :class:`.BulkProgress`: The final progress of the import.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If an argument is invalid or the checkpoint does
+            not match the import.
+
+    Examples:
+
+        Import a previously exported collection::
+
+            from couchbase.bulk import import_collection
+
+            collection = bucket.scope('inventory').collection('airline')
+            res = import_collection(collection, 'airline.ndjson.gz', checkpoint_path='airline-import.ckpt')
+            print(f'Imported {res.documents} documents ({res.failed} failed)')
+
+    """
+    if not isinstance(collection, Collection):
+        raise InvalidArgumentException('collection must be a couchbase.collection.Collection.')
+    batch_size = _validate_positive_int('batch_size', batch_size, DEFAULT_BATCH_SIZE)
+    max_in_flight = _validate_positive_int('max_in_flight', max_in_flight, DEFAULT_MAX_IN_FLIGHT)
+
+    path = os.path.abspath(path)
+    state = _load_checkpoint(checkpoint_path, 'import', path)
+    if state is None:
+        state = {'operation': 'import', 'path': path, 'lines': 0, 'documents': 0, 'failed': 0, 'bytes': 0}
+
+    result = BulkProgress('import', documents=state['documents'], failed=state['failed'], bytes=state['bytes'])
+    reporter = _ProgressReporter(result, progress, progress_interval)
+    upsert_opts = (upsert_options,) if upsert_options is not None else ()
+    upsert_batch = partial(_upsert_import_batch, collection, upsert_opts)
+    tracker = _ImportBatchTracker(state, result, checkpoint_path)
+
+    with _open_for_read(path, compress) as fileobj:
+        reader = _ImportReader(fileobj, state['lines'], batch_size, DEFAULT_QUEUE_SIZE)
+        reader.start()
+        in_flight = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='pycbc-bulk-import') as executor:
+                _run_import_batches(reader, executor, upsert_batch, in_flight, max_in_flight, tracker, reporter)
+        finally:
+            for ft in in_flight:
+                ft.cancel()
+            reader.stop()
+            reader.join()
+        if reader.error is not None:
+            raise reader.error
+
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return reporter.finish()
+
+
+def _upsert_import_batch(collection,  # type: Collection
+                         upsert_opts,  # type: Tuple[Any, ...]
+                         docs,  # type: Dict[str, Tuple[bytes, int]]
+                         ) -> Optional[MultiMutationResult]:
+    if not docs:
+        return None
+    return collection.upsert_multi(docs,
+                                   *upsert_opts,
+                                   transcoder=_PASSTHROUGH_TRANSCODER,
+                                   return_exceptions=True)
+
+
+def _run_import_batches(reader,  # type: _ImportReader
+                        executor,  # type: ThreadPoolExecutor
+                        upsert_batch,  # type: Callable[[Dict[str, Tuple[bytes, int]]], Any]
+                        in_flight,  # type: Dict[Any, Tuple[int, Tuple[Any, ...]]]
+                        max_in_flight,  # type: int
+                        tracker,  # type: _ImportBatchTracker
+                        reporter,  # type: _ProgressReporter
+                        ) -> None:
+    """**INTERNAL**
+
+    Upserts the reader's batches with at most ``max_in_flight`` batches outstanding.
+    """
+    seq = 0
+    while True:
+        batch = reader.queue.get()
+        if batch is None:
+            break
+        if len(in_flight) >= max_in_flight:
+            _complete_import_batches(in_flight, tracker.on_batch_done)
+        in_flight[executor.submit(upsert_batch, batch[0])] = (seq, batch)
+        seq += 1
+        reporter.maybe_report()
+    while in_flight:
+        _complete_import_batches(in_flight, tracker.on_batch_done)
+        reporter.maybe_report()
+
+
+class _ImportBatchTracker:
+    """**INTERNAL**
+
+    Collects the results of the import's batches.  Batches complete out of order, the checkpoint only moves past a
+    batch once every earlier batch is done.  A batch that completes ahead of an earlier batch is imported again on
+    resume, so its counts are only added to the checkpoint once the checkpoint moves past it.
+    """
+
+    def __init__(self,
+                 state,  # type: Dict[str, Any]
+                 result,  # type: BulkProgress
+                 checkpoint_path,  # type: Optional[str]
+                 ):
+        self._state = state
+        self._result = result
+        self._checkpoint_path = checkpoint_path
+        self._completed = {}  # type: Dict[int, Tuple[int, int, int, int]]
+        self._next_seq = 0
+
+    def on_batch_done(self,
+                      seq,  # type: int
+                      batch,  # type: Tuple[Any, ...]
+                      res,  # type: Optional[MultiMutationResult]
+                      ) -> None:
+        docs, num_lines, num_bytes, num_failed = batch
+        failed = num_failed + self._count_failed(res)
+        documents = len(docs) + num_failed - failed
+        self._result.documents += documents
+        self._result.failed += failed
+        self._result.bytes += num_bytes
+        self._completed[seq] = (num_lines, documents, failed, num_bytes)
+        if self._advance() and self._checkpoint_path is not None:
+            _save_checkpoint(self._checkpoint_path, self._state)
+
+    def _count_failed(self, res  # type: Optional[MultiMutationResult]
+                      ) -> int:
+        if res is None:
+            return 0
+        for key, exc in res.exceptions.items():
+            log.warning('Unable to import document %s: %s', key, exc)
+        return len(res.exceptions)
+
+    def _advance(self) -> bool:
+        advanced = False
+        while self._next_seq in self._completed:
+            num_lines, documents, failed, num_bytes = self._completed.pop(self._next_seq)
+            self._state['lines'] += num_lines
+            self._state['documents'] += documents
+            self._state['failed'] += failed
+            self._state['bytes'] += num_bytes
+            self._next_seq += 1
+            advanced = True
+        return advanced
+
+
+def _complete_import_batches(in_flight,  # type: Dict[Any, Tuple[int, Tuple[Any, ...]]]
+                             on_batch_done,  # type: Callable[[int, Tuple[Any, ...], Any], None]
+                             ) -> None:
+    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+    for ft in done:
+        seq, batch = in_flight.pop(ft)
+        on_batch_done(seq, batch, ft.result())
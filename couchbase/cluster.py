@@ -19,9 +19,12 @@ import time
 from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
-                    Dict)
+                    Dict,
+                    Iterable,
+                    List,
+                    Tuple)
 
-from couchbase.analytics import AnalyticsQuery, AnalyticsRequest
+from couchbase._utils import lazy_import
 from couchbase.bucket import Bucket
 from couchbase.diagnostics import ClusterState, ServiceType
 from couchbase.exceptions import ErrorMapper, UnAmbiguousTimeoutException
@@ -29,12 +32,6 @@ from couchbase.exceptions import exception as BaseCouchbaseException
 from couchbase.logic import BlockingWrapper
 from couchbase.logic.cluster import ClusterLogic
 from couchbase.logic.supportability import Supportability
-from couchbase.management.analytics import AnalyticsIndexManager
-from couchbase.management.buckets import BucketManager
-from couchbase.management.eventing import EventingFunctionManager
-from couchbase.management.queries import QueryIndexManager
-from couchbase.management.search import SearchIndexManager
-from couchbase.management.users import UserManager
 from couchbase.n1ql import N1QLQuery, N1QLRequest
 from couchbase.options import PingOptions, forward_args
 from couchbase.result import (AnalyticsResult,
@@ -43,19 +40,46 @@ from couchbase.result import (AnalyticsResult,
                               PingResult,
                               QueryResult,
                               SearchResult)
-from couchbase.search import (FullTextSearchRequest,
-                              SearchQueryBuilder,
-                              SearchRequest)
-from couchbase.transactions import Transactions
 
 if TYPE_CHECKING:
+    from couchbase.management.analytics import AnalyticsIndexManager
+    from couchbase.management.buckets import BucketManager
+    from couchbase.management.eventing import EventingFunctionManager
+    from couchbase.management.queries import QueryIndexManager
+    from couchbase.management.search import SearchIndexManager
+    from couchbase.management.users import UserManager
     from couchbase.options import (AnalyticsOptions,
                                    ClusterOptions,
                                    DiagnosticsOptions,
                                    QueryOptions,
+                                   SearchManyOptions,
                                    SearchOptions,
                                    WaitUntilReadyOptions)
-    from couchbase.search import SearchQuery
+    from couchbase.search import (SearchQuery,
+                                  SearchRequest,
+                                  SearchRow)
+    from couchbase.transactions import Transactions
+
+# The management APIs, search, analytics and transactions are imported on first use, the names below remain
+# importable from this module.
+_LAZY_IMPORTS = {
+    'AnalyticsIndexManager': 'couchbase.management.analytics',
+    'AnalyticsQuery': 'couchbase.analytics',
+    'AnalyticsRequest': 'couchbase.analytics',
+    'BucketManager': 'couchbase.management.buckets',
+    'EventingFunctionManager': 'couchbase.management.eventing',
+    'FullTextSearchRequest': 'couchbase.search',
+    'QueryIndexManager': 'couchbase.management.queries',
+    'SearchIndexManager': 'couchbase.management.search',
+    'SearchQueryBuilder': 'couchbase.search',
+    'SearchRequest': 'couchbase.search',
+    'Transactions': 'couchbase.transactions',
+    'UserManager': 'couchbase.management.users',
+}
+
+
+def __getattr__(name):
+    return lazy_import(__name__, name, _LAZY_IMPORTS)
 
 
 class Cluster(ClusterLogic):
@@ -119,6 +143,7 @@ class Cluster(ClusterLogic):
                 perform transactions on this cluster.
         """
         if not self._transactions:
+            from couchbase.transactions import Transactions
             self._transactions = Transactions(self, self._transaction_config)
         return self._transactions
 
@@ -473,6 +498,7 @@ class Cluster(ClusterLogic):
         # also does not specify an analytics_timeout we set the streaming_timeout to
         # couchbase::core::timeout_defaults::analytics_timeout when the streaming object is created in the bindings.
         streaming_timeout = self.streaming_timeouts.get('analytics_timeout', None)
+        from couchbase.analytics import AnalyticsQuery, AnalyticsRequest
         query = AnalyticsQuery.create_query_object(statement, *options, **kwargs)
         return AnalyticsResult(AnalyticsRequest.generate_analytics_request(self.connection,
                                                                            query.params,
@@ -577,6 +603,7 @@ class Cluster(ClusterLogic):
         # also does not specify a search_timeout we set the streaming_timeout to
         # couchbase::core::timeout_defaults::search_timeout when the streaming object is created in the bindings.
         streaming_timeout = self.streaming_timeouts.get('search_timeout', None)
+        from couchbase.search import FullTextSearchRequest, SearchQueryBuilder
         query = SearchQueryBuilder.create_search_query_object(index, query, *options, **kwargs)
         return SearchResult(FullTextSearchRequest.generate_search_request(self.connection,
                                                                           query.as_encodable(),
@@ -679,12 +706,76 @@ class Cluster(ClusterLogic):
         # also does not specify a search_timeout we set the streaming_timeout to
         # couchbase::core::timeout_defaults::search_timeout when the streaming object is created in the bindings.
         streaming_timeout = self.streaming_timeouts.get('search_timeout', None)
+        from couchbase.search import FullTextSearchRequest, SearchQueryBuilder
         query = SearchQueryBuilder.create_search_query_from_request(index, request, *options, **kwargs)
         return SearchResult(FullTextSearchRequest.generate_search_request(self.connection,
                                                                           query.as_encodable(),
                                                                           default_serializer=self.default_serializer,
                                                                           streaming_timeout=streaming_timeout))
 
+    def search_many(self,
+                    requests,  # type: Iterable[Tuple[Any, ...]]
+                    *options,  # type: SearchManyOptions
+                    **kwargs,  # type: Dict[str, Any]
+                    ) -> List[SearchRow]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Executes several searches against the cluster concurrently and merges their rows.
+
+        The rows of each search are merged as they are streamed.  Once the top ``limit`` rows can no longer change,
+        the merged rows are returned without waiting for the remaining rows of each search.
+
+        .. note::
+            Merging by :attr:`~couchbase.search.SearchMergeStrategy.SORT` requires every search to use the same sort
+            and only supports sorting by score and by document ID, as the SDK does not receive the values of other
+            sort fields.  :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION` merges searches of
+            any sort by the rank of each row within its search.
+
+        Args:
+            requests (Iterable[Tuple[Any, ...]]): The searches to execute.  Each search is either an
+                ``(index, SearchRequest)`` or ``(index, SearchRequest, SearchOptions)`` tuple.
+            options (:class:`~couchbase.options.SearchManyOptions`): Optional parameters for merging the searches.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.SearchManyOptions`
+
+        Returns:
+            List[:class:`~couchbase.search.SearchRow`]: The top ``limit`` merged rows.  When merged by
+            :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION`, the score of each row is its fused
+            score over the rows received before the merge stopped.  The merge stops as soon as the rows' order is
+            settled, so the score is a lower bound of the row's fused score over every row of the searches.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the searches cannot be merged with the
+                provided merge strategy.
+
+        Examples:
+
+            Merge a text search and a vector search::
+
+                import couchbase.search as search
+                from couchbase.options import SearchManyOptions
+                from couchbase.vector_search import VectorQuery, VectorSearch
+
+                # ... other code ...
+
+                text_request = search.SearchRequest.create(search.MatchQuery('beach'))
+                vector_request = search.SearchRequest.create(VectorSearch.from_vector_query(VectorQuery('vector_field',
+                                                                                                        vector)))
+                rows = cluster.search_many([('travel-sample-index', text_request),
+                                            ('travel-sample-vector-index', vector_request)],
+                                           SearchManyOptions(limit=10,
+                                                             merge_strategy=search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION))
+
+                for row in rows:
+                    print(f'Found row: {row}')
+        """  # noqa: E501
+        from couchbase.logic.search import _get_search_many_args
+        from couchbase.search import _search_many
+        searches, merge_args = _get_search_many_args(requests, *options, **kwargs)
+        results = [self.search(index, request, *search_opts, **search_kwargs)
+                   for index, request, search_opts, search_kwargs in searches]
+        return _search_many(results, merge_args)
+
     def buckets(self) -> BucketManager:
         """
         Get a :class:`~couchbase.management.buckets.BucketManager` which can be used to manage the buckets
@@ -694,6 +785,7 @@ class Cluster(ClusterLogic):
             :class:`~couchbase.management.buckets.BucketManager`: A :class:`~couchbase.management.buckets.BucketManager` instance.
         """  # noqa: E501
         # TODO:  AlreadyShutdownException?
+        from couchbase.management.buckets import BucketManager
         return BucketManager(self.connection)
 
     def users(self) -> UserManager:
@@ -705,6 +797,7 @@ class Cluster(ClusterLogic):
             :class:`~couchbase.management.users.UserManager`: A :class:`~couchbase.management.users.UserManager` instance.
         """  # noqa: E501
         # TODO:  AlreadyShutdownException?
+        from couchbase.management.users import UserManager
         return UserManager(self.connection)
 
     def query_indexes(self) -> QueryIndexManager:
@@ -716,6 +809,7 @@ class Cluster(ClusterLogic):
             :class:`~couchbase.management.queries.QueryIndexManager`: A :class:`~couchbase.management.queries.QueryIndexManager` instance.
         """  # noqa: E501
         # TODO:  AlreadyShutdownException?
+        from couchbase.management.queries import QueryIndexManager
         return QueryIndexManager(self.connection)
 
     def analytics_indexes(self) -> AnalyticsIndexManager:
@@ -727,6 +821,7 @@ class Cluster(ClusterLogic):
             :class:`~couchbase.management.analytics.AnalyticsIndexManager`: An :class:`~couchbase.management.analytics.AnalyticsIndexManager` instance.
         """  # noqa: E501
         # TODO:  AlreadyShutdownException?
+        from couchbase.management.analytics import AnalyticsIndexManager
         return AnalyticsIndexManager(self.connection)
 
     def search_indexes(self) -> SearchIndexManager:
@@ -739,6 +834,7 @@ class Cluster(ClusterLogic):
 
         """  # noqa: E501
         # TODO:  AlreadyShutdownException?
+        from couchbase.management.search import SearchIndexManager
         return SearchIndexManager(self.connection)
 
     def eventing_functions(self) -> EventingFunctionManager:
@@ -755,6 +851,7 @@ class Cluster(ClusterLogic):
 
         """  # noqa: E501
         # TODO:  AlreadyShutdownException?
+        from couchbase.management.eventing import EventingFunctionManager
         return EventingFunctionManager(self.connection)
 
     @staticmethod
@@ -20,6 +20,7 @@ from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
                     Iterable,
+                    Iterator,
                     List,
                     Optional,
                     Tuple,
@@ -37,12 +38,9 @@ from couchbase.exceptions import (DocumentExistsException,
                                   QueueEmpty)
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.kv_range_scan import RangeScanRequest
-from couchbase.logic import (BlockingWrapper,
-                             decode_replicas,
-                             decode_value)
+from couchbase.logic import BlockingWrapper, decode_replicas
 from couchbase.logic.collection import CollectionLogic
 from couchbase.logic.supportability import Supportability
-from couchbase.management.queries import CollectionQueryIndexManager
 from couchbase.options import (AppendMultiOptions,
                                DecrementMultiOptions,
                                ExistsMultiOptions,
@@ -60,11 +58,8 @@ from couchbase.options import (AppendMultiOptions,
                                TouchMultiOptions,
                                UnlockMultiOptions,
                                UpsertMultiOptions,
-                               forward_args,
-                               get_valid_multi_args)
-from couchbase.pycbc_core import (binary_multi_operation,
-                                  kv_multi_operation,
-                                  operations)
+                               forward_args)
+from couchbase.pycbc_core import kv_multi_operation, operations
 from couchbase.result import (CounterResult,
                               ExistsResult,
                               GetReplicaResult,
@@ -88,13 +83,14 @@ from couchbase.subdocument import get as subdoc_get
 from couchbase.subdocument import remove as subdoc_remove
 from couchbase.subdocument import replace
 from couchbase.subdocument import upsert as subdoc_upsert
-from couchbase.transcoder import Transcoder
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
     from couchbase._utils import JSONType
     from couchbase.kv_range_scan import ScanType
+    from couchbase.management.queries import CollectionQueryIndexManager
+    from couchbase.near_cache import NearCache
     from couchbase.options import (AppendOptions,
                                    DecrementOptions,
                                    ExistsOptions,
@@ -106,17 +102,19 @@ if TYPE_CHECKING:
                                    InsertOptions,
                                    LookupInAllReplicasOptions,
                                    LookupInAnyReplicaOptions,
+                                   LookupInMultiOptions,
                                    LookupInOptions,
+                                   MutateInMultiOptions,
                                    MutateInOptions,
-                                   MutationMultiOptions,
-                                   NoValueMultiOptions,
                                    PrependOptions,
                                    RemoveOptions,
                                    ReplaceOptions,
                                    TouchOptions,
                                    UnlockOptions,
                                    UpsertOptions)
-    from couchbase.result import MultiResultType
+    from couchbase.result import (MultiLookupInResult,
+                                  MultiMutateInResult,
+                                  MultiResultType)
     from couchbase.subdocument import Spec
 
 
@@ -169,6 +167,10 @@ class Collection(CollectionLogic):
         """
 
         final_args = forward_args(kwargs, *opts)
+        near_cache = self._near_cache
+        if near_cache is not None and near_cache.is_cacheable(final_args):
+            return self._get_near_cached(near_cache, key, **final_args)
+
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -176,6 +178,27 @@ class Collection(CollectionLogic):
 
         return self._get_internal(key, **final_args)
 
+    def _get_near_cached(self,
+                         near_cache,  # type: NearCache
+                         key,  # type: str
+                         **kwargs,  # type: Dict[str, Any]
+                         ) -> GetResult:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`Collection.get` instead.
+        """
+        res = near_cache.get(key)
+        if res is not None:
+            return res
+
+        token = near_cache.begin_load(key)
+        res = None
+        try:
+            res = self._get_internal(key, transcoder=self.default_transcoder, **kwargs)
+        finally:
+            near_cache.end_load(key, token, res)
+        return res
+
     @BlockingWrapper.block_and_decode(GetResult)
     def _get_internal(
         self,
@@ -188,6 +211,20 @@ class Collection(CollectionLogic):
         """
         return super().get(key, **kwargs)
 
+    def refresh_near_cache(self) -> None:
+        """Verifies the entries of the collection's near cache against the server.  Entries whose CAS is
+        unchanged have their staleness window extended, entries for documents that have changed are re-fetched
+        and entries for documents that no longer exist are dropped.
+
+        This is done periodically in the background if the near cache was created with a ``refresh_interval``.
+        If a near cache has not been enabled, this is a no-op.
+
+        Raises:
+            :class:`~couchbase.exceptions.CouchbaseException`: If the CAS of the cached documents could not be
+                verified.  Entries that could not be verified are left to expire.
+        """
+        self._refresh_near_cache()
+
     def get_any_replica(self,
                         key,  # type: str
                         *opts,  # type: GetAnyReplicaOptions
@@ -1864,79 +1901,6 @@ class Collection(CollectionLogic):
         """
         return self.list_size(key)
 
-    def _get_multi_mutation_transcoded_op_args(
-        self,
-        keys_and_docs,  # type: Dict[str, JSONType]
-        *opts,  # type: MutationMultiOptions
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool]:
-
-        if not isinstance(keys_and_docs, dict):
-            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
-
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
-
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-        per_key_args = final_args.pop('per_key_options', None)
-        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
-        op_args = {}
-        for key, value in keys_and_docs.items():
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                key_transcoder = per_key_args.pop('transcoder', op_transcoder)
-                op_args[key].update(per_key_args[key])
-                transcoded_value = key_transcoder.encode_value(value)
-            else:
-                transcoded_value = op_transcoder.encode_value(value)
-            op_args[key]['value'] = transcoded_value
-
-        if isinstance(opts_type, ReplaceMultiOptions):
-            for k, v in op_args.items():
-                expiry = v.get('expiry', None)
-                preserve_expiry = v.get('preserve_expiry', False)
-                if expiry and preserve_expiry is True:
-                    raise InvalidArgumentException(
-                        message=("The expiry and preserve_expiry options cannot "
-                                 f"both be set for replace operations.  Multi-op key: {k}.")
-                    )
-
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions
-
-    def _get_multi_op_args(
-        self,
-        keys,  # type: List[str]
-        *opts,  # type: NoValueMultiOptions
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool, Dict[str, Transcoder]]:
-        if not isinstance(keys, list):
-            raise InvalidArgumentException(message='Expected keys to be a list.')
-
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
-
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
-        per_key_args = final_args.pop('per_key_options', None)
-        op_args = {}
-        key_transcoders = {}
-        for key in keys:
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                key_transcoder = per_key_args.pop('transcoder', op_transcoder)
-                key_transcoders[key] = key_transcoder
-                op_args[key].update(per_key_args[key])
-            else:
-                key_transcoders[key] = op_transcoder
-
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions, key_transcoders
-
     def get_multi(self,
                   keys,  # type: List[str]
                   *opts,  # type: GetMultiOptions
@@ -2004,27 +1968,60 @@ class Collection(CollectionLogic):
 
 
         """
-        op_args, return_exceptions, transcoders = self._get_multi_op_args(keys,
-                                                                          *opts,
-                                                                          opts_type=GetMultiOptions,
-                                                                          **kwargs)
-        op_type = operations.GET.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        for k, v in res.raw_result.items():
-            if k == 'all_okay':
-                continue
-            if isinstance(v, CouchbaseBaseException):
-                continue
-            value = v.raw_result.get('value', None)
-            flags = v.raw_result.get('flags', None)
-            tc = transcoders[k]
-            v.raw_result['value'] = decode_value(tc, value, flags)
+        return super().get_multi(keys, *opts, **kwargs)
+
+    def get_multi_iter(self,
+                       keys,  # type: Iterable[str]
+                       *opts,  # type: GetMultiOptions
+                       chunk_size=None,  # type: Optional[int]
+                       max_in_flight=None,  # type: Optional[int]
+                       **kwargs,  # type: Dict[str, Any]
+                       ) -> Iterator[Tuple[str, Union[GetResult, CouchbaseBaseException]]]:
+        """For each key in the provided iterable, retrieve the document associated with the key.  Unlike
+        :meth:`.get_multi`, the keys are consumed lazily and submitted in chunks of ``chunk_size`` keys with at
+        most ``max_in_flight`` operations outstanding at once.  Results are yielded as each chunk completes, so
+        memory use is bounded by the window rather than by the number of keys.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
 
-        return MultiGetResult(res, return_exceptions)
+        Args:
+            keys (Iterable[str]): The keys to use for the multiple get operations.  Can be any iterable,
+                including a generator.
+            opts (:class:`~couchbase.options.GetMultiOptions`): Optional parameters for this operation.
+            chunk_size (int, optional): The number of keys submitted per chunk.  Defaults to 100.
+            max_in_flight (int, optional): The maximum number of operations outstanding at once.  Defaults to
+                1000.  Chunks beyond the window are not read from ``keys`` until a chunk completes.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.GetMultiOptions`
+
+        Returns:
+            Iterator[Tuple[str, Union[:class:`~couchbase.result.GetResult`, Exception]]]: An iterator of
+            ``(key, result)`` pairs.  Operations that fail yield the exception as the result (the
+            ``return_exceptions`` option is ignored).
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If ``chunk_size`` or ``max_in_flight`` is
+                not a positive int.
+
+        Examples:
+
+            Get every key produced by a generator::
+
+                collection = bucket.default_collection()
+                keys = (f'doc{i}' for i in range(1000000))
+                for key, res in collection.get_multi_iter(keys, chunk_size=500, max_in_flight=5000):
+                    if isinstance(res, Exception):
+                        print(f'Failed to get {key}: {res}')
+                    else:
+                        print(f'Doc {key} has value: {res.content_as[dict]}')
+
+        """
+        chunk_size, max_chunks = self._get_multi_iter_window(chunk_size, max_in_flight)
+        chunks = self._iter_key_chunks(keys, chunk_size)
+        kwargs['return_exceptions'] = True
+        return self._run_multi_iter(lambda chunk: self.get_multi(chunk, *opts, **kwargs), chunks, max_chunks)
 
     def get_any_replica_multi(self,
                               keys,  # type: List[str]
@@ -2112,15 +2109,7 @@ class Collection(CollectionLogic):
             op_type=op_type,
             op_args=op_args
         )
-        for k, v in res.raw_result.items():
-            if k == 'all_okay':
-                continue
-            if isinstance(v, CouchbaseBaseException):
-                continue
-            value = v.raw_result.get('value', None)
-            flags = v.raw_result.get('flags', None)
-            tc = transcoders[k]
-            v.raw_result['value'] = decode_value(tc, value, flags)
+        self._decode_multi_values(res, transcoders)
 
         return MultiGetReplicaResult(res, return_exceptions)
 
@@ -2314,28 +2303,7 @@ class Collection(CollectionLogic):
                     print(f'Locked document: key={k}, content={v.content_as[str]}')
 
         """
-        kwargs["lock_time"] = lock_time
-        op_args, return_exceptions, transcoders = self._get_multi_op_args(keys,
-                                                                          *opts,
-                                                                          opts_type=LockMultiOptions,
-                                                                          **kwargs)
-        op_type = operations.GET_AND_LOCK.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        for k, v in res.raw_result.items():
-            if k == 'all_okay':
-                continue
-            if isinstance(v, CouchbaseBaseException):
-                continue
-            value = v.raw_result.get('value', None)
-            flags = v.raw_result.get('flags', None)
-            tc = transcoders[k]
-            v.raw_result['value'] = decode_value(tc, value, flags)
-
-        return MultiGetResult(res, return_exceptions)
+        return super().get_and_lock_multi(keys, lock_time, *opts, **kwargs)
 
     def exists_multi(self,
                      keys,  # type: List[str]
@@ -2396,17 +2364,7 @@ class Collection(CollectionLogic):
                 for k, v in res.results.items():
                     print(f'Doc with key={k} {"exists" if v.exists else "does not exist"}')
         """  # noqa: E501
-        op_args, return_exceptions, _ = self._get_multi_op_args(keys,
-                                                                *opts,
-                                                                opts_type=ExistsMultiOptions,
-                                                                **kwargs)
-        op_type = operations.EXISTS.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiExistsResult(res, return_exceptions)
+        return super().exists_multi(keys, *opts, **kwargs)
 
     def insert_multi(self,
                      keys_and_docs,  # type: Dict[str, JSONType]
@@ -2489,17 +2447,7 @@ class Collection(CollectionLogic):
                     print(f'Doc inserted: key={k}, cas={v.cas}')
 
         """  # noqa: E501
-        op_args, return_exceptions = self._get_multi_mutation_transcoded_op_args(keys_and_docs,
-                                                                                 *opts,
-                                                                                 opts_type=InsertMultiOptions,
-                                                                                 **kwargs)
-        op_type = operations.INSERT.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiMutationResult(res, return_exceptions)
+        return super().insert_multi(keys_and_docs, *opts, **kwargs)
 
     def upsert_multi(self,
                      keys_and_docs,  # type: Dict[str, JSONType]
@@ -2577,17 +2525,59 @@ class Collection(CollectionLogic):
                     print(f'Doc upserted: key={k}, cas={v.cas}')
 
         """  # noqa: E501
-        op_args, return_exceptions = self._get_multi_mutation_transcoded_op_args(keys_and_docs,
-                                                                                 *opts,
-                                                                                 opts_type=UpsertMultiOptions,
-                                                                                 **kwargs)
-        op_type = operations.UPSERT.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiMutationResult(res, return_exceptions)
+        return super().upsert_multi(keys_and_docs, *opts, **kwargs)
+
+    def upsert_multi_iter(self,
+                          keys_and_docs,  # type: Union[Dict[str, JSONType], Iterable[Tuple[str, JSONType]]]
+                          *opts,  # type: UpsertMultiOptions
+                          chunk_size=None,  # type: Optional[int]
+                          max_in_flight=None,  # type: Optional[int]
+                          **kwargs,  # type: Dict[str, Any]
+                          ) -> Iterator[Tuple[str, Union[MutationResult, CouchbaseBaseException]]]:
+        """For each key, value pair in the provided iterable, upsert the document into the collection.  Unlike
+        :meth:`.upsert_multi`, the documents are consumed lazily and submitted in chunks of ``chunk_size``
+        documents with at most ``max_in_flight`` operations outstanding at once.  Results are yielded as each
+        chunk completes, so memory use is bounded by the window rather than by the number of documents.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
+
+        Args:
+            keys_and_docs (Union[Dict[str, JSONType], Iterable[Tuple[str, JSONType]]]): The keys and values/docs
+                to use for the multiple upsert operations.  Either a dict or any iterable (including a
+                generator) of ``(key, doc)`` pairs.
+            opts (:class:`~couchbase.options.UpsertMultiOptions`): Optional parameters for this operation.
+            chunk_size (int, optional): The number of documents submitted per chunk.  Defaults to 100.
+            max_in_flight (int, optional): The maximum number of operations outstanding at once.  Defaults to
+                1000.  Chunks beyond the window are not read from ``keys_and_docs`` until a chunk completes.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.UpsertMultiOptions`
+
+        Returns:
+            Iterator[Tuple[str, Union[:class:`~couchbase.result.MutationResult`, Exception]]]: An iterator of
+            ``(key, result)`` pairs.  Operations that fail yield the exception as the result (the
+            ``return_exceptions`` option is ignored).
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If ``chunk_size`` or ``max_in_flight`` is
+                not a positive int.
+
+        Examples:
+
+            Backfill documents produced by a generator::
+
+                collection = bucket.default_collection()
+                docs = ((f'doc{i}', {'id': i}) for i in range(1000000))
+                for key, res in collection.upsert_multi_iter(docs, chunk_size=500, max_in_flight=5000):
+                    if isinstance(res, Exception):
+                        print(f'Failed to upsert {key}: {res}')
+
+        """
+        chunk_size, max_chunks = self._get_multi_iter_window(chunk_size, max_in_flight)
+        chunks = self._iter_doc_chunks(keys_and_docs, chunk_size)
+        kwargs['return_exceptions'] = True
+        return self._run_multi_iter(lambda chunk: self.upsert_multi(chunk, *opts, **kwargs), chunks, max_chunks)
 
     def replace_multi(self,
                       keys_and_docs,  # type: Dict[str, JSONType]
@@ -2676,17 +2666,7 @@ class Collection(CollectionLogic):
                     print(f'Doc replaced: key={k}, cas={v.cas}')
 
         """  # noqa: E501
-        op_args, return_exceptions = self._get_multi_mutation_transcoded_op_args(keys_and_docs,
-                                                                                 *opts,
-                                                                                 opts_type=ReplaceMultiOptions,
-                                                                                 **kwargs)
-        op_type = operations.REPLACE.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiMutationResult(res, return_exceptions)
+        return super().replace_multi(keys_and_docs, *opts, **kwargs)
 
     def remove_multi(self,
                      keys,  # type: List[str]
@@ -2748,17 +2728,7 @@ class Collection(CollectionLogic):
                                               RemoveMultiOptions(per_key_options=per_key_opts))
 
         """  # noqa: E501
-        op_args, return_exceptions, _ = self._get_multi_op_args(keys,
-                                                                *opts,
-                                                                opts_type=RemoveMultiOptions,
-                                                                **kwargs)
-        op_type = operations.REMOVE.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiMutationResult(res, return_exceptions)
+        return super().remove_multi(keys, *opts, **kwargs)
 
     def touch_multi(self,
                     keys,  # type: List[str]
@@ -2790,18 +2760,7 @@ class Collection(CollectionLogic):
                 match to the key, but is not raised.
 
         """
-        kwargs['expiry'] = expiry
-        op_args, return_exceptions, _ = self._get_multi_op_args(keys,
-                                                                *opts,
-                                                                opts_type=TouchMultiOptions,
-                                                                **kwargs)
-        op_type = operations.TOUCH.value
-        res = kv_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiMutationResult(res, return_exceptions)
+        return super().touch_multi(keys, expiry, *opts, **kwargs)
 
     def unlock_multi(self,  # noqa: C901
                      keys,  # type: Union[MultiResultType, Dict[str, int]]
@@ -2854,8 +2813,8 @@ class Collection(CollectionLogic):
                                                                 opts_type=UnlockMultiOptions,
                                                                 **kwargs)
 
-        for k, v in op_args.items():
-            v['cas'] = op_keys_cas[k]
+        # the per key args can share the same dict, each key needs its own for the CAS
+        op_args = {k: {**v, 'cas': op_keys_cas[k]} for k, v in op_args.items()}
 
         op_type = operations.UNLOCK.value
         res = kv_multi_operation(
@@ -2877,85 +2836,128 @@ class Collection(CollectionLogic):
 
         return output
 
-    def _get_multi_counter_op_args(
-        self,
-        keys,  # type: List[str]
-        *opts,  # type: Union[IncrementMultiOptions, DecrementMultiOptions]
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool]:
-        if not isinstance(keys, list):
-            raise InvalidArgumentException(message='Expected keys to be a list.')
-
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
-
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-
-        global_delta, global_initial = self._get_and_validate_delta_initial(final_args)
-        final_args['delta'] = int(global_delta)
-        final_args['initial'] = int(global_initial)
-
-        per_key_args = final_args.pop('per_key_options', None)
-        op_args = {}
-        for key in keys:
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                # need to validate delta/initial if provided per key
-                delta = per_key_args[key].get('delta', None)
-                initial = per_key_args[key].get('initial', None)
-                self._validate_delta_initial(delta=delta, initial=initial)
-                if delta:
-                    per_key_args[key]['delta'] = int(delta)
-                if initial:
-                    per_key_args[key]['initial'] = int(initial)
-                op_args[key].update(per_key_args[key])
-
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions
-
-    def _get_multi_binary_mutation_op_args(
-        self,
-        keys_and_docs,  # type: Dict[str, Union[str, bytes, bytearray]]
-        *opts,  # type: Union[AppendMultiOptions, PrependMultiOptions]
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool]:
+    def lookup_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: LookupInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> MultiLookupInResult:
+        """For each key provided, perform a lookup-in operation on the document associated with the key.
 
-        if not isinstance(keys_and_docs, dict):
-            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
+        The specs can be provided per key (a dict of key to specs) or shared by all keys (a list of keys and a
+        *spec*).  When the specs are provided per key, *spec* can be omitted and the options passed in its place.
 
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
 
-        parsed_keys_and_docs = {}
-        for k, v in keys_and_docs.items():
-            if isinstance(v, str):
-                value = v.encode("utf-8")
-            elif isinstance(v, bytearray):
-                value = bytes(v)
-            else:
-                value = v
+        Args:
+            keys_and_specs (Union[Dict[str, Iterable[:class:`~couchbase.subdocument.Spec`]], List[str]]): Either
+                the specs to use for each key, or the keys to use with the shared *spec*.
+            spec (Iterable[:class:`~couchbase.subdocument.Spec`], optional): The specs used for every key, required
+                if *keys_and_specs* is a list of keys.
+            opts (:class:`~couchbase.options.LookupInMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.LookupInMultiOptions`
+
+        Returns:
+            :class:`~couchbase.result.MultiLookupInResult`: An instance of
+            :class:`~couchbase.result.MultiLookupInResult`.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        Examples:
+
+            Simple lookup-in-multi operation with a shared spec::
+
+                import couchbase.subdocument as SD
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                keys = ['doc1', 'doc2', 'doc3']
+                res = collection.lookup_in_multi(keys, (SD.get('name'), SD.exists('email')))
+                for k, v in res.results.items():
+                    print(f'Doc {k} has name: {v.content_as[str](0)}')
 
-            if not isinstance(value, bytes):
-                raise ValueError(
-                    "The value provided must of type str, bytes or bytearray.")
+            Simple lookup-in-multi operation with per key specs::
 
-            parsed_keys_and_docs[k] = value
+                import couchbase.subdocument as SD
+                from couchbase.options import LookupInMultiOptions
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                keys_and_specs = {'doc1': (SD.get('name'),), 'doc2': (SD.get('email'),)}
+                res = collection.lookup_in_multi(keys_and_specs, LookupInMultiOptions(return_exceptions=False))
+
+        """
+        return super().lookup_in_multi(keys_and_specs, spec, *opts, **kwargs)
+
+    def mutate_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: MutateInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> MultiMutateInResult:
+        """For each key provided, perform a mutate-in operation on the document associated with the key.
+
+        The specs can be provided per key (a dict of key to specs) or shared by all keys (a list of keys and a
+        *spec*).  When the specs are provided per key, *spec* can be omitted and the options passed in its place.
+        Only the paths being changed are sent to the server, not the full documents.
+
+        .. note::
+            This method is part of an **uncommitted** API that is unlikely to change,
+            but may still change as final consensus on its behavior has not yet been reached.
 
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-        per_key_args = final_args.pop('per_key_options', None)
-        op_args = {}
-        for key, value in parsed_keys_and_docs.items():
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                op_args[key].update(per_key_args[key])
-            op_args[key]['value'] = value
+        Args:
+            keys_and_specs (Union[Dict[str, Iterable[:class:`~couchbase.subdocument.Spec`]], List[str]]): Either
+                the specs to use for each key, or the keys to use with the shared *spec*.
+            spec (Iterable[:class:`~couchbase.subdocument.Spec`], optional): The specs used for every key, required
+                if *keys_and_specs* is a list of keys.
+            opts (:class:`~couchbase.options.MutateInMultiOptions`): Optional parameters for this operation.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.MutateInMultiOptions`
+
+        Returns:
+            :class:`~couchbase.result.MultiMutateInResult`: An instance of
+            :class:`~couchbase.result.MultiMutateInResult`.
+
+        Raises:
+            :class:`~couchbase.exceptions.DocumentNotFoundException`: If the key provided does not exist on the
+                server and the return_exceptions options is False.  Otherwise the exception is returned as a
+                match to the key, but is not raised.
+
+        Examples:
 
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions
+            Update a single field on many documents::
+
+                import couchbase.subdocument as SD
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                keys = ['profile1', 'profile2', 'profile3']
+                res = collection.mutate_in_multi(keys, (SD.upsert('verified', True),))
+                print(f'All updated: {res.all_ok}')
+
+            Per key specs, with a CAS check for one of the keys::
+
+                import couchbase.subdocument as SD
+                from couchbase.options import MutateInMultiOptions, MutateInOptions
+
+                # ... other code ...
+
+                keys_and_specs = {'profile1': (SD.upsert('name', 'Jane'),),
+                                  'profile2': (SD.increment('logins', 1),)}
+                opts = MutateInMultiOptions(per_key_options={'profile1': MutateInOptions(cas=cas)})
+                res = collection.mutate_in_multi(keys_and_specs, opts)
+
+        """
+        return super().mutate_in_multi(keys_and_specs, spec, *opts, **kwargs)
 
     def _append_multi(
         self,
@@ -2963,17 +2965,7 @@ class Collection(CollectionLogic):
         *opts,  # type: AppendMultiOptions
         **kwargs,  # type: Dict[str, Any]
     ) -> MultiMutationResult:
-        op_args, return_exceptions = self._get_multi_binary_mutation_op_args(keys_and_values,
-                                                                             *opts,
-                                                                             opts_type=AppendMultiOptions,
-                                                                             **kwargs)
-        op_type = operations.APPEND.value
-        res = binary_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiMutationResult(res, return_exceptions)
+        return super().append_multi(keys_and_values, *opts, **kwargs)
 
     def _prepend_multi(
         self,
@@ -2981,17 +2973,7 @@ class Collection(CollectionLogic):
         *opts,  # type: PrependMultiOptions
         **kwargs,  # type: Dict[str, Any]
     ) -> MultiMutationResult:
-        op_args, return_exceptions = self._get_multi_binary_mutation_op_args(keys_and_values,
-                                                                             *opts,
-                                                                             opts_type=PrependMultiOptions,
-                                                                             **kwargs)
-        op_type = operations.PREPEND.value
-        res = binary_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiMutationResult(res, return_exceptions)
+        return super().prepend_multi(keys_and_values, *opts, **kwargs)
 
     def _increment_multi(
         self,
@@ -2999,17 +2981,7 @@ class Collection(CollectionLogic):
         *opts,  # type: IncrementMultiOptions
         **kwargs,  # type: Dict[str, Any]
     ) -> MultiCounterResult:
-        op_args, return_exceptions = self._get_multi_counter_op_args(keys,
-                                                                     *opts,
-                                                                     opts_type=IncrementMultiOptions,
-                                                                     **kwargs)
-        op_type = operations.INCREMENT.value
-        res = binary_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiCounterResult(res, return_exceptions)
+        return super().increment_multi(keys, *opts, **kwargs)
 
     def _decrement_multi(
         self,
@@ -3017,17 +2989,7 @@ class Collection(CollectionLogic):
         *opts,  # type: DecrementMultiOptions
         **kwargs,  # type: Dict[str, Any]
     ) -> MultiCounterResult:
-        op_args, return_exceptions = self._get_multi_counter_op_args(keys,
-                                                                     *opts,
-                                                                     opts_type=DecrementMultiOptions,
-                                                                     **kwargs)
-        op_type = operations.DECREMENT.value
-        res = binary_multi_operation(
-            **self._get_connection_args(),
-            op_type=op_type,
-            op_args=op_args
-        )
-        return MultiCounterResult(res, return_exceptions)
+        return super().decrement_multi(keys, *opts, **kwargs)
 
     def query_indexes(self) -> CollectionQueryIndexManager:
         """
@@ -3037,6 +2999,7 @@ class Collection(CollectionLogic):
         Returns:
             :class:`~couchbase.management.queries.CollectionQueryIndexManager`: A :class:`~couchbase.management.queries.CollectionQueryIndexManager` instance.
         """  # noqa: E501
+        from couchbase.management.queries import CollectionQueryIndexManager
         return CollectionQueryIndexManager(self.connection, self._scope.bucket_name, self._scope.name, self.name)
 
     @staticmethod
@@ -18,11 +18,14 @@ import re
 import sys
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from string import Template
 from typing import (Any,
                     Dict,
+                    FrozenSet,
                     Optional,
                     Set,
+                    Tuple,
                     Union)
 
 from couchbase.pycbc_core import exception
@@ -1933,13 +1936,53 @@ QUERY_ERROR_MAPPING = {r'.*Keyspace not found.*': KeyspaceNotFoundException,
                        r'.*[iI]ndex.*already exists.*': QueryIndexAlreadyExistsException}
 
 
+# response body fields that are unique to each request and are not needed to classify an error
+_UNCLASSIFIED_HTTP_BODY_FIELDS = ('requestID', 'clientContextID', 'metrics')
+# error content longer than this is classified w/o the cache, so the cache never holds on to large error bodies
+_MAX_CACHED_ERROR_CONTENT = 4096
+
+
+class _CompiledErrorMapping:
+    """
+    **INTERNAL**
+
+    The (pattern, exception class) pairs of an error mapping, compiled once.  Hashes on identity so it is a cheap
+    cache key for :meth:`ErrorMapper._classify_http_error` and :meth:`ErrorMapper._classify_kv_error`.
+    """
+    __slots__ = ('_mapping', 'patterns')
+
+    def __init__(self, mapping  # type: Dict[str, CouchbaseException]
+                 ):
+        # hold a reference to the source mapping so its id() stays unique while the compiled entry is cached
+        self._mapping = mapping
+        self.patterns = tuple(({str: re.compile}.get(type(k), lambda x: x)(k), v) for k, v in mapping.items())
+
+
 class ErrorMapper:
+    _MAX_COMPILED_MAPPINGS = 256
+    _COMPILED_MAPPINGS = {}  # type: Dict[int, _CompiledErrorMapping]
+
+    @staticmethod
+    def _compile_mapping(mapping  # type: Optional[Dict[str, CouchbaseException]]
+                         ) -> Optional[_CompiledErrorMapping]:
+        if not mapping:
+            return None
+        compiled = ErrorMapper._COMPILED_MAPPINGS.get(id(mapping), None)
+        if compiled is None or compiled._mapping is not mapping:
+            if len(ErrorMapper._COMPILED_MAPPINGS) >= ErrorMapper._MAX_COMPILED_MAPPINGS:
+                ErrorMapper._COMPILED_MAPPINGS.clear()
+            compiled = _CompiledErrorMapping(mapping)
+            ErrorMapper._COMPILED_MAPPINGS[id(mapping)] = compiled
+        return compiled
+
     @staticmethod
-    def _process_mapping(compiled_map,  # type: Dict[str, CouchbaseException]
+    def _process_mapping(compiled_map,  # type: Optional[_CompiledErrorMapping]
                          err_content  # type: str
                          ) -> Optional[CouchbaseException]:
+        if compiled_map is None:
+            return None
         matches = None
-        for pattern, exc_class in compiled_map.items():
+        for pattern, exc_class in compiled_map.patterns:
             try:
                 matches = pattern.match(err_content)
             except Exception:  # nosec
@@ -1950,7 +1993,7 @@ class ErrorMapper:
         return None
 
     @staticmethod  # noqa: C901
-    def _parse_http_response_body(compiled_map,  # type: Dict[str, CouchbaseException]  # noqa: C901
+    def _parse_http_response_body(compiled_map,  # type: Optional[_CompiledErrorMapping]  # noqa: C901
                                   response_body  # type: str
                                   ) -> Optional[CouchbaseException]:
 
@@ -1989,58 +2032,116 @@ class ErrorMapper:
         return None
 
     @staticmethod
-    def _parse_http_context(err_ctx,  # type: HTTPErrorContext
-                            mapping=None,  # type: Dict[str, CouchbaseException]
-                            err_info=None  # type: Dict[str, Any]
-                            ) -> Optional[CouchbaseException]:
-        from couchbase._utils import is_null_or_empty
+    def _normalize_http_body(response_body  # type: Optional[str]
+                             ) -> Tuple[Optional[str], Tuple[Any, ...]]:
+        """**INTERNAL**
 
-        compiled_map = {}
-        if mapping:
-            compiled_map = {{str: re.compile}.get(
-                type(k), lambda x: x)(k): v for k, v in mapping.items()}
+        Returns the response body w/o the fields that are unique to each request (so repeated errors share a cache
+        entry) along with the codes of the body's errors.  Bodies that are not JSON objects are returned as is.
+        """
+        try:
+            http_body = json.loads(response_body)
+        except (TypeError, json.decoder.JSONDecodeError):
+            return response_body, ()
+        if not isinstance(http_body, dict):
+            return response_body, ()
+
+        errors = http_body.get('errors', None)
+        error_codes = ()
+        if isinstance(errors, list):
+            error_codes = tuple(err.get('code', None) for err in errors if isinstance(err, dict))
+        if not any(field in http_body for field in _UNCLASSIFIED_HTTP_BODY_FIELDS):
+            return response_body, error_codes
+        for field in _UNCLASSIFIED_HTTP_BODY_FIELDS:
+            http_body.pop(field, None)
+        return json.dumps(http_body, separators=(',', ':'), ensure_ascii=False), error_codes
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _classify_http_error(compiled_map,  # type: Optional[_CompiledErrorMapping]
+                             context_type,  # type: str
+                             error_codes,  # type: Tuple[Any, ...]
+                             exc_msg,  # type: Optional[str]
+                             response_body  # type: Optional[str]
+                             ) -> Optional[CouchbaseException]:
+        """**INTERNAL**
+
+        Classifies an HTTP error from its message and normalized response body (see
+        :meth:`ErrorMapper._normalize_http_body`).  The context type and error codes only narrow the cache key.
+        """
+        from couchbase._utils import is_null_or_empty
 
-        exc_msg = err_info.get('error_message', None) if err_info else None
         if not is_null_or_empty(exc_msg):
             exc_class = ErrorMapper._process_mapping(compiled_map, exc_msg)
             if exc_class is not None:
                 return exc_class
 
-        if not is_null_or_empty(err_ctx.response_body):
-            err_text = err_ctx.response_body
-            exc_class = ErrorMapper._process_mapping(compiled_map, err_text)
+        if not is_null_or_empty(response_body):
+            exc_class = ErrorMapper._process_mapping(compiled_map, response_body)
             if exc_class is not None:
                 return exc_class
 
-            exc_class = ErrorMapper._parse_http_response_body(compiled_map, err_text)
+            exc_class = ErrorMapper._parse_http_response_body(compiled_map, response_body)
             if exc_class is not None:
                 return exc_class
 
         return None
 
     @staticmethod
-    def _parse_kv_context(err_ctx,  # type: KeyValueErrorContext
-                          mapping,  # type: Dict[str, CouchbaseException]
-                          err_content=None  # type: str
-                          ) -> Optional[CouchbaseException]:
+    @lru_cache(maxsize=1024)
+    def _classify_kv_error(compiled_map,  # type: Optional[_CompiledErrorMapping]
+                           err_content,  # type: Optional[str]
+                           retry_reasons  # type: Optional[FrozenSet[str]]
+                           ) -> Optional[CouchbaseException]:
         from couchbase._utils import is_null_or_empty
 
-        compiled_map = {{str: re.compile}.get(
-            type(k), lambda x: x)(k): v for k, v in mapping.items()}
-
         if not is_null_or_empty(err_content):
             exc_class = ErrorMapper._process_mapping(compiled_map, err_content)
             if exc_class is not None:
                 return exc_class
 
-        if err_ctx.retry_reasons is not None:
-            for rr in err_ctx.retry_reasons:
+        if retry_reasons is not None:
+            for rr in retry_reasons:
                 exc_class = ErrorMapper._process_mapping(compiled_map, rr)
                 if exc_class is not None:
                     return exc_class
 
         return None
 
+    @staticmethod
+    def _parse_http_context(err_ctx,  # type: HTTPErrorContext
+                            mapping=None,  # type: Dict[str, CouchbaseException]
+                            err_info=None  # type: Dict[str, Any]
+                            ) -> Optional[CouchbaseException]:
+        compiled_map = ErrorMapper._compile_mapping(mapping)
+        exc_msg = err_info.get('error_message', None) if err_info else None
+        response_body, error_codes = ErrorMapper._normalize_http_body(err_ctx.response_body)
+        classify_args = (compiled_map, type(err_ctx).__name__, error_codes, exc_msg, response_body)
+        cacheable = all(content is None or (isinstance(content, str) and len(content) <= _MAX_CACHED_ERROR_CONTENT)
+                        for content in (exc_msg, response_body))
+        if cacheable:
+            try:
+                return ErrorMapper._classify_http_error(*classify_args)
+            except TypeError:
+                # unhashable error content, skip the cache
+                pass
+        return ErrorMapper._classify_http_error.__wrapped__(*classify_args)
+
+    @staticmethod
+    def _parse_kv_context(err_ctx,  # type: KeyValueErrorContext
+                          mapping,  # type: Dict[str, CouchbaseException]
+                          err_content=None  # type: str
+                          ) -> Optional[CouchbaseException]:
+        compiled_map = ErrorMapper._compile_mapping(mapping)
+        retry_reasons = err_ctx.retry_reasons
+        if retry_reasons is not None:
+            retry_reasons = frozenset(retry_reasons)
+        try:
+            return ErrorMapper._classify_kv_error(compiled_map, err_content, retry_reasons)
+        except TypeError:
+            # unhashable error content, skip the cache
+            return ErrorMapper._classify_kv_error.__wrapped__(compiled_map, err_content, retry_reasons)
+
     @classmethod
     def build_exception(cls,
                         base_exc,  # type: exception
@@ -2074,3 +2175,8 @@ class ErrorMapper:
 
         exc = exc_class(base=base_exc, exc_info=err_info, context=err_ctx)
         return exc
+
+
+# the default mappings are compiled at import, management mappings are compiled on first use
+ErrorMapper._compile_mapping(KV_ERROR_CONTEXT_MAPPING)
+ErrorMapper._compile_mapping(QUERY_ERROR_MAPPING)
@@ -14,12 +14,25 @@
 # limitations under the License.
 #
 
-from typing import Any, Dict
+from __future__ import annotations
+
+import multiprocessing
+import queue
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Dict,
+                    Iterator,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
 
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
                                   ExceptionMap,
+                                  InvalidArgumentException,
                                   RangeScanCompletedException)
 from couchbase.logic.kv_range_scan import PrefixScan  # noqa: F401
 from couchbase.logic.kv_range_scan import RangeScan  # noqa: F401
@@ -28,6 +41,18 @@ from couchbase.logic.kv_range_scan import ScanTerm  # noqa: F401
 from couchbase.logic.kv_range_scan import ScanType  # noqa: F401
 from couchbase.logic.kv_range_scan import RangeScanRequestLogic
 
+if TYPE_CHECKING:
+    from couchbase.cluster import Cluster
+    from couchbase.options import ClusterOptions, ScanOptions
+    from couchbase.result import ScanResult
+
+# the cluster connection of a parallel_scan worker process, created once per process by _init_scan_worker
+_worker_cluster = None  # type: Optional[Cluster]
+# the bounded queue a parallel_scan worker process sends its row chunks back on
+_worker_rows = None  # type: Optional[multiprocessing.Queue]
+# how often parallel_scan checks the worker pool for a failed partition while waiting for rows
+_PARALLEL_SCAN_POLL_INTERVAL = 0.1
+
 
 class RangeScanRequest(RangeScanRequestLogic):
     def __init__(self,
@@ -60,3 +85,167 @@ class RangeScanRequest(RangeScanRequestLogic):
             exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
             excptn = exc_cls(str(ex))
             raise excptn
+
+
+def scan_row_to_tuple(row  # type: ScanResult
+                      ) -> Union[str, Tuple[str, Any]]:
+    """The default ``row_processor`` of :func:`parallel_scan`.
+
+    Args:
+        row (:class:`~couchbase.result.ScanResult`): The scanned row.
+
+    Returns:
+        Union[str, Tuple[str, Any]]: The row's id if the scan was requested with ``ids_only``, otherwise a tuple of
+        the row's id and decoded content.
+    """
+    if row.ids_only:
+        return row.id
+    return row.id, row.value
+
+
+def _init_scan_worker(connstr,  # type: str
+                      cluster_options,  # type: ClusterOptions
+                      rows,  # type: multiprocessing.Queue
+                      ) -> None:
+    global _worker_cluster, _worker_rows
+    from couchbase.cluster import Cluster
+    _worker_cluster = Cluster(connstr, cluster_options)
+    _worker_rows = rows
+
+
+def _scan_partition(task  # type: Tuple[Any, ...]
+                    ) -> None:
+    """**INTERNAL**
+
+    Scans a partition in a worker process, sending the processed rows back in chunks of ``chunk_size`` rows.  The
+    rows queue is bounded, so the worker blocks (holding a single chunk) until the caller catches up.  A ``None``
+    chunk marks the end of the partition.
+    """
+    bucket_name, scope_name, collection_name, scan_type, scan_options, row_processor, chunk_size = task
+    collection = _worker_cluster.bucket(bucket_name).scope(scope_name).collection(collection_name)
+    opts = (scan_options,) if scan_options is not None else ()
+    chunk = []
+    for row in collection.scan(scan_type, *opts).rows():
+        chunk.append(row_processor(row))
+        if len(chunk) >= chunk_size:
+            _worker_rows.put(chunk)
+            chunk = []
+    if chunk:
+        _worker_rows.put(chunk)
+    _worker_rows.put(None)
+
+
+def parallel_scan(connstr,  # type: str
+                  cluster_options,  # type: ClusterOptions
+                  bucket_name,  # type: str
+                  scope_name,  # type: str
+                  collection_name,  # type: str
+                  scan_type,  # type: Union[RangeScan, PrefixScan]
+                  scan_options=None,  # type: Optional[ScanOptions]
+                  num_processes=None,  # type: Optional[int]
+                  num_partitions=None,  # type: Optional[int]
+                  split_points=None,  # type: Optional[List[Union[str, bytes]]]
+                  row_processor=None,  # type: Optional[Callable[[ScanResult], Any]]
+                  mp_context=None,  # type: Optional[multiprocessing.context.BaseContext]
+                  chunk_size=1000,  # type: Optional[int]
+                  ) -> Iterator[Any]:
+    """Partitions a range or prefix scan into disjoint key sub-ranges (see :meth:`.RangeScan.partition`) and scans
+    the partitions in a pool of worker processes, so decoding the scanned documents scales with the number of cores.
+
+    Each worker process opens its own connection to the cluster.  Every scanned row is passed to
+    ``row_processor`` in the worker and the (picklable) return values are streamed back to the caller in chunks of
+    ``chunk_size`` rows, interleaving the partitions being scanned.  The chunks are sent through a bounded queue, so
+    a worker process holds at most one chunk in memory while it waits for the caller to catch up.
+
+    .. note::
+        Worker processes are started with the ``spawn`` start method by default, as forking a process with an open
+        cluster connection is not supported.  As such, ``row_processor`` must be a module-level function and the
+        program's entry point must be guarded by ``if __name__ == '__main__':``.
+
+    Args:
+        connstr (str): The connection string to use for connecting to the cluster.
+        cluster_options (:class:`~couchbase.options.ClusterOptions`): Options to connect to the cluster with.  Must
+            be picklable.
+        bucket_name (str): The name of the bucket.
+        scope_name (str): The name of the scope.
+        collection_name (str): The name of the collection.
+        scan_type (Union[:class:`.RangeScan`, :class:`.PrefixScan`]): The scan to partition.
+        scan_options (:class:`~couchbase.options.ScanOptions`, optional): Options for each partition's scan.
+        num_processes (int, optional): The number of worker processes.  Defaults to the number of CPUs.
+        num_partitions (int, optional): The number of partitions.  Defaults to 4 partitions per worker process
+            so that unevenly sized partitions are balanced across the workers.
+        split_points (List[Union[str, bytes]], optional): Explicit keys to partition the scan at, instead of
+            num_partitions.
+        row_processor (Callable[[:class:`~couchbase.result.ScanResult`], Any], optional): Run in the worker
+            process for every row.  Defaults to :func:`scan_row_to_tuple`.
+        mp_context (``multiprocessing.context.BaseContext``, optional): The multiprocessing context to create the
+            worker pool from.  Defaults to the ``spawn`` context.
+        chunk_size (int, optional): The number of rows a worker process sends back at a time.  Defaults to 1000.
+
+    Returns:
+        Iterator[Any]: An iterator of the values returned by ``row_processor``.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If scan_type is not a RangeScan or PrefixScan, or
+            if num_processes or chunk_size is not a positive int.
+
+    Examples:
+
+        Export a collection's documents using all cores::
+
+            from couchbase.auth import PasswordAuthenticator
+            from couchbase.kv_range_scan import RangeScan, parallel_scan
+            from couchbase.options import ClusterOptions
+
+            if __name__ == '__main__':
+                opts = ClusterOptions(PasswordAuthenticator('username', 'password'))
+                for key, doc in parallel_scan('couchbase://localhost', opts, 'travel-sample', 'inventory',
+                                              'airline', RangeScan()):
+                    print(f'{key}: {doc}')
+
+    """
+    if not isinstance(scan_type, (RangeScan, PrefixScan)):
+        raise InvalidArgumentException('scan_type must be Union[RangeScan, PrefixScan]')
+    if num_processes is None:
+        num_processes = multiprocessing.cpu_count()
+    if not isinstance(num_processes, int) or isinstance(num_processes, bool) or num_processes < 1:
+        raise InvalidArgumentException('num_processes must be a positive int.')
+    if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1:
+        raise InvalidArgumentException('chunk_size must be a positive int.')
+    if num_partitions is None and split_points is None:
+        num_partitions = num_processes * 4
+    partitions = scan_type.partition(num_partitions=num_partitions, split_points=split_points)
+    if row_processor is None:
+        row_processor = scan_row_to_tuple
+    if mp_context is None:
+        mp_context = multiprocessing.get_context('spawn')
+
+    return _run_parallel_scan(mp_context,
+                              min(num_processes, len(partitions)),
+                              (connstr, cluster_options),
+                              [(bucket_name, scope_name, collection_name, p, scan_options, row_processor, chunk_size)
+                               for p in partitions])
+
+
+def _run_parallel_scan(mp_context,  # type: multiprocessing.context.BaseContext
+                       num_processes,  # type: int
+                       init_args,  # type: Tuple[Any, ...]
+                       tasks,  # type: List[Tuple[Any, ...]]
+                       ) -> Iterator[Any]:
+    # two chunks per worker, so a worker can keep scanning while the caller works through the other chunks
+    rows = mp_context.Queue(2 * num_processes)
+    with mp_context.Pool(num_processes, initializer=_init_scan_worker, initargs=init_args + (rows,)) as pool:
+        scans = pool.map_async(_scan_partition, tasks, chunksize=1)
+        remaining = len(tasks)
+        while remaining > 0:
+            try:
+                chunk = rows.get(timeout=_PARALLEL_SCAN_POLL_INTERVAL)
+            except queue.Empty:
+                # a failed partition never sends its end marker, raise its exception instead of waiting forever
+                if scans.ready() and not scans.successful():
+                    scans.get()
+                continue
+            if chunk is None:
+                remaining -= 1
+            else:
+                yield from chunk
@@ -48,7 +48,9 @@ from couchbase.pycbc_core import (close_connection,
 from couchbase.result import (ClusterInfoResult,
                               DiagnosticsResult,
                               PingResult)
-from couchbase.serializer import DefaultJsonSerializer, Serializer
+from couchbase.serializer import (DefaultJsonSerializer,
+                                  Serializer,
+                                  get_json_serializer)
 from couchbase.transcoder import JSONTranscoder, Transcoder
 
 if TYPE_CHECKING:
@@ -148,12 +150,14 @@ class ClusterLogic:
             cluster_opts['tracing_options'] = tracing_opts
 
         self._default_serializer = cluster_opts.pop("serializer", None)
-        if not self._default_serializer:
+        if isinstance(self._default_serializer, str):
+            self._default_serializer = get_json_serializer(self._default_serializer)
+        elif not self._default_serializer:
             self._default_serializer = DefaultJsonSerializer()
 
         self._default_transcoder = cluster_opts.pop("transcoder", None)
         if not self._default_transcoder:
-            self._default_transcoder = JSONTranscoder()
+            self._default_transcoder = JSONTranscoder(self._default_serializer)
 
         cluster_opts['user_agent_extra'] = PYCBC_VERSION
 
@@ -13,25 +13,59 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import os
+from collections.abc import Mapping
+from concurrent.futures import (FIRST_COMPLETED,
+                                ThreadPoolExecutor,
+                                wait)
+from copy import copy
 from datetime import timedelta
+from functools import partial
+from itertools import islice
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
                     Dict,
                     Iterable,
+                    Iterator,
+                    List,
                     Optional,
+                    Tuple,
                     Union)
 
 from couchbase._utils import timedelta_as_microseconds
+from couchbase.durability import DurabilityParser
 from couchbase.exceptions import InvalidArgumentException
+from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.kv_range_scan import (PrefixScan,
                                      RangeScan,
                                      SamplingScan)
+from couchbase.logic import decode_value
 from couchbase.logic.options import DeltaValueBase, SignedInt64Base
 from couchbase.mutation_state import MutationState
-from couchbase.options import forward_args
-from couchbase.pycbc_core import (binary_operation,
+from couchbase.near_cache import NearCache
+from couchbase.options import (AppendMultiOptions,
+                               DecrementMultiOptions,
+                               ExistsMultiOptions,
+                               GetAndLockMultiOptions,
+                               GetMultiOptions,
+                               IncrementMultiOptions,
+                               InsertMultiOptions,
+                               LookupInMultiOptions,
+                               MutateInMultiOptions,
+                               PrependMultiOptions,
+                               RemoveMultiOptions,
+                               ReplaceMultiOptions,
+                               TouchMultiOptions,
+                               UpsertMultiOptions,
+                               forward_args,
+                               get_valid_multi_args)
+from couchbase.pycbc_core import (binary_multi_operation,
+                                  binary_operation,
+                                  kv_multi_operation,
                                   kv_operation,
                                   operations,
+                                  subdoc_multi_operation,
                                   subdoc_operation)
 from couchbase.result import (CounterResult,
                               ExistsResult,
@@ -39,12 +73,18 @@ from couchbase.result import (CounterResult,
                               GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiCounterResult,
+                              MultiExistsResult,
+                              MultiGetResult,
+                              MultiLookupInResult,
+                              MultiMutateInResult,
+                              MultiMutationResult,
                               MutateInResult,
                               MutationResult)
 from couchbase.subdocument import (Spec,
                                    StoreSemantics,
                                    SubDocOp)
-from couchbase.transcoder import Transcoder
+from couchbase.transcoder import Transcoder, get_lazy_transcoder
 
 if TYPE_CHECKING:
     from couchbase._utils import JSONType
@@ -54,7 +94,9 @@ if TYPE_CHECKING:
                                    IncrementOptions,
                                    InsertOptions,
                                    MutateInOptions,
+                                   MutationMultiOptions,
                                    MutationOptions,
+                                   NoValueMultiOptions,
                                    PrependOptions,
                                    RemoveOptions,
                                    ReplaceOptions,
@@ -62,6 +104,12 @@ if TYPE_CHECKING:
                                    UnlockOptions,
                                    UpsertOptions)
 
+# defaults for the chunked multi-operations (i.e. Collection.get_multi_iter)
+DEFAULT_MULTI_ITER_CHUNK_SIZE = 100
+DEFAULT_MULTI_ITER_MAX_IN_FLIGHT = 1000
+# the number of threads used to run the chunks, regardless of how many chunks are allowed in flight
+MULTI_ITER_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 
 class CollectionLogic:
     def __init__(self, scope, name):
@@ -72,6 +120,7 @@ class CollectionLogic:
         self._scope = scope
         self._collection_name = name
         self._connection = scope.connection
+        self._near_cache = None
 
     @property
     def connection(self):
@@ -91,6 +140,94 @@ class CollectionLogic:
         """
         return self._collection_name
 
+    @property
+    def near_cache(self) -> Optional[NearCache]:
+        """
+            Optional[:class:`~couchbase.near_cache.NearCache`]: The near cache attached to this collection, if
+                enabled.
+        """
+        return self._near_cache
+
+    def enable_near_cache(self,
+                          near_cache=None,  # type: Optional[NearCache]
+                          ) -> NearCache:
+        """Attaches a client-side near cache to this collection object.  See
+        :class:`~couchbase.near_cache.NearCache` for details on what is cached and how entries are invalidated.
+
+        Args:
+            near_cache (:class:`~couchbase.near_cache.NearCache`, optional): The near cache to attach.  If not
+                provided, a :class:`~couchbase.near_cache.NearCache` with the default settings is created.
+
+        Returns:
+            :class:`~couchbase.near_cache.NearCache`: The attached near cache.
+        """
+        if near_cache is None:
+            near_cache = NearCache()
+        elif not isinstance(near_cache, NearCache):
+            raise InvalidArgumentException('near_cache must be an instance of NearCache.')
+        self.disable_near_cache()
+        near_cache._bind(self._scope.bucket_name, self._scope.name, self.name)
+        self._near_cache = near_cache
+        near_cache._start_refresh(self._refresh_near_cache)
+        return near_cache
+
+    def disable_near_cache(self) -> None:
+        """Detaches the near cache (if any) from this collection object, stopping its background refresh.
+        """
+        near_cache = self._near_cache
+        if near_cache is None:
+            return
+        self._near_cache = None
+        near_cache._stop_refresh()
+        near_cache.clear()
+
+    def _write_near_cached(self,
+                           op,  # type: Callable[..., Any]
+                           **kwargs,  # type: Any
+                           ) -> Any:
+        """**INTERNAL**
+
+        Runs the write *op*, invalidating the written key(s) in the near cache before the write is sent and again
+        once it completes.  The second invalidation drops any get that read the document before the write landed.
+        """
+        near_cache = self._near_cache
+        if near_cache is None:
+            return op(**kwargs)
+
+        op_args = kwargs['op_args']
+        keys = [kwargs['key']] if 'key' in kwargs else list(op_args)
+        near_cache.invalidate(*keys)
+        if callable(op_args.get('callback', None)):
+            # async operation, the callbacks are called once the write completes
+            op_args['callback'] = partial(near_cache._invalidate_and_call, keys, op_args['callback'])
+            op_args['errback'] = partial(near_cache._invalidate_and_call, keys, op_args.get('errback', None))
+            return op(**kwargs)
+        try:
+            return op(**kwargs)
+        finally:
+            near_cache.invalidate(*keys)
+
+    def _refresh_near_cache(self) -> None:
+        """**INTERNAL**
+
+        Verifies the near cache's entries against the server, re-fetching the documents that have changed.  This
+        is a blocking operation (the async APIs run it in an executor).
+        """
+        near_cache = self._near_cache
+        if near_cache is None or not self._connection:
+            return
+        candidates = near_cache._refresh_candidates()
+        if not candidates:
+            return
+        try:
+            exists_res = CollectionLogic.exists_multi(self, list(candidates))
+        except Exception:
+            near_cache._abort_refresh(candidates)
+            raise
+        near_cache._apply_refresh(candidates,
+                                  exists_res.results,
+                                  lambda keys: CollectionLogic.get_multi(self, keys).results)
+
     def _set_connection(self):
         """
         **INTERNAL**
@@ -213,7 +350,8 @@ class CollectionLogic:
         transcoder = final_args.pop('transcoder', self.default_transcoder)
         transcoded_value = transcoder.encode_value(value)
         op_type = operations.INSERT.value
-        return kv_operation(
+        return self._write_near_cached(
+            kv_operation,
             **self._get_connection_args(),
             key=key,
             value=transcoded_value,
@@ -233,7 +371,8 @@ class CollectionLogic:
         transcoded_value = transcoder.encode_value(value)
 
         op_type = operations.UPSERT.value
-        return kv_operation(
+        return self._write_near_cached(
+            kv_operation,
             **self._get_connection_args(),
             key=key,
             value=transcoded_value,
@@ -259,7 +398,8 @@ class CollectionLogic:
         transcoded_value = transcoder.encode_value(value)
 
         op_type = operations.REPLACE.value
-        return kv_operation(
+        return self._write_near_cached(
+            kv_operation,
             **self._get_connection_args(),
             key=key,
             value=transcoded_value,
@@ -274,7 +414,8 @@ class CollectionLogic:
                ) -> Optional[MutationResult]:
         final_args = self._get_mutation_options(*opts, **kwargs)
         op_type = operations.REMOVE.value
-        return kv_operation(
+        return self._write_near_cached(
+            kv_operation,
             **self._get_connection_args(), key=key, op_type=op_type, op_args=final_args
         )
 
@@ -286,7 +427,8 @@ class CollectionLogic:
               ) -> Optional[MutationResult]:
         kwargs["expiry"] = expiry
         op_type = operations.TOUCH.value
-        return kv_operation(
+        return self._write_near_cached(
+            kv_operation,
             **self._get_connection_args(), key=key, op_type=op_type, op_args=forward_args(kwargs, *opts)
         )
 
@@ -295,7 +437,8 @@ class CollectionLogic:
                       **kwargs,  # type: Any
                       ) -> Optional[GetResult]:
         op_type = operations.GET_AND_TOUCH.value
-        return kv_operation(
+        return self._write_near_cached(
+            kv_operation,
             **self._get_connection_args(), key=key, op_type=op_type, op_args=kwargs
         )
 
@@ -304,7 +447,8 @@ class CollectionLogic:
                      **kwargs,  # type: Any
                      ) -> Optional[GetResult]:
         op_type = operations.GET_AND_LOCK.value
-        return kv_operation(
+        return self._write_near_cached(
+            kv_operation,
             **self._get_connection_args(), key=key, op_type=op_type, op_args=kwargs
         )
 
@@ -377,17 +521,9 @@ class CollectionLogic:
         final_args = self._get_mutation_options(*opts, **kwargs)
         transcoder = final_args.pop('transcoder', self.default_transcoder)
 
-        expiry = final_args.get('expiry', None)
-        preserve_expiry = final_args.get('preserve_expiry', False)
-
-        spec_ops = [s[0] for s in spec]
-        if SubDocOp.DICT_ADD in spec_ops and preserve_expiry is True:
-            raise InvalidArgumentException(
-                'The preserve_expiry option cannot be set for mutate_in with insert operations.')
-
-        if SubDocOp.REPLACE in spec_ops and expiry and preserve_expiry is True:
-            raise InvalidArgumentException(
-                'The expiry and preserve_expiry options cannot both be set for mutate_in with replace operations.')
+        self._validate_mutate_in_expiry([s[0] for s in spec],
+                                        final_args.get('expiry', None),
+                                        final_args.get('preserve_expiry', False))
 
         """
             @TODO(jc): document that the kwarg will override option:
@@ -414,6 +550,35 @@ class CollectionLogic:
         if replace_semantics is not None:
             final_args["store_semantics"] = StoreSemantics.REPLACE
 
+        final_spec = self._encode_mutate_in_spec(spec, transcoder)
+
+        op_type = operations.MUTATE_IN.value
+        return self._write_near_cached(
+            subdoc_operation,
+            **self._get_connection_args(),
+            key=key,
+            spec=final_spec,
+            op_type=op_type,
+            op_args=final_args
+        )
+
+    @staticmethod
+    def _validate_mutate_in_expiry(spec_ops,  # type: List[int]
+                                   expiry,  # type: Optional[int]
+                                   preserve_expiry,  # type: Optional[bool]
+                                   ) -> None:
+        if SubDocOp.DICT_ADD in spec_ops and preserve_expiry is True:
+            raise InvalidArgumentException(
+                'The preserve_expiry option cannot be set for mutate_in with insert operations.')
+
+        if SubDocOp.REPLACE in spec_ops and expiry and preserve_expiry is True:
+            raise InvalidArgumentException(
+                'The expiry and preserve_expiry options cannot both be set for mutate_in with replace operations.')
+
+    @staticmethod
+    def _encode_mutate_in_spec(spec,  # type: Iterable[Spec]
+                               transcoder,  # type: Transcoder
+                               ) -> List[Spec]:
         final_spec = []
         allowed_multi_ops = [SubDocOp.ARRAY_PUSH_FIRST,
                              SubDocOp.ARRAY_PUSH_LAST,
@@ -433,15 +598,167 @@ class CollectionLogic:
                 final_spec.append(tuple(tmp))
             else:
                 final_spec.append(s)
-
-        op_type = operations.MUTATE_IN.value
-        return subdoc_operation(
-            **self._get_connection_args(),
-            key=key,
-            spec=final_spec,
-            op_type=op_type,
-            op_args=final_args
-        )
+        return final_spec
+
+    # the multi-operations block until every key has completed, the async APIs run them in an executor
+    def get_multi(self,
+                  keys,  # type: List[str]
+                  *opts,  # type: GetMultiOptions
+                  **kwargs,  # type: Dict[str, Any]
+                  ) -> MultiGetResult:
+        op_args, return_exceptions, transcoders = self._get_multi_op_args(keys,
+                                                                          *opts,
+                                                                          opts_type=GetMultiOptions,
+                                                                          **kwargs)
+        res = kv_multi_operation(**self._get_connection_args(),
+                                 op_type=operations.GET.value,
+                                 op_args=op_args)
+        self._decode_multi_values(res, transcoders)
+        return MultiGetResult(res, return_exceptions)
+
+    def get_and_lock_multi(self,
+                           keys,  # type: List[str]
+                           lock_time,  # type: timedelta
+                           *opts,  # type: GetAndLockMultiOptions
+                           **kwargs,  # type: Dict[str, Any]
+                           ) -> MultiGetResult:
+        kwargs['lock_time'] = lock_time
+        op_args, return_exceptions, transcoders = self._get_multi_op_args(keys,
+                                                                          *opts,
+                                                                          opts_type=GetAndLockMultiOptions,
+                                                                          **kwargs)
+        res = self._write_near_cached(kv_multi_operation,
+                                      **self._get_connection_args(),
+                                      op_type=operations.GET_AND_LOCK.value,
+                                      op_args=op_args)
+        self._decode_multi_values(res, transcoders)
+        return MultiGetResult(res, return_exceptions)
+
+    def exists_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: ExistsMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> MultiExistsResult:
+        op_args, return_exceptions, _ = self._get_multi_op_args(keys,
+                                                                *opts,
+                                                                opts_type=ExistsMultiOptions,
+                                                                **kwargs)
+        res = kv_multi_operation(**self._get_connection_args(),
+                                 op_type=operations.EXISTS.value,
+                                 op_args=op_args)
+        return MultiExistsResult(res, return_exceptions)
+
+    def _mutation_multi(self,
+                        op_type,  # type: int
+                        keys_and_docs,  # type: Dict[str, JSONType]
+                        *opts,  # type: MutationMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> MultiMutationResult:
+        op_args, return_exceptions = self._get_multi_mutation_transcoded_op_args(keys_and_docs, *opts, **kwargs)
+        res = self._write_near_cached(kv_multi_operation,
+                                      **self._get_connection_args(),
+                                      op_type=op_type,
+                                      op_args=op_args)
+        return MultiMutationResult(res, return_exceptions)
+
+    def insert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: InsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> MultiMutationResult:
+        return self._mutation_multi(operations.INSERT.value,
+                                    keys_and_docs,
+                                    *opts,
+                                    opts_type=InsertMultiOptions,
+                                    **kwargs)
+
+    def upsert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: UpsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> MultiMutationResult:
+        return self._mutation_multi(operations.UPSERT.value,
+                                    keys_and_docs,
+                                    *opts,
+                                    opts_type=UpsertMultiOptions,
+                                    **kwargs)
+
+    def replace_multi(self,
+                      keys_and_docs,  # type: Dict[str, JSONType]
+                      *opts,  # type: ReplaceMultiOptions
+                      **kwargs,  # type: Dict[str, Any]
+                      ) -> MultiMutationResult:
+        return self._mutation_multi(operations.REPLACE.value,
+                                    keys_and_docs,
+                                    *opts,
+                                    opts_type=ReplaceMultiOptions,
+                                    **kwargs)
+
+    def remove_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: RemoveMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> MultiMutationResult:
+        op_args, return_exceptions, _ = self._get_multi_op_args(keys,
+                                                                *opts,
+                                                                opts_type=RemoveMultiOptions,
+                                                                **kwargs)
+        res = self._write_near_cached(kv_multi_operation,
+                                      **self._get_connection_args(),
+                                      op_type=operations.REMOVE.value,
+                                      op_args=op_args)
+        return MultiMutationResult(res, return_exceptions)
+
+    def touch_multi(self,
+                    keys,  # type: List[str]
+                    expiry,  # type: timedelta
+                    *opts,  # type: TouchMultiOptions
+                    **kwargs,  # type: Dict[str, Any]
+                    ) -> MultiMutationResult:
+        kwargs['expiry'] = expiry
+        op_args, return_exceptions, _ = self._get_multi_op_args(keys,
+                                                                *opts,
+                                                                opts_type=TouchMultiOptions,
+                                                                **kwargs)
+        res = self._write_near_cached(kv_multi_operation,
+                                      **self._get_connection_args(),
+                                      op_type=operations.TOUCH.value,
+                                      op_args=op_args)
+        return MultiMutationResult(res, return_exceptions)
+
+    def lookup_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: LookupInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> MultiLookupInResult:
+        op_args, return_exceptions, transcoders = self._get_multi_subdoc_op_args(keys_and_specs,
+                                                                                 spec,
+                                                                                 *opts,
+                                                                                 opts_type=LookupInMultiOptions,
+                                                                                 **kwargs)
+        res = subdoc_multi_operation(**self._get_connection_args(),
+                                     op_type=operations.LOOKUP_IN.value,
+                                     op_args=op_args)
+        self._decode_multi_values(res, transcoders, is_subdoc=True)
+        return MultiLookupInResult(res, return_exceptions)
+
+    def mutate_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: MutateInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> MultiMutateInResult:
+        op_args, return_exceptions, _ = self._get_multi_subdoc_op_args(keys_and_specs,
+                                                                       spec,
+                                                                       *opts,
+                                                                       opts_type=MutateInMultiOptions,
+                                                                       **kwargs)
+        res = self._write_near_cached(subdoc_multi_operation,
+                                      **self._get_connection_args(),
+                                      op_type=operations.MUTATE_IN.value,
+                                      op_args=op_args)
+        return MultiMutateInResult(res, return_exceptions)
 
     def _validate_delta_initial(self, delta=None, initial=None) -> None:
         # @TODO: remove deprecation next .minor
@@ -465,6 +782,396 @@ class CollectionLogic:
 
         return delta, initial
 
+    def _get_multi_mutation_transcoded_op_args(
+        self,
+        keys_and_docs,  # type: Dict[str, JSONType]
+        *opts,  # type: MutationMultiOptions
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+
+        if not isinstance(keys_and_docs, dict):
+            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+        per_key_args = final_args.pop('per_key_options', None)
+        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
+        op_args = {}
+        for key, value in keys_and_docs.items():
+            op_args[key] = copy(final_args)
+            # per key args override global args
+            if per_key_args and key in per_key_args:
+                key_transcoder = per_key_args.pop('transcoder', op_transcoder)
+                op_args[key].update(per_key_args[key])
+                transcoded_value = key_transcoder.encode_value(value)
+            else:
+                transcoded_value = op_transcoder.encode_value(value)
+            op_args[key]['value'] = transcoded_value
+
+        if isinstance(opts_type, ReplaceMultiOptions):
+            for k, v in op_args.items():
+                expiry = v.get('expiry', None)
+                preserve_expiry = v.get('preserve_expiry', False)
+                if expiry and preserve_expiry is True:
+                    raise InvalidArgumentException(
+                        message=("The expiry and preserve_expiry options cannot "
+                                 f"both be set for replace operations.  Multi-op key: {k}.")
+                    )
+
+        return_exceptions = final_args.pop('return_exceptions', True)
+        return op_args, return_exceptions
+
+    def _get_multi_op_args(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: NoValueMultiOptions
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool, Dict[str, Transcoder]]:
+        if not isinstance(keys, list):
+            raise InvalidArgumentException(message='Expected keys to be a list.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+        base_transcoder = final_args.pop('transcoder', self.default_transcoder)
+        lazy_decode = final_args.pop('lazy_decode', None)
+        op_transcoder = get_lazy_transcoder(base_transcoder, lazy_decode)
+        per_key_args = final_args.pop('per_key_options', None)
+        return_exceptions = final_args.pop('return_exceptions', True)
+        op_args = self._get_shared_multi_op_args(keys, final_args, per_key_args)
+        key_transcoders = {}
+        for key in keys:
+            key_transcoders[key] = op_transcoder
+            if op_args[key] is final_args:
+                continue
+            # per key args override global args
+            key_transcoder = op_args[key].pop('transcoder', None)
+            key_lazy_decode = op_args[key].pop('lazy_decode', None)
+            if key_transcoder is not None or key_lazy_decode is not None:
+                key_transcoders[key] = get_lazy_transcoder(key_transcoder or base_transcoder,
+                                                           lazy_decode if key_lazy_decode is None else key_lazy_decode)
+
+        return op_args, return_exceptions, key_transcoders
+
+    def _get_shared_multi_op_args(
+        self,
+        keys,  # type: List[str]
+        base_args,  # type: Dict[str, Any]
+        per_key_args,  # type: Optional[Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """**INTERNAL**
+
+        Keys without per key options all share the same (read-only) *base_args* dict, only keys with per key
+        options get their own copy.
+        """
+        if not per_key_args:
+            return dict.fromkeys(keys, base_args)
+
+        op_args = {}
+        for key in keys:
+            key_args = per_key_args.get(key, None)
+            op_args[key] = {**base_args, **key_args} if key_args else base_args
+        return op_args
+
+    def _get_multi_subdoc_op_args(  # noqa: C901
+        self,
+        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+        spec,  # type: Optional[Union[Iterable[Spec], LookupInMultiOptions, MutateInMultiOptions]]
+        *opts,  # type: Union[LookupInMultiOptions, MutateInMultiOptions]
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool, Dict[str, Transcoder]]:
+        """**INTERNAL**
+
+        *keys_and_specs* is either a dict of key -> specs or a list of keys that all use the shared *spec*.  As the
+        options are positional, the options can take the place of *spec* when the specs are provided per key.
+        """
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        if isinstance(spec, dict):
+            opts = (spec,) + opts
+            spec = None
+
+        if isinstance(keys_and_specs, dict):
+            if spec is not None:
+                raise InvalidArgumentException(
+                    message='A shared spec cannot be provided when keys_and_specs is a dict of per key specs.')
+            key_specs = {k: list(v) for k, v in keys_and_specs.items()}
+            keys = list(key_specs)
+        elif isinstance(keys_and_specs, list):
+            if spec is None:
+                raise InvalidArgumentException(message='Expected a shared spec when keys_and_specs is a list of keys.')
+            key_specs = None
+            keys = keys_and_specs
+            spec = list(spec)
+        else:
+            raise InvalidArgumentException(message='Expected keys_and_specs to be a dict or a list.')
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+        # copy the per key options as they are updated below
+        per_key_args = {k: dict(v) for k, v in (final_args.pop('per_key_options', None) or {}).items()}
+        return_exceptions = final_args.pop('return_exceptions', True)
+        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
+        key_transcoders = dict.fromkeys(keys, op_transcoder)
+        for key, args in per_key_args.items():
+            # per key args override global args
+            key_transcoder = args.pop('transcoder', None)
+            if key_transcoder is not None and key in key_transcoders:
+                key_transcoders[key] = key_transcoder
+
+        is_mutation = opts_type is MutateInMultiOptions
+        if is_mutation:
+            for args in [final_args, *per_key_args.values()]:
+                if 'durability' in args:
+                    args['durability'] = DurabilityParser.parse_durability(args['durability'])
+                    if isinstance(args['durability'], int) and 'timeout' not in final_args and 'timeout' not in args:
+                        args['timeout'] = timedelta_as_microseconds(timedelta(seconds=10))
+
+        if key_specs is None:
+            # the (encoded) spec is shared by every key, keys without per key options also share the op args
+            if is_mutation:
+                encoded_spec = tuple(self._encode_mutate_in_spec(spec, op_transcoder))
+                spec_ops = [s[0] for s in spec]
+                for key_args in [final_args, *per_key_args.values()]:
+                    merged = {**final_args, **key_args}
+                    self._validate_mutate_in_expiry(spec_ops,
+                                                    merged.get('expiry', None),
+                                                    merged.get('preserve_expiry', False))
+            else:
+                encoded_spec = tuple(spec)
+            final_args['spec'] = encoded_spec
+            op_args = self._get_shared_multi_op_args(keys, final_args, per_key_args)
+            if is_mutation:
+                # a key w/ its own transcoder needs its own op args, the shared args must not be modified
+                for key, key_transcoder in key_transcoders.items():
+                    if key_transcoder is not op_transcoder:
+                        op_args[key] = {**op_args[key],
+                                        'spec': tuple(self._encode_mutate_in_spec(spec, key_transcoder))}
+            return op_args, return_exceptions, key_transcoders
+
+        op_args = {}
+        for key in keys:
+            key_spec = key_specs[key]
+            key_args = {**final_args, **per_key_args.get(key, {})}
+            if is_mutation:
+                self._validate_mutate_in_expiry([s[0] for s in key_spec],
+                                                key_args.get('expiry', None),
+                                                key_args.get('preserve_expiry', False))
+                key_spec = self._encode_mutate_in_spec(key_spec, key_transcoders[key])
+            key_args['spec'] = tuple(key_spec)
+            op_args[key] = key_args
+        return op_args, return_exceptions, key_transcoders
+
+    def _get_multi_counter_op_args(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: Union[IncrementMultiOptions, DecrementMultiOptions]
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+        if not isinstance(keys, list):
+            raise InvalidArgumentException(message='Expected keys to be a list.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+
+        global_delta, global_initial = self._get_and_validate_delta_initial(final_args)
+        final_args['delta'] = int(global_delta)
+        final_args['initial'] = int(global_initial)
+
+        per_key_args = final_args.pop('per_key_options', None)
+        return_exceptions = final_args.pop('return_exceptions', True)
+        if per_key_args:
+            for key in keys:
+                if key not in per_key_args:
+                    continue
+                # need to validate delta/initial if provided per key
+                delta = per_key_args[key].get('delta', None)
+                initial = per_key_args[key].get('initial', None)
+                self._validate_delta_initial(delta=delta, initial=initial)
+                if delta:
+                    per_key_args[key]['delta'] = int(delta)
+                if initial:
+                    per_key_args[key]['initial'] = int(initial)
+
+        op_args = self._get_shared_multi_op_args(keys, final_args, per_key_args)
+        return op_args, return_exceptions
+
+    def _get_multi_binary_mutation_op_args(
+        self,
+        keys_and_docs,  # type: Dict[str, Union[str, bytes, bytearray]]
+        *opts,  # type: Union[AppendMultiOptions, PrependMultiOptions]
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+
+        if not isinstance(keys_and_docs, dict):
+            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        parsed_keys_and_docs = {}
+        for k, v in keys_and_docs.items():
+            if isinstance(v, str):
+                value = v.encode("utf-8")
+            elif isinstance(v, bytearray):
+                value = bytes(v)
+            else:
+                value = v
+
+            if not isinstance(value, bytes):
+                raise ValueError(
+                    "The value provided must of type str, bytes or bytearray.")
+
+            parsed_keys_and_docs[k] = value
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+        per_key_args = final_args.pop('per_key_options', None)
+        op_args = {}
+        for key, value in parsed_keys_and_docs.items():
+            op_args[key] = copy(final_args)
+            # per key args override global args
+            if per_key_args and key in per_key_args:
+                op_args[key].update(per_key_args[key])
+            op_args[key]['value'] = value
+
+        return_exceptions = final_args.pop('return_exceptions', True)
+        return op_args, return_exceptions
+
+    def _decode_multi_values(self,
+                             res,  # type: Any
+                             transcoders,  # type: Dict[str, Transcoder]
+                             is_subdoc=False,  # type: Optional[bool]
+                             ) -> None:
+        for k, v in res.raw_result.items():
+            if k == 'all_okay':
+                continue
+            if isinstance(v, CouchbaseBaseException):
+                continue
+            value = v.raw_result.get('value', None)
+            flags = v.raw_result.get('flags', None)
+            tc = transcoders[k]
+            v.raw_result['value'] = decode_value(tc, value, flags, is_subdoc=is_subdoc)
+
+    @staticmethod
+    def _get_multi_iter_window(chunk_size,  # type: Optional[int]
+                               max_in_flight,  # type: Optional[int]
+                               ) -> Tuple[int, int]:
+        """**INTERNAL**
+
+        Returns the chunk size and the number of chunks allowed to be in flight at once.
+        """
+        if chunk_size is None:
+            chunk_size = DEFAULT_MULTI_ITER_CHUNK_SIZE
+        if max_in_flight is None:
+            max_in_flight = DEFAULT_MULTI_ITER_MAX_IN_FLIGHT
+        for name, val in (('chunk_size', chunk_size), ('max_in_flight', max_in_flight)):
+            if not isinstance(val, int) or isinstance(val, bool) or val < 1:
+                raise InvalidArgumentException(message=f'{name} must be a positive int.')
+        if max_in_flight < chunk_size:
+            chunk_size = max_in_flight
+        return chunk_size, max_in_flight // chunk_size
+
+    @staticmethod
+    def _iter_key_chunks(keys,  # type: Iterable[str]
+                         chunk_size,  # type: int
+                         ) -> Iterator[List[str]]:
+        """**INTERNAL**
+
+        Lazily splits *keys* into lists of (at most) *chunk_size* keys.
+        """
+        if isinstance(keys, str):
+            raise InvalidArgumentException(message='Expected keys to be an iterable of keys.')
+        it = iter(keys)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _iter_doc_chunks(keys_and_docs,  # type: Union[Dict[str, Any], Iterable[Tuple[str, Any]]]
+                         chunk_size,  # type: int
+                         ) -> Iterator[Dict[str, Any]]:
+        """**INTERNAL**
+
+        Lazily splits *keys_and_docs* (a dict or an iterable of ``(key, doc)`` pairs) into dicts of (at most)
+        *chunk_size* documents.
+        """
+        if isinstance(keys_and_docs, Mapping):
+            keys_and_docs = keys_and_docs.items()
+        elif isinstance(keys_and_docs, str):
+            raise InvalidArgumentException(message='Expected keys_and_docs to be an iterable of (key, doc) pairs.')
+        it = iter(keys_and_docs)
+        while True:
+            chunk = dict(islice(it, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _iter_multi_results(res,  # type: Union[MultiGetResult, MultiMutationResult]
+                            ) -> Iterator[Tuple[str, Union[GetResult, MutationResult, CouchbaseBaseException]]]:
+        """**INTERNAL**
+        """
+        return res._iter_results()
+
+    def _run_multi_chunks(self,
+                          multi_op,  # type: Callable[[Any], Union[MultiGetResult, MultiMutationResult]]
+                          chunks,  # type: Iterator[Any]
+                          max_chunks,  # type: int
+                          ) -> Iterator[Union[MultiGetResult, MultiMutationResult]]:
+        """**INTERNAL**
+
+        Runs the blocking *multi_op* for each chunk with at most *max_chunks* chunks in flight, yielding the result
+        of each chunk as it completes.  The multi-operations release the GIL while waiting on the C++ client, so
+        the chunks are run on a thread pool of at most ``MULTI_ITER_MAX_WORKERS`` threads; chunks beyond the
+        pool's size wait in the pool's queue (*max_chunks* bounds the keys in flight, not the threads).
+        """
+        if max_chunks == 1:
+            for chunk in chunks:
+                yield multi_op(chunk)
+            return
+
+        max_workers = min(max_chunks, MULTI_ITER_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pycbc-multi-iter') as executor:
+            in_flight = set()
+            try:
+                for chunk in chunks:
+                    if len(in_flight) >= max_chunks:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for ft in done:
+                            yield ft.result()
+                    in_flight.add(executor.submit(multi_op, chunk))
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for ft in done:
+                        yield ft.result()
+            finally:
+                for ft in in_flight:
+                    ft.cancel()
+
+    def _run_multi_iter(self,
+                        multi_op,  # type: Callable[[Any], Union[MultiGetResult, MultiMutationResult]]
+                        chunks,  # type: Iterator[Any]
+                        max_chunks,  # type: int
+                        ) -> Iterator[Tuple[str, Union[GetResult, MutationResult, CouchbaseBaseException]]]:
+        """**INTERNAL**
+
+        Flattens the results of :meth:`_run_multi_chunks` into ``(key, result)`` pairs.
+        """
+        for res in self._run_multi_chunks(multi_op, chunks, max_chunks):
+            yield from self._iter_multi_results(res)
+
     def increment(
         self,
         key,  # type: str
@@ -483,10 +1190,11 @@ class CollectionLogic:
         op_type = operations.INCREMENT.value
         final_args['initial'] = int(final_args['initial'])
         final_args['delta'] = int(final_args['delta'])
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                op_args=final_args)
+        return self._write_near_cached(binary_operation,
+                                       **self._get_connection_args(),
+                                       key=key,
+                                       op_type=op_type,
+                                       op_args=final_args)
 
     def decrement(
         self,
@@ -506,10 +1214,11 @@ class CollectionLogic:
         op_type = operations.DECREMENT.value
         final_args['initial'] = int(final_args['initial'])
         final_args['delta'] = int(final_args['delta'])
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                op_args=final_args)
+        return self._write_near_cached(binary_operation,
+                                       **self._get_connection_args(),
+                                       key=key,
+                                       op_type=op_type,
+                                       op_args=final_args)
 
     def append(
         self,
@@ -529,11 +1238,12 @@ class CollectionLogic:
                 "The value provided must of type str, bytes or bytearray.")
 
         op_type = operations.APPEND.value
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                value=value,
-                                op_args=final_args)
+        return self._write_near_cached(binary_operation,
+                                       **self._get_connection_args(),
+                                       key=key,
+                                       op_type=op_type,
+                                       value=value,
+                                       op_args=final_args)
 
     def prepend(
         self,
@@ -553,11 +1263,82 @@ class CollectionLogic:
                 "The value provided must of type str, bytes or bytearray.")
 
         op_type = operations.PREPEND.value
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                value=value,
-                                op_args=final_args)
+        return self._write_near_cached(binary_operation,
+                                       **self._get_connection_args(),
+                                       key=key,
+                                       op_type=op_type,
+                                       value=value,
+                                       op_args=final_args)
+
+    def _binary_mutation_multi(self,
+                               op_type,  # type: int
+                               keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+                               *opts,  # type: Union[AppendMultiOptions, PrependMultiOptions]
+                               **kwargs,  # type: Dict[str, Any]
+                               ) -> MultiMutationResult:
+        op_args, return_exceptions = self._get_multi_binary_mutation_op_args(keys_and_values, *opts, **kwargs)
+        res = self._write_near_cached(binary_multi_operation,
+                                      **self._get_connection_args(),
+                                      op_type=op_type,
+                                      op_args=op_args)
+        return MultiMutationResult(res, return_exceptions)
+
+    def _counter_multi(self,
+                       op_type,  # type: int
+                       keys,  # type: List[str]
+                       *opts,  # type: Union[IncrementMultiOptions, DecrementMultiOptions]
+                       **kwargs,  # type: Dict[str, Any]
+                       ) -> MultiCounterResult:
+        op_args, return_exceptions = self._get_multi_counter_op_args(keys, *opts, **kwargs)
+        res = self._write_near_cached(binary_multi_operation,
+                                      **self._get_connection_args(),
+                                      op_type=op_type,
+                                      op_args=op_args)
+        return MultiCounterResult(res, return_exceptions)
+
+    def append_multi(self,
+                     keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+                     *opts,  # type: AppendMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> MultiMutationResult:
+        return self._binary_mutation_multi(operations.APPEND.value,
+                                           keys_and_values,
+                                           *opts,
+                                           opts_type=AppendMultiOptions,
+                                           **kwargs)
+
+    def prepend_multi(self,
+                      keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+                      *opts,  # type: PrependMultiOptions
+                      **kwargs,  # type: Dict[str, Any]
+                      ) -> MultiMutationResult:
+        return self._binary_mutation_multi(operations.PREPEND.value,
+                                           keys_and_values,
+                                           *opts,
+                                           opts_type=PrependMultiOptions,
+                                           **kwargs)
+
+    def increment_multi(self,
+                        keys,  # type: List[str]
+                        *opts,  # type: IncrementMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> MultiCounterResult:
+        return self._counter_multi(operations.INCREMENT.value,
+                                   keys,
+                                   *opts,
+                                   opts_type=IncrementMultiOptions,
+                                   **kwargs)
+
+    def decrement_multi(self,
+                        keys,  # type: List[str]
+                        *opts,  # type: DecrementMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> MultiCounterResult:
+        return self._counter_multi(operations.DECREMENT.value,
+                                   keys,
+                                   *opts,
+                                   opts_type=DecrementMultiOptions,
+                                   **kwargs)
 
     def build_scan_args(self,  # noqa: C901
                         scan_type,  # type: Union[RangeScan, PrefixScan, SamplingScan]
@@ -603,14 +1384,14 @@ class CollectionLogic:
         else:
             raise InvalidArgumentException('scan_type must be Union[RangeScan, PrefixScan, SamplingScan]')
 
-        transcoder = kwargs.pop('transcoder', None)
+        transcoder = get_lazy_transcoder(kwargs.pop('transcoder', None), kwargs.pop('lazy_decode', None))
 
         consistent_with = kwargs.pop('consistent_with', None)
         if consistent_with:
-            if not (isinstance(consistent_with, MutationState) and len(consistent_with._sv) > 0):
+            if not isinstance(consistent_with, MutationState) or consistent_with._is_empty():
                 raise InvalidArgumentException('Passed empty or invalid mutation state')
             else:
-                kwargs['consistent_with'] = list(token.as_dict() for token in consistent_with._sv)
+                kwargs['consistent_with'] = consistent_with._to_dicts()
 
         return_args = {
             'transcoder': transcoder,
@@ -17,7 +17,11 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING, Optional
+from typing import (TYPE_CHECKING,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
 
 from couchbase.exceptions import ErrorMapper, InvalidArgumentException
 from couchbase.exceptions import exception as CouchbaseBaseException
@@ -29,22 +33,39 @@ if TYPE_CHECKING:
     from couchbase.transcoder import Transcoder
 
 
+# when a side of the range is unbounded, partition boundaries are interpolated within printable ASCII
+PARTITION_KEY_LOWER_BOUND = b'!'
+PARTITION_KEY_UPPER_BOUND = b'\x7f'
+# keys are ordered by their UTF-8 bytes, 0xFF never occurs in a valid UTF-8 key
+MAX_KEY_BYTE = b'\xff'
+
+
 class ScanTerm:
     """Represents a search term for a RangeScan
+
+    The term can be provided as raw bytes in order to express bounds that are not valid UTF-8 (i.e. ``b'\\xff'``).
     """
 
-    def __init__(self, term,  # type: str
+    def __init__(self, term,  # type: Union[str, bytes]
                  exclusive=None  # type: Optional[bool]
                  ) -> None:
 
         self._term = None
-        if isinstance(term, str):
+        if isinstance(term, (str, bytes)):
             self._term = term
         else:
-            raise InvalidArgumentException('Invalid term value provided.  Expected str.')
+            raise InvalidArgumentException('Invalid term value provided.  Expected str or bytes.')
 
         self._exclusive = exclusive
 
+    @property
+    def term(self) -> Union[str, bytes]:
+        return self._term
+
+    @property
+    def exclusive(self) -> Optional[bool]:
+        return self._exclusive
+
     def to_dict(self):
         return {
             'term': self._term,
@@ -77,6 +98,34 @@ class RangeScan(ScanType):
     def end(self) -> ScanTerm:
         return self._end
 
+    def partition(self,
+                  num_partitions=None,  # type: Optional[int]
+                  split_points=None,  # type: Optional[List[Union[str, bytes]]]
+                  ) -> List[RangeScan]:
+        """Splits the scan into disjoint :class:`.RangeScan` sub-ranges that together cover this scan's range.  Each
+        sub-range can be scanned independently (i.e. by a different thread or process).
+
+        Args:
+            num_partitions (int, optional): The number of sub-ranges to create.  The boundaries are interpolated
+                between the scan's start and end keys (or within printable ASCII if a side is unbounded), so the
+                sub-ranges are only evenly sized if the keys are evenly distributed.
+            split_points (List[Union[str, bytes]], optional): Explicit keys to split the range at, i.e. sampled
+                from the key distribution.  Each split point starts a new (inclusive) sub-range.
+
+        Returns:
+            List[:class:`.RangeScan`]: The sub-ranges, in key order.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If neither, or both, of num_partitions and
+                split_points is provided or num_partitions is not a positive int.
+        """
+        start = _term_as_bytes(self._start) if self._start is not None else b''
+        end = _term_as_bytes(self._end) if self._end is not None else MAX_KEY_BYTE
+        interior = (start if self._start is not None else PARTITION_KEY_LOWER_BOUND,
+                    end if self._end is not None else PARTITION_KEY_UPPER_BOUND)
+        boundaries = _get_partition_boundaries(start, end, interior, num_partitions, split_points)
+        return _build_partitions(self._start, self._end, boundaries)
+
 
 class PrefixScan(ScanType):
     """A PrefixScan performs a scan on a given prefix
@@ -91,6 +140,34 @@ class PrefixScan(ScanType):
     def prefix(self) -> str:
         return self._prefix
 
+    def partition(self,
+                  num_partitions=None,  # type: Optional[int]
+                  split_points=None,  # type: Optional[List[Union[str, bytes]]]
+                  ) -> List[RangeScan]:
+        """Splits the scan into disjoint :class:`.RangeScan` sub-ranges that together cover all keys with the
+        scan's prefix.  Each sub-range can be scanned independently (i.e. by a different thread or process).
+
+        Args:
+            num_partitions (int, optional): The number of sub-ranges to create.  The boundaries are interpolated
+                within printable ASCII following the prefix, so the sub-ranges are only evenly sized if the keys are
+                evenly distributed.
+            split_points (List[Union[str, bytes]], optional): Explicit keys to split the range at, i.e. sampled
+                from the key distribution.  Each split point starts a new (inclusive) sub-range.
+
+        Returns:
+            List[:class:`.RangeScan`]: The sub-ranges, in key order.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If neither, or both, of num_partitions and
+                split_points is provided or num_partitions is not a positive int.
+        """
+        prefix = self._prefix.encode('utf-8')
+        start = ScanTerm(self._prefix)
+        end = ScanTerm(prefix + MAX_KEY_BYTE)
+        interior = (prefix + PARTITION_KEY_LOWER_BOUND, prefix + PARTITION_KEY_UPPER_BOUND)
+        boundaries = _get_partition_boundaries(prefix, prefix + MAX_KEY_BYTE, interior, num_partitions, split_points)
+        return _build_partitions(start, end, boundaries)
+
 
 class SamplingScan(ScanType):
     """A SamplingScan performs a scan on a random sampling of keys with the sampling bounded by a limit.
@@ -111,6 +188,95 @@ class SamplingScan(ScanType):
         return self._seed
 
 
+def _term_as_bytes(term  # type: ScanTerm
+                   ) -> bytes:
+    if isinstance(term.term, bytes):
+        return term.term
+    return term.term.encode('utf-8')
+
+
+def _interpolate_boundaries(low,  # type: bytes
+                            high,  # type: bytes
+                            num_partitions,  # type: int
+                            ) -> List[bytes]:
+    """**INTERNAL**
+
+    Returns (at most) num_partitions - 1 keys evenly spaced between low and high, treating the bytes following their
+    common prefix as a base-256 number.
+    """
+    prefix_len = 0
+    while prefix_len < min(len(low), len(high)) and low[prefix_len] == high[prefix_len]:
+        prefix_len += 1
+    prefix = low[:prefix_len]
+
+    # widen the interpolated suffix until there is room for every boundary
+    for width in range(1, 9):
+        lo = int.from_bytes(low[prefix_len:prefix_len + width].ljust(width, b'\x00'), 'big')
+        hi = int.from_bytes(high[prefix_len:prefix_len + width].ljust(width, b'\x00'), 'big')
+        if hi - lo >= num_partitions:
+            break
+
+    boundaries = []
+    for i in range(1, num_partitions):
+        suffix = (lo + (hi - lo) * i // num_partitions).to_bytes(width, 'big').rstrip(b'\x00')
+        boundaries.append(prefix + suffix)
+    return boundaries
+
+
+def _get_partition_boundaries(start,  # type: bytes
+                              end,  # type: bytes
+                              interior,  # type: Tuple[bytes, bytes]
+                              num_partitions,  # type: Optional[int]
+                              split_points,  # type: Optional[List[Union[str, bytes]]]
+                              ) -> List[bytes]:
+    """**INTERNAL**
+
+    Returns the sorted, de-duplicated boundaries strictly within (start, end).
+    """
+    if (num_partitions is None) == (split_points is None):
+        raise InvalidArgumentException('Must provide either num_partitions or split_points.')
+
+    if split_points is not None:
+        if not all(map(lambda p: isinstance(p, (str, bytes)), split_points)):
+            raise InvalidArgumentException('split_points must be a list of str or bytes keys.')
+        boundaries = [p.encode('utf-8') if isinstance(p, str) else p for p in split_points]
+    else:
+        if not isinstance(num_partitions, int) or isinstance(num_partitions, bool) or num_partitions < 1:
+            raise InvalidArgumentException('num_partitions must be a positive int.')
+        low, high = max(interior[0], start), min(interior[1], end)
+        if low >= high:
+            # the interior range is outside of the scan's range, interpolate over the whole range instead
+            low, high = start, end
+        boundaries = _interpolate_boundaries(low, high, num_partitions)
+
+    return sorted(set(b for b in boundaries if start < b < end))
+
+
+def _build_partitions(start,  # type: Optional[ScanTerm]
+                      end,  # type: Optional[ScanTerm]
+                      boundaries,  # type: List[bytes]
+                      ) -> List[RangeScan]:
+    """**INTERNAL**
+
+    Each boundary ends a sub-range (exclusive) and starts the next (inclusive).  The first and last sub-ranges keep
+    the scan's original start and end terms.
+    """
+    terms = []
+    for boundary in boundaries:
+        try:
+            terms.append(boundary.decode('utf-8'))
+        except UnicodeDecodeError:
+            terms.append(boundary)
+
+    partitions = []
+    lower = start
+    for term in terms:
+        partitions.append(RangeScan(start=lower, end=ScanTerm(term, exclusive=True)))
+        lower = ScanTerm(term, exclusive=False)
+    partitions.append(RangeScan(start=lower, end=end))
+    return partitions
+
+
 class RangeScanRequestLogic:
     """
     ** INTERNAL **
@@ -326,6 +326,8 @@ class N1QLQuery:
         "preserve_expiry": {"preserve_expiry": lambda x: x},
         "use_replica": {"use_replica": lambda x: x},
         "serializer": {"serializer": lambda x: x},
+        "stream_rows": {"stream_rows": lambda x: x},
+        "stream_high_water_mark": {"stream_high_water_mark": lambda x: x},
         "positional_parameters": {},
         "named_parameters": {},
         "span": {"span": lambda x: x}
@@ -494,11 +496,11 @@ class N1QLQuery:
 
         # avoid circular import
         from couchbase.mutation_state import MutationState  # noqa: F811
-        if not (isinstance(value, MutationState) and len(value._sv) > 0):
+        if not isinstance(value, MutationState) or value._is_empty():
             raise TypeError('Passed empty or invalid state')
         # 3.x SDK had to set the consistency, couchbase++ will take care of that for us
         self._params.pop('scan_consistency', None)
-        self.set_option('mutation_state', list(mt.as_dict() for mt in value._sv))
+        self.set_option('mutation_state', value._to_dicts())
 
     @property
     def adhoc(self) -> bool:
@@ -646,6 +648,28 @@ class N1QLQuery:
                     ) -> None:
         self.set_option('use_replica', value)
 
+    @property
+    def stream_rows(self) -> bool:
+        return self._params.get('stream_rows', False)
+
+    @stream_rows.setter
+    def stream_rows(self, value  # type: bool
+                    ) -> None:
+        if not isinstance(value, bool):
+            raise InvalidArgumentException(message='stream_rows must be a bool.')
+        self.set_option('stream_rows', value)
+
+    @property
+    def stream_high_water_mark(self) -> Optional[int]:
+        return self._params.get('stream_high_water_mark', None)
+
+    @stream_high_water_mark.setter
+    def stream_high_water_mark(self, value  # type: int
+                               ) -> None:
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise InvalidArgumentException(message='stream_high_water_mark must be a positive int.')
+        self.set_option('stream_high_water_mark', value)
+
     @property
     def raw(self) -> Optional[Dict[str, Any]]:
         return self._params.get('raw', None)
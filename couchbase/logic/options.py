@@ -47,6 +47,7 @@ if TYPE_CHECKING:
     from couchbase.n1ql import QueryProfile, QueryScanConsistency
     from couchbase.search import (Facet,
                                   HighlightStyle,
+                                  SearchMergeStrategy,
                                   SearchScanConsistency,
                                   Sort)
     from couchbase.serializer import Serializer
@@ -114,6 +115,9 @@ VALID_MULTI_OPTS = {
     'cas': validate_int,
     'durability': lambda x: x,
     'transcoder': lambda x: x,
+    'lazy_decode': validate_bool,
+    'access_deleted': validate_bool,
+    'store_semantics': lambda x: x,
     'span': lambda x: x,
     'project': lambda x: x,
     'delta': lambda x: x,
@@ -555,6 +559,7 @@ class ClusterOptionsBase(dict):
         "dns_nameserver": {"dns_nameserver": validate_str},
         "dns_port": {"dns_port": validate_int},
         "dump_configuration": {"dump_configuration": validate_bool},
+        "streaming_executor_max_workers": {"streaming_executor_max_workers": validate_int},
     }
 
     @overload
@@ -576,7 +581,7 @@ class ClusterOptionsBase(dict):
         enable_metrics=None,    # type: Optional[bool]
         network=None,    # type: Optional[str]
         tls_verify=None,    # type: Optional[Union[TLSVerifyMode, str]]
-        serializer=None,  # type: Optional[Serializer]
+        serializer=None,  # type: Optional[Union[Serializer, str]]
         transcoder=None,  # type: Optional[Transcoder]
         tcp_keep_alive_interval=None,  # type: Optional[timedelta]
         config_poll_interval=None,  # type: Optional[timedelta]
@@ -596,6 +601,7 @@ class ClusterOptionsBase(dict):
         dns_port=None,  # type: Optional[int]
         disable_mozilla_ca_certificates=None,  # type: Optional[bool]
         dump_configuration=None,  # type: Optional[bool]
+        streaming_executor_max_workers=None,  # type: Optional[int]
     ):
         """ClusterOptions instance."""
 
@@ -808,6 +814,7 @@ class ScanOptionsBase(OptionsTimeoutBase):
             batch_item_limit=None,  # type: Optional[int]
             batch_time_limit=None,  # type: Optional[timedelta]
             transcoder=None,  # type: Optional[Transcoder]
+            lazy_decode=None,  # type: Optional[bool]
             concurrency=None,  # type: Optional[int]
             span=None,  # type: Optional[Any]
     ):
@@ -826,6 +833,7 @@ class ScanOptionsBase(OptionsTimeoutBase):
                 'batch_item_limit',
                 'concurrency',
                 'transcoder',
+                'lazy_decode',
                 'span']
 
 
@@ -867,7 +875,8 @@ class GetOptionsBase(OptionsTimeoutBase):
         timeout=None,  # type: Optional[timedelta]
         with_expiry=None,  # type: Optional[bool]
         project=None,  # type: Optional[Iterable[str]]
-        transcoder=None  # type: Optional[Transcoder]
+        transcoder=None,  # type: Optional[Transcoder]
+        lazy_decode=None  # type: Optional[bool]
     ):
         pass
 
@@ -912,7 +921,8 @@ class GetAllReplicasOptionsBase(OptionsTimeoutBase):
     @overload
     def __init__(self,
                  timeout=None,  # type: Optional[timedelta]
-                 transcoder=None  # type: Optional[Transcoder]
+                 transcoder=None,  # type: Optional[Transcoder]
+                 lazy_decode=None  # type: Optional[bool]
                  ):
         pass
 
@@ -925,7 +935,8 @@ class GetAndTouchOptionsBase(OptionsTimeoutBase):
     @overload
     def __init__(self,
                  timeout=None,  # type: Optional[timedelta]
-                 transcoder=None  # type: Optional[Transcoder]
+                 transcoder=None,  # type: Optional[Transcoder]
+                 lazy_decode=None  # type: Optional[bool]
                  ):
         pass
 
@@ -938,7 +949,8 @@ class GetAndLockOptionsBase(OptionsTimeoutBase):
     @overload
     def __init__(self,
                  timeout=None,  # type: Optional[timedelta]
-                 transcoder=None  # type: Optional[Transcoder]
+                 transcoder=None,  # type: Optional[Transcoder]
+                 lazy_decode=None  # type: Optional[bool]
                  ):
         pass
 
@@ -951,7 +963,8 @@ class GetAnyReplicaOptionsBase(OptionsTimeoutBase):
     @overload
     def __init__(self,
                  timeout=None,  # type: Optional[timedelta]
-                 transcoder=None  # type: Optional[Transcoder]
+                 transcoder=None,  # type: Optional[Transcoder]
+                 lazy_decode=None  # type: Optional[bool]
                  ):
         pass
 
@@ -1134,7 +1147,9 @@ class QueryOptionsBase(dict):
         send_to_node=None,  # type: Optional[str]
         raw=None,  # type: Optional[Dict[str,Any]]
         span=None,  # type: Optional[Any]
-        serializer=None  # type: Optional[Serializer]
+        serializer=None,  # type: Optional[Serializer]
+        stream_rows=None,  # type: Optional[bool]
+        stream_high_water_mark=None  # type: Optional[int]
     ):
         pass
 
@@ -1204,6 +1219,7 @@ class SearchOptionsBase(OptionsTimeoutBase):
                  show_request=None,      # type: Optional[bool]
                  log_request=None,      # type: Optional[bool]
                  log_response=None,      # type: Optional[bool]
+                 ids_and_scores_only=None,  # type: Optional[bool]
                  ):
         pass
 
@@ -1228,6 +1244,23 @@ class VectorSearchOptionsBase(dict):
         super().__init__(**kwargs)
 
 
+class SearchManyOptionsBase(dict):
+    """
+    **VOLATILE** This API is subject to change at any time.
+    """
+    @overload
+    def __init__(self,
+                 limit=None,           # type: Optional[int]
+                 merge_strategy=None,  # type: Optional[SearchMergeStrategy]
+                 rrf_k=None,           # type: Optional[int]
+                 ):
+        pass
+
+    def __init__(self, **kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        super().__init__(**kwargs)
+
+
 """
 
 Couchbase Python SDK View related Options
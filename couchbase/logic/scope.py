@@ -13,30 +13,34 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import annotations
+
 from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
-                    Optional)
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
 
-from couchbase.analytics import AnalyticsQuery, AnalyticsRequest
 from couchbase.collection import Collection
-from couchbase.management.eventing import ScopeEventingFunctionManager
-from couchbase.management.search import ScopeSearchIndexManager
 from couchbase.n1ql import N1QLQuery, N1QLRequest
 from couchbase.options import (AnalyticsOptions,
                                QueryOptions,
+                               SearchManyOptions,
                                SearchOptions)
 from couchbase.result import (AnalyticsResult,
                               QueryResult,
                               SearchResult)
-from couchbase.search import (FullTextSearchRequest,
-                              SearchQueryBuilder,
-                              SearchRequest)
 from couchbase.serializer import Serializer
 from couchbase.transcoder import Transcoder
 
 if TYPE_CHECKING:
-    from couchbase.search import SearchQuery
+    from couchbase.management.eventing import ScopeEventingFunctionManager
+    from couchbase.management.search import ScopeSearchIndexManager
+    from couchbase.search import (SearchQuery,
+                                  SearchRequest,
+                                  SearchRow)
 
 
 class ScopeLogic:
@@ -265,6 +269,7 @@ class ScopeLogic:
         if not ('query_context' in opt or 'query_context' in kwargs):
             kwargs['query_context'] = 'default:`{}`.`{}`'.format(self.bucket_name, self.name)
 
+        from couchbase.analytics import AnalyticsQuery, AnalyticsRequest
         query = AnalyticsQuery.create_query_object(statement, *options, **kwargs)
         # See cluster.analytics_query() for note on streaming timeout
         streaming_timeout = self.streaming_timeouts.get('analytics_timeout', None)
@@ -377,6 +382,7 @@ class ScopeLogic:
             kwargs['scope_name'] = f'{self.name}'
         # See cluster.search_query() for note on streaming timeout
         streaming_timeout = self.streaming_timeouts.get('search_timeout', None)
+        from couchbase.search import FullTextSearchRequest, SearchQueryBuilder
         query = SearchQueryBuilder.create_search_query_object(index, query, *options, **kwargs)
         return SearchResult(FullTextSearchRequest.generate_search_request(self.connection,
                                                                           query.as_encodable(),
@@ -467,6 +473,7 @@ class ScopeLogic:
         """  # noqa: E501
         # See cluster.search() for note on streaming timeout
         streaming_timeout = self.streaming_timeouts.get('search_timeout', None)
+        from couchbase.search import FullTextSearchRequest, SearchQueryBuilder
         query = SearchQueryBuilder.create_search_query_from_request(index, request, *options, **kwargs)
         return SearchResult(FullTextSearchRequest.generate_search_request(self.connection,
                                                                           query.as_encodable(),
@@ -475,6 +482,69 @@ class ScopeLogic:
                                                                           bucket_name=self.bucket_name,
                                                                           scope_name=self.name))
 
+    def search_many(self,
+                    requests,  # type: Iterable[Tuple[Any, ...]]
+                    *options,  # type: SearchManyOptions
+                    **kwargs,  # type: Dict[str, Any]
+                    ) -> List[SearchRow]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Executes several searches against the scope concurrently and merges their rows.
+
+        The rows of each search are merged as they are streamed.  Once the top ``limit`` rows can no longer change,
+        the merged rows are returned without waiting for the remaining rows of each search.
+
+        .. note::
+            Merging by :attr:`~couchbase.search.SearchMergeStrategy.SORT` requires every search to use the same sort
+            and only supports sorting by score and by document ID, as the SDK does not receive the values of other
+            sort fields.  :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION` merges searches of
+            any sort by the rank of each row within its search.
+
+        Args:
+            requests (Iterable[Tuple[Any, ...]]): The searches to execute.  Each search is either an
+                ``(index, SearchRequest)`` or ``(index, SearchRequest, SearchOptions)`` tuple.
+            options (:class:`~couchbase.options.SearchManyOptions`): Optional parameters for merging the searches.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.SearchManyOptions`
+
+        Returns:
+            List[:class:`~couchbase.search.SearchRow`]: The top ``limit`` merged rows.  When merged by
+            :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION`, the score of each row is its fused
+            score over the rows received before the merge stopped.  The merge stops as soon as the rows' order is
+            settled, so the score is a lower bound of the row's fused score over every row of the searches.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the searches cannot be merged with the
+                provided merge strategy.
+
+        Examples:
+
+            Merge a text search and a vector search::
+
+                import couchbase.search as search
+                from couchbase.options import SearchManyOptions
+                from couchbase.vector_search import VectorQuery, VectorSearch
+
+                # ... other code ...
+
+                text_request = search.SearchRequest.create(search.MatchQuery('beach'))
+                vector_request = search.SearchRequest.create(VectorSearch.from_vector_query(VectorQuery('vector_field',
+                                                                                                        vector)))
+                rows = scope.search_many([('travel-sample-index', text_request),
+                                          ('travel-sample-vector-index', vector_request)],
+                                         SearchManyOptions(limit=10,
+                                                           merge_strategy=search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION))
+
+                for row in rows:
+                    print(f'Found row: {row}')
+        """  # noqa: E501
+        from couchbase.logic.search import _get_search_many_args
+        from couchbase.search import _search_many
+        searches, merge_args = _get_search_many_args(requests, *options, **kwargs)
+        results = [self.search(index, request, *search_opts, **search_kwargs)
+                   for index, request, search_opts, search_kwargs in searches]
+        return _search_many(results, merge_args)
+
     def search_indexes(self) -> ScopeSearchIndexManager:
         """
         Get a :class:`~couchbase.management.search.ScopeSearchIndexManager` which can be used to manage the search
@@ -485,6 +555,7 @@ class ScopeLogic:
 
         """  # noqa: E501
         # TODO:  AlreadyShutdownException?
+        from couchbase.management.search import ScopeSearchIndexManager
         return ScopeSearchIndexManager(self.connection, self.bucket_name, self.name)
 
     def eventing_functions(self) -> ScopeEventingFunctionManager:
@@ -496,6 +567,7 @@ class ScopeLogic:
             :class:`~couchbase.management.search.ScopeEventingFunctionManager`: A :class:`~couchbase.management.search.ScopeSearchIndexManager` instance.
 
         """  # noqa: E501
+        from couchbase.management.eventing import ScopeEventingFunctionManager
         return ScopeEventingFunctionManager(self.connection, self.bucket_name, self.name)
 
     @staticmethod
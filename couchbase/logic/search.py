@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import json
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -23,6 +24,7 @@ from typing import (TYPE_CHECKING,
                     Any,
                     Callable,
                     Dict,
+                    Iterable,
                     List,
                     Optional,
                     Set,
@@ -32,10 +34,11 @@ from typing import (TYPE_CHECKING,
 from couchbase._utils import is_null_or_empty, to_microseconds
 from couchbase.exceptions import ErrorMapper, InvalidArgumentException
 from couchbase.exceptions import exception as CouchbaseBaseException
-from couchbase.logic.options import SearchOptionsBase
+from couchbase.logic.options import SearchManyOptionsBase, SearchOptionsBase
 from couchbase.logic.supportability import Supportability
 from couchbase.logic.vector_search import VectorQueryCombination
-from couchbase.options import (SearchOptions,
+from couchbase.options import (SearchManyOptions,
+                               SearchOptions,
                                UnsignedInt32,
                                UnsignedInt64)
 from couchbase.pycbc_core import search_query
@@ -314,6 +317,22 @@ class MatchOperator(Enum):
     """
     OR = "or"
     AND = "and"
+
+
+class SearchMergeStrategy(Enum):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Specifies how the rows of the searches executed with ``search_many()`` are merged.
+
+    Members:
+    SORT (default): The rows are merged in the searches' sort order, by default descending score.  All searches must
+        use the same sort and only score and document ID sorts are supported.
+    RECIPROCAL_RANK_FUSION: The rows are ranked by their reciprocal rank fusion (RRF) score, the sum of
+        ``1 / (rrf_k + rank)`` over the searches that returned the document, e.g. to combine a text search and a vector
+        search.  A document returned by several searches is returned once.
+    """
+    SORT = 'sort'
+    RECIPROCAL_RANK_FUSION = 'rrf'
     """
 
 Search Metrics and Metadata per the RFC
@@ -868,21 +887,154 @@ class SearchRowFields(dict):
         super().__init__(**kwargs)
 
 
-@dataclass
+# marks a SearchRow payload that has not been parsed yet
+_UNPARSED = object()
+
+
 class SearchRow:
     """A single entry of search results. The server calls them "hits",
         and represents as a JSON object. The following interface describes
-        the contents of the result row."""
+        the contents of the result row.
+
+        The fields, locations and explanation of a row returned by a search query are kept as returned by the
+        search service and only parsed on first access."""
+
+    __slots__ = ('index', 'id', 'score', 'sort', 'fragments',
+                 '_fields', '_locations', '_explanation',
+                 '_raw_fields', '_raw_locations', '_raw_explanation')
+
+    # only equality is defined, same as the previous (non-frozen) dataclass
+    __hash__ = None
+
+    def __init__(self,
+                 index=None,  # type: Optional[str]
+                 id=None,  # type: Optional[str]
+                 score=None,  # type: Optional[float]
+                 fields=None,  # type: Optional[SearchRowFields]
+                 sort=None,  # type: Optional[list]
+                 locations=None,  # type: Optional[SearchRowLocations]
+                 fragments=None,  # type: Optional[dict]
+                 explanation=None,  # type: Optional[dict]
+                 ):
+        self.index = index
+        self.id = id
+        self.score = score
+        self.sort = [] if sort is None else sort
+        self.fragments = {} if fragments is None else fragments
+        self._fields = SearchRowFields() if fields is None else fields
+        self._locations = locations
+        self._explanation = {} if explanation is None else explanation
+        self._raw_fields = self._raw_locations = self._raw_explanation = None
+
+    @classmethod
+    def _from_raw(cls,
+                  row,  # type: Dict[str, Any]
+                  ids_and_scores_only=False,  # type: Optional[bool]
+                  ) -> SearchRow:
+        """**INTERNAL**
+
+        Creates a row from a search hit without parsing its payloads.
+        """
+        search_row = cls.__new__(cls)
+        search_row.index = row.get('index', None)
+        search_row.id = row.get('id', None)
+        search_row.score = row.get('score', None)
+        search_row.sort = []
+        if ids_and_scores_only:
+            search_row.fragments = {}
+            search_row._fields = search_row._locations = None
+            search_row._explanation = {}
+            search_row._raw_fields = search_row._raw_locations = search_row._raw_explanation = None
+        else:
+            search_row.fragments = row.get('fragments', None) or {}
+            search_row._fields = search_row._locations = search_row._explanation = _UNPARSED
+            search_row._raw_fields = row.get('fields', None)
+            search_row._raw_locations = row.get('locations', None)
+            search_row._raw_explanation = row.get('explanation', None)
+        return search_row
+
+    @property
+    def fields(self) -> Optional[SearchRowFields]:
+        """
+            Optional[:class:`~couchbase.search.SearchRowFields`]: The stored fields requested by the search query.
+        """
+        if self._fields is _UNPARSED:
+            fields = self._raw_fields
+            self._fields = None if is_null_or_empty(fields) else SearchRowFields(**json.loads(fields))
+            self._raw_fields = None
+        return self._fields
+
+    @fields.setter
+    def fields(self, value  # type: Optional[SearchRowFields]
+               ) -> None:
+        self._fields = value
+
+    @property
+    def locations(self) -> Optional[SearchRowLocations]:
+        """
+            Optional[:class:`~couchbase.search.SearchRowLocations`]: The term locations, if requested by the
+            search query.
+        """
+        if self._locations is _UNPARSED:
+            locations = self._raw_locations
+            self._locations = SearchRowLocations(locations) if locations else None
+            self._raw_locations = None
+        return self._locations
+
+    @locations.setter
+    def locations(self, value  # type: Optional[SearchRowLocations]
+                  ) -> None:
+        self._locations = value
+
+    @property
+    def explanation(self) -> Dict[str, Any]:
+        """
+            Dict[str, Any]: The score explanation, if requested by the search query.
+        """
+        if self._explanation is _UNPARSED:
+            explanation = self._raw_explanation
+            self._explanation = {} if is_null_or_empty(explanation) else json.loads(explanation)
+            self._raw_explanation = None
+        return self._explanation
+
+    @explanation.setter
+    def explanation(self, value  # type: Dict[str, Any]
+                    ) -> None:
+        self._explanation = value
+
+    def _as_tuple(self):
+        return (self.index, self.id, self.score, self.fields, self.sort, self.locations, self.fragments,
+                self.explanation)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._as_tuple() == other._as_tuple()
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(index={self.index!r}, id={self.id!r}, score={self.score!r}, '
+                f'fields={self.fields!r}, sort={self.sort!r}, locations={self.locations!r}, '
+                f'fragments={self.fragments!r}, explanation={self.explanation!r})')
+
+
+@dataclass
+class _SearchRowDataclass:
     index: str = None
     id: str = None
     score: float = None
     fields: SearchRowFields = field(default_factory=SearchRowFields)
     sort: list = field(default_factory=list)
-    locations: SearchRowLocations = field(default_factory=SearchRowLocations)
+    locations: SearchRowLocations = None
     fragments: dict = field(default_factory=dict)
     explanation: dict = field(default_factory=dict)
 
 
+# SearchRow used to be a dataclass, keep its dataclass fields so that a dataclass subclass (i.e. a custom
+# row_factory) still inherits them
+SearchRow.__dataclass_fields__ = _SearchRowDataclass.__dataclass_fields__
+SearchRow.__dataclass_params__ = _SearchRowDataclass.__dataclass_params__
+
+
 """
 
 The SearchQueryBuild is the mechanism that holds and stores the
@@ -918,7 +1070,8 @@ class SearchQueryBuilder:
         "span": {"span": lambda x: x},
         "vector_query_combination": {"vector_query_combination": lambda x: x},
         "log_request": {"log_request": lambda x: x},
-        "log_response": {"log_response": lambda x: x}
+        "log_response": {"log_response": lambda x: x},
+        "ids_and_scores_only": {"ids_and_scores_only": lambda x: x}
     }
 
     def __init__(self,
@@ -961,9 +1114,13 @@ class SearchQueryBuilder:
         for query in self._vector_search.queries:
             encoded_query = {
                 'field': query.field_name,
-                'vector': query.vector,
                 'k': query.num_candidates if query.num_candidates is not None else 3
             }
+            vector_base64 = query.vector_base64
+            if vector_base64 is not None:
+                encoded_query['vector_base64'] = vector_base64
+            else:
+                encoded_query['vector'] = query.vector
             if query.boost is not None:
                 encoded_query['boost'] = query.boost
             encoded_queries.append(encoded_query)
@@ -983,6 +1140,10 @@ class SearchQueryBuilder:
         # deprecate the scope_name option, no need to pass it to the C++ client
         # as the search API will not use
         params.update({k: v for k, v in self._params.items() if k not in ['scope_name']})
+        if self.ids_and_scores_only is True:
+            # the rows only need their ID and score, don't have the search service return anything else
+            for k in ['fields', 'highlight_style', 'highlight_fields', 'explain', 'include_locations']:
+                params.pop(k, None)
 
         if self.facets:
             encoded_facets = {}
@@ -1184,11 +1345,11 @@ class SearchQueryBuilder:
 
         # avoid circular import
         from couchbase.mutation_state import MutationState  # noqa: F811
-        if not (isinstance(value, MutationState) and len(value._sv) > 0):
+        if not isinstance(value, MutationState) or value._is_empty():
             raise TypeError('Passed empty or invalid state')
         # 3.x SDK had to set the consistency, couchbase++ will take care of that for us
         self._params.pop('scan_consistency', None)
-        self.set_option('mutation_state', list(mt.as_dict() for mt in value._sv))
+        self.set_option('mutation_state', value._to_dicts())
 
     @property
     def scope_name(self) -> Optional[str]:
@@ -1326,6 +1487,15 @@ class SearchQueryBuilder:
                      ) -> None:
         self.set_option('log_response', value)
 
+    @property
+    def ids_and_scores_only(self) -> bool:
+        return self._params.get('ids_and_scores_only', False)
+
+    @ids_and_scores_only.setter
+    def ids_and_scores_only(self, value  # type: bool
+                            ) -> None:
+        self.set_option('ids_and_scores_only', value)
+
     @classmethod
     def create_search_query_object(cls,
                                    index_name,  # type: str
@@ -1405,6 +1575,64 @@ class SearchQueryBuilder:
         return args
 
 
+def _parse_sort_specs(sort_specs,  # type: Optional[List[str]]
+                      operation,  # type: str
+                      ) -> List[Tuple[str, bool]]:
+    """**INTERNAL**
+
+    Returns the row attribute (``score`` or ``id``) and direction (True if descending) of each encoded sort spec, the
+    search service's default sort is by descending score.  The bindings do not return the search service's per-row
+    sort values, so only score and document ID sorts can be evaluated by the SDK.
+    """
+    if not sort_specs:
+        return [('score', True)]
+    keys = []
+    for spec in sort_specs:
+        sort = json.loads(spec)
+        key = None
+        if isinstance(sort, str):
+            key = {'_score': 'score', '_id': 'id'}.get(sort.lstrip('-'), None)
+            desc = sort.startswith('-')
+        elif isinstance(sort, dict) and sort.get('by', None) in ['score', 'id']:
+            key = sort['by']
+            desc = sort.get('desc', False) is True
+        if key is None:
+            raise InvalidArgumentException(f'{operation} only supports score and ID sorts, got {sort}.')
+        keys.append((key, desc))
+    return keys
+
+
+def _get_search_after_sort(sort_specs  # type: Optional[List[str]]
+                           ) -> Tuple[List[str], List[str]]:
+    """**INTERNAL**
+
+    Returns the sort specs used to page through a search with ``search_after`` and, for each sort spec, the row
+    attribute (``score`` or ``id``) its ``search_after`` value is taken from.  A document ID sort is appended as a
+    tie-breaker when needed so every row has a distinct position.
+    """
+    keys = [key for key, _ in _parse_sort_specs(sort_specs, 'Paging with search_after')]
+    sort_specs = list(sort_specs) if sort_specs else [json.dumps('-_score')]
+    if 'id' not in keys:
+        sort_specs.append(json.dumps('_id'))
+        keys.append('id')
+    return sort_specs, keys
+
+
+def _get_search_after(row,  # type: Union[SearchRow, Dict[str, Any]]
+                      keys  # type: List[str]
+                      ) -> str:
+    """**INTERNAL**
+
+    Returns the JSON encoded ``search_after`` values that position a search right after the provided row.
+    """
+    if isinstance(row, dict):
+        row_id, score = row.get('id', None), row.get('score', None)
+    else:
+        row_id, score = row.id, row.score
+    # repr() of a float round-trips exactly, so the row itself is excluded from the next page
+    return json.dumps([row_id if key == 'id' else repr(float(score)) for key in keys])
+
+
 class FullTextSearchRequestLogic:
     def __init__(self,
                  connection,
@@ -1427,6 +1655,7 @@ class FullTextSearchRequestLogic:
         self._result_facets = None
         self._bucket_name = kwargs.pop('bucket_name', None)
         self._scope_name = kwargs.pop('scope_name', None)
+        self._ids_and_scores_only = encoded_query.get('ids_and_scores_only', False) is True
 
     @property
     def encoded_query(self) -> Dict[str, Any]:
@@ -1506,6 +1735,11 @@ class FullTextSearchRequestLogic:
         if not issubclass(self.row_factory, SearchRow):
             return row
 
+        if self.row_factory is SearchRow:
+            # the fields, locations and explanation are parsed on first access
+            return SearchRow._from_raw(row, self._ids_and_scores_only)
+
+        # a SearchRow subclass is built through its constructor so that its own initialization is run
         deserialized_row = row
         locations = deserialized_row.get('locations', None)
         if locations:
@@ -1570,3 +1804,225 @@ class FullTextSearchRequestLogic:
         raise NotImplementedError(
             'Cannot use asynchronous iterator.'
         )
+
+
+class _Descending:
+    """**INTERNAL**
+
+    Reverses the ordering of a value within a sort key.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class _SearchResultMerger:
+    """**INTERNAL**
+
+    Merges the rows of several searches as they arrive.  Each search's rows are expected in its sort order, ``done``
+    is set as soon as the top ``limit`` rows, and their order, can no longer change.
+    """
+
+    def __init__(self,
+                 sort_specs,  # type: List[Optional[List[str]]]
+                 limit,  # type: int
+                 strategy,  # type: SearchMergeStrategy
+                 rrf_k,  # type: int
+                 ):
+        self._limit = limit
+        self._strategy = strategy
+        self._finished = [False] * len(sort_specs)
+        self.done = len(sort_specs) == 0
+        if strategy == SearchMergeStrategy.RECIPROCAL_RANK_FUSION:
+            self._rrf_k = rrf_k
+            self._ranks = [0] * len(sort_specs)
+            # document ID -> [fused score, first row seen, searches that returned the document, order first seen]
+            self._fused = {}  # type: Dict[str, List[Any]]
+            self._unchecked = 0
+        else:
+            sort_keys = set(tuple(_parse_sort_specs(specs, 'Merging by sort')) for specs in sort_specs)
+            if len(sort_keys) > 1:
+                raise InvalidArgumentException('All searches must use the same sort to be merged by sort.')
+            self._sort_keys = sort_keys.pop() if sort_keys else ()
+            self._pending = [deque() for _ in sort_specs]
+            self._rows = []  # type: List[SearchRow]
+
+    def add(self,
+            idx,  # type: int
+            item,  # type: Union[SearchRow, Exception, None]
+            ) -> None:
+        """Adds a row of a search, None once the search is finished.  An exception from the search is raised."""
+        if isinstance(item, Exception):
+            raise item
+        if item is None:
+            self.finish(idx)
+        else:
+            self.add_row(idx, item)
+
+    def add_row(self,
+                idx,  # type: int
+                row,  # type: SearchRow
+                ) -> None:
+        if self.done:
+            return
+        if self._strategy != SearchMergeStrategy.RECIPROCAL_RANK_FUSION:
+            self._pending[idx].append(row)
+            self._merge_sorted()
+            return
+
+        self._ranks[idx] += 1
+        score = 1.0 / (self._rrf_k + self._ranks[idx])
+        entry = self._fused.get(row.id, None)
+        if entry is None:
+            self._fused[row.id] = [score, row, {idx}, len(self._fused)]
+        elif idx not in entry[2]:
+            entry[0] += score
+            entry[2].add(idx)
+        self._unchecked += 1
+        # the check sorts every fused document, so it only runs once per `limit` rows
+        if self._unchecked >= self._limit:
+            self._check_fused()
+
+    def finish(self,
+               idx,  # type: int
+               ) -> None:
+        self._finished[idx] = True
+        if self.done:
+            return
+        if self._strategy != SearchMergeStrategy.RECIPROCAL_RANK_FUSION:
+            self._merge_sorted()
+        else:
+            self._check_fused()
+
+    def rows(self) -> List[SearchRow]:
+        if self._strategy != SearchMergeStrategy.RECIPROCAL_RANK_FUSION:
+            return self._rows
+        rows = []
+        # when the merge stops early, the fused scores only include the rows received so far, the rows' order is
+        # final but each score is a lower bound of the row's full fused score
+        for score, row, _, _ in self._sorted_fused()[:self._limit]:
+            row.score = score
+            rows.append(row)
+        return rows
+
+    def _sort_key(self, row  # type: SearchRow
+                  ) -> List[Any]:
+        key = []
+        for attr, desc in self._sort_keys:
+            if attr == 'score':
+                key.append(-row.score if desc else row.score)
+            else:
+                key.append(_Descending(row.id) if desc else row.id)
+        return key
+
+    def _merge_sorted(self) -> None:
+        # a row can be emitted once every search that is not finished has a row pending
+        while len(self._rows) < self._limit:
+            best = best_key = None
+            for idx, pending in enumerate(self._pending):
+                if not pending:
+                    if not self._finished[idx]:
+                        return
+                    continue
+                key = self._sort_key(pending[0])
+                if best is None or key < best_key:
+                    best, best_key = idx, key
+            if best is None:
+                break
+            self._rows.append(self._pending[best].popleft())
+        self.done = True
+
+    def _sorted_fused(self) -> List[List[Any]]:
+        return sorted(self._fused.values(), key=lambda e: (-e[0], e[3]))
+
+    def _check_fused(self) -> None:
+        self._unchecked = 0
+        if all(self._finished):
+            self.done = True
+            return
+        if len(self._fused) < self._limit:
+            return
+        # the most a document can still gain from each search that is not finished
+        gains = [0.0 if finished else 1.0 / (self._rrf_k + rank + 1)
+                 for finished, rank in zip(self._finished, self._ranks)]
+
+        def upper_bound(entry):
+            return entry[0] + sum(g for idx, g in enumerate(gains) if idx not in entry[2])
+
+        entries = self._sorted_fused()
+        top = entries[:self._limit]
+        # a document not seen yet can at most score the sum of the gains
+        contender = max([sum(gains)] + [upper_bound(e) for e in entries[self._limit:]])
+        # each top document must stay ahead of every document ranked after it
+        for entry in reversed(top):
+            if entry[0] <= contender:
+                return
+            contender = max(contender, upper_bound(entry))
+        self.done = True
+
+
+def _get_search_many_merge_args(*options,  # type: SearchManyOptions
+                                **kwargs,  # type: Dict[str, Any]
+                                ) -> Dict[str, Any]:
+    """**INTERNAL**
+
+    Returns the validated ``limit``, ``strategy`` and ``rrf_k`` used to merge the searches.
+    """
+    args = {}
+    for opt in options:
+        if isinstance(opt, (SearchManyOptions, SearchManyOptionsBase)):
+            args.update(opt)
+    args.update(kwargs)
+    limit = args.get('limit', 10)
+    if not isinstance(limit, int) or limit < 1:
+        raise InvalidArgumentException('limit must be an int >= 1.')
+    strategy = args.get('merge_strategy', SearchMergeStrategy.SORT)
+    if isinstance(strategy, str):
+        strategy = SearchMergeStrategy(strategy)
+    if not isinstance(strategy, SearchMergeStrategy):
+        raise InvalidArgumentException('merge_strategy must be a SearchMergeStrategy.')
+    rrf_k = args.get('rrf_k', 60)
+    if not isinstance(rrf_k, int) or rrf_k < 0:
+        raise InvalidArgumentException('rrf_k must be an int >= 0.')
+    return {'limit': limit, 'strategy': strategy, 'rrf_k': rrf_k}
+
+
+def _get_search_many_search(search,  # type: Tuple[Any, ...]
+                            limit,  # type: int
+                            ) -> Tuple[str, SearchRequest, List[Any], Dict[str, Any]]:
+    """**INTERNAL**
+
+    Returns the ``(index, request, options, kwargs)`` of a search provided to ``search_many()``.
+    """
+    if not isinstance(search, (list, tuple)) or len(search) not in [2, 3]:
+        raise InvalidArgumentException(('Each search must be provided as an (index, SearchRequest) '
+                                        'or (index, SearchRequest, SearchOptions) tuple.'))
+    search_opts = [search[2]] if len(search) == 3 and search[2] is not None else []
+    search_kwargs = {}
+    if not any('limit' in opt for opt in search_opts):
+        # no search needs more rows than are returned
+        search_kwargs['limit'] = limit
+    return search[0], search[1], search_opts, search_kwargs
+
+
+def _get_search_many_args(requests,  # type: Iterable[Tuple[Any, ...]]
+                          *options,  # type: SearchManyOptions
+                          **kwargs,  # type: Dict[str, Any]
+                          ) -> Tuple[List[Tuple[str, SearchRequest, List[Any], Dict[str, Any]]], Dict[str, Any]]:
+    """**INTERNAL**
+
+    Returns the ``(index, request, options, kwargs)`` of each search to execute and the merge args.
+    """
+    merge_args = _get_search_many_merge_args(*options, **kwargs)
+    searches = [_get_search_many_search(search, merge_args['limit']) for search in requests or []]
+    if not searches:
+        raise InvalidArgumentException('At least one search must be provided.')
+    return searches, merge_args
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import base64
+import sys
+from array import array
 from enum import Enum
-from typing import List, Optional
+from typing import (Any,
+                    List,
+                    Optional,
+                    Union)
 
 from couchbase.exceptions import InvalidArgumentException
 from couchbase.options import VectorSearchOptions
@@ -29,38 +35,118 @@ class VectorQueryCombination(Enum):
     OR = 'or'
 
 
+# struct format codes of the float buffers that can be used as a vector
+_FLOAT32_FORMATS = ('f', '@f', '=f', '<f')
+_FLOAT64_FORMATS = ('d', '@d', '=d')
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def _validate_vector_buffer(vector  # type: Any
+                            ) -> None:
+    """**INTERNAL**
+
+    Only the buffer's format and shape are checked, the values are not visited.
+    """
+    try:
+        view = memoryview(vector)
+    except TypeError:
+        raise InvalidArgumentException(('Provided vector must be a list of floats, a base64 encoded str or '
+                                        f'a buffer of float32 values, got {type(vector).__name__}.')) from None
+    # release the view so the caller can still resize the buffer, e.g. an array.array
+    with view:
+        if view.format not in _FLOAT32_FORMATS and view.format not in _FLOAT64_FORMATS:
+            raise InvalidArgumentException(('Provided vector buffer must contain float32 values, '
+                                            f'got format {view.format}.'))
+        if view.ndim != 1:
+            raise InvalidArgumentException(f'Provided vector buffer must be one dimensional, got shape {view.shape}.')
+        if view.shape[0] == 0:
+            raise InvalidArgumentException('Provided vector cannot be empty.')
+
+
+def _vector_buffer_to_base64(vector  # type: Any
+                             ) -> str:
+    """**INTERNAL**"""
+    with memoryview(vector) as view:
+        if view.format in _FLOAT32_FORMATS and (_LITTLE_ENDIAN or view.format == '<f'):
+            # already little-endian float32, encode the buffer as is
+            return base64.b64encode(view if view.c_contiguous else view.tobytes()).decode('ascii')
+    values = _vector_buffer_to_array(vector)
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    return base64.b64encode(values).decode('ascii')
+
+
+def _vector_buffer_to_array(vector  # type: Any
+                            ) -> array:
+    """**INTERNAL**"""
+    with memoryview(vector) as view:
+        if view.format in _FLOAT64_FORMATS:
+            return array('f', view)
+        values = array('f')
+        values.frombytes(view.tobytes())
+        if view.format == '<f' and not _LITTLE_ENDIAN:
+            values.byteswap()
+        return values
+
+
 class VectorQuery:
     """ Represents a vector query.
 
     **UNCOMMITTED** This API is unlikely to change,
     but may still change as final consensus on its behavior has not yet been reached.
 
+    The vector can be provided as a list of floats, as a base64 encoded str of little-endian float32 values or as a
+    one dimensional buffer of float32 (or float64) values, e.g. a NumPy ``float32`` array, an ``array.array('f')``
+    or a ``memoryview``.  A buffer is validated by its format and shape only and is sent to the search service in
+    the more compact ``vector_base64`` form, which requires Couchbase Server 7.6.2 or later.
+
     Args:
         field_name (str): The name of the field in the search index that stores the vector.
-        vector (List[float]): The vector to use in the query.
+        vector (Union[List[float], str, Any]): The vector to use in the query.
         num_candidates (int, optional): Specifies the number of results returned. If provided, must be greater or equal to 1.
         boost (float, optional): Add boost to query.
 
     Raises:
         :class:`~couchbase.exceptions.InvalidArgumentException`: If the vector is not provided.
         :class:`~couchbase.exceptions.InvalidArgumentException`: If all values of the provided vector are not instances of float.
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If the provided buffer is not a one dimensional buffer of float values.
 
     Returns:
         :class:`~couchbase.vector_search.VectorQuery`: The created vector query.
+
+    Examples:
+        Vector query from a NumPy array::
+
+            import numpy as np
+            from couchbase.vector_search import VectorQuery
+
+            embedding = np.asarray(model.encode('a query'), dtype=np.float32)
+            query = VectorQuery('vector_field', embedding)
     """  # noqa: E501
 
     def __init__(self,
                  field_name,  # type: str
-                 vector,  # type: List[float]
+                 vector,  # type: Union[List[float], str, Any]
                  num_candidates=None,  # type: Optional[int]
                  boost=None,  # type: Optional[float]
                  ):
         self._field_name = field_name
-        if vector is None or len(vector) == 0:
+        self._vector = self._vector_buffer = self._vector_base64 = None
+        if vector is None:
             raise InvalidArgumentException('Provided vector cannot be empty.')
-        if not all(map(lambda q: isinstance(q, float), vector)):
-            raise InvalidArgumentException('All vector values must be a float.')
-        self._vector = vector
+        if isinstance(vector, str):
+            if len(vector) == 0:
+                raise InvalidArgumentException('Provided vector cannot be empty.')
+            self._vector_base64 = vector
+        elif isinstance(vector, (list, tuple)):
+            if len(vector) == 0:
+                raise InvalidArgumentException('Provided vector cannot be empty.')
+            if not all(map(lambda q: isinstance(q, float), vector)):
+                raise InvalidArgumentException('All vector values must be a float.')
+            self._vector = vector
+        else:
+            _validate_vector_buffer(vector)
+            self._vector_buffer = vector
         self._num_candidates = self._boost = None
         if num_candidates is not None:
             self.num_candidates = num_candidates
@@ -116,19 +202,35 @@ class VectorQuery:
         self._num_candidates = value
 
     @property
-    def vector(self) -> List[float]:
+    def vector(self) -> Optional[List[float]]:
         """
         **UNCOMMITTED** This API is unlikely to change,
         but may still change as final consensus on its behavior has not yet been reached.
 
-        List[float]: Returns the vector query's vector.
+        Optional[List[float]]: Returns the vector query's vector.  A vector provided as a buffer is copied into a
+        new list, None is returned if the vector was provided as a base64 encoded str.
         """
+        if self._vector_buffer is not None:
+            return _vector_buffer_to_array(self._vector_buffer).tolist()
         return self._vector
 
+    @property
+    def vector_base64(self) -> Optional[str]:
+        """
+        **UNCOMMITTED** This API is unlikely to change,
+        but may still change as final consensus on its behavior has not yet been reached.
+
+        Optional[str]: Returns the vector query's vector as a base64 encoded str of little-endian float32 values,
+        if the vector was provided as a buffer or a base64 encoded str.
+        """
+        if self._vector_base64 is None and self._vector_buffer is not None:
+            self._vector_base64 = _vector_buffer_to_base64(self._vector_buffer)
+        return self._vector_base64
+
     @classmethod
     def create(cls,
                field_name,  # type: str
-               vector,  # type: List[float]
+               vector,  # type: Union[List[float], str, Any]
                num_candidates=None,  # type: Optional[int]
                boost=None,  # type: Optional[float]
                ) -> VectorQuery:
@@ -139,13 +241,15 @@ class VectorQuery:
 
         Args:
             field_name (str): The name of the field in the search index that stores the vector.
-            vector (List[float]): The vector to use in the query.
+            vector (Union[List[float], str, Any]): The vector to use in the query, see
+                :class:`~couchbase.vector_search.VectorQuery` for the accepted types.
             num_candidates (int, optional): Specifies the number of results returned. If provided, must be greater or equal to 1.
             boost (float, optional): Add boost to query.
 
         Raises:
             :class:`~couchbase.exceptions.InvalidArgumentException`: If the vector is not provided.
             :class:`~couchbase.exceptions.InvalidArgumentException`: If all values of the provided vector are not instances of float.
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the provided buffer is not a one dimensional buffer of float values.
 
         Returns:
             :class:`~couchbase.vector_search.VectorQuery`: The created vector query.
@@ -31,6 +31,7 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   UnAmbiguousTimeoutException)
 from couchbase.exceptions import exception as BaseCouchbaseException
 from couchbase.exceptions import exception as CouchbaseBaseException
+from couchbase.transcoder import get_lazy_transcoder
 
 
 def decode_value(transcoder, value, flags, is_subdoc=False):
@@ -110,7 +111,7 @@ class BlockingWrapper:
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
                 try:
-                    transcoder = kwargs.pop('transcoder')
+                    transcoder = get_lazy_transcoder(kwargs.pop('transcoder'), kwargs.pop('lazy_decode', None))
                     ret = fn(self, *args, **kwargs)
                     if isinstance(ret, BaseCouchbaseException):
                         raise ErrorMapper.build_exception(ret)
@@ -13,10 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import time
 from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
 from typing import (Any,
                     Dict,
-                    Optional)
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import InvalidArgumentException
 
 
 class CouchbaseValueRecorder(ABC):
@@ -82,3 +90,265 @@ class CouchbaseMeter(ABC):
             :class:`~couchbase.metrics.CouchbaseValueRecorder`:
         """
         pass
+
+
+@dataclass(frozen=True)
+class LatencySnapshot:
+    """
+    Point-in-time latency statistics for a single operation type, as returned by
+    :meth:`~couchbase.metrics.LatencyHistogramMeter.snapshot`.  Latencies are in microseconds.
+
+    Attributes:
+        count (int): Number of operations recorded.
+        p50 (int): 50th percentile latency.
+        p99 (int): 99th percentile latency.
+        p999 (int): 99.9th percentile latency.
+        max (int): Largest latency recorded.
+        throughput (float): Operations per second since the recorder was created or last reset.
+    """
+    count: int
+    p50: int
+    p99: int
+    p999: int
+    max: int
+    throughput: float
+
+
+class LatencyHistogramValueRecorder(CouchbaseValueRecorder):
+    """
+    A :class:`~couchbase.metrics.CouchbaseValueRecorder` backed by a fixed size, log-linear (HDR-style) histogram.
+
+    Every power of two range of values is split into ``2**(significant_bits - 1)`` equally sized buckets, so a
+    recorded value is reported with a relative error of at most ``2**-(significant_bits - 1)``.  Recording a value
+    is a bucket index computation and an increment, no lock is taken.  Values larger than ``highest_trackable_value``
+    are counted in the last bucket, the exact maximum is always kept.
+
+    Args:
+        significant_bits (int, optional): Bits of precision kept for each value.  Defaults to 7 (< 1.6% error).
+        highest_trackable_value (int, optional): Largest value, in microseconds, that is bucketed precisely.
+            Defaults to ``2**32 - 1`` (~71 minutes).
+    """
+
+    def __init__(self,
+                 significant_bits=7,  # type: Optional[int]
+                 highest_trackable_value=2**32 - 1  # type: Optional[int]
+                 ):
+        if not isinstance(significant_bits, int) or not 2 <= significant_bits <= 16:
+            raise InvalidArgumentException('significant_bits must be an int between 2 and 16.')
+        if not isinstance(highest_trackable_value, int) or highest_trackable_value < 2**significant_bits:
+            raise InvalidArgumentException('highest_trackable_value must be an int >= 2**significant_bits.')
+        super().__init__()
+        self._bits = significant_bits
+        self._half_shift = significant_bits - 1
+        self._last_index = self._bucket_index(highest_trackable_value)
+        self.reset()
+
+    def _bucket_index(self, value  # type: int
+                      ) -> int:
+        shift = value.bit_length() - self._bits
+        if shift <= 0:
+            return value
+        return (shift << self._half_shift) + (value >> shift)
+
+    def _bucket_highest_value(self, index  # type: int
+                              ) -> int:
+        """**INTERNAL**"""
+        half = 1 << self._half_shift
+        if index < (half << 1):
+            return index
+        shift = (index >> self._half_shift) - 1
+        return ((index - (shift << self._half_shift) + 1) << shift) - 1
+
+    def record_value(self,
+                     value,      # type: int
+                     ) -> None:
+        """
+        Records a single latency value.
+
+        Args:
+            value (int): The latency, in microseconds, to record.
+        """
+        if value < 0:
+            value = 0
+        shift = value.bit_length() - self._bits
+        idx = value if shift <= 0 else (shift << self._half_shift) + (value >> shift)
+        # bind the current histogram once, a concurrent reset() swaps in a new one
+        counts = self._counts
+        counts[idx if idx < self._last_index else self._last_index] += 1
+        if value > self._max:
+            self._max = value
+
+    def reset(self) -> None:
+        """
+        Clears all recorded values and restarts the throughput window.
+        """
+        self._counts = array('q', bytes(8 * (self._last_index + 1)))
+        self._max = 0
+        self._start = time.monotonic()
+
+    def percentiles(self,
+                    quantiles  # type: Iterable[float]
+                    ) -> Tuple[int, List[int]]:
+        """
+        Computes the given percentiles in a single pass over the histogram.
+
+        Args:
+            quantiles (Iterable[float]): The percentiles to compute, e.g. ``(50, 99, 99.9)``.
+
+        Returns:
+            Tuple[int, List[int]]: The number of recorded values and the latency, in microseconds, at each of the
+            requested percentiles.  Each latency is the highest value equivalent to its bucket, capped at the
+            maximum recorded value.
+        """
+        counts = self._counts.tolist()
+        max_value = self._max
+        total = sum(counts)
+        quantiles = list(quantiles)
+        results = [0] * len(quantiles)
+        if total == 0:
+            return 0, results
+        # the smallest rank that satisfies each percentile, -(-a // b) is ceil(a / b)
+        ranks = sorted((max(1, -(-int(q * total * 1000) // 100000)), i) for i, q in enumerate(quantiles))
+        pending = iter(ranks)
+        rank, i = next(pending)
+        seen = 0
+        for idx, count in enumerate(counts):
+            if not count:
+                continue
+            seen += count
+            while seen >= rank:
+                # the last bucket also holds the values above highest_trackable_value
+                value = max_value if idx == self._last_index else self._bucket_highest_value(idx)
+                results[i] = min(value, max_value)
+                nxt = next(pending, None)
+                if nxt is None:
+                    return total, results
+                rank, i = nxt
+        # only reached for percentiles above 100
+        results[i] = max_value
+        for _, i in pending:
+            results[i] = max_value
+        return total, results
+
+    def snapshot(self) -> LatencySnapshot:
+        """
+        Returns the current latency statistics of this recorder.
+
+        Returns:
+            :class:`~couchbase.metrics.LatencySnapshot`: The recorded count, percentiles, maximum and throughput.
+        """
+        elapsed = time.monotonic() - self._start
+        total, (p50, p99, p999) = self.percentiles((50, 99, 99.9))
+        return LatencySnapshot(count=total,
+                               p50=p50,
+                               p99=p99,
+                               p999=p999,
+                               max=self._max,
+                               throughput=total / elapsed if elapsed > 0 else 0.0)
+
+
+class _NoOpValueRecorder(CouchbaseValueRecorder):
+    """**INTERNAL**"""
+
+    def record_value(self, value  # type: int
+                     ) -> None:
+        pass
+
+
+class LatencyHistogramMeter(CouchbaseMeter):
+    """
+    A ready-made, in-process :class:`~couchbase.metrics.CouchbaseMeter` that keeps an HDR-style latency histogram
+    (see :class:`~couchbase.metrics.LatencyHistogramValueRecorder`) per service and operation type.
+
+    Only the ``db.couchbase.operations`` metric is recorded, other metrics are dropped.  Recording is cheap enough
+    to leave enabled in production, :meth:`snapshot` and :meth:`reset` can be called at any time from any thread.
+
+    Args:
+        significant_bits (int, optional): Bits of precision kept for each value.  Defaults to 7 (< 1.6% error).
+        highest_trackable_value (int, optional): Largest value, in microseconds, that is bucketed precisely.
+            Defaults to ``2**32 - 1`` (~71 minutes).
+
+    Examples:
+        Record KV latencies and print the percentiles::
+
+            from couchbase.auth import PasswordAuthenticator
+            from couchbase.cluster import Cluster
+            from couchbase.metrics import LatencyHistogramMeter
+            from couchbase.options import ClusterOptions
+
+            meter = LatencyHistogramMeter()
+            auth = PasswordAuthenticator('username', 'password')
+            cluster = Cluster('couchbase://localhost', ClusterOptions(auth, meter=meter))
+            collection = cluster.bucket('default').default_collection()
+
+            for i in range(1000):
+                collection.upsert(f'key-{i}', {'id': i})
+
+            stats = meter.snapshot()['kv']['upsert']
+            print(f'p50={stats.p50}us p99={stats.p99}us p999={stats.p999}us max={stats.max}us, '
+                  f'{stats.throughput:.0f} ops/s')
+            meter.reset()
+    """
+    _CB_OPERATION = 'db.couchbase.operations'
+    _CB_SERVICE = 'db.couchbase.service'
+    _CB_OP = 'db.operation'
+
+    def __init__(self,
+                 significant_bits=7,  # type: Optional[int]
+                 highest_trackable_value=2**32 - 1  # type: Optional[int]
+                 ):
+        # validate eagerly instead of on the first recorded operation
+        LatencyHistogramValueRecorder(significant_bits, highest_trackable_value)
+        super().__init__()
+        self._significant_bits = significant_bits
+        self._highest_trackable_value = highest_trackable_value
+        self._noop = _NoOpValueRecorder()
+        self._recorders = {}  # type: Dict[Tuple[str, str], LatencyHistogramValueRecorder]
+
+    def value_recorder(self,
+                       name,      # type: str
+                       tags       # type: Dict[str, str]
+                       ) -> CouchbaseValueRecorder:
+        """
+        Returns the recorder for the service and operation in the provided tags.
+
+        Args:
+            name (str): The name of the recorder.
+            tags (Dict[str, str]): The tags associated with the recorder.
+
+        Returns:
+            :class:`~couchbase.metrics.CouchbaseValueRecorder`: The histogram recorder for the service and
+            operation, or a no-op recorder if the metric is not an operation latency.
+        """
+        if name != self._CB_OPERATION:
+            return self._noop
+        key = (tags.get(self._CB_SERVICE, None), tags.get(self._CB_OP, None))
+        recorder = self._recorders.get(key, None)
+        if recorder is None:
+            if key[0] is None or key[1] is None:
+                return self._noop
+            # setdefault so concurrent first calls for a key share a single recorder
+            recorder = self._recorders.setdefault(key,
+                                                  LatencyHistogramValueRecorder(self._significant_bits,
+                                                                                self._highest_trackable_value))
+        return recorder
+
+    def snapshot(self) -> Dict[str, Dict[str, LatencySnapshot]]:
+        """
+        Returns the current latency statistics of every operation type recorded so far.
+
+        Returns:
+            Dict[str, Dict[str, :class:`~couchbase.metrics.LatencySnapshot`]]: The statistics keyed by service
+            (e.g. ``kv``, ``query``) and then by operation (e.g. ``get``, ``upsert``).
+        """
+        stats = {}  # type: Dict[str, Dict[str, LatencySnapshot]]
+        for (svc, op), recorder in list(self._recorders.items()):
+            stats.setdefault(svc, {})[op] = recorder.snapshot()
+        return stats
+
+    def reset(self) -> None:
+        """
+        Clears the recorded values of every operation type, e.g. between benchmark runs.
+        """
+        for recorder in list(self._recorders.values()):
+            recorder.reset()
@@ -13,30 +13,111 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from array import array
 from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
-                    List)
+                    Iterator,
+                    List,
+                    Tuple,
+                    Union)
 
 from couchbase.exceptions import MissingTokenException
-from couchbase.result import MutationToken
+from couchbase.result import MultiMutationResult, MutationToken
 
 if TYPE_CHECKING:
     from couchbase.result import MutationResult
 
 
+class _PartitionVector:
+    """**INTERNAL**
+
+    The highest sequence number (and the partition uuid that goes with it) seen for each
+    partition of a single bucket.  Partitions are indexed by partition id into flat arrays
+    so the state stays at one entry per vbucket no matter how many mutations are added.
+    """
+
+    __slots__ = ('_seqnos', '_uuids', '_present')
+
+    def __init__(self):
+        self._seqnos = array('Q')
+        self._uuids = array('Q')
+        self._present = bytearray()
+
+    def _grow(self, size  # type: int
+              ) -> None:
+        extra = size - len(self._present)
+        if extra > 0:
+            self._seqnos.frombytes(bytes(extra * self._seqnos.itemsize))
+            self._uuids.frombytes(bytes(extra * self._uuids.itemsize))
+            self._present.extend(bytes(extra))
+
+    def update(self,
+               partition_id,  # type: int
+               partition_uuid,  # type: int
+               sequence_number  # type: int
+               ) -> None:
+        if partition_id >= len(self._present):
+            self._grow(partition_id + 1)
+        if not self._present[partition_id] or sequence_number > self._seqnos[partition_id]:
+            self._present[partition_id] = 1
+            self._seqnos[partition_id] = sequence_number
+            self._uuids[partition_id] = partition_uuid
+
+    def merge(self, other  # type: _PartitionVector
+              ) -> None:
+        for partition_id, partition_uuid, sequence_number in other:
+            self.update(partition_id, partition_uuid, sequence_number)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        seqnos = self._seqnos
+        uuids = self._uuids
+        for partition_id, present in enumerate(self._present):
+            if present:
+                yield partition_id, uuids[partition_id], seqnos[partition_id]
+
+
 class MutationState:
-    def __init__(self, *docs,  # type: List[MutationResult]
+    """Tracks the mutations a query, search or scan request should be consistent with.
+
+    Only the highest sequence number seen for each partition (vbucket) of a bucket is kept, as
+    that is all the server needs in order to wait for the preceding mutations to be indexed.
+    Adding thousands of mutation tokens therefore results in at most one entry per vbucket.
+
+    Args:
+        docs (Union[:class:`~couchbase.result.MutationResult`, :class:`~couchbase.result.MultiMutationResult`]): One or
+            more results returned from mutations.
+        quiet (bool, optional): Suppress errors if one of the results does not contain a mutation token.
+
+    Examples:
+        Build the state from individual and multi-op results::
+
+            res = collection.upsert('doc-1', {'a': 1})
+            multi_res = collection.upsert_multi({'doc-2': {'b': 2}, 'doc-3': {'c': 3}})
+            state = MutationState(res, multi_res)
+
+            q_res = cluster.query('SELECT * FROM `default`', QueryOptions(consistent_with=state))
+    """
+
+    def __init__(self, *docs,  # type: Union[MutationResult, MultiMutationResult]
                  **kwargs  # type: Dict[str, Any]
                  ):
-        self._sv = set()
+        self._vectors = {}  # type: Dict[str, _PartitionVector]
         if docs:
             self.add_results(*docs, **kwargs)
 
     def add_mutation_token(self, mut_token  # type: MutationToken
                            ) -> None:
         if isinstance(mut_token, MutationToken):
-            self._sv.add(mut_token)
+            self._add_token(mut_token)
+
+    def _add_token(self, mut_token  # type: MutationToken
+                   ) -> None:
+        token = mut_token.as_dict()
+        vector = self._vectors.get(token['bucket_name'])
+        if vector is None:
+            vector = self._vectors[token['bucket_name']] = _PartitionVector()
+        vector.update(token['partition_id'], token['partition_uuid'], token['sequence_number'])
 
     def _add_scanvec(self, mut_token  # type: MutationToken
                      ) -> bool:
@@ -46,12 +127,12 @@ class MutationState:
             `(vbucket id, vbucket uuid, mutation sequence)`
         """
         if isinstance(mut_token, MutationToken):
-            self._sv.add(mut_token)
+            self._add_token(mut_token)
             return True
 
         return False
 
-    def add_results(self, *rvs,  # type: List[MutationResult]
+    def add_results(self, *rvs,  # type: Union[MutationResult, MultiMutationResult]
                     **kwargs  # type: Dict[str, Any]
                     ) -> bool:
         """
@@ -63,7 +144,8 @@ class MutationState:
         must have been successful.
 
         :param rvs: One or more :class:`~.OperationResult` which have been
-            returned from mutations
+            returned from mutations.  A :class:`~.MultiMutationResult` adds
+            the token of every successful mutation it contains.
         :param quiet: Suppress errors if one of the results does not
             contain a convertible state.
         :return: `True` if the result was valid and added, `False` if not
@@ -74,6 +156,10 @@ class MutationState:
         if not rvs:
             raise MissingTokenException(message='No results passed')
         for rv in rvs:
+            if isinstance(rv, MultiMutationResult):
+                if not self.add_multi_results(rv, **kwargs):
+                    return False
+                continue
             mut_token = rv.mutation_token()
             if not isinstance(mut_token, MutationToken):
                 if kwargs.get('quiet', False) is True:
@@ -84,6 +170,81 @@ class MutationState:
                 return False
         return True
 
+    def add_multi_results(self, *multi_results,  # type: MultiMutationResult
+                          **kwargs  # type: Dict[str, Any]
+                          ) -> bool:
+        """Adds the mutation tokens of every successful operation in the given multi-op results.
+
+        Keys that failed (i.e. the multi-op was executed with ``return_exceptions=True``) have no
+        mutation to wait for and are skipped.
+
+        Args:
+            multi_results (:class:`~couchbase.result.MultiMutationResult`): One or more results returned from
+                multi mutation operations (e.g. :meth:`~couchbase.collection.Collection.upsert_multi`).
+            quiet (bool, optional): Suppress errors if one of the results does not contain a mutation token.
+
+        Returns:
+            bool: True if all tokens were added, False if a token was missing and `quiet` was specified.
+
+        Raises:
+            :class:`~couchbase.exceptions.MissingTokenException`: If no results are passed, or if a result does not
+                contain a mutation token and `quiet` was not specified.
+        """
+        if not multi_results:
+            raise MissingTokenException(message='No results passed')
+        quiet = kwargs.get('quiet', False) is True
+        for multi_res in multi_results:
+            for rv in multi_res.results.values():
+                mut_token = rv.mutation_token()
+                if not isinstance(mut_token, MutationToken):
+                    if quiet:
+                        return False
+                    raise MissingTokenException(message='Result does not contain token')
+                self._add_token(mut_token)
+        return True
+
+    def add_state(self, *states  # type: MutationState
+                  ) -> None:
+        """Merges other mutation states into this one.
+
+        For every partition, the resulting state keeps the highest sequence number found across all of
+        the states.
+
+        Args:
+            states (:class:`.MutationState`): One or more states to merge into this state.
+        """
+        for state in states:
+            if not isinstance(state, MutationState):
+                continue
+            for bucket_name, other in state._vectors.items():
+                vector = self._vectors.get(bucket_name)
+                if vector is None:
+                    vector = self._vectors[bucket_name] = _PartitionVector()
+                vector.merge(other)
+
+    def tokens(self) -> List[MutationToken]:
+        """Returns the mutation tokens that make up this state.
+
+        Returns:
+            List[:class:`~couchbase.result.MutationToken`]: One token per partition of each bucket; the token with
+            the highest sequence number that was added.
+        """
+        return [MutationToken(t) for t in self._to_dicts()]
+
+    def _to_dicts(self) -> List[Dict[str, Union[str, int]]]:
+        """**INTERNAL**
+        The state in the form expected by the query, search and range scan options.
+        """
+        return [{'partition_id': partition_id,
+                 'partition_uuid': partition_uuid,
+                 'sequence_number': sequence_number,
+                 'bucket_name': bucket_name}
+                for bucket_name, vector in self._vectors.items()
+                for partition_id, partition_uuid, sequence_number in vector]
+
+    def _is_empty(self) -> bool:
+        return not self._vectors
+
     def add_all(self, bucket, quiet=False):
         """
         Ensures the query result is consistent with all prior
@@ -105,4 +266,4 @@ class MutationState:
         raise NotImplementedError("Feature currently not implemented in 4.x series of the Python SDK")
 
     def __repr__(self):
-        return "MutationState:{}".format(self._sv)
+        return "MutationState:{}".format(self.tokens())
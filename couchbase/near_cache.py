@@ -0,0 +1,401 @@
+#  Copyright 2016-2023. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from datetime import timedelta
+from threading import (Event,
+                       Lock,
+                       Thread)
+from time import monotonic
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import InvalidArgumentException
+
+if TYPE_CHECKING:
+    from couchbase.metrics import CouchbaseMeter, CouchbaseValueRecorder
+    from couchbase.result import GetResult
+
+log = logging.getLogger(__name__)
+
+# only plain gets are cached, any other get option (including a transcoder) changes the content of the result
+CACHEABLE_GET_OPTIONS = frozenset(['timeout'])
+
+
+class _NearCacheEntry:
+    __slots__ = ('result', 'cas', 'expires')
+
+    def __init__(self,
+                 result,  # type: GetResult
+                 expires,  # type: float
+                 ):
+        self.result = result
+        self.cas = result.cas
+        self.expires = expires
+
+
+class NearCache:
+    """A size-bounded, client-side cache for the results of a collection's get operations.
+
+    A near cache is attached to a single collection object with
+    :meth:`~couchbase.collection.Collection.enable_near_cache`.  Once attached:
+
+    * Gets without options (other than ``timeout``) are served from the cache when possible.
+    * Once ``max_size`` entries are cached, the least recently used entry is evicted.
+    * An entry is served at most ``max_staleness`` after it was last read from, or verified against, the server.
+    * Writes made through the same collection object (upsert, insert, replace, remove, touch, mutate_in, etc.)
+      invalidate the key before the write is sent and again once it completes.  A get that was in flight when the
+      key was invalidated is not cached, so a get that read the document before the write landed is not served
+      after the write completes.
+    * Refreshing the cache verifies the CAS of every entry with a single multi-exists operation.  Only the
+      documents that have changed are fetched again (with a multi-get), so entries do not need to expire.
+      Set ``refresh_interval`` to refresh the cache in the background.
+
+    Writes made by other clients (or through other collection objects) are only seen once the entry expires or
+    the cache is refreshed.
+
+    .. note::
+        Results served from the cache are shared by all callers and should not be modified.
+
+    Args:
+        max_size (int, optional): The maximum number of entries.  Defaults to 1024.
+        max_staleness (timedelta, optional): How long an entry can be served without verifying it against the
+            server.  Defaults to 1 second.
+        refresh_interval (timedelta, optional): If set, the cache is refreshed in the background at this
+            interval.  Defaults to None (no background refresh).
+        meter (:class:`~couchbase.metrics.CouchbaseMeter`, optional): If set, cache hits, misses and evictions
+            are recorded to the ``db.couchbase.near_cache.hits``, ``db.couchbase.near_cache.misses`` and
+            ``db.couchbase.near_cache.evictions`` value recorders (a value of 1 is recorded per event).
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If any of the arguments are invalid.
+    """
+
+    def __init__(self,
+                 max_size=1024,  # type: Optional[int]
+                 max_staleness=timedelta(seconds=1),  # type: Optional[timedelta]
+                 refresh_interval=None,  # type: Optional[timedelta]
+                 meter=None,  # type: Optional[CouchbaseMeter]
+                 ):
+        if not isinstance(max_size, int) or isinstance(max_size, bool) or max_size < 1:
+            raise InvalidArgumentException('max_size must be a positive int.')
+        if not isinstance(max_staleness, timedelta) or max_staleness.total_seconds() <= 0:
+            raise InvalidArgumentException('max_staleness must be a positive timedelta.')
+        if refresh_interval is not None and (not isinstance(refresh_interval, timedelta)
+                                             or refresh_interval.total_seconds() <= 0):
+            raise InvalidArgumentException('refresh_interval must be a positive timedelta.')
+
+        self._max_size = max_size
+        self._max_staleness = max_staleness.total_seconds()
+        self._refresh_interval = refresh_interval
+        self._meter = meter
+        self._recorders = {}  # type: Dict[str, CouchbaseValueRecorder]
+        self._lock = Lock()
+        self._entries = OrderedDict()  # type: OrderedDict[str, _NearCacheEntry]
+        # invalidations are numbered, a load is only cached if its key was not invalidated while it was in flight
+        self._epoch = 0
+        self._loading = {}  # type: Dict[str, int]
+        self._invalidated = {}  # type: Dict[str, int]
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._refresh_stop = None  # type: Optional[Event]
+
+    @property
+    def max_size(self) -> int:
+        """
+            int: The maximum number of entries.
+        """
+        return self._max_size
+
+    @property
+    def max_staleness(self) -> timedelta:
+        """
+            timedelta: How long an entry can be served without verifying it against the server.
+        """
+        return timedelta(seconds=self._max_staleness)
+
+    @property
+    def refresh_interval(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: The interval the cache is refreshed at in the background, if set.
+        """
+        return self._refresh_interval
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache's counters.
+
+        Returns:
+            Dict[str, int]: The number of ``hits``, ``misses`` and ``evictions`` and the current ``size``.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Removes all entries from the cache.
+        """
+        with self._lock:
+            self._epoch += 1
+            for key in self._loading:
+                self._invalidated[key] = self._epoch
+            self._entries.clear()
+
+    def _bind(self,
+              bucket_name,  # type: str
+              scope_name,  # type: str
+              collection_name,  # type: str
+              ) -> None:
+        """**INTERNAL**"""
+        if self._meter is None:
+            return
+        tags = {
+            'db.couchbase.bucket': bucket_name,
+            'db.couchbase.scope': scope_name,
+            'db.couchbase.collection': collection_name,
+        }
+        for event in ['hits', 'misses', 'evictions']:
+            self._recorders[event] = self._meter.value_recorder(f'db.couchbase.near_cache.{event}', tags)
+
+    def _record(self, event  # type: str
+                ) -> None:
+        recorder = self._recorders.get(event, None)
+        if recorder is not None:
+            recorder.record_value(1)
+
+    @staticmethod
+    def is_cacheable(get_args  # type: Dict[str, Any]
+                     ) -> bool:
+        """**INTERNAL**
+
+        Returns True if a get with the provided (forwarded) arguments can be served from, and stored in, the cache.
+        """
+        return all(k in CACHEABLE_GET_OPTIONS for k in get_args)
+
+    def get(self, key  # type: str
+            ) -> Optional[GetResult]:
+        """**INTERNAL**
+
+        Returns the cached result for the key, if it is cached and not stale.
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None and entry.expires <= monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        self._record('misses' if entry is None else 'hits')
+        return None if entry is None else entry.result
+
+    def begin_load(self, key  # type: str
+                   ) -> int:
+        """**INTERNAL**
+
+        Registers a get (or refresh) for the key that is about to be sent to the server.  The returned token must
+        be passed to :meth:`end_load` once the operation completes.
+        """
+        with self._lock:
+            self._loading[key] = self._loading.get(key, 0) + 1
+            return self._epoch
+
+    def end_load(self,
+                 key,  # type: str
+                 token,  # type: int
+                 result=None,  # type: Optional[GetResult]
+                 ) -> None:
+        """**INTERNAL**
+
+        Caches the result of a get (or refresh) registered with :meth:`begin_load`.  Nothing is cached if the
+        operation failed (no result), if the key has been invalidated since the operation was sent, or if a result
+        with a newer CAS is already cached.
+        """
+        evicted = 0
+        with self._lock:
+            invalidated = self._invalidated.get(key, -1)
+            count = self._loading.get(key, 1) - 1
+            if count > 0:
+                self._loading[key] = count
+            else:
+                self._loading.pop(key, None)
+                self._invalidated.pop(key, None)
+
+            if result is None or invalidated > token:
+                return
+
+            entry = self._entries.get(key, None)
+            if entry is not None and entry.cas > result.cas:
+                return
+
+            self._entries[key] = _NearCacheEntry(result, monotonic() + self._max_staleness)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+            self._evictions += evicted
+
+        for _ in range(evicted):
+            self._record('evictions')
+
+    def invalidate(self, *keys  # type: str
+                   ) -> None:
+        """Removes the keys from the cache.  Gets for the keys that are in flight will not be cached.
+
+        Args:
+            keys (str): The keys to invalidate.
+        """
+        with self._lock:
+            self._epoch += 1
+            for key in keys:
+                self._entries.pop(key, None)
+                if key in self._loading:
+                    self._invalidated[key] = self._epoch
+
+    def _invalidate_and_call(self,
+                             keys,  # type: List[str]
+                             callback,  # type: Optional[Callable[..., Any]]
+                             *args,  # type: Any
+                             ) -> None:
+        """**INTERNAL**
+
+        Invalidates the keys once an async write completes, then calls the operation's original callback.
+        """
+        self.invalidate(*keys)
+        if callback is not None:
+            callback(*args)
+
+    def _refresh_candidates(self) -> Dict[str, Tuple[int, int]]:
+        """**INTERNAL**
+
+        Returns the cached keys, mapped to their cached CAS and a load token.
+        """
+        with self._lock:
+            candidates = {}
+            for key, entry in self._entries.items():
+                self._loading[key] = self._loading.get(key, 0) + 1
+                candidates[key] = (entry.cas, self._epoch)
+            return candidates
+
+    def _revalidate(self,
+                    key,  # type: str
+                    token,  # type: int
+                    cas,  # type: int
+                    ) -> None:
+        """**INTERNAL**
+
+        The server confirmed the cached CAS is current, the entry can be served for another ``max_staleness``.
+        """
+        with self._lock:
+            invalidated = self._invalidated.get(key, -1)
+            count = self._loading.get(key, 1) - 1
+            if count > 0:
+                self._loading[key] = count
+            else:
+                self._loading.pop(key, None)
+                self._invalidated.pop(key, None)
+
+            entry = self._entries.get(key, None)
+            if entry is not None and invalidated <= token and entry.cas == cas:
+                entry.expires = monotonic() + self._max_staleness
+
+    def _abort_refresh(self, candidates  # type: Dict[str, Tuple[int, int]]
+                       ) -> None:
+        """**INTERNAL**
+
+        The refresh failed, the entries are left as they are.
+        """
+        for key, (_, token) in candidates.items():
+            self.end_load(key, token)
+
+    def _apply_refresh(self,
+                       candidates,  # type: Dict[str, Tuple[int, int]]
+                       exists_results,  # type: Dict[str, Any]
+                       get_multi,  # type: Callable[[List[str]], Dict[str, Any]]
+                       ) -> None:
+        """**INTERNAL**
+
+        Applies the CAS values returned by a multi-exists, fetching the documents that have changed.
+        """
+        changed = []
+        for key, (cas, token) in candidates.items():
+            res = exists_results.get(key, None)
+            if res is not None and getattr(res, 'exists', False) is True and res.cas == cas:
+                self._revalidate(key, token, cas)
+            elif res is not None and getattr(res, 'exists', False) is True:
+                changed.append(key)
+            else:
+                # the document was removed (or the exists failed), stop serving it
+                self.invalidate(key)
+                self.end_load(key, token)
+
+        if not changed:
+            return
+
+        get_results = {}
+        try:
+            get_results = get_multi(changed)
+        finally:
+            for key in changed:
+                res = get_results.get(key, None)
+                if res is None or isinstance(res, Exception):
+                    self.invalidate(key)
+                    self.end_load(key, candidates[key][1])
+                else:
+                    self.end_load(key, candidates[key][1], res)
+
+    def _start_refresh(self, refresh  # type: Callable[[], None]
+                       ) -> None:
+        """**INTERNAL**
+
+        Runs *refresh* every ``refresh_interval`` in a daemon thread, until :meth:`_stop_refresh` is called.
+        """
+        if self._refresh_interval is None or self._refresh_stop is not None:
+            return
+        stop = Event()
+        self._refresh_stop = stop
+        interval = self._refresh_interval.total_seconds()
+
+        def refresh_loop():
+            while not stop.wait(interval):
+                try:
+                    refresh()
+                except Exception as ex:  # nosec
+                    log.debug('Failed to refresh near cache: %s', ex)
+
+        Thread(target=refresh_loop, name='pycbc-near-cache-refresh', daemon=True).start()
+
+    def _stop_refresh(self) -> None:
+        """**INTERNAL**"""
+        if self._refresh_stop is not None:
+            self._refresh_stop.set()
+            self._refresh_stop = None
@@ -23,6 +23,7 @@ from abc import (ABC,
 from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
                     Dict,
                     Iterable,
                     Optional,
@@ -73,6 +74,7 @@ from couchbase.logic.options import (AnalyticsOptionsBase,
                                      RemoveOptionsBase,
                                      ReplaceOptionsBase,
                                      ScanOptionsBase,
+                                     SearchManyOptionsBase,
                                      SearchOptionsBase,
                                      SignedInt64Base,
                                      TouchOptionsBase,
@@ -96,6 +98,7 @@ if TYPE_CHECKING:
     from couchbase.collection import Collection
     from couchbase.durability import DurabilityType, ServerDurability
     from couchbase.n1ql import QueryScanConsistency
+    from couchbase.subdocument import StoreSemantics
     from couchbase.transactions import TransactionKeyspace
     from couchbase.transcoder import Transcoder
 
@@ -333,10 +336,12 @@ class ClusterOptions(ClusterOptionsBase):
             TLSVerifyMode.PEER.
         disable_mozilla_ca_certificates (bool, optional): Set to True to disable loading Mozilla's list of CA
             certificates for TLS verification. Defaults to False (enabled).
-        serializer (:class:`~.serializer.Serializer`, optional): Global serializer to translate JSON to Python objects.
+        serializer (Union[:class:`~.serializer.Serializer`, str], optional): Global serializer to translate JSON to
+            Python objects.  Can also be the name of a built-in serializer: ``fast`` (the fastest available, see
+            :data:`~.serializer.FastJsonSerializer`), ``orjson``, ``msgspec``, ``ujson`` or ``json``.
             Defaults to :class:`~.serializer.DefaultJsonSerializer`.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Global transcoder to use for kv-operations.
-            Defaults to :class:`~.transcoder.JsonTranscoder`.
+            Defaults to :class:`~.transcoder.JsonTranscoder` using the global serializer.
         tcp_keep_alive_interval (timedelta, optional): TCP keep-alive interval. Defaults to None.
         config_poll_interval (timedelta, optional): Config polling floor interval.
             Defaults to None.
@@ -357,9 +362,11 @@ class ClusterOptions(ClusterOptionsBase):
             (see :class:`~.ClusterTracingOptions`) and then `enable_tracing` option are ignored.
         meter (:class:`~couchbase.metrics.CouchbaseMeter`, optional): Set an external meter.  Defaults to None,
             enabling the `logging_meter`.   Note when this is set, the `logging_meter_emit_interval` option is ignored.
+            See :class:`~couchbase.metrics.LatencyHistogramMeter` for an in-process latency histogram meter.
         dns_nameserver (str, optional):  **VOLATILE** This API is subject to change at any time. Set to configure custom DNS nameserver. Defaults to None.
         dns_port (int, optional):  **VOLATILE** This API is subject to change at any time. Set to configure custom DNS port. Defaults to None.
         dump_configuration (bool, optional): Set to True to dump every new configuration when TRACE level logging. Defaults to False (disabled).
+        streaming_executor_max_workers (int, optional): **VOLATILE** This API is subject to change at any time. *acouchbase* API only.  The maximum number of threads in the executor shared by all streaming (query, analytics, search, view and range scan) requests and multi-operations of the cluster. Defaults to min(32, os.cpu_count() + 4).
     """  # noqa: E501
 
     def apply_profile(self,
@@ -490,6 +497,8 @@ class GetOptions(GetOptionsBase):
             whole document.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
     """
 
 
@@ -505,6 +514,8 @@ class GetAllReplicasOptions(GetAllReplicasOptionsBase):
             key-value operation timeout.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
     """
 
 
@@ -520,6 +531,8 @@ class GetAndLockOptions(GetAndLockOptionsBase):
             key-value operation timeout.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
     """
 
 
@@ -535,6 +548,8 @@ class GetAndTouchOptions(GetAndTouchOptionsBase):
             key-value operation timeout.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
     """
 
 
@@ -550,6 +565,8 @@ class GetAnyReplicaOptions(GetAnyReplicaOptionsBase):
             key-value operation timeout.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
     """
 
 
@@ -672,7 +689,11 @@ class ScanOptions(ScanOptionsBase):
         batch_item_limit (int, optional): The limit applied to the number of items returned from the server
             for each partition batch. Defaults to 50.
         transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): Specifies an explicit transcoder
-            to use for this specific operation. Defaults to :class:`~couchbase.transcoder.JsonTranscoder`.
+            to use for this specific operation. Defaults to :class:`~couchbase.transcoder.JsonTranscoder`.  A
+            :class:`~couchbase.transcoder.JSONTranscoder` with a :class:`~couchbase.serializer.SchemaSerializer`
+            decodes each document into a row schema.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
         concurrency (int, optional): The upper bound on the number of vbuckets that should be scanned in parallel.
             Defaults to 1.
     """  # noqa: E501
@@ -830,6 +851,8 @@ class GetAllReplicasMultiOptions(dict):
             key-value operation timeout.
         transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
         per_key_options (Dict[str, :class:`.GetAllReplicasOptions`], optional): Specify
             :class:`.GetAllReplicasOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
@@ -839,6 +862,7 @@ class GetAllReplicasMultiOptions(dict):
     def __init__(
         self,
         transcoder=None,  # type: Transcoder
+        lazy_decode=None,  # type: bool
         per_key_options=None,       # type: Dict[str, GetAllReplicasOptions]
         return_exceptions=None      # type: Optional[bool]
     ):
@@ -850,7 +874,7 @@ class GetAllReplicasMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'transcoder', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'transcoder', 'lazy_decode', 'per_key_options', 'return_exceptions']
 
 
 class GetAnyReplicaMultiOptions(dict):
@@ -864,6 +888,8 @@ class GetAnyReplicaMultiOptions(dict):
             key-value operation timeout.
         transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
         per_key_options (Dict[str, :class:`.GetAnyReplicaOptions`], optional): Specify
             :class:`.GetAnyReplicaOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
@@ -873,6 +899,7 @@ class GetAnyReplicaMultiOptions(dict):
     def __init__(
         self,
         transcoder=None,  # type: Transcoder
+        lazy_decode=None,  # type: bool
         per_key_options=None,       # type: Dict[str, GetAnyReplicaOptions]
         return_exceptions=None      # type: Optional[bool]
     ):
@@ -884,7 +911,7 @@ class GetAnyReplicaMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'transcoder', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'transcoder', 'lazy_decode', 'per_key_options', 'return_exceptions']
 
 
 class GetMultiOptions(dict):
@@ -903,6 +930,8 @@ class GetMultiOptions(dict):
             whole document.
         transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
         per_key_options (Dict[str, :class:`.GetOptions`], optional): Specify :class:`.GetOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
             Exception without raising.  Defaults to True.
@@ -914,6 +943,7 @@ class GetMultiOptions(dict):
         with_expiry=None,  # type: bool
         project=None,  # type: Iterable[str]
         transcoder=None,  # type: Transcoder
+        lazy_decode=None,  # type: bool
         per_key_options=None,       # type: Dict[str, GetOptions]
         return_exceptions=None      # type: Optional[bool]
     ):
@@ -926,7 +956,7 @@ class GetMultiOptions(dict):
     @classmethod
     def get_valid_keys(cls):
         return ['timeout', 'with_expiry', 'project', 'transcoder',
-                'per_key_options', 'return_exceptions']
+                'lazy_decode', 'per_key_options', 'return_exceptions']
 
 
 class ExistsMultiOptions(dict):
@@ -1166,6 +1196,8 @@ class GetAndLockMultiOptions(dict):
     Args:
         timeout (timedelta, optional): The timeout for this operation. Defaults to global
             key-value operation timeout.
+        lazy_decode (bool, optional): If True, the document's content is kept as returned by the server and
+            is only decoded by the transcoder the first time the result's content is accessed.  Defaults to False.
         per_key_options (Dict[str, :class:`.GetAndLockOptions`], optional): Specify :class:`.GetAndLockOptions` per
             key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
@@ -1176,6 +1208,7 @@ class GetAndLockMultiOptions(dict):
         self,
         timeout=None,  # type: timedelta
         transcoder=None,  # type: Transcoder
+        lazy_decode=None,  # type: bool
         per_key_options=None,       # type: Dict[str, GetAndLockOptions]
         return_exceptions=None      # type: Optional[bool]
     ):
@@ -1187,7 +1220,7 @@ class GetAndLockMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'transcoder', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'transcoder', 'lazy_decode', 'per_key_options', 'return_exceptions']
 
 
 LockMultiOptions = GetAndLockMultiOptions
@@ -1387,6 +1420,94 @@ class PrependMultiOptions(dict):
                 'span', 'per_key_options', 'return_exceptions']
 
 
+class LookupInMultiOptions(dict):
+    """Available options to for a subdocument multi-lookup-in operation.
+
+    Options can be set at a global level (i.e. for all lookup-in operations handled with this multi-lookup-in
+    operation). Use *per_key_options* to set specific :class:`.LookupInOptions` for specific keys.
+
+    Args:
+        timeout (timedelta, optional): The timeout for this operation. Defaults to global
+            subdocument operation timeout.
+        access_deleted (bool, optional): Allows access to the xattrs of deleted documents.  Defaults to False.
+        transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): Specifies an explicit transcoder
+            to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        per_key_options (Dict[str, :class:`.LookupInOptions`], optional): Specify :class:`.LookupInOptions` per key.
+        return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
+            Exception without raising.  Defaults to True.
+    """
+    @overload
+    def __init__(
+        self,
+        timeout=None,  # type: timedelta
+        access_deleted=None,  # type: bool
+        span=None,  # type: Any
+        transcoder=None,  # type: Transcoder
+        per_key_options=None,       # type: Dict[str, LookupInOptions]
+        return_exceptions=None      # type: Optional[bool]
+    ):
+        pass
+
+    def __init__(self, **kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        super().__init__(**kwargs)
+
+    @classmethod
+    def get_valid_keys(cls):
+        return ['timeout', 'access_deleted', 'span', 'transcoder', 'per_key_options', 'return_exceptions']
+
+
+class MutateInMultiOptions(dict):
+    """Available options to for a subdocument multi-mutate-in operation.
+
+    Options can be set at a global level (i.e. for all mutate-in operations handled with this multi-mutate-in
+    operation). Use *per_key_options* to set specific :class:`.MutateInOptions` for specific keys.
+
+    Args:
+        cas (int, optional): If specified, indicates that operation should be failed if the CAS has changed from
+            this value, indicating that the document has changed.  Usually only useful as a per key option.
+        timeout (timedelta, optional): The timeout for this operation. Defaults to global
+            subdocument operation timeout.
+        expiry (timedelta, optional): Specifies the expiry time for the documents.
+        durability (:class:`~couchbase.durability.DurabilityType`, optional): Specifies the level of durability
+            for this operation.
+        preserve_expiry (bool, optional): Specifies that any existing expiry on the document should be preserved.
+        store_semantics (:class:`~couchbase.subdocument.StoreSemantics`, optional): Specifies the store semantics
+            to use for this operation.
+        access_deleted (bool, optional): Allows access to the xattrs of deleted documents.  Defaults to False.
+        transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): Specifies an explicit transcoder
+            to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        per_key_options (Dict[str, :class:`.MutateInOptions`], optional): Specify :class:`.MutateInOptions` per key.
+        return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
+            Exception without raising.  Defaults to True.
+    """
+    @overload
+    def __init__(
+        self,
+        timeout=None,  # type: timedelta
+        expiry=None,  # type: timedelta
+        preserve_expiry=None,  # type: bool
+        durability=None,  # type: DurabilityType
+        cas=None,  # type: int
+        store_semantics=None,  # type: StoreSemantics
+        access_deleted=None,  # type: bool
+        span=None,  # type: Any
+        transcoder=None,  # type: Transcoder
+        per_key_options=None,       # type: Dict[str, MutateInOptions]
+        return_exceptions=None      # type: Optional[bool]
+    ):
+        pass
+
+    def __init__(self, **kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        super().__init__(**kwargs)
+
+    @classmethod
+    def get_valid_keys(cls):
+        return ['timeout', 'expiry', 'preserve_expiry', 'durability', 'cas', 'store_semantics',
+                'access_deleted', 'span', 'transcoder', 'per_key_options', 'return_exceptions']
+
+
 NoValueMultiOptions = Union[GetMultiOptions, ExistsMultiOptions,
                             RemoveMultiOptions, TouchMultiOptions, LockMultiOptions, UnlockMultiOptions]
 MutationMultiOptions = Union[InsertMultiOptions, UpsertMultiOptions, ReplaceMultiOptions]
@@ -1449,9 +1570,19 @@ class QueryOptions(QueryOptionsBase):
             None.
         serializer (:class:`~couchbase.serializer.Serializer`, optional): Specifies an explicit serializer
             to use for this specific N1QL operation. Defaults to
-            :class:`~couchbase.serializer.DefaultJsonSerializer`.
+            :class:`~couchbase.serializer.DefaultJsonSerializer`.  Use a
+            :class:`~couchbase.serializer.SchemaSerializer` to decode each row into a row schema.
         raw (Dict[str, Any], optional): Specifies any additional parameters which should be passed to the query engine
             when executing the query. Defaults to None.
+        stream_rows (bool, optional): **VOLATILE** If set to True, rows are made available to the result iterator
+            as they are returned by the query service instead of after the entire result set has been received.
+            Defaults to False.
+        stream_high_water_mark (int, optional): **VOLATILE** Only applies when ``stream_rows`` is enabled. The
+            maximum number of rows buffered in the SDK that have not yet been consumed.  Once reached, reading the
+            HTTP response is paused until the application consumes rows, so a slow consumer is paced rather than
+            failed.  Note that the pause blocks one of the SDK's IO threads, so consider increasing the
+            ``num_io_threads`` cluster option when streaming large result sets concurrently with other operations.
+            Defaults to 1000.
     """
 
 
@@ -1480,7 +1611,8 @@ class AnalyticsOptions(AnalyticsOptionsBase):
             This can be scoped to a scope or a collection within the dataset. Defaults to None.
         serializer (:class:`~couchbase.serializer.Serializer`, optional): Specifies an explicit serializer
             to use for this specific analytics query. Defaults to
-            :class:`~couchbase.serializer.DefaultJsonSerializer`.
+            :class:`~couchbase.serializer.DefaultJsonSerializer`.  Use a
+            :class:`~couchbase.serializer.SchemaSerializer` to decode each row into a row schema.
         raw (Dict[str, Any], optional): Specifies any additional parameters which should be passed to the analytics
             query engine when executing the analytics query. Defaults to None.
     """
@@ -1533,9 +1665,27 @@ class SearchOptions(SearchOptionsBase):
         show_request (bool, optional): Specifies if the search response should contain the request for the search query. Defaults to False.
         log_request (bool, optional): **UNCOMMITTED** Specifies if search request body should appear the log. Defaults to False.
         log_response (bool, optional): **UNCOMMITTED** Specifies if search response should appear in the log. Defaults to False.
+        ids_and_scores_only (bool, optional): **VOLATILE** This API is subject to change at any time. If set to True, only the index, ID and score of each
+            :class:`~couchbase.search.SearchRow` are set and the ``fields``, ``highlight_style``, ``highlight_fields``, ``explain`` and ``include_locations``
+            options are ignored.  Defaults to False.
     """  # noqa: E501
 
 
+class SearchManyOptions(SearchManyOptionsBase):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Available options for executing several search queries with ``search_many()``.
+
+    Args:
+        limit (int, optional): The number of merged rows to return.  Also used as the limit of each search query that
+            does not set its own limit.  Defaults to 10.
+        merge_strategy (:class:`~couchbase.search.SearchMergeStrategy`, optional): Specifies how the rows of the search
+            queries are merged.  Defaults to :attr:`~couchbase.search.SearchMergeStrategy.SORT`.
+        rrf_k (int, optional): The rank constant of reciprocal rank fusion, only used when ``merge_strategy`` is
+            :attr:`~couchbase.search.SearchMergeStrategy.RECIPROCAL_RANK_FUSION`.  Defaults to 60.
+    """
+
+
 class VectorSearchOptions(VectorSearchOptionsBase):
     """**UNCOMMITTED** This API is unlikely to change,
     but may still change as final consensus on its behavior has not yet been reached.
@@ -1774,27 +1924,49 @@ class Forwarder(metaclass=ABCMeta):
         *options  # type: OptionsBase
     ):
         # type: (...) -> OptionsBase[str,Any]
-        arg_vars = copy.copy(arg_vars) if arg_vars else {}
-        temp_options = (
-            copy.copy(
-                options[0]) if (
-                options and options[0]) else OptionsBase())
-        kwargs = arg_vars.pop("kwargs", {})
-        temp_options.update(kwargs)
-        temp_options.update(arg_vars)
-
+        opts = options[0] if options else None
+        # fast path, nothing to forward
+        if not (arg_vars or opts):
+            return {}
+
+        if arg_vars:
+            temp_options = copy.copy(opts) if opts else OptionsBase()
+            kwargs = arg_vars.get("kwargs", None)
+            if kwargs:
+                temp_options.update(kwargs)
+            temp_options.update(arg_vars)
+            if "kwargs" in arg_vars:
+                temp_options.pop("kwargs")
+        else:
+            # the options are only read, no need to copy them
+            temp_options = opts
+
+        conversion_plan = self.conversion_plan()
         end_options = {}
         for k, v in temp_options.items():
-            map_item = self.arg_mapping().get(k, None)
-            if not (map_item is None):
-                for out_k, out_f in map_item.items():
-                    converted = out_f(v)
-                    if converted is not None:
-                        end_options[out_k] = converted
-            else:
+            conversions = conversion_plan.get(k, None)
+            if conversions is None:
                 end_options[k] = v
+                continue
+            for out_k, out_f in conversions:
+                converted = out_f(v)
+                if converted is not None:
+                    end_options[out_k] = converted
         return end_options
 
+    def conversion_plan(self):
+        # type: (...) -> Dict[str, Tuple[Tuple[str, Callable[[Any], Any]], ...]]
+        """**INTERNAL**
+
+        :meth:`arg_mapping` compiled into tuples of (output key, conversion) per option key.  The mapping does not
+        depend on the options class, so the plan is built once and shared by every options class (and every call).
+        """
+        plan = getattr(self, '_conversion_plan', None)
+        if plan is None:
+            plan = {k: tuple(v.items()) for k, v in self.arg_mapping().items()}
+            self._conversion_plan = plan
+        return plan
+
     @abstractmethod
     def arg_mapping(self):
         pass
@@ -16,17 +16,17 @@
 from __future__ import annotations
 
 import json
+import sys
+from array import array
 from datetime import datetime
 from typing import (Any,
                     Dict,
+                    Iterator,
+                    List,
                     Optional,
                     Tuple,
                     Union)
 
-from acouchbase.analytics import AsyncAnalyticsRequest
-from acouchbase.n1ql import AsyncN1QLRequest
-from acouchbase.search import AsyncFullTextSearchRequest
-from acouchbase.views import AsyncViewRequest
 from couchbase.diagnostics import (ClusterState,
                                    EndpointDiagnosticsReport,
                                    EndpointPingReport,
@@ -39,6 +39,20 @@ from couchbase.exceptions import (CLIENT_ERROR_MAP,
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.pycbc_core import exception, result
 from couchbase.subdocument import parse_subdocument_content_as, parse_subdocument_exists
+from couchbase.transcoder import LazyValue
+
+
+def _is_async_request(request,  # type: Any
+                      module_name,  # type: str
+                      class_name,  # type: str
+                      ) -> bool:
+    """**INTERNAL**
+
+    An acouchbase streaming request can only exist if its module has been imported, so the (blocking API) results do
+    not need to import acouchbase to check for one.
+    """
+    module = sys.modules.get(module_name, None)
+    return module is not None and isinstance(request, getattr(module, class_name))
 
 
 class Result:
@@ -59,7 +73,12 @@ class Result:
         """
             Optional[Any]: The content of the document, if it exists.
         """
-        return self._orig.raw_result.get("value", None)
+        value = self._orig.raw_result.get("value", None)
+        if isinstance(value, LazyValue):
+            # lazy_decode was requested, decode on first access and keep the decoded value
+            value = value.decode()
+            self._orig.raw_result["value"] = value
+        return value
 
     @property
     def cas(self) -> Optional[int]:
@@ -106,6 +125,9 @@ class ContentProxy:
         :param type_: the type to attempt to cast the result to
         :return: the content cast to the given type, if possible
         """
+        # content decoded into a row schema (see SchemaSerializer) is returned as is
+        if not isinstance(self._content, (dict, list)) and isinstance(type_, type) and isinstance(self._content, type_):
+            return self._content
         return type_(self._content)
 
 
@@ -399,6 +421,106 @@ class MultiResult:
         return exc
 
 
+class _ColumnarMultiResult:
+    """**INTERNAL**
+
+    Base for the get and mutation multi-op results.  The raw (key -> result or exception) mapping returned by the
+    C++ client is kept as-is; the per-key :class:`.Result` objects and exceptions are only built when they are
+    accessed.  :meth:`cas_array`, :meth:`failed_keys` and :meth:`keys` read the raw results column-wise without
+    building any per-key objects.
+    """
+
+    def __init__(self,
+                 orig,  # type: result
+                 result_type,  # type: Union[GetResult, MutationResult]
+                 return_exceptions  # type: bool
+                 ):
+        self._orig = orig
+        self._all_ok = self._orig.raw_result.pop('all_okay', False)
+        self._raw_results = self._orig.raw_result
+        self._result_type = result_type
+        # results/exceptions that have been accessed, by key
+        self._results = {}
+        if not return_exceptions and self._all_ok is not True:
+            for v in self._raw_results.values():
+                if isinstance(v, CouchbaseBaseException):
+                    raise ErrorMapper.build_exception(v)
+
+    def _materialize(self,
+                     key,  # type: str
+                     raw  # type: Union[result, CouchbaseBaseException]
+                     ) -> Union[Result, CouchbaseException]:
+        res = self._results.get(key, None)
+        if res is None:
+            if isinstance(raw, CouchbaseBaseException):
+                res = ErrorMapper.build_exception(raw)
+            else:
+                res = self._result_type(raw)
+            self._results[key] = res
+        return res
+
+    def _iter_results(self) -> Iterator[Tuple[str, Union[Result, CouchbaseException]]]:
+        """**INTERNAL**
+        """
+        for k, v in self._raw_results.items():
+            yield k, self._materialize(k, v)
+
+    @property
+    def all_ok(self) -> bool:
+        """
+            bool: True if all operations succeeded, false otherwise.
+        """
+        return self._all_ok
+
+    @property
+    def exceptions(self) -> Dict[str, CouchbaseBaseException]:
+        """
+            Dict[str, Exception]: Map of keys to their respective exceptions, if the
+                operation had an exception.
+        """
+        if self._all_ok is True:
+            return {}
+        return {k: self._materialize(k, v)
+                for k, v in self._raw_results.items() if isinstance(v, CouchbaseBaseException)}
+
+    def keys(self) -> List[str]:
+        """Returns the keys of the operation.
+
+        The arrays returned by :meth:`cas_array` (and :meth:`~.MultiGetResult.values`,
+        :meth:`~.MultiGetResult.flags_array`) are aligned with these keys.
+
+        Returns:
+            List[str]: The keys, in result order.
+        """
+        return list(self._raw_results)
+
+    def failed_keys(self) -> List[str]:
+        """Returns the keys whose operation failed, without building the exceptions.
+
+        Returns:
+            List[str]: The keys that have an exception.
+        """
+        if self._all_ok is True:
+            return []
+        return [k for k, v in self._raw_results.items() if isinstance(v, CouchbaseBaseException)]
+
+    def cas_array(self) -> array:
+        """Returns the CAS of every key, aligned with :meth:`keys`.
+
+        Returns:
+            array: An ``array('Q')`` of CAS values, 0 for keys whose operation failed.
+        """
+        return array('Q', [0 if isinstance(v, CouchbaseBaseException) else v.raw_result.get('cas', 0)
+                           for v in self._raw_results.values()])
+
+    def _results_of_type(self) -> Dict[str, Result]:
+        return {k: self._materialize(k, v)
+                for k, v in self._raw_results.items() if not isinstance(v, CouchbaseBaseException)}
+
+    def _repr_results(self) -> str:
+        return ", ".join(f'{k}:{v}' for k, v in self._iter_results())
+
+
 class MultiGetReplicaResult(MultiResult):
     def __init__(self,
                  orig,  # type: result
@@ -428,7 +550,7 @@ class MultiGetReplicaResult(MultiResult):
         return f'MultiGetReplicaResult( {", ".join(output_results)} )'
 
 
-class MultiGetResult(MultiResult):
+class MultiGetResult(_ColumnarMultiResult):
     def __init__(self,
                  orig,  # type: result
                  return_exceptions  # type: bool
@@ -441,18 +563,45 @@ class MultiGetResult(MultiResult):
             Dict[str, :class:`.GetResult`]: Map of keys to their respective :class:`.GetResult`, if the
                 operation has a result.
         """
-        res = {}
-        for k, v in self._results.items():
-            if isinstance(v, GetResult):
-                res[k] = v
-        return res
+        return self._results_of_type()
 
-    def __repr__(self):
-        output_results = []
-        for k, v in self._results.items():
-            output_results.append(f'{k}:{v}')
+    def values(self) -> List[Any]:
+        """Returns the content of every document, aligned with :meth:`keys`.
+
+        Unlike :attr:`results`, no :class:`.GetResult` is created for each key.
 
-        return f'MultiGetResult( {", ".join(output_results)} )'
+        Returns:
+            List[Any]: The document contents, None for keys whose operation failed.
+
+        Examples:
+            Pair keys with their documents::
+
+                res = collection.get_multi(keys)
+                docs = dict(zip(res.keys(), res.values()))
+        """
+        values = []
+        for v in self._raw_results.values():
+            if isinstance(v, CouchbaseBaseException):
+                values.append(None)
+                continue
+            value = v.raw_result.get('value', None)
+            if isinstance(value, LazyValue):
+                value = value.decode()
+                v.raw_result['value'] = value
+            values.append(value)
+        return values
+
+    def flags_array(self) -> array:
+        """Returns the flags of every document, aligned with :meth:`keys`.
+
+        Returns:
+            array: An ``array('L')`` of flags, 0 for keys whose operation failed.
+        """
+        return array('L', [0 if isinstance(v, CouchbaseBaseException) else v.raw_result.get('flags', 0)
+                           for v in self._raw_results.values()])
+
+    def __repr__(self):
+        return f'MultiGetResult( {self._repr_results()} )'
 
 
 class ExistsResult(Result):
@@ -547,42 +696,12 @@ class MutationResult(Result):
         return "MutationResult:{}".format(self._orig)
 
 
-class MultiMutationResult:
+class MultiMutationResult(_ColumnarMultiResult):
     def __init__(self,
                  orig,  # type: result
                  return_exceptions  # type: bool
                  ):
-
-        self._orig = orig
-        self._all_ok = self._orig.raw_result.pop('all_okay', False)
-        self._results = {}
-        for k, v in self._orig.raw_result.items():
-            if isinstance(v, CouchbaseBaseException):
-                if not return_exceptions:
-                    raise ErrorMapper.build_exception(v)
-                else:
-                    self._results[k] = ErrorMapper.build_exception(v)
-            else:
-                self._results[k] = MutationResult(v)
-
-    @property
-    def all_ok(self) -> bool:
-        """
-            bool: True if all operations succeeded, false otherwise.
-        """
-        return self._all_ok
-
-    @property
-    def exceptions(self) -> Dict[str, CouchbaseBaseException]:
-        """
-            Dict[str, Exception]: Map of keys to their respective exceptions, if the
-                operation had an exception.
-        """
-        exc = {}
-        for k, v in self._results.items():
-            if not isinstance(v, MutationResult):
-                exc[k] = v
-        return exc
+        super().__init__(orig, MutationResult, return_exceptions)
 
     @property
     def results(self) -> Dict[str, MutationResult]:
@@ -590,18 +709,10 @@ class MultiMutationResult:
             Dict[str, :class:`.MutationResult`]: Map of keys to their respective :class:`.MutationResult`, if the
                 operation has a result.
         """
-        res = {}
-        for k, v in self._results.items():
-            if isinstance(v, MutationResult):
-                res[k] = v
-        return res
+        return self._results_of_type()
 
     def __repr__(self):
-        output_results = []
-        for k, v in self._results.items():
-            output_results.append(f'{k}:{v}')
-
-        return f'MultiMutationResult( {", ".join(output_results)} )'
+        return f'MultiMutationResult( {self._repr_results()} )'
 
 
 MultiResultType = Union[MultiGetResult, MultiMutationResult]
@@ -748,6 +859,44 @@ class MutateInResult(MutationResult):
         return "MutateInResult:{}".format(self._orig)
 
 
+class MultiLookupInResult(_ColumnarMultiResult):
+    def __init__(self,
+                 orig,  # type: result
+                 return_exceptions  # type: bool
+                 ):
+        super().__init__(orig, LookupInResult, return_exceptions)
+
+    @property
+    def results(self) -> Dict[str, LookupInResult]:
+        """
+            Dict[str, :class:`.LookupInResult`]: Map of keys to their respective :class:`.LookupInResult`, if the
+                operation has a result.
+        """
+        return self._results_of_type()
+
+    def __repr__(self):
+        return f'MultiLookupInResult( {self._repr_results()} )'
+
+
+class MultiMutateInResult(MultiMutationResult):
+    def __init__(self,
+                 orig,  # type: result
+                 return_exceptions  # type: bool
+                 ):
+        _ColumnarMultiResult.__init__(self, orig, MutateInResult, return_exceptions)
+
+    @property
+    def results(self) -> Dict[str, MutateInResult]:
+        """
+            Dict[str, :class:`.MutateInResult`]: Map of keys to their respective :class:`.MutateInResult`, if the
+                operation has a result.
+        """
+        return self._results_of_type()
+
+    def __repr__(self):
+        return f'MultiMutateInResult( {self._repr_results()} )'
+
+
 class CounterResult(MutationResult):
 
     # Uncomment and delete previous property when ready to remove cas CounterResult.
@@ -1037,15 +1186,33 @@ class ScanResultIterable:
         Returns:
             Iterable: Either an iterable or async iterable.
         """
-        # avoid circular import
-        from acouchbase.kv_range_scan import AsyncRangeScanRequest  # noqa: F811
-        if isinstance(self._request, AsyncRangeScanRequest):
+        if _is_async_request(self._request, 'acouchbase.kv_range_scan', 'AsyncRangeScanRequest'):
             return self.__aiter__()
         return self.__iter__()
 
     def cancel_scan(self):
         self._request.cancel_scan()
 
+    def rows_batched(self):
+        """**VOLATILE** This API is subject to change at any time.
+
+        The rows which have been returned by the scan, grouped into lists.  Each list is pulled from the
+        underlying stream with a single executor hop.  The maximum size of a list can be set with the
+        ``row_batch_size`` keyword argument when executing the scan.
+
+        .. note::
+            Only available with the *acouchbase* API, be sure to use ``async for`` when looping over the lists.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If not using the *acouchbase* API.
+
+        Returns:
+            AsyncIterator[List[Any]]: An async iterator that yields lists of rows.
+        """
+        if not _is_async_request(self._request, 'acouchbase.kv_range_scan', 'AsyncRangeScanRequest'):
+            raise InvalidArgumentException('rows_batched() is only available with the acouchbase API.')
+        return self._request.rows_batched()
+
     def __iter__(self):
         return self._request.__iter__()
 
@@ -1072,7 +1239,7 @@ class QueryResult:
         Returns:
             Iterable: Either an iterable or async iterable.
         """
-        if isinstance(self._request, AsyncN1QLRequest):
+        if _is_async_request(self._request, 'acouchbase.n1ql', 'AsyncN1QLRequest'):
             return self.__aiter__()
         return self.__iter__()
 
@@ -1096,6 +1263,26 @@ class QueryResult:
         """
         return self._request.metadata()
 
+    def rows_batched(self):
+        """**VOLATILE** This API is subject to change at any time.
+
+        The rows which have been returned by the query, grouped into lists.  Each list is pulled from the
+        underlying stream with a single executor hop.  The maximum size of a list can be set with the
+        ``row_batch_size`` keyword argument when executing the query.
+
+        .. note::
+            Only available with the *acouchbase* API, be sure to use ``async for`` when looping over the lists.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If not using the *acouchbase* API.
+
+        Returns:
+            AsyncIterator[List[Any]]: An async iterator that yields lists of rows.
+        """
+        if not _is_async_request(self._request, 'acouchbase.n1ql', 'AsyncN1QLRequest'):
+            raise InvalidArgumentException('rows_batched() is only available with the acouchbase API.')
+        return self._request.rows_batched()
+
     def __iter__(self):
         return self._request.__iter__()
 
@@ -1125,7 +1312,7 @@ class AnalyticsResult:
         Returns:
             Iterable: Either an iterable or async iterable.
         """
-        if isinstance(self._request, AsyncAnalyticsRequest):
+        if _is_async_request(self._request, 'acouchbase.analytics', 'AsyncAnalyticsRequest'):
             return self.__aiter__()
         return self.__iter__()
 
@@ -1138,6 +1325,26 @@ class AnalyticsResult:
         """
         return self._request.metadata()
 
+    def rows_batched(self):
+        """**VOLATILE** This API is subject to change at any time.
+
+        The rows which have been returned by the analytics query, grouped into lists.  Each list is pulled from the
+        underlying stream with a single executor hop.  The maximum size of a list can be set with the
+        ``row_batch_size`` keyword argument when executing the analytics query.
+
+        .. note::
+            Only available with the *acouchbase* API, be sure to use ``async for`` when looping over the lists.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If not using the *acouchbase* API.
+
+        Returns:
+            AsyncIterator[List[Any]]: An async iterator that yields lists of rows.
+        """
+        if not _is_async_request(self._request, 'acouchbase.analytics', 'AsyncAnalyticsRequest'):
+            raise InvalidArgumentException('rows_batched() is only available with the acouchbase API.')
+        return self._request.rows_batched()
+
     def __iter__(self):
         return self._request.__iter__()
 
@@ -1164,7 +1371,7 @@ class SearchResult:
         Returns:
             Iterable: Either an iterable or async iterable.
         """
-        if isinstance(self._request, AsyncFullTextSearchRequest):
+        if _is_async_request(self._request, 'acouchbase.search', 'AsyncFullTextSearchRequest'):
             return self.__aiter__()
         return self.__iter__()
 
@@ -1183,6 +1390,78 @@ class SearchResult:
     def facets(self):
         return self._request.result_facets()
 
+    def rows_batched(self):
+        """**VOLATILE** This API is subject to change at any time.
+
+        The rows which have been returned by the search query, grouped into lists.  Each list is pulled from the
+        underlying stream with a single executor hop.  The maximum size of a list can be set with the
+        ``row_batch_size`` keyword argument when executing the search query.
+
+        .. note::
+            Only available with the *acouchbase* API, be sure to use ``async for`` when looping over the lists.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If not using the *acouchbase* API.
+
+        Returns:
+            AsyncIterator[List[Any]]: An async iterator that yields lists of rows.
+        """
+        if not _is_async_request(self._request, 'acouchbase.search', 'AsyncFullTextSearchRequest'):
+            raise InvalidArgumentException('rows_batched() is only available with the acouchbase API.')
+        return self._request.rows_batched()
+
+    def iter_all(self,
+                 page_size=None,  # type: Optional[int]
+                 prefetch_pages=None,  # type: Optional[int]
+                 ) -> Iterator[Any]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Iterates over every row matching the search query, one page of ``page_size`` rows at a time.  Instead of an
+        ever growing ``skip``, each page is positioned with ``search_after`` using the sort values of the previous
+        page's last row, so the search service does the same amount of work for every page.  The next page is
+        fetched on a separate thread while the current page is consumed.
+
+        The search's ``limit`` option, if set, caps the total number of rows, a ``skip`` only applies to the first
+        page.  Metadata and facets are those of the first page.  As the search service's per-row sort values are
+        not available to the SDK, only score and document ID sorts (the default sort is by descending score) are
+        supported, a document ID sort is added as a tie-breaker.
+
+        .. note::
+            Only available with the *couchbase* API and must be called before the rows are iterated.
+
+        Args:
+            page_size (int, optional): The number of rows requested per page.  Defaults to 100.
+            prefetch_pages (int, optional): The number of pages fetched ahead of the page being consumed, at most
+                ``prefetch_pages + 2`` pages of rows are held in memory.  Set to 0 to fetch each page only once
+                the previous page is consumed.  Defaults to 1.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If not using the *couchbase* API, if the search
+                is sorted by fields or geo distance or if ``page_size`` or ``prefetch_pages`` is invalid.
+            :class:`~couchbase.exceptions.AlreadyQueriedException`: If the rows have already been iterated.
+
+        Returns:
+            Iterator[Any]: An iterator over every matching row.
+
+        Examples:
+            Export the IDs of every matching document::
+
+                import couchbase.search as search
+                from couchbase.options import SearchOptions
+
+                # ... other code ...
+
+                request = search.SearchRequest.create(search.TermQuery('home'))
+                result = cluster.search('travel-sample-index', request, SearchOptions(sort=['-_score']))
+                with open('ids.txt', 'w') as f:
+                    for row in result.iter_all(page_size=1000):
+                        f.write(f'{row.id}\n')
+        """
+        iter_all = getattr(self._request, 'iter_all', None)
+        if iter_all is None:
+            raise InvalidArgumentException('iter_all() is only available with the couchbase API.')
+        return iter_all(page_size=page_size, prefetch_pages=prefetch_pages)
+
     def __iter__(self):
         return self._request.__iter__()
 
@@ -1209,7 +1488,7 @@ class ViewResult:
         Returns:
             Iterable: Either an iterable or async iterable.
         """
-        if isinstance(self._request, AsyncViewRequest):
+        if _is_async_request(self._request, 'acouchbase.views', 'AsyncViewRequest'):
             return self.__aiter__()
         return self.__iter__()
 
@@ -1222,6 +1501,26 @@ class ViewResult:
         """
         return self._request.metadata()
 
+    def rows_batched(self):
+        """**VOLATILE** This API is subject to change at any time.
+
+        The rows which have been returned by the view query, grouped into lists.  Each list is pulled from the
+        underlying stream with a single executor hop.  The maximum size of a list can be set with the
+        ``row_batch_size`` keyword argument when executing the view query.
+
+        .. note::
+            Only available with the *acouchbase* API, be sure to use ``async for`` when looping over the lists.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If not using the *acouchbase* API.
+
+        Returns:
+            AsyncIterator[List[Any]]: An async iterator that yields lists of rows.
+        """
+        if not _is_async_request(self._request, 'acouchbase.views', 'AsyncViewRequest'):
+            raise InvalidArgumentException('rows_batched() is only available with the acouchbase API.')
+        return self._request.rows_batched()
+
     def __iter__(self):
         return self._request.__iter__()
 
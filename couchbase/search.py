@@ -13,12 +13,24 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import annotations
+
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    Iterator,
+                    List,
+                    Optional)
+
 from couchbase.exceptions import NoChildrenException  # noqa: F401
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
                                   ErrorMapper,
-                                  ExceptionMap)
+                                  ExceptionMap,
+                                  InvalidArgumentException)
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.logic.search import DateFacet  # noqa: F401
 from couchbase.logic.search import Facet  # noqa: F401
@@ -26,6 +38,7 @@ from couchbase.logic.search import HighlightStyle  # noqa: F401
 from couchbase.logic.search import NumericFacet  # noqa: F401
 from couchbase.logic.search import SearchDateRangeFacet  # noqa: F401
 from couchbase.logic.search import SearchFacetResult  # noqa: F401
+from couchbase.logic.search import SearchMergeStrategy  # noqa: F401
 from couchbase.logic.search import SearchMetaData  # noqa: F401
 from couchbase.logic.search import SearchMetrics  # noqa: F401
 from couchbase.logic.search import SearchNumericRangeFacet  # noqa: F401
@@ -42,7 +55,10 @@ from couchbase.logic.search import SortGeoDistance  # noqa: F401
 from couchbase.logic.search import SortID  # noqa: F401
 from couchbase.logic.search import SortScore  # noqa: F401
 from couchbase.logic.search import TermFacet  # noqa: F401
-from couchbase.logic.search import FullTextSearchRequestLogic
+from couchbase.logic.search import (FullTextSearchRequestLogic,
+                                    _get_search_after,
+                                    _get_search_after_sort,
+                                    _SearchResultMerger)
 from couchbase.logic.search_queries import BooleanFieldQuery  # noqa: F401
 from couchbase.logic.search_queries import BooleanQuery  # noqa: F401
 from couchbase.logic.search_queries import ConjunctionQuery  # noqa: F401
@@ -70,6 +86,9 @@ from couchbase.logic.search_queries import WildcardQuery  # noqa: F401
 from couchbase.logic.search_request import SearchRequest  # noqa: F401
 from couchbase.logic.supportability import Supportability
 
+if TYPE_CHECKING:
+    from couchbase.result import SearchResult
+
 
 class FullTextSearchRequest(FullTextSearchRequestLogic):
     def __init__(self,
@@ -139,6 +158,189 @@ class FullTextSearchRequest(FullTextSearchRequestLogic):
             excptn = exc_cls(str(ex))
             raise excptn
 
+    def iter_all(self,
+                 page_size=None,  # type: Optional[int]
+                 prefetch_pages=None,  # type: Optional[int]
+                 ) -> Iterator[Any]:
+        """**INTERNAL**
+
+        See :meth:`~couchbase.result.SearchResult.iter_all`.
+        """
+        page_size = 100 if page_size is None else page_size
+        prefetch_pages = 1 if prefetch_pages is None else prefetch_pages
+        if not isinstance(page_size, int) or isinstance(page_size, bool) or page_size < 1:
+            raise InvalidArgumentException('page_size must be an int >= 1.')
+        if not isinstance(prefetch_pages, int) or isinstance(prefetch_pages, bool) or prefetch_pages < 0:
+            raise InvalidArgumentException('prefetch_pages must be an int >= 0.')
+        if self.started_streaming or self.done_streaming:
+            raise AlreadyQueriedException()
+        sort_specs, sort_keys = _get_search_after_sort(self.encoded_query.get('sort_specs', None))
+
+        pages = self._iter_pages(page_size, sort_specs, sort_keys)
+        if prefetch_pages == 0:
+            return (row for page in pages for row in page)
+        return self._iter_prefetched(pages, prefetch_pages)
+
+    def _iter_pages(self,
+                    page_size,  # type: int
+                    sort_specs,  # type: List[str]
+                    sort_keys,  # type: List[str]
+                    ) -> Iterator[List[Any]]:
+        """**INTERNAL**
+
+        Yields the rows of each page.  The first page is fetched by this request, so its metadata and facets are
+        available from the result, following pages are fetched by new requests positioned with ``search_after``.
+        """
+        base_query = dict(self.encoded_query)
+        base_query.pop('span', None)
+        base_query['sort_specs'] = sort_specs
+        # an overall limit caps the number of rows across all pages
+        remaining = base_query.pop('limit', None)
+        # the first page is fetched by this request with a copy of its query, the caller's query is not modified
+        request = self
+        query = dict(self.encoded_query)
+        query['sort_specs'] = sort_specs
+        self._encoded_query = query
+        while True:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            query['limit'] = limit
+            rows = list(request)
+            if rows:
+                yield rows
+            if remaining is not None:
+                remaining -= len(rows)
+            if len(rows) < limit or remaining == 0:
+                return
+
+            query = {k: v for k, v in base_query.items() if k not in ['skip', 'facets']}
+            query['raw'] = dict(base_query.get('raw', None) or {})
+            query['raw']['search_after'] = _get_search_after(rows[-1], sort_keys)
+            request = self._create_page_request(query)
+
+    def _create_page_request(self, encoded_query  # type: Dict[str, Any]
+                             ) -> FullTextSearchRequest:
+        """**INTERNAL**"""
+        return self.__class__(self._connection,
+                              encoded_query,
+                              row_factory=self.row_factory,
+                              default_serializer=self._default_serializer,
+                              streaming_timeout=self._streaming_timeout,
+                              bucket_name=self._bucket_name,
+                              scope_name=self._scope_name)
+
+    def _iter_prefetched(self,
+                         pages,  # type: Iterator[List[Any]]
+                         prefetch_pages,  # type: int
+                         ) -> Iterator[Any]:
+        """**INTERNAL**
+
+        Fetches pages on a separate thread while the caller consumes the current page.  The queue holds at most
+        ``prefetch_pages`` pages, so no more than ``prefetch_pages + 2`` pages of rows are held in memory.
+        """
+        prefetcher = _PagePrefetcher(pages, prefetch_pages)
+        try:
+            while True:
+                page = prefetcher.get()
+                if page is None:
+                    return
+                yield from page
+        finally:
+            # the fetcher stops at its next page if the caller stops iterating early
+            prefetcher.stop()
+
+
+class _PagePrefetcher:
+    """**INTERNAL**
+
+    Fetches pages on a daemon thread into a bounded queue.
+    """
+
+    def __init__(self,
+                 pages,  # type: Iterator[List[Any]]
+                 prefetch_pages,  # type: int
+                 ):
+        self._pages = pages
+        self._queue = Queue(maxsize=prefetch_pages)
+        self._stopped = Event()
+        self._fetcher = Thread(target=self._fetch, name='pycbc-search-prefetch', daemon=True)
+        self._fetcher.start()
+
+    def get(self) -> Optional[List[Any]]:
+        """Returns the next page, None once all pages are fetched.  Raises the fetcher's exception, if any."""
+        page = self._queue.get()
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _put(self, item  # type: Any
+             ) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _fetch(self) -> None:
+        try:
+            for page in self._pages:
+                if not self._put(page):
+                    return
+        except Exception as ex:
+            self._put(ex)
+            return
+        self._put(None)
+
+
+def _stream_search_rows(idx,  # type: int
+                        result,  # type: SearchResult
+                        queue,  # type: Queue
+                        stopped,  # type: Event
+                        ) -> None:
+    """**INTERNAL**
+
+    Puts ``(idx, row)`` for each row of the search, then ``(idx, None)`` or ``(idx, exception)``.
+    """
+    try:
+        for row in result.rows():
+            if stopped.is_set():
+                return
+            queue.put((idx, row))
+    except Exception as ex:
+        queue.put((idx, ex))
+        return
+    queue.put((idx, None))
+
+
+def _search_many(results,  # type: List[SearchResult]
+                 merge_args,  # type: Dict[str, Any]
+                 ) -> List[SearchRow]:
+    """**INTERNAL**
+
+    Streams the rows of each search on its own thread and merges them as they arrive.  Returns as soon as the merged
+    rows are settled, the remaining rows of each search are not waited for.
+    """
+    merger = _SearchResultMerger([r._request.encoded_query.get('sort_specs', None) for r in results], **merge_args)
+    # each search returns at most `limit` rows, so the queue is bounded by the number of searches * limit
+    queue = Queue()
+    stopped = Event()
+    for idx, result in enumerate(results):
+        Thread(target=_stream_search_rows,
+               args=(idx, result, queue, stopped),
+               name=f'pycbc-search-many-{idx}',
+               daemon=True).start()
+    try:
+        while not merger.done:
+            merger.add(*queue.get())
+        return merger.rows()
+    finally:
+        # searches that are still streaming stop at their next row
+        stopped.set()
+
 
 """
 ** DEPRECATION NOTICE **
@@ -13,9 +13,38 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import dataclasses
 import json
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from threading import RLock
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Optional,
+                    Set,
+                    Tuple,
+                    Type,
+                    Union,
+                    get_type_hints)
+
+from couchbase.exceptions import InvalidArgumentException, ValueFormatException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 class Serializer(ABC):
@@ -50,7 +79,409 @@ class DefaultJsonSerializer(Serializer):
         return json.dumps(value, ensure_ascii=False).encode('utf-8')
 
     def deserialize(self,
-                    value  # type: bytes
+                    value  # type: Union[bytes, bytearray, memoryview]
                     ) -> Any:
 
+        if isinstance(value, memoryview):
+            value = value.tobytes()
         return json.loads(value.decode('utf-8'))
+
+
+class OrjsonSerializer(Serializer):
+    """JSON serializer backed by `orjson <https://github.com/ijl/orjson>`_.
+
+    Encodes directly to bytes and decodes bytes, bytearray and memoryview values without an intermediate str.
+    Non-str dict keys are converted to str, matching the behavior of :class:`DefaultJsonSerializer`.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonSerializer requires the orjson package.')
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._dumps_opts = orjson.OPT_NON_STR_KEYS
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+
+        return self._dumps(value, option=self._dumps_opts)
+
+    def deserialize(self,
+                    value  # type: Union[bytes, bytearray, memoryview, str]
+                    ) -> Any:
+
+        return self._loads(value)
+
+
+class UjsonSerializer(Serializer):
+    """JSON serializer backed by `ujson <https://github.com/ultrajson/ultrajson>`_.
+
+    Decodes bytes values without an intermediate str.
+    """
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError('UjsonSerializer requires the ujson package.')
+        self._dumps = ujson.dumps
+        self._loads = ujson.loads
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+
+        return self._dumps(value, ensure_ascii=False).encode('utf-8')
+
+    def deserialize(self,
+                    value  # type: Union[bytes, bytearray, memoryview, str]
+                    ) -> Any:
+
+        if isinstance(value, (bytearray, memoryview)):
+            value = bytes(value)
+        return self._loads(value)
+
+
+class MsgspecSerializer(Serializer):
+    """JSON serializer backed by `msgspec <https://github.com/jcrist/msgspec>`_.
+
+    Encodes directly to bytes and decodes any buffer-protocol value without an intermediate str.
+    """
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError('MsgspecSerializer requires the msgspec package.')
+        self._encode = msgspec.json.Encoder().encode
+        self._decode = msgspec.json.Decoder().decode
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+
+        return self._encode(value)
+
+    def deserialize(self,
+                    value  # type: Union[bytes, bytearray, memoryview, str]
+                    ) -> Any:
+
+        return self._decode(value)
+
+
+# in order of preference
+_JSON_SERIALIZERS = {
+    'orjson': (OrjsonSerializer, orjson),
+    'msgspec': (MsgspecSerializer, msgspec),
+    'ujson': (UjsonSerializer, ujson),
+    'json': (DefaultJsonSerializer, json),
+}  # type: Dict[str, Any]
+
+
+def _detect_fast_serializer() -> Type[Serializer]:
+    for serializer_cls, module in _JSON_SERIALIZERS.values():
+        if module is not None:
+            return serializer_cls
+    return DefaultJsonSerializer
+
+
+FastJsonSerializer = _detect_fast_serializer()
+"""The fastest :class:`Serializer` available, chosen at import from (in order) orjson, msgspec, ujson and
+:class:`DefaultJsonSerializer`."""
+
+
+def get_json_serializer(name=None  # type: Optional[str]
+                        ) -> Serializer:
+    """Returns a built-in JSON :class:`Serializer` instance.
+
+    Args:
+        name (str, optional): One of ``fast``, ``orjson``, ``msgspec``, ``ujson`` or ``json``.  ``fast`` (or None)
+            returns the fastest serializer available (see :data:`FastJsonSerializer`).
+
+    Returns:
+        :class:`Serializer`: The requested serializer.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If the name is unknown or the required library
+            is not installed.
+    """
+    if name is None or name == 'fast':
+        return FastJsonSerializer()
+    serializer_info = _JSON_SERIALIZERS.get(name, None)
+    if serializer_info is None:
+        raise InvalidArgumentException(f'Unknown serializer: {name}.  Expected one of: '
+                                       f'fast, {", ".join(_JSON_SERIALIZERS.keys())}.')
+    serializer_cls, module = serializer_info
+    if module is None:
+        raise InvalidArgumentException(f'Serializer {name} is not available.  The {name} package is not installed.')
+    return serializer_cls()
+
+
+_NoneType = type(None)
+
+
+def _is_typed_dict(schema  # type: Any
+                   ) -> bool:
+    return isinstance(schema, type) and issubclass(schema, dict) and hasattr(schema, '__total__')
+
+
+def _get_slots(schema  # type: type
+               ) -> List[str]:
+    slots = []
+    for klass in reversed(schema.__mro__):
+        klass_slots = klass.__dict__.get('__slots__', ())
+        if isinstance(klass_slots, str):
+            klass_slots = (klass_slots,)
+        slots.extend(s for s in klass_slots if s not in ('__dict__', '__weakref__') and s not in slots)
+    return slots
+
+
+def _is_row_schema(schema  # type: Any
+                   ) -> bool:
+    if not isinstance(schema, type):
+        return False
+    return dataclasses.is_dataclass(schema) or _is_typed_dict(schema) or len(_get_slots(schema)) > 0
+
+
+def _get_schema_fields(schema  # type: type
+                       ) -> Tuple[List[str], Dict[str, Any]]:
+    """**INTERNAL**
+
+    Returns the field names of a row schema and the type hints available for them.
+    """
+    try:
+        hints = get_type_hints(schema)
+    except Exception:
+        # hints that cannot be resolved only prevent decoding nested schemas
+        hints = getattr(schema, '__annotations__', {})
+    if dataclasses.is_dataclass(schema):
+        names = [f.name for f in dataclasses.fields(schema) if f.init]
+    elif _is_typed_dict(schema):
+        names = list(hints.keys())
+    else:
+        names = _get_slots(schema)
+    return names, hints
+
+
+def _compile_field_decoder(hint  # type: Any
+                           ) -> Optional[Callable[[Any], Any]]:
+    """**INTERNAL**
+
+    Returns a decoder for a field whose type is a row schema, a list of a row schema or an Optional of either.
+    None is returned for any other type, the JSON value is then used as is.
+    """
+    if _is_row_schema(hint):
+        if hint in _COMPILING_SCHEMAS:
+            # a recursive schema, its decoder is registered once compiled
+            return lambda value: _ROW_DECODERS[hint](value)
+        return _compile_row_decoder(hint)
+    origin = getattr(hint, '__origin__', None)
+    args = [a for a in getattr(hint, '__args__', None) or () if a is not _NoneType]
+    if origin is Union and len(args) == 1:
+        return _compile_field_decoder(args[0])
+    if origin in (list, List) and len(args) == 1:
+        item_decoder = _compile_field_decoder(args[0])
+        if item_decoder is not None:
+            return lambda value: [item_decoder(v) for v in value] if isinstance(value, list) else value
+    return None
+
+
+_ROW_DECODERS = {}  # type: Dict[type, Callable[[Any], Any]]
+_COMPILING_SCHEMAS = set()  # type: Set[type]
+_ROW_DECODERS_LOCK = RLock()
+
+
+def _compile_values_getter(schema,  # type: type
+                           names,  # type: List[str]
+                           hints,  # type: Dict[str, Any]
+                           ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """**INTERNAL**
+
+    Returns a function that reads the schema's fields from a JSON object, keyed by the schema's interned field names.
+    """
+    _COMPILING_SCHEMAS.add(schema)
+    try:
+        field_decoders = [(name, _compile_field_decoder(hints.get(name, None))) for name in names]
+    finally:
+        _COMPILING_SCHEMAS.discard(schema)
+    # every row shares the interned key strings of the schema
+    plain_keys = [sys.intern(name) for name, field_decoder in field_decoders if field_decoder is None]
+    nested_keys = [(sys.intern(name), field_decoder)
+                   for name, field_decoder in field_decoders if field_decoder is not None]
+
+    def _get_values(obj):
+        values = {key: obj[key] for key in plain_keys if key in obj}
+        for key, field_decoder in nested_keys:
+            if key in obj:
+                value = obj[key]
+                values[key] = None if value is None else field_decoder(value)
+        return values
+
+    return _get_values
+
+
+def _dataclass_decoder(schema,  # type: type
+                       get_values,  # type: Callable[[Dict[str, Any]], Dict[str, Any]]
+                       names,  # type: List[str]
+                       ) -> Callable[[Any], Any]:
+    """**INTERNAL**"""
+    def decoder(obj):
+        if not isinstance(obj, dict):
+            return obj
+        # fields missing from the row keep their defaults
+        return schema(**get_values(obj))
+    return decoder
+
+
+def _typed_dict_decoder(schema,  # type: type
+                        get_values,  # type: Callable[[Dict[str, Any]], Dict[str, Any]]
+                        names,  # type: List[str]
+                        ) -> Callable[[Any], Any]:
+    """**INTERNAL**"""
+    def decoder(obj):
+        if not isinstance(obj, dict):
+            return obj
+        return get_values(obj)
+    return decoder
+
+
+def _slots_decoder(schema,  # type: type
+                   get_values,  # type: Callable[[Dict[str, Any]], Dict[str, Any]]
+                   names,  # type: List[str]
+                   ) -> Callable[[Any], Any]:
+    """**INTERNAL**"""
+    setters = [(sys.intern(name), getattr(schema, name).__set__) for name in names]
+
+    def decoder(obj):
+        if not isinstance(obj, dict):
+            return obj
+        # the class' __init__ is not called, fields missing from the row are set to None
+        row = schema.__new__(schema)
+        values = get_values(obj)
+        for key, setter in setters:
+            setter(row, values.get(key, None))
+        return row
+    return decoder
+
+
+def _compile_row_decoder(schema  # type: type
+                         ) -> Callable[[Any], Any]:
+    """**INTERNAL**
+
+    Returns the decoder that builds an instance of the schema from a deserialized JSON object.  Decoders are compiled
+    once per schema.  Only the schema's fields are read from the JSON object, other fields are skipped.
+    """
+    decoder = _ROW_DECODERS.get(schema, None)
+    if decoder is not None:
+        return decoder
+    if not _is_row_schema(schema):
+        raise InvalidArgumentException(('Row schema must be a dataclass, a TypedDict or a class that defines '
+                                        f'__slots__, got {schema}.'))
+
+    with _ROW_DECODERS_LOCK:
+        decoder = _ROW_DECODERS.get(schema, None)
+        if decoder is not None:
+            return decoder
+
+        names, hints = _get_schema_fields(schema)
+        get_values = _compile_values_getter(schema, names, hints)
+        if dataclasses.is_dataclass(schema):
+            decoder_factory = _dataclass_decoder
+        elif _is_typed_dict(schema):
+            decoder_factory = _typed_dict_decoder
+        else:
+            decoder_factory = _slots_decoder
+        decoder = decoder_factory(schema, get_values, names)
+        _ROW_DECODERS[schema] = decoder
+        return decoder
+
+
+class SchemaSerializer(Serializer):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Deserializes JSON objects into instances of a row schema.
+
+    The schema can be a dataclass, a ``TypedDict`` or a class that defines ``__slots__``.  The decoder for a schema is
+    compiled once and reused across rows and requests.  It reads only the schema's fields from each JSON object, other
+    fields are not copied into the row, and the rows share the schema's interned key strings.  Fields typed as a
+    schema, or a list of a schema, are decoded recursively.
+
+    A :class:`MsgspecSerializer` decodes dataclass and ``TypedDict`` schemas directly from the JSON bytes with
+    ``msgspec``, which skips unused fields while parsing and validates the field types.
+
+    Use the serializer with the ``serializer`` option of :class:`~couchbase.options.QueryOptions` and
+    :class:`~couchbase.options.AnalyticsOptions`, or with a :class:`~couchbase.transcoder.JSONTranscoder` for the
+    ``transcoder`` option of :class:`~couchbase.options.ScanOptions`.
+
+    Args:
+        schema (type): The row schema.
+        serializer (:class:`Serializer`, optional): The serializer used to deserialize the JSON objects (and to
+            serialize values).  Defaults to :class:`DefaultJsonSerializer`.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If the schema is not a dataclass, a ``TypedDict`` or
+            a class that defines ``__slots__``.
+
+    :meth:`deserialize` raises a :class:`~couchbase.exceptions.ValueFormatException` if a JSON object cannot be
+    decoded into the schema, e.g. the JSON is malformed, a required dataclass field is missing or (with ``msgspec``) a
+    field has the wrong type.  The original error is the exception's ``__cause__``.
+
+    Examples:
+
+        Decode query rows into a dataclass::
+
+            from dataclasses import dataclass
+
+            from couchbase.options import QueryOptions
+            from couchbase.serializer import SchemaSerializer
+
+            @dataclass
+            class Airline:
+                name: str
+                country: str
+
+            result = cluster.query('SELECT name, country FROM `travel-sample` WHERE type = "airline"',
+                                   QueryOptions(serializer=SchemaSerializer(Airline)))
+            for row in result.rows():
+                print(f'{row.name} ({row.country})')
+    """
+
+    def __init__(self,
+                 schema,  # type: type
+                 serializer=None,  # type: Optional[Serializer]
+                 ):
+        self._schema = schema
+        self._serializer = serializer or DefaultJsonSerializer()
+        self._decoder = _compile_row_decoder(schema)
+        self._deserialize = self._serializer.deserialize
+        # Serializer's __subclasshook__ makes isinstance() true for any serializer, check the MRO instead
+        use_msgspec = MsgspecSerializer in type(self._serializer).__mro__
+        if use_msgspec and (dataclasses.is_dataclass(schema) or _is_typed_dict(schema)):
+            try:
+                self._deserialize = msgspec.json.Decoder(schema).decode
+                self._decoder = None
+            except TypeError:
+                # msgspec does not support the schema (i.e. a nested __slots__ class)
+                pass
+
+    @property
+    def schema(self) -> type:
+        """
+            type: The row schema.
+        """
+        return self._schema
+
+    def serialize(self,
+                  value,  # type: Any
+                  ) -> bytes:
+
+        return self._serializer.serialize(value)
+
+    def deserialize(self,
+                    value  # type: Union[bytes, bytearray, memoryview, str]
+                    ) -> Any:
+
+        try:
+            if self._decoder is None:
+                return self._deserialize(value)
+            return self._decoder(self._deserialize(value))
+        except (TypeError, ValueError) as ex:
+            # msgspec's DecodeError and ValidationError are ValueErrors, a dataclass w/ a missing field raises TypeError
+            raise ValueFormatException(f'Unable to decode value into {self._schema.__name__}: {ex}') from ex
@@ -0,0 +1,263 @@
+#  Copyright 2016-2023. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import gzip
+import json
+import os
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from couchbase.bulk import (BulkProgress,
+                            _export_line,
+                            _ImportBatchTracker,
+                            _load_checkpoint,
+                            _parse_line,
+                            export_collection,
+                            import_collection)
+from couchbase.constants import FMT_BYTES, FMT_JSON
+from couchbase.exceptions import DocumentNotFoundException, InvalidArgumentException
+from couchbase.kv_range_scan import PrefixScan, SamplingScan
+from couchbase.mutation_state import MutationState
+from couchbase.options import ScanOptions
+from couchbase.transcoder import RawBinaryTranscoder
+from tests.environments import CollectionType
+from tests.test_features import EnvironmentFeatures
+
+
+class BulkTestSuite:
+
+    TEST_MANIFEST = [
+        'test_export_checkpoint_resume',
+        'test_export_import',
+        'test_export_invalid_input',
+        'test_import_checkpoint_resume',
+        'test_import_checkpoint_out_of_order',
+        'test_ndjson_lines',
+    ]
+
+    @pytest.fixture(scope='class')
+    def check_range_scan_supported(self, cb_env):
+        EnvironmentFeatures.check_if_feature_supported('kv_range_scan',
+                                                       cb_env.server_version_short,
+                                                       cb_env.mock_server_type)
+
+    @pytest.fixture(scope='class')
+    def test_id(self):
+        return str(uuid4())
+
+    @pytest.fixture(scope='class')
+    def test_docs(self, test_id):
+        return {f'{test_id}-{i}': {'id': i, 'name': f'doc "{i}"\n'} for i in range(50)}
+
+    @pytest.fixture(scope='class')
+    def binary_doc(self, test_id):
+        return f'{test_id}-binary', b'\x00\x01{"id": 1}\n\xff'
+
+    @pytest.fixture(scope='class')
+    def test_mutation_state(self, cb_env, test_docs, binary_doc):
+        results = [cb_env.collection.upsert(k, v) for k, v in test_docs.items()]
+        results.append(cb_env.collection.upsert(*binary_doc, transcoder=RawBinaryTranscoder()))
+        return MutationState(*results)
+
+    def _purge_temp_docs(self, cb_env, keys):
+        for key in keys:
+            try:
+                cb_env.collection.remove(key)
+            except DocumentNotFoundException:
+                pass
+
+    def _validate_docs(self, cb_env, test_docs, binary_doc):
+        res = cb_env.collection.get_multi(list(test_docs.keys()))
+        assert res.all_ok is True
+        for k, v in res.results.items():
+            assert v.content_as[dict] == test_docs[k]
+        res = cb_env.collection.get(binary_doc[0], transcoder=RawBinaryTranscoder())
+        assert res.content_as[bytes] == binary_doc[1]
+
+    @pytest.mark.usefixtures('check_range_scan_supported')
+    def test_export_checkpoint_resume(self, cb_env, test_id, test_docs, binary_doc, test_mutation_state, tmp_path):
+        path = str(tmp_path / 'export.ndjson.gz')
+        checkpoint_path = str(tmp_path / 'export.ckpt')
+        # 12 docs in the first partition, 22 in the second and 17 in the third
+        split_points = [f'{test_id}-2', f'{test_id}-4']
+
+        def interrupt(progress):
+            if progress.documents >= 30 and not progress.done:
+                raise RuntimeError('interrupted')
+
+        with pytest.raises(RuntimeError):
+            export_collection(cb_env.collection,
+                              path,
+                              PrefixScan(test_id),
+                              ScanOptions(consistent_with=test_mutation_state),
+                              batch_size=5,
+                              split_points=split_points,
+                              checkpoint_path=checkpoint_path,
+                              progress=interrupt,
+                              progress_interval=timedelta(0))
+        with open(checkpoint_path, 'r') as f:
+            state = json.load(f)
+        assert state['completed'] == 1
+        assert state['documents'] == 12
+
+        res = export_collection(cb_env.collection,
+                                path,
+                                PrefixScan(test_id),
+                                ScanOptions(consistent_with=test_mutation_state),
+                                batch_size=5,
+                                split_points=split_points,
+                                checkpoint_path=checkpoint_path)
+        assert res.done is True
+        assert res.partitions_completed == 3
+        assert res.documents == len(test_docs) + 1
+        assert not os.path.exists(checkpoint_path)
+        with gzip.open(path, 'rb') as f:
+            keys = [_parse_line(line)[0] for line in f]
+        # every document is exported exactly once
+        assert sorted(keys) == sorted(list(test_docs.keys()) + [binary_doc[0]])
+
+    @pytest.mark.usefixtures('check_range_scan_supported')
+    @pytest.mark.parametrize('file_name', ['export.ndjson', 'export.ndjson.gz'])
+    def test_export_import(self, cb_env, test_id, test_docs, binary_doc, test_mutation_state, tmp_path, file_name):
+        path = str(tmp_path / file_name)
+        progress = []
+        res = export_collection(cb_env.collection,
+                                path,
+                                PrefixScan(test_id),
+                                ScanOptions(consistent_with=test_mutation_state),
+                                batch_size=7,
+                                progress=progress.append)
+        assert isinstance(res, BulkProgress)
+        assert res.documents == len(test_docs) + 1
+        assert res.failed == 0
+        assert progress[-1] is res
+        opener = gzip.open if file_name.endswith('.gz') else open
+        with opener(path, 'rb') as f:
+            assert len(f.readlines()) == len(test_docs) + 1
+
+        self._purge_temp_docs(cb_env, list(test_docs.keys()) + [binary_doc[0]])
+        res = import_collection(cb_env.collection, path, batch_size=7, max_in_flight=3)
+        assert res.documents == len(test_docs) + 1
+        assert res.failed == 0
+        self._validate_docs(cb_env, test_docs, binary_doc)
+
+    def test_export_invalid_input(self, cb_env, tmp_path):
+        path = str(tmp_path / 'export.ndjson')
+        with pytest.raises(InvalidArgumentException):
+            export_collection(cb_env.collection, path, batch_size=0)
+        with pytest.raises(InvalidArgumentException):
+            export_collection(cb_env.collection, path, SamplingScan(10), checkpoint_path=f'{path}.ckpt')
+        with pytest.raises(InvalidArgumentException):
+            import_collection(cb_env.collection, path, max_in_flight=0)
+
+    def test_import_checkpoint_resume(self, cb_env, test_docs, binary_doc, tmp_path):
+        path = str(tmp_path / 'import.ndjson')
+        checkpoint_path = str(tmp_path / 'import.ckpt')
+        with open(path, 'wb') as f:
+            for k, v in test_docs.items():
+                f.write(_export_line(k, json.dumps(v).encode('utf-8'), FMT_JSON))
+            f.write(b'not json\n')
+            f.write(_export_line(binary_doc[0], binary_doc[1], FMT_BYTES))
+
+        # a checkpoint part of the way through the file
+        with open(checkpoint_path, 'w') as f:
+            json.dump({'operation': 'import', 'path': os.path.abspath(path), 'lines': 20, 'documents': 20,
+                       'failed': 0, 'bytes': 0}, f)
+        self._purge_temp_docs(cb_env, list(test_docs.keys()) + [binary_doc[0]])
+        res = import_collection(cb_env.collection, path, batch_size=10, checkpoint_path=checkpoint_path)
+        assert res.documents == len(test_docs) + 1
+        assert res.failed == 1
+        assert not os.path.exists(checkpoint_path)
+
+        keys = list(test_docs.keys())
+        # the lines before the checkpoint are skipped
+        with pytest.raises(DocumentNotFoundException):
+            cb_env.collection.get(keys[0])
+        assert cb_env.collection.get(keys[20]).content_as[dict] == test_docs[keys[20]]
+        assert cb_env.collection.get(binary_doc[0], transcoder=RawBinaryTranscoder()).content_as[bytes] == binary_doc[1]
+
+    def test_import_checkpoint_out_of_order(self, tmp_path):
+        path = str(tmp_path / 'import.ndjson')
+        checkpoint_path = str(tmp_path / 'import.ckpt')
+
+        def batch(seq):
+            # 10 lines, 10 documents of 5 bytes each
+            return {f'doc-{seq}-{i}': (b'"abc"', FMT_JSON) for i in range(10)}, 10, 50, 0
+
+        state = {'operation': 'import', 'path': path, 'lines': 0, 'documents': 0, 'failed': 0, 'bytes': 0}
+        result = BulkProgress('import')
+        tracker = _ImportBatchTracker(state, result, checkpoint_path)
+        tracker.on_batch_done(1, batch(1), None)
+        # batch 0 is still in flight, nothing to checkpoint
+        assert not os.path.exists(checkpoint_path)
+        tracker.on_batch_done(0, batch(0), None)
+        tracker.on_batch_done(3, batch(3), None)
+        assert result.documents == 30
+        # the import stops w/ batch 2 in flight, batch 3 is imported again on resume
+        state = _load_checkpoint(checkpoint_path, 'import', path)
+        assert state['lines'] == 20
+        assert (state['documents'], state['failed'], state['bytes']) == (20, 0, 100)
+
+        # resume, the remaining batches are numbered from the checkpoint's line
+        result = BulkProgress('import', documents=state['documents'], failed=state['failed'], bytes=state['bytes'])
+        tracker = _ImportBatchTracker(state, result, checkpoint_path)
+        tracker.on_batch_done(1, batch(3), None)
+        tracker.on_batch_done(0, batch(2), None)
+        assert (result.documents, result.failed, result.bytes) == (40, 0, 200)
+        state = _load_checkpoint(checkpoint_path, 'import', path)
+        assert (state['lines'], state['documents'], state['failed'], state['bytes']) == (40, 40, 0, 200)
+
+    def test_ndjson_lines(self):
+        doc = {'a': 'b"\\', 'nested': {'list': [1, 2.5, None]}}
+        raw = json.dumps(doc, indent=2).encode('utf-8')
+        line = _export_line('key "with" \\ quotes', raw, FMT_JSON)
+        assert line.endswith(b'\n') and line.count(b'\n') == 1
+        assert json.loads(line) == {'id': 'key "with" \\ quotes', 'value': doc}
+        key, (value, flags) = _parse_line(line)
+        assert key == 'key "with" \\ quotes'
+        assert json.loads(value) == doc
+        assert flags == FMT_JSON
+
+        line = _export_line('bin', b'\xff\x00\n', FMT_BYTES)
+        assert _parse_line(line) == ('bin', (b'\xff\x00\n', FMT_BYTES))
+
+        # lines written by other tools are parsed
+        assert _parse_line(b'{"value": {"a": 1}, "id": "k"}\n') == ('k', (b'{"a": 1}', FMT_JSON))
+        with pytest.raises(ValueError):
+            _parse_line(b'{"value": {"a": 1}}\n')
+
+
+class ClassicBulkTests(BulkTestSuite):
+    @pytest.fixture(scope='class')
+    def test_manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicBulkTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+
+        method_list = [meth for meth in dir(ClassicBulkTests) if valid_test_method(meth)]
+        compare = set(ClassicBulkTests.TEST_MANIFEST).difference(method_list)
+        return compare
+
+    @pytest.fixture(scope='class', name='cb_env', params=[CollectionType.DEFAULT, CollectionType.NAMED])
+    def couchbase_test_environment(self, cb_base_env, test_manifest_validated, request, test_docs, binary_doc):
+        if test_manifest_validated:
+            pytest.fail(f'Test manifest not validated.  Missing tests: {test_manifest_validated}.')
+
+        cb_base_env.setup(collection_type=request.param, num_docs=0)
+        yield cb_base_env
+        self._purge_temp_docs(cb_base_env, list(test_docs.keys()) + [binary_doc[0]])
+        cb_base_env.teardown(request.param)
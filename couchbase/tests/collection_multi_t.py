@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import threading
 from datetime import timedelta
 
 import pytest
@@ -23,8 +24,10 @@ from couchbase.exceptions import (CouchbaseException,
                                   DocumentNotFoundException,
                                   DocumentUnretrievableException,
                                   InvalidArgumentException)
+from couchbase.logic.collection import MULTI_ITER_MAX_WORKERS
 from couchbase.options import (GetAnyReplicaMultiOptions,
                                GetMultiOptions,
+                               GetOptions,
                                InsertMultiOptions,
                                InsertOptions,
                                ReplaceMultiOptions,
@@ -57,8 +60,13 @@ class CollectionMultiTestSuite:
         'test_multi_get_any_replica_fail',
         'test_multi_get_any_replica_invalid_input',
         'test_multi_get_any_replica_simple',
+        'test_multi_get_columnar_accessors',
         'test_multi_get_fail',
         'test_multi_get_invalid_input',
+        'test_multi_get_iter',
+        'test_multi_get_iter_invalid_input',
+        'test_multi_get_iter_worker_cap',
+        'test_multi_get_key_opts',
         'test_multi_get_simple',
         'test_multi_insert_fail',
         'test_multi_insert_global_opts',
@@ -79,8 +87,10 @@ class CollectionMultiTestSuite:
         'test_multi_touch_invalid_input',
         'test_multi_touch_simple',
         'test_multi_unlock_invalid_input',
+        'test_multi_upsert_columnar_accessors',
         'test_multi_upsert_global_opts',
         'test_multi_upsert_invalid_input',
+        'test_multi_upsert_iter',
         'test_multi_upsert_key_opts',
         'test_multi_upsert_simple',
     ]
@@ -230,6 +240,28 @@ class CollectionMultiTestSuite:
             assert isinstance(v.is_replica, bool)
             assert v.content_as[dict] == keys_and_docs[k]
 
+    def test_multi_get_columnar_accessors(self, cb_env):
+        keys_and_docs = cb_env.get_docs(4)
+        fake_keys = list(cb_env.FAKE_DOCS.keys())
+        res = cb_env.collection.get_multi(list(keys_and_docs.keys()) + fake_keys)
+        assert isinstance(res, MultiGetResult)
+        assert sorted(res.keys()) == sorted(list(keys_and_docs.keys()) + fake_keys)
+        assert sorted(res.failed_keys()) == sorted(fake_keys)
+        cas = res.cas_array()
+        assert len(cas) == len(res.keys())
+        for k, v, c, f in zip(res.keys(), res.values(), cas, res.flags_array()):
+            if k in fake_keys:
+                assert v is None
+                assert c == 0
+                assert f == 0
+            else:
+                assert v == keys_and_docs[k]
+                assert c == res.results[k].cas
+                assert f == res.results[k].flags
+        # the per-key results are only built once
+        assert res.results[res.keys()[0]] is res.results[res.keys()[0]]
+        assert all(map(lambda e: isinstance(e, DocumentNotFoundException), res.exceptions.values())) is True
+
     def test_multi_get_fail(self, cb_env):
         keys_and_docs = cb_env.FAKE_DOCS
         keys = list(keys_and_docs.keys())
@@ -256,6 +288,62 @@ class CollectionMultiTestSuite:
         with pytest.raises(InvalidArgumentException):
             cb_env.collection.get_multi(keys_and_docs)
 
+    @pytest.mark.parametrize('chunk_size, max_in_flight', [(None, None), (3, 3), (2, 5)])
+    def test_multi_get_iter(self, cb_env, chunk_size, max_in_flight):
+        keys_and_docs = cb_env.get_docs(10)
+        fake_keys = list(cb_env.FAKE_DOCS.keys())
+        keys = (k for k in list(keys_and_docs.keys()) + fake_keys)
+        results = {}
+        for k, v in cb_env.collection.get_multi_iter(keys, chunk_size=chunk_size, max_in_flight=max_in_flight):
+            assert k not in results
+            results[k] = v
+        assert len(results) == len(keys_and_docs) + len(fake_keys)
+        for k, v in keys_and_docs.items():
+            assert isinstance(results[k], GetResult)
+            assert results[k].content_as[dict] == v
+        # exceptions are returned, regardless of the return_exceptions option
+        assert all(map(lambda k: isinstance(results[k], DocumentNotFoundException), fake_keys)) is True
+
+        res = list(cb_env.collection.get_multi_iter(fake_keys, GetMultiOptions(return_exceptions=False)))
+        assert len(res) == len(fake_keys)
+
+    @pytest.mark.parametrize('chunk_size, max_in_flight', [(0, None), (None, -1), (2.5, None), (True, None)])
+    def test_multi_get_iter_invalid_input(self, cb_env, chunk_size, max_in_flight):
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.get_multi_iter(['key1'], chunk_size=chunk_size, max_in_flight=max_in_flight)
+
+    def test_multi_get_iter_worker_cap(self, cb_env):
+        num_keys = MULTI_ITER_MAX_WORKERS * 4
+        keys = (f'not-a-key{i}' for i in range(num_keys))
+        # a window of 1000 single key chunks must not start a thread per chunk
+        results = {}
+        max_workers = 0
+        for k, v in cb_env.collection.get_multi_iter(keys, chunk_size=1, max_in_flight=1000):
+            workers = [t for t in threading.enumerate() if t.name.startswith('pycbc-multi-iter')]
+            max_workers = max(max_workers, len(workers))
+            results[k] = v
+        assert len(results) == num_keys
+        assert all(map(lambda r: isinstance(r, DocumentNotFoundException), results.values())) is True
+        assert 0 < max_workers <= MULTI_ITER_MAX_WORKERS
+
+    def test_multi_get_key_opts(self, cb_env):
+        keys_and_docs = cb_env.get_docs(4)
+        keys = list(keys_and_docs.keys())
+        opts = GetMultiOptions(timeout=timedelta(seconds=5),
+                               per_key_options={keys[0]: GetOptions(with_expiry=True)})
+        op_args, _, _ = cb_env.collection._get_multi_op_args(keys, opts, opts_type=GetMultiOptions)
+        # keys w/o per key options share their args
+        assert op_args[keys[1]] is op_args[keys[2]]
+        assert op_args[keys[0]] is not op_args[keys[1]]
+        assert op_args[keys[0]]['with_expiry'] is True
+        assert 'with_expiry' not in op_args[keys[1]]
+
+        res = cb_env.collection.get_multi(keys, opts)
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is True
+        for k, v in res.results.items():
+            assert v.content_as[dict] == keys_and_docs[k]
+
     def test_multi_get_simple(self, cb_env):
         keys_and_docs = cb_env.get_docs(4)
         keys = list(keys_and_docs.keys())
@@ -499,6 +587,16 @@ class CollectionMultiTestSuite:
         with pytest.raises(InvalidArgumentException):
             cb_env.collection.unlock_multi(list(keys_and_docs.keys()))
 
+    def test_multi_upsert_columnar_accessors(self, cb_env):
+        keys_and_docs = cb_env.get_docs(4)
+        res = cb_env.collection.upsert_multi(keys_and_docs)
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+        assert sorted(res.keys()) == sorted(keys_and_docs.keys())
+        assert res.failed_keys() == []
+        assert list(res.cas_array()) == [res.results[k].cas for k in res.keys()]
+        assert all(map(lambda c: c != 0, res.cas_array())) is True
+
     def test_multi_upsert_global_opts(self, cb_env):
         keys_and_docs = cb_env.get_docs(4)
         opts = UpsertMultiOptions(expiry=timedelta(seconds=2))
@@ -516,6 +614,18 @@ class CollectionMultiTestSuite:
         with pytest.raises(InvalidArgumentException):
             cb_env.collection.upsert_multi(keys)
 
+    def test_multi_upsert_iter(self, cb_env):
+        keys_and_docs = cb_env.get_new_docs(10)
+        results = dict(cb_env.collection.upsert_multi_iter(((k, v) for k, v in keys_and_docs.items()),
+                                                           chunk_size=3,
+                                                           max_in_flight=6))
+        assert set(results.keys()) == set(keys_and_docs.keys())
+        assert all(map(lambda r: isinstance(r, MutationResult), results.values())) is True
+
+        res = cb_env.collection.get_multi(list(keys_and_docs.keys()))
+        for k, v in res.results.items():
+            assert v.content_as[dict] == keys_and_docs[k]
+
     def test_multi_upsert_key_opts(self, cb_env):
         keys_and_docs = cb_env.get_docs(4)
         key1 = list(keys_and_docs.keys())[0]
@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 from datetime import datetime, timedelta
-from time import time
+from time import perf_counter, time
 
 import pytest
 
@@ -29,10 +29,12 @@ from couchbase.exceptions import (AmbiguousTimeoutException,
                                   DocumentUnretrievableException,
                                   InvalidArgumentException,
                                   TemporaryFailException)
+from couchbase.near_cache import NearCache
 from couchbase.options import (GetOptions,
                                InsertOptions,
                                ReplaceOptions,
-                               UpsertOptions)
+                               UpsertOptions,
+                               forward_args)
 from couchbase.result import (ExistsResult,
                               GetReplicaResult,
                               GetResult,
@@ -52,6 +54,7 @@ class CollectionTestSuite:
         'test_does_not_exists',
         'test_exists',
         'test_expiry_really_expires',
+        'test_forward_args_cost',
         'test_get',
         'test_get_after_lock',
         'test_get_all_replicas',
@@ -68,6 +71,10 @@ class CollectionTestSuite:
         'test_get_with_expiry',
         'test_insert',
         'test_insert_document_exists',
+        'test_near_cache',
+        'test_near_cache_eviction',
+        'test_near_cache_refresh',
+        'test_near_cache_write_race',
         'test_project',
         'test_project_bad_path',
         'test_project_project_not_list',
@@ -188,6 +195,23 @@ class CollectionTestSuite:
         with pytest.raises(DocumentNotFoundException):
             cb_env.collection.get(key)
 
+    def test_forward_args_cost(self):
+        opts = GetOptions(timeout=timedelta(seconds=2), with_expiry=True)
+        assert forward_args({}) == {}
+        assert forward_args({}, opts) == {'timeout': 2000000, 'with_expiry': True}
+        assert forward_args({'timeout': timedelta(seconds=1)}, opts) == {'timeout': 1000000, 'with_expiry': True}
+        # the options are not modified
+        assert opts['timeout'] == timedelta(seconds=2)
+
+        iterations = 10000
+        start = perf_counter()
+        for _ in range(iterations):
+            forward_args({}, opts)
+            forward_args({'timeout': timedelta(seconds=1)})
+        per_call = (perf_counter() - start) / (2 * iterations)
+        # generous bound to keep slow CI machines green
+        assert per_call < 20e-6
+
     def test_get(self, cb_env):
         key, value = cb_env.get_existing_doc()
         result = cb_env.collection.get(key)
@@ -366,6 +390,89 @@ class CollectionTestSuite:
         with pytest.raises(DocumentExistsException):
             cb_env.collection.insert(key, value)
 
+    def test_near_cache(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        near_cache = cb_env.collection.enable_near_cache(NearCache(max_staleness=timedelta(seconds=30)))
+        try:
+            assert cb_env.collection.near_cache is near_cache
+            result = cb_env.collection.get(key)
+            assert result.content_as[dict] == value
+            assert cb_env.collection.get(key) is result
+            # gets w/ options other than timeout bypass the cache
+            cb_env.collection.get(key, GetOptions(with_expiry=True))
+            assert near_cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1}
+
+            # writes through the collection invalidate the key
+            _, new_value = cb_env.get_new_doc()
+            cb_env.collection.upsert(key, new_value)
+            assert len(near_cache) == 0
+            assert cb_env.collection.get(key).content_as[dict] == new_value
+            assert near_cache.stats()['misses'] == 2
+        finally:
+            cb_env.collection.disable_near_cache()
+        assert cb_env.collection.near_cache is None
+        assert len(near_cache) == 0
+
+    def test_near_cache_eviction(self, cb_env):
+        keys = [cb_env.get_existing_doc(key_only=True) for _ in range(3)]
+        near_cache = cb_env.collection.enable_near_cache(NearCache(max_size=2, max_staleness=timedelta(seconds=30)))
+        try:
+            for key in keys:
+                cb_env.collection.get(key)
+            assert near_cache.stats() == {'hits': 0, 'misses': 3, 'evictions': 1, 'size': 2}
+            # the least recently used key was evicted
+            cb_env.collection.get(keys[0])
+            assert near_cache.stats()['misses'] == 4
+            cb_env.collection.get(keys[2])
+            assert near_cache.stats()['hits'] == 1
+        finally:
+            cb_env.collection.disable_near_cache()
+
+    def test_near_cache_refresh(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        _, new_value = cb_env.get_new_doc()
+        cb_env.collection.enable_near_cache(NearCache(max_staleness=timedelta(seconds=30)))
+        try:
+            result = cb_env.collection.get(key)
+            # unchanged documents are kept
+            cb_env.collection.refresh_near_cache()
+            assert cb_env.collection.get(key) is result
+
+            # a write made by another client is picked up by the refresh
+            other = cb_env.collection._scope.collection(cb_env.collection.name)
+            other.upsert(key, new_value)
+            assert cb_env.collection.get(key).content_as[dict] == value
+            cb_env.collection.refresh_near_cache()
+            refreshed = cb_env.collection.get(key)
+            assert refreshed is not result
+            assert refreshed.content_as[dict] == new_value
+        finally:
+            cb_env.collection.disable_near_cache()
+
+    def test_near_cache_write_race(self, cb_env):
+        key, _ = cb_env.get_existing_doc()
+        _, new_value = cb_env.get_new_doc()
+        near_cache = cb_env.collection.enable_near_cache(NearCache(max_staleness=timedelta(seconds=30)))
+        stale = cb_env.collection._scope.collection(cb_env.collection.name).get(key)
+        tokens = []
+        invalidate = near_cache.invalidate
+
+        def begin_load_after_invalidate(*keys):
+            invalidate(*keys)
+            if not tokens:
+                # a get that starts after the key is invalidated, but reads the document before the write lands
+                tokens.append(near_cache.begin_load(key))
+
+        near_cache.invalidate = begin_load_after_invalidate
+        try:
+            cb_env.collection.upsert(key, new_value)
+            near_cache.end_load(key, tokens[0], stale)
+            assert len(near_cache) == 0
+            assert cb_env.collection.get(key).content_as[dict] == new_value
+        finally:
+            del near_cache.invalidate
+            cb_env.collection.disable_near_cache()
+
     def test_project(self, cb_env):
         # @TODO(jc): Why does caves not like the dealership type???
         key, value = cb_env.get_existing_doc()
@@ -13,7 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
 import sys
+import uuid
+from time import perf_counter
 
 import pytest
 
@@ -23,6 +26,7 @@ from tests.environments import CollectionType
 
 class ExceptionTestSuite:
     TEST_MANIFEST = [
+        'test_error_mapper_classification_cost',
         'test_exceptions_create_only_message',
     ]
 
@@ -52,6 +56,36 @@ class ExceptionTestSuite:
 
         return couchbase_exceptions
 
+    def test_error_mapper_classification_cost(self):
+        def query_ctx(idx):
+            # every query error body has its own requestID, clientContextID and metrics
+            http_body = json.dumps({
+                'requestID': str(uuid.uuid4()),
+                'clientContextID': str(uuid.uuid4()),
+                'errors': [{'code': 12003, 'msg': 'Keyspace not found in CB datastore: default:fake-bucket'}],
+                'status': 'fatal',
+                'metrics': {'elapsedTime': f'{idx}.1ms', 'executionTime': f'{idx}.0ms', 'resultCount': 0},
+            }, indent=4)
+            return E.QueryErrorContext(context_type='QueryErrorContext', http_body=http_body)
+
+        iterations = 10000
+        query_ctxs = [query_ctx(idx) for idx in range(iterations)]
+        kv_ctx = E.KeyValueErrorContext(context_type='KeyValueErrorContext', retry_reasons={'key_value_locked'})
+        assert E.ErrorMapper._parse_kv_context(kv_ctx, E.KV_ERROR_CONTEXT_MAPPING) is E.DocumentLockedException
+
+        E.ErrorMapper._classify_http_error.cache_clear()
+        start = perf_counter()
+        for ctx in query_ctxs:
+            assert E.ErrorMapper._parse_http_context(ctx, E.QUERY_ERROR_MAPPING) is E.KeyspaceNotFoundException
+            E.ErrorMapper._parse_kv_context(kv_ctx, E.KV_ERROR_CONTEXT_MAPPING)
+        per_exception = (perf_counter() - start) / (2 * iterations)
+        # the bodies only differ in per-request fields, so they share a single cache entry
+        cache_info = E.ErrorMapper._classify_http_error.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.currsize == 1
+        # generous bound to keep slow CI machines green
+        assert per_exception < 100e-6
+
     def test_exceptions_create_only_message(self, cb_exceptions):
         for ex in cb_exceptions:
             new_ex = ex('This is a test message.')
@@ -0,0 +1,117 @@
+#  Copyright 2016-2023. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.environments import CollectionType
+
+# modules that should only be imported on first use
+LAZY_MODULES = [
+    'acouchbase',
+    'couchbase.analytics',
+    'couchbase.management.analytics',
+    'couchbase.management.buckets',
+    'couchbase.management.collections',
+    'couchbase.management.eventing',
+    'couchbase.management.queries',
+    'couchbase.management.search',
+    'couchbase.management.users',
+    'couchbase.management.views',
+    'couchbase.search',
+    'couchbase.transactions',
+    'couchbase.views',
+]
+
+
+class ImportTimeTestSuite:
+    TEST_MANIFEST = [
+        'test_cluster_import_is_lazy',
+        'test_couchbase_import_is_lazy',
+        'test_lazy_names_importable',
+    ]
+
+    @staticmethod
+    def _loaded_modules(module):
+        # import in a fresh interpreter, the test session has already imported everything
+        code = f'import json, sys; import {module}; print(json.dumps(list(sys.modules)))'
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(p for p in sys.path if p)
+        res = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        return json.loads(res.stdout)
+
+    def test_cluster_import_is_lazy(self):
+        loaded = self._loaded_modules('couchbase.cluster')
+        assert 'couchbase.cluster' in loaded
+        assert [m for m in loaded if m in LAZY_MODULES] == []
+
+    def test_couchbase_import_is_lazy(self):
+        loaded = self._loaded_modules('couchbase')
+        assert 'couchbase' in loaded
+        assert [m for m in loaded if m in LAZY_MODULES] == []
+
+    def test_lazy_names_importable(self):
+        from couchbase.bucket import (CollectionManager,
+                                      ViewIndexManager,
+                                      ViewScanConsistency)
+        from couchbase.cluster import (AnalyticsIndexManager,
+                                       BucketManager,
+                                       QueryIndexManager,
+                                       SearchRequest,
+                                       Transactions)
+        from couchbase.management.analytics import AnalyticsIndexManager as AnalyticsIndexManager_
+        from couchbase.management.buckets import BucketManager as BucketManager_
+        from couchbase.management.collections import CollectionManager as CollectionManager_
+        from couchbase.management.queries import QueryIndexManager as QueryIndexManager_
+        from couchbase.management.views import ViewIndexManager as ViewIndexManager_
+        from couchbase.search import SearchRequest as SearchRequest_
+        from couchbase.transactions import Transactions as Transactions_
+        from couchbase.views import ViewScanConsistency as ViewScanConsistency_
+
+        assert AnalyticsIndexManager is AnalyticsIndexManager_
+        assert BucketManager is BucketManager_
+        assert CollectionManager is CollectionManager_
+        assert QueryIndexManager is QueryIndexManager_
+        assert SearchRequest is SearchRequest_
+        assert Transactions is Transactions_
+        assert ViewIndexManager is ViewIndexManager_
+        assert ViewScanConsistency is ViewScanConsistency_
+
+        import couchbase.cluster
+        with pytest.raises(AttributeError):
+            couchbase.cluster.NotAName
+
+
+class ClassicImportTimeTests(ImportTimeTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicImportTimeTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicImportTimeTests) if valid_test_method(meth)]
+        test_list = set(ImportTimeTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest not validated.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='cb_env', params=[CollectionType.DEFAULT])
+    def couchbase_test_environment(self, cb_base_env, request):
+        cb_base_env.setup(request.param)
+        yield cb_base_env
+        cb_base_env.teardown(request.param)
@@ -13,11 +13,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import multiprocessing
 from datetime import timedelta
 from uuid import uuid4
 
 import pytest
 
+import couchbase.kv_range_scan as kv_range_scan
 from couchbase.exceptions import (AlreadyQueriedException,
                                   DocumentNotFoundException,
                                   FeatureUnavailableException,
@@ -25,14 +27,57 @@ from couchbase.exceptions import (AlreadyQueriedException,
 from couchbase.kv_range_scan import (PrefixScan,
                                      RangeScan,
                                      SamplingScan,
-                                     ScanTerm)
+                                     ScanTerm,
+                                     parallel_scan)
 from couchbase.mutation_state import MutationState
 from couchbase.options import ScanOptions
 from couchbase.result import ScanResult, ScanResultIterable
+from couchbase.serializer import SchemaSerializer
+from couchbase.transcoder import JSONTranscoder
 from tests.environments import CollectionType
 from tests.test_features import EnvironmentFeatures
 
 
+class ScanRow:
+    __slots__ = ('id',)
+
+
+# stand-ins for the parallel_scan worker functions, these need to be module level functions as they are pickled
+# (by reference) to the spawned worker processes
+def _init_fake_scan_worker(connstr, cluster_options, rows):
+    # no cluster connection, only the rows queue passed in through initargs
+    kv_range_scan._worker_rows = rows
+
+
+def _fake_scan_partition(task):
+    partition, num_rows, chunk_size = task
+    chunk = []
+    for i in range(num_rows):
+        chunk.append(f'{partition}-{i}')
+        if len(chunk) >= chunk_size:
+            kv_range_scan._worker_rows.put(chunk)
+            chunk = []
+    if partition == 'fail':
+        raise RuntimeError('Failed to scan partition.')
+    if chunk:
+        kv_range_scan._worker_rows.put(chunk)
+    kv_range_scan._worker_rows.put(None)
+
+
+class PoolTrackingContext:
+    def __init__(self, ctx):
+        self._ctx = ctx
+        self.pools = []
+
+    def Queue(self, *args, **kwargs):
+        return self._ctx.Queue(*args, **kwargs)
+
+    def Pool(self, *args, **kwargs):
+        pool = self._ctx.Pool(*args, **kwargs)
+        self.pools.append(pool)
+        return pool
+
+
 class RangeScanTestSuite:
     TEST_MANIFEST = [
         'test_range_scan',
@@ -56,6 +101,14 @@ class RangeScanTestSuite:
         'test_sampling_scan_with_zero_limit',
         'test_sampling_scan_with_negative_limit',
         'test_range_scan_feature_unavailable',
+        'test_range_scan_partition',
+        'test_range_scan_partition_invalid_input',
+        'test_range_scan_partitioned',
+        'test_prefix_scan_partitioned',
+        'test_parallel_scan_invalid_input',
+        'test_parallel_scan_worker_failure',
+        'test_parallel_scan_workers',
+        'test_prefix_scan_row_schema',
     ]
 
     @pytest.fixture(scope='class')
@@ -216,6 +269,100 @@ class RangeScanTestSuite:
         for r in rows:
             assert r.id in test_ids
 
+    def test_range_scan_partition(self):
+        partitions = RangeScan().partition(4)
+        assert len(partitions) == 4
+        assert partitions[0].start is None
+        assert partitions[-1].end is None
+        for lower, upper in zip(partitions, partitions[1:]):
+            # each boundary ends a partition (exclusive) and starts the next (inclusive)
+            assert lower.end.term == upper.start.term
+            assert lower.end.exclusive is True
+            assert upper.start.exclusive is False
+
+        start, end = ScanTerm('doc-1', True), ScanTerm('doc-9')
+        partitions = RangeScan(start, end).partition(split_points=['doc-5', 'doc-3', 'doc-3', 'zzz'])
+        assert partitions[0].start is start
+        assert partitions[-1].end is end
+        # split points outside of the range are ignored
+        assert [p.end.term for p in partitions[:-1]] == ['doc-3', 'doc-5']
+
+        partitions = PrefixScan('doc-').partition(3)
+        assert len(partitions) == 3
+        assert partitions[0].start.term == 'doc-'
+        assert partitions[-1].end.term == b'doc-\xff'
+        assert [p.end.term for p in partitions[:-1]] == [p.start.term for p in partitions[1:]]
+
+    @pytest.mark.parametrize('kwargs', [{}, {'num_partitions': 0}, {'num_partitions': 2, 'split_points': ['a']},
+                                        {'split_points': [1]}])
+    def test_range_scan_partition_invalid_input(self, kwargs):
+        with pytest.raises(InvalidArgumentException):
+            RangeScan().partition(**kwargs)
+
+    @pytest.mark.parametrize('kwargs', [{'num_processes': 0}, {'chunk_size': 0}, {'chunk_size': True}])
+    def test_parallel_scan_invalid_input(self, kwargs):
+        with pytest.raises(InvalidArgumentException):
+            parallel_scan('couchbase://localhost', None, 'bucket', 'scope', 'collection', RangeScan(), **kwargs)
+
+    def test_parallel_scan_worker_failure(self, monkeypatch):
+        monkeypatch.setattr(kv_range_scan, '_init_scan_worker', _init_fake_scan_worker)
+        monkeypatch.setattr(kv_range_scan, '_scan_partition', _fake_scan_partition)
+        ctx = PoolTrackingContext(multiprocessing.get_context('spawn'))
+        tasks = [('p0', 20, 5), ('fail', 3, 5), ('p2', 20, 5)]
+        rows = []
+        # the failed partition never sends its end marker, its exception must be raised instead
+        with pytest.raises(RuntimeError):
+            for row in kv_range_scan._run_parallel_scan(ctx, 2, ('couchbase://localhost', None), tasks):
+                rows.append(row)
+        assert len(ctx.pools) == 1
+        # the pool was torn down
+        with pytest.raises(ValueError):
+            ctx.pools[0].apply_async(abs, (1,))
+
+    def test_parallel_scan_workers(self, monkeypatch):
+        monkeypatch.setattr(kv_range_scan, '_init_scan_worker', _init_fake_scan_worker)
+        monkeypatch.setattr(kv_range_scan, '_scan_partition', _fake_scan_partition)
+        ctx = PoolTrackingContext(multiprocessing.get_context('spawn'))
+        # more chunks than the rows queue holds, so the workers block until the rows are consumed
+        tasks = [(f'p{i}', 50, 7) for i in range(4)]
+        rows = list(kv_range_scan._run_parallel_scan(ctx, 2, ('couchbase://localhost', None), tasks))
+        assert sorted(rows) == sorted(f'p{p}-{i}' for p in range(4) for i in range(50))
+        # the rows of each partition are streamed in order
+        for p in range(4):
+            assert [r for r in rows if r.startswith(f'p{p}-')] == [f'p{p}-{i}' for i in range(50)]
+        with pytest.raises(ValueError):
+            ctx.pools[0].apply_async(abs, (1,))
+
+    @pytest.mark.usefixtures('check_range_scan_supported')
+    def test_range_scan_partitioned(self, cb_env, test_id, test_ids, test_mutation_state):
+        scan_type = RangeScan(ScanTerm(f'{test_id}-1'), ScanTerm(f'{test_id}-2'))
+        expected = set(r.id for r in cb_env.collection.scan(scan_type,
+                                                            ids_only=True,
+                                                            consistent_with=test_mutation_state))
+        seen = set()
+        for partition in scan_type.partition(split_points=[f'{test_id}-13', f'{test_id}-16']):
+            res = cb_env.collection.scan(partition, ScanOptions(timeout=timedelta(seconds=10),
+                                                                ids_only=True,
+                                                                consistent_with=test_mutation_state))
+            rows = self._validate_result(res, ids_only=True, return_rows=True)
+            ids = set(r.id for r in rows)
+            assert seen.isdisjoint(ids)
+            seen.update(ids)
+        assert seen == expected
+
+    @pytest.mark.usefixtures('check_range_scan_supported')
+    @pytest.mark.parametrize('num_partitions', [1, 3, 8])
+    def test_prefix_scan_partitioned(self, cb_env, test_id, test_ids, test_mutation_state, num_partitions):
+        seen = set()
+        for partition in PrefixScan(f'{test_id}').partition(num_partitions):
+            res = cb_env.collection.scan(partition, ScanOptions(timeout=timedelta(seconds=10),
+                                                                consistent_with=test_mutation_state))
+            rows = self._validate_result(res, return_rows=True)
+            ids = set(r.id for r in rows)
+            assert seen.isdisjoint(ids)
+            seen.update(ids)
+        assert seen == set(test_ids)
+
     @pytest.mark.usefixtures('check_range_scan_supported')
     @pytest.mark.parametrize('batch_byte_limit', [0, 1, 25, 100])
     def test_range_scan_with_batch_byte_limit(self, cb_env, test_id, test_mutation_state, batch_byte_limit):
@@ -340,6 +487,19 @@ class RangeScanTestSuite:
         with pytest.raises(FeatureUnavailableException):
             self._validate_result(res)
 
+    @pytest.mark.usefixtures('check_range_scan_supported')
+    def test_prefix_scan_row_schema(self, cb_env, test_id, test_ids, test_mutation_state):
+        tc = JSONTranscoder(SchemaSerializer(ScanRow))
+        res = cb_env.collection.scan(PrefixScan(test_id), ScanOptions(timeout=timedelta(seconds=10),
+                                                                      transcoder=tc,
+                                                                      consistent_with=test_mutation_state))
+        rows = list(res.rows())
+        assert len(rows) == len(test_ids)
+        for r in rows:
+            content = r.content_as[ScanRow]
+            assert isinstance(content, ScanRow)
+            assert content.id == r.id
+
 
 class ClassicRangeScanTests(RangeScanTestSuite):
     @pytest.fixture(scope='class')
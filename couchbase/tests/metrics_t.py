@@ -15,7 +15,10 @@
 
 import pytest
 
-from couchbase.exceptions import CouchbaseException
+from couchbase.exceptions import CouchbaseException, InvalidArgumentException
+from couchbase.metrics import (LatencyHistogramMeter,
+                               LatencyHistogramValueRecorder,
+                               LatencySnapshot)
 from tests.environments.tracing_and_metrics_environment import TracingAndMetricsTestEnvironment
 
 
@@ -110,3 +113,111 @@ class ClassicMetricsTests(MetricsTestSuite):
         yield cb_env
         cb_env.teardown()
         cb_env.cluster.close()
+
+
+class LatencyHistogramMeterTestSuite:
+
+    TEST_MANIFEST = [
+        'test_histogram_invalid_args',
+        'test_histogram_meter_kv',
+        'test_histogram_meter_recorders',
+        'test_histogram_percentiles',
+    ]
+
+    def test_histogram_invalid_args(self):
+        with pytest.raises(InvalidArgumentException):
+            LatencyHistogramValueRecorder(significant_bits=1)
+        with pytest.raises(InvalidArgumentException):
+            LatencyHistogramMeter(highest_trackable_value=10)
+
+    @pytest.mark.parametrize('op', ['get', 'upsert', 'replace'])
+    def test_histogram_meter_kv(self, cb_env, op):
+        cb_env.meter.reset()
+        operation = getattr(cb_env.collection, op)
+        for _ in range(10):
+            if op == 'get':
+                operation(cb_env.get_existing_doc(key_only=True))
+            else:
+                operation(*cb_env.get_existing_doc())
+
+        stats = cb_env.meter.snapshot()['kv'][op]
+        assert isinstance(stats, LatencySnapshot)
+        assert stats.count == 10
+        assert 0 < stats.p50 <= stats.p99 <= stats.p999 <= stats.max
+        assert stats.throughput > 0
+
+    def test_histogram_meter_recorders(self):
+        meter = LatencyHistogramMeter()
+        tags = {'db.couchbase.service': 'kv', 'db.operation': 'get'}
+        recorder = meter.value_recorder('db.couchbase.operations', tags)
+        assert isinstance(recorder, LatencyHistogramValueRecorder)
+        assert meter.value_recorder('db.couchbase.operations', dict(tags)) is recorder
+        # other metrics and incomplete tags are not recorded
+        assert not isinstance(meter.value_recorder('db.couchbase.other', tags), LatencyHistogramValueRecorder)
+        assert not isinstance(meter.value_recorder('db.couchbase.operations', {'db.operation': 'get'}),
+                              LatencyHistogramValueRecorder)
+
+        for value in range(1, 101):
+            recorder.record_value(value)
+        meter.value_recorder('db.couchbase.operations',
+                             {'db.couchbase.service': 'query', 'db.operation': 'query'}).record_value(5000)
+        stats = meter.snapshot()
+        assert list(stats.keys()) == ['kv', 'query']
+        assert stats['kv']['get'].count == 100
+        assert stats['kv']['get'].max == 100
+        assert stats['query']['query'].p50 == 5000
+
+        # recorders handed out before the reset keep recording into the meter
+        meter.reset()
+        assert meter.snapshot()['kv']['get'].count == 0
+        recorder.record_value(42)
+        stats = meter.snapshot()['kv']['get']
+        assert (stats.count, stats.p50, stats.p99, stats.p999, stats.max) == (1, 42, 42, 42, 42)
+
+    def test_histogram_percentiles(self):
+        recorder = LatencyHistogramValueRecorder(significant_bits=7)
+        assert recorder.percentiles((50, 99)) == (0, [0, 0])
+        values = list(range(1, 100001))
+        for value in reversed(values):
+            recorder.record_value(value)
+        total, results = recorder.percentiles((99.9, 50, 99, 100))
+        assert total == len(values)
+        for result, expected in zip(results, [99900, 50000, 99000, 100000]):
+            # 7 significant bits keep the relative error below 2**-6
+            assert expected <= result <= expected * (1 + 2**-6)
+        assert results[3] == 100000
+
+        # values below 2**significant_bits are exact
+        recorder.reset()
+        for value in range(128):
+            recorder.record_value(value)
+        assert recorder.percentiles((50, 100))[1] == [63, 127]
+
+        # values above highest_trackable_value are reported as the exact max
+        recorder = LatencyHistogramValueRecorder(highest_trackable_value=1000)
+        recorder.record_value(10**9)
+        assert recorder.snapshot().p50 == recorder.snapshot().max == 10**9
+
+
+class ClassicLatencyHistogramMeterTests(LatencyHistogramMeterTestSuite):
+    @pytest.fixture(scope='class')
+    def test_manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicLatencyHistogramMeterTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicLatencyHistogramMeterTests) if valid_test_method(meth)]
+        compare = set(LatencyHistogramMeterTestSuite.TEST_MANIFEST).difference(method_list)
+        return compare
+
+    @pytest.fixture(scope='class', name='cb_env')
+    def couchbase_test_environment(self, cb_base_env, test_manifest_validated):
+        if test_manifest_validated:
+            pytest.fail(f'Test manifest not validated.  Missing tests: {test_manifest_validated}.')
+
+        # a new environment and cluster is created
+        cb_env = TracingAndMetricsTestEnvironment.from_environment(cb_base_env,
+                                                                   meter=LatencyHistogramMeter())
+        cb_env.setup(num_docs=10)
+        yield cb_env
+        cb_env.teardown()
+        cb_env.cluster.close()
@@ -16,6 +16,8 @@
 import pytest
 
 import couchbase.subdocument as SD
+from couchbase.mutation_state import MutationState
+from couchbase.result import MutationToken
 from tests.environments import CollectionType
 from tests.environments.test_environment import TestEnvironment
 
@@ -63,6 +65,9 @@ class MutationTokensDisabledTestSuite:
 class MutationTokensEnabledTestSuite:
 
     TEST_MANIFEST = [
+        'test_mutation_state_max_seqno',
+        'test_mutation_state_merge',
+        'test_mutation_state_multi_results',
         'test_mutation_tokens_enabled_insert',
         'test_mutation_tokens_enabled_mutate_in',
         'test_mutation_tokens_enabled_remove',
@@ -99,6 +104,56 @@ class MutationTokensEnabledTestSuite:
         result = TestEnvironment.try_n_times(5, 3, cb_env.collection.upsert, key, value)
         cb_env.verify_mutation_tokens(cb_env.bucket.name, result)
 
+    def test_mutation_state_max_seqno(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        results = [cb_env.collection.upsert(key, value) for _ in range(5)]
+        state = MutationState(*results)
+        tokens = state.tokens()
+        # every mutation is on the same partition, only the latest is kept
+        assert len(tokens) == 1
+        assert tokens[0] == results[-1].mutation_token()
+        state.add_mutation_token(results[0].mutation_token())
+        assert state.tokens() == tokens
+
+    def test_mutation_state_merge(self, cb_env):
+        def token(partition_id, partition_uuid, sequence_number, bucket_name=cb_env.bucket.name):
+            return MutationToken({'partition_id': partition_id,
+                                  'partition_uuid': partition_uuid,
+                                  'sequence_number': sequence_number,
+                                  'bucket_name': bucket_name})
+
+        state = MutationState()
+        state.add_mutation_token(token(10, 1, 5))
+        state.add_mutation_token(token(1023, 2, 7))
+        other = MutationState()
+        other.add_mutation_token(token(10, 3, 9))
+        other.add_mutation_token(token(1023, 2, 6))
+        other.add_mutation_token(token(10, 1, 1, bucket_name='other'))
+        state.add_state(other)
+        assert sorted(state.tokens(), key=lambda t: t.as_tuple()) == [token(10, 1, 1, bucket_name='other'),
+                                                                      token(10, 3, 9),
+                                                                      token(1023, 2, 7)]
+        # merging does not modify the other state
+        assert len(other.tokens()) == 3
+
+    def test_mutation_state_multi_results(self, cb_env):
+        keys_and_docs = {f'{cb_env.get_new_doc(key_only=True)}-{i}': {'id': i} for i in range(20)}
+        res = cb_env.collection.upsert_multi(keys_and_docs)
+        assert res.all_ok is True
+        state = MutationState(res)
+        expected = {}
+        for r in res.results.values():
+            token = r.mutation_token()
+            current = expected.get(token.partition_id)
+            if current is None or token.sequence_number > current.sequence_number:
+                expected[token.partition_id] = token
+        assert sorted(state.tokens(), key=lambda t: t.partition_id) == [expected[k] for k in sorted(expected)]
+
+        other = MutationState()
+        assert other.add_multi_results(res) is True
+        assert sorted(other.tokens(), key=lambda t: t.partition_id) == [expected[k] for k in sorted(expected)]
+        cb_env.collection.remove_multi(list(keys_and_docs.keys()))
+
 
 class ClassicMutationTokensDisabledTests(MutationTokensDisabledTestSuite):
 
@@ -47,6 +47,7 @@ class QueryParamTestSuite:
         'test_params_scan_consistency',
         'test_params_scan_wait',
         'test_params_serializer',
+        'test_params_stream_rows',
         'test_params_timeout',
         'test_params_use_replica',
     ]
@@ -313,6 +314,28 @@ class QueryParamTestSuite:
         exp_opts['serializer'] = serializer
         assert query.params == exp_opts
 
+    def test_params_stream_rows(self, base_opts):
+        q_str = 'SELECT * FROM default'
+        q_opts = QueryOptions(stream_rows=True, stream_high_water_mark=500)
+        query = N1QLQuery.create_query_object(q_str, q_opts)
+
+        exp_opts = base_opts.copy()
+        exp_opts['stream_rows'] = True
+        exp_opts['stream_high_water_mark'] = 500
+        assert query.params == exp_opts
+        assert query.stream_rows is True
+        assert query.stream_high_water_mark == 500
+
+        # if not set, the prop will return False, but stream_rows should
+        # not be in the params
+        query = N1QLQuery.create_query_object(q_str)
+        assert query.params.get('stream_rows', None) is None
+        assert query.stream_rows is False
+        assert query.stream_high_water_mark is None
+
+        with pytest.raises(InvalidArgumentException):
+            N1QLQuery.create_query_object(q_str, QueryOptions(stream_rows=True, stream_high_water_mark=0))
+
     def test_params_timeout(self, base_opts):
         q_str = 'SELECT * FROM default'
         q_opts = QueryOptions(timeout=timedelta(seconds=20))
@@ -14,6 +14,8 @@
 #  limitations under the License.
 
 import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 import pytest
@@ -34,6 +36,7 @@ from couchbase.n1ql import (QueryMetaData,
 from couchbase.options import (QueryOptions,
                                UnsignedInt64,
                                UpsertOptions)
+from couchbase.serializer import SchemaSerializer
 from tests.environments import CollectionType
 from tests.environments.query_environment import QueryTestEnvironment
 from tests.environments.test_environment import TestEnvironment
@@ -200,7 +203,9 @@ class QueryTestSuite:
         'test_query_in_thread',
         'test_query_metadata',
         'test_query_raw_options',
+        'test_query_row_schema',
         'test_query_ryow',
+        'test_query_stream_rows_slow_consumer',
         'test_query_timeout',
         'test_query_with_metrics',
         'test_query_with_profile',
@@ -333,6 +338,35 @@ class QueryTestSuite:
                                       QueryOptions(raw={'args': [f'{batch_id}%']}))
         cb_env.assert_rows(result, 1)
 
+    def test_query_row_schema(self, cb_env):
+        @dataclass
+        class BatchRow:
+            batch: str
+            missing: str = 'default'
+
+        batch_id = cb_env.get_batch_id()
+        q_str = f"SELECT b.* FROM `{cb_env.bucket.name}` b WHERE batch LIKE '{batch_id}%' LIMIT 2"
+        result = cb_env.cluster.query(q_str, QueryOptions(serializer=SchemaSerializer(BatchRow)))
+        rows = list(result.rows())
+        assert len(rows) == 2
+        for row in rows:
+            assert isinstance(row, BatchRow)
+            assert row.batch.startswith(batch_id)
+            assert row.missing == 'default'
+
+    def test_query_stream_rows_slow_consumer(self, cb_env):
+        num_rows = 5000
+        q_str = f'SELECT RAW i FROM ARRAY_RANGE(0, {num_rows}) AS i'
+        result = cb_env.cluster.query(q_str, QueryOptions(stream_rows=True, stream_high_water_mark=10))
+        rows = []
+        for row in result.rows():
+            # fall behind the query service so the row stream is repeatedly paced by the high-water mark
+            if len(rows) % 500 == 0:
+                time.sleep(0.1)
+            rows.append(row)
+        assert rows == list(range(num_rows))
+        assert result.metadata() is not None
+
     # creating a new connection, allow retries
     @pytest.mark.flaky(reruns=5, reruns_delay=1)
     def test_query_timeout(self, cb_env):
@@ -13,19 +13,29 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import base64
+import json
+import struct
 import warnings
+from array import array
+from dataclasses import dataclass
 from datetime import timedelta
 
 import pytest
 
 import couchbase.search as search
 from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.search import _get_search_many_args, _SearchResultMerger
 from couchbase.mutation_state import MutationState
-from couchbase.options import SearchOptions, VectorSearchOptions
+from couchbase.options import (SearchManyOptions,
+                               SearchOptions,
+                               VectorSearchOptions)
 from couchbase.result import MutationToken
 from couchbase.search import (HighlightStyle,
                               MatchOperator,
-                              SearchRequest)
+                              SearchMergeStrategy,
+                              SearchRequest,
+                              SearchRow)
 from couchbase.vector_search import (VectorQuery,
                                      VectorQueryCombination,
                                      VectorSearch)
@@ -56,6 +66,7 @@ class SearchParamTestSuite:
         'test_params_fields',
         'test_params_highlight_style',
         'test_params_highlight_style_fields',
+        'test_params_ids_and_scores_only',
         'test_params_include_locations',
         'test_params_limit',
         'test_params_logging',
@@ -70,6 +81,10 @@ class SearchParamTestSuite:
         'test_prefix_query',
         'test_raw_query',
         'test_regexp_query',
+        'test_search_many_args',
+        'test_search_many_merge_rrf',
+        'test_search_many_merge_sort',
+        'test_search_row_factory_subclass',
         'test_string_query',
         'test_term_search',
         'test_termrange_query',
@@ -553,6 +568,21 @@ class SearchParamTestSuite:
         assert search_query.params == exp_opts
         assert search_query.highlight_style == HighlightStyle.Ansi
 
+    def test_params_ids_and_scores_only(self, cb_env, base_query_opts):
+        q, base_opts = base_query_opts
+        opts = SearchOptions(ids_and_scores_only=True,
+                             fields=['a'],
+                             explain=True,
+                             include_locations=True,
+                             highlight_style=HighlightStyle.Html)
+        search_query = search.SearchQueryBuilder.create_search_query_object(
+            cb_env.TEST_INDEX_NAME, q, opts
+        )
+        assert search_query.params['ids_and_scores_only'] is True
+        encoded_q = cb_env.get_encoded_query(search_query)
+        for k in ['fields', 'explain', 'include_locations', 'highlight_style', 'highlight_fields']:
+            assert k not in encoded_q
+
     def test_params_include_locations(self, cb_env, base_query_opts):
         q, base_opts = base_query_opts
         opts = SearchOptions(include_locations=True)
@@ -766,6 +796,98 @@ class SearchParamTestSuite:
         encoded_q = cb_env.get_encoded_query(search_query)
         assert exp_json == encoded_q
 
+    def test_search_many_args(self):
+        req = search.SearchRequest.create(search.MatchAllQuery())
+        searches, merge_args = _get_search_many_args([('idx-a', req), ('idx-b', req, SearchOptions(limit=3))],
+                                                     SearchManyOptions(limit=5),
+                                                     merge_strategy=SearchMergeStrategy.RECIPROCAL_RANK_FUSION)
+        assert merge_args == {'limit': 5, 'strategy': SearchMergeStrategy.RECIPROCAL_RANK_FUSION, 'rrf_k': 60}
+        # the limit is applied to each search that does not set its own limit
+        assert searches[0] == ('idx-a', req, [], {'limit': 5})
+        assert searches[1] == ('idx-b', req, [SearchOptions(limit=3)], {})
+
+        with pytest.raises(InvalidArgumentException):
+            _get_search_many_args([])
+        with pytest.raises(InvalidArgumentException):
+            _get_search_many_args([('idx-a',)])
+        with pytest.raises(InvalidArgumentException):
+            _get_search_many_args([('idx-a', req)], limit=0)
+        with pytest.raises(InvalidArgumentException):
+            _get_search_many_args([('idx-a', req)], merge_strategy=1)
+
+    def test_search_many_merge_rrf(self):
+        merger = _SearchResultMerger([None, None], 2, SearchMergeStrategy.RECIPROCAL_RANK_FUSION, 0)
+        rows_added = 0
+        for i in range(10):
+            for idx in range(2):
+                merger.add_row(idx, SearchRow(index='idx', id=f'doc-{i}', score=1.0))
+                rows_added += 1
+            if merger.done:
+                break
+        # the top 2 documents can no longer be overtaken once each search has returned 2 rows
+        assert merger.done is True
+        assert rows_added == 4
+        rows = merger.rows()
+        assert [r.id for r in rows] == ['doc-0', 'doc-1']
+        assert [r.score for r in rows] == [2.0, 1.0]
+
+    def test_search_many_merge_sort(self):
+        def row(doc_id, score):
+            return SearchRow(index='idx', id=doc_id, score=score)
+
+        merger = _SearchResultMerger([None, None], 3, SearchMergeStrategy.SORT, 60)
+        for idx, r in [(0, row('a', 5)), (1, row('b', 4)), (0, row('c', 3))]:
+            merger.add_row(idx, r)
+        # c cannot be merged until the second search returns a row with a lower score or finishes
+        assert merger.done is False
+        merger.add_row(1, row('d', 3.5))
+        assert merger.done is True
+        assert [r.id for r in merger.rows()] == ['a', 'b', 'd']
+
+        merger = _SearchResultMerger([None, None], 3, SearchMergeStrategy.SORT, 60)
+        merger.add_row(0, row('a', 5))
+        merger.finish(1)
+        merger.finish(0)
+        assert merger.done is True
+        assert [r.id for r in merger.rows()] == ['a']
+
+    def test_search_row_factory_subclass(self):
+        class InitRow(SearchRow):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.tag = 'initialized'
+
+        @dataclass
+        class DataclassRow(SearchRow):
+            tag: str = 'initialized'
+
+        def raw_row():
+            return {'index': 'idx', 'id': 'doc-1', 'score': 1.5, 'sort': [], 'fragments': {},
+                    'fields': json.dumps({'make': 'auto'}), 'locations': None, 'explanation': ''}
+
+        for row_factory in [InitRow, DataclassRow]:
+            request = search.FullTextSearchRequest(None, {}, row_factory=row_factory)
+            row = request._deserialize_row(raw_row())
+            assert type(row) is row_factory
+            # the row is built through the subclass's own __init__
+            assert row.tag == 'initialized'
+            assert (row.index, row.id, row.score) == ('idx', 'doc-1', 1.5)
+            assert row.fields == {'make': 'auto'}
+            assert row.explanation == {}
+            assert row.locations is None
+
+        request = search.FullTextSearchRequest(None, {})
+        row = request._deserialize_row(raw_row())
+        assert type(row) is SearchRow
+        assert row == SearchRow(index='idx', id='doc-1', score=1.5, fields={'make': 'auto'})
+
+        id_sort = [json.dumps(search.SortID(desc=True).as_encodable())]
+        with pytest.raises(InvalidArgumentException):
+            _SearchResultMerger([None, id_sort], 3, SearchMergeStrategy.SORT, 60)
+        field_sort = [json.dumps(search.SortField('name').as_encodable())]
+        with pytest.raises(InvalidArgumentException):
+            _SearchResultMerger([field_sort], 3, SearchMergeStrategy.SORT, 60)
+
     def test_string_query(self, cb_env):
         exp_json = {
             'query': {
@@ -873,7 +995,9 @@ class VectorSearchParamTestSuite:
         'test_vector_query_invalid_boost',
         'test_vector_query_invalid_num_candidates',
         'test_vector_query_invalid_vector',
+        'test_vector_query_vector_buffer',
         'test_vector_search',
+        'test_vector_search_base64',
         'test_vector_search_invalid',
         'test_vector_search_multiple_queries'
     ]
@@ -933,6 +1057,41 @@ class VectorSearchParamTestSuite:
             VectorQuery('vector_field', [1])
         with pytest.raises(InvalidArgumentException):
             VectorQuery('vector_field', [1.111, 2, 3.14159])
+        # buffers must be one dimensional and contain floats
+        with pytest.raises(InvalidArgumentException):
+            VectorQuery('vector_field', array('f'))
+        with pytest.raises(InvalidArgumentException):
+            VectorQuery('vector_field', array('i', [1, 2, 3]))
+        with pytest.raises(InvalidArgumentException):
+            VectorQuery('vector_field', b'\x00\x00\x80\x3f')
+        with pytest.raises(InvalidArgumentException):
+            VectorQuery('vector_field', memoryview(array('f', self.TEST_VECTOR)).cast('B').cast('f', (2, 3)))
+        with pytest.raises(InvalidArgumentException):
+            VectorQuery('vector_field', '')
+        with pytest.raises(InvalidArgumentException):
+            VectorQuery('vector_field', 1.0)
+
+    @pytest.mark.parametrize('vector_type', ['array_f', 'array_d', 'memoryview', 'strided'])
+    def test_vector_query_vector_buffer(self, vector_type):
+        expected = struct.unpack(f'<{len(self.TEST_VECTOR)}f', struct.pack(f'<{len(self.TEST_VECTOR)}f',
+                                                                           *self.TEST_VECTOR))
+        if vector_type == 'array_f':
+            vector = array('f', self.TEST_VECTOR)
+        elif vector_type == 'array_d':
+            vector = array('d', self.TEST_VECTOR)
+        elif vector_type == 'memoryview':
+            vector = memoryview(array('f', self.TEST_VECTOR))
+        else:
+            vector = memoryview(array('f', [v for v in self.TEST_VECTOR for _ in range(2)]))[::2]
+
+        query = VectorQuery('vector_field', vector)
+        assert query.vector == list(expected)
+        decoded = base64.b64decode(query.vector_base64)
+        assert struct.unpack(f'<{len(self.TEST_VECTOR)}f', decoded) == expected
+
+        query = VectorQuery('vector_field', query.vector_base64)
+        assert query.vector is None
+        assert base64.b64decode(query.vector_base64) == decoded
 
     def test_vector_search(self, cb_env):
         exp_json = {
@@ -958,6 +1117,39 @@ class VectorSearchParamTestSuite:
         encoded_q = cb_env.get_encoded_query(search_query)
         assert exp_json == encoded_q
 
+    def test_vector_search_base64(self, cb_env):
+        vector_base64 = base64.b64encode(struct.pack(f'<{len(self.TEST_VECTOR)}f', *self.TEST_VECTOR)).decode()
+        exp_json = {
+            'query': {'match_none': None},
+            'index_name': cb_env.TEST_INDEX_NAME,
+            'metrics': True,
+            'show_request': False,
+            'vector_search': [
+                {
+                    'field': 'vector_field',
+                    'vector_base64': vector_base64,
+                    'k': 3
+                },
+                {
+                    'field': 'vector_field',
+                    'vector_base64': vector_base64,
+                    'k': 5
+                }
+            ]
+        }
+
+        vector_queries = [
+            VectorQuery('vector_field', array('f', self.TEST_VECTOR)),
+            VectorQuery('vector_field', vector_base64, num_candidates=5)
+        ]
+        req = SearchRequest.create(VectorSearch(vector_queries))
+        search_query = search.SearchQueryBuilder.create_search_query_from_request(
+            cb_env.TEST_INDEX_NAME,
+            req
+        )
+        encoded_q = cb_env.get_encoded_query(search_query)
+        assert exp_json == encoded_q
+
     def test_vector_search_invalid(self):
         with pytest.raises(InvalidArgumentException):
             VectorSearch([])
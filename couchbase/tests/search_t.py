@@ -22,14 +22,16 @@ from datetime import datetime, timedelta
 import pytest
 
 import couchbase.search as search
-from couchbase.exceptions import (AmbiguousTimeoutException,
+from couchbase.exceptions import (AlreadyQueriedException,
+                                  AmbiguousTimeoutException,
                                   InvalidArgumentException,
                                   QueryIndexNotFoundException)
 from couchbase.mutation_state import MutationState
-from couchbase.options import SearchOptions
+from couchbase.options import SearchManyOptions, SearchOptions
 from couchbase.search import (HighlightStyle,
                               SearchDateRangeFacet,
                               SearchFacetResult,
+                              SearchMergeStrategy,
                               SearchNumericRangeFacet,
                               SearchRow,
                               SearchTermFacet)
@@ -186,7 +188,12 @@ class SearchTestSuite:
         'test_cluster_sort_id',
         'test_cluster_sort_score',
         'test_cluster_sort_str',
+        'test_search_ids_and_scores_only',
         'test_search_include_locations',
+        'test_search_iter_all',
+        'test_search_iter_all_invalid',
+        'test_search_many',
+        'test_search_many_rrf',
         'test_search_match_operator',
         'test_search_match_operator_fail',
         'test_search_no_include_locations',
@@ -671,6 +678,26 @@ class SearchTestSuite:
             assert score >= row.score
             score = row.score
 
+    def test_search_ids_and_scores_only(self, cb_env):
+        q = search.TermQuery('auto')
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME,
+                                          q,
+                                          SearchOptions(limit=10, fields=['make'], include_locations=True))
+        expected = {r.id: r.score for r in res.rows()}
+
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME,
+                                          q,
+                                          SearchOptions(limit=10,
+                                                        fields=['make'],
+                                                        include_locations=True,
+                                                        ids_and_scores_only=True))
+        rows = cb_env.assert_rows(res, 1, return_rows=True)
+        assert {r.id: r.score for r in rows} == expected
+        for row in rows:
+            assert row.fields is None
+            assert row.locations is None
+            assert row.explanation == {}
+
     def test_search_include_locations(self, cb_env):
         q = search.TermQuery('auto')
         # check w/in options
@@ -691,6 +718,79 @@ class SearchTestSuite:
         assert isinstance(locations, search.SearchRowLocations)
         assert all(map(lambda l: isinstance(l, search.SearchRowLocation), locations.get_all())) is True
 
+    @pytest.mark.parametrize('prefetch_pages', [0, 2])
+    def test_search_iter_all(self, cb_env, prefetch_pages):
+        q = search.TermQuery('auto')
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME, q, SearchOptions(limit=1000))
+        expected = [r.id for r in res.rows()]
+        assert len(expected) >= 2
+
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME, q, SearchOptions(sort=['-_score']))
+        rows = list(res.iter_all(page_size=1, prefetch_pages=prefetch_pages))
+        assert all(map(lambda r: isinstance(r, SearchRow), rows)) is True
+        assert sorted(r.id for r in rows) == sorted(expected)
+        scores = [r.score for r in rows]
+        assert scores == sorted(scores, reverse=True)
+
+        # the limit caps the total number of rows
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME, q, SearchOptions(limit=2))
+        assert len(set(r.id for r in res.iter_all(page_size=1))) == 2
+
+    def test_search_iter_all_invalid(self, cb_env):
+        q = search.TermQuery('auto')
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME, q)
+        with pytest.raises(InvalidArgumentException):
+            res.iter_all(page_size=0)
+        with pytest.raises(InvalidArgumentException):
+            res.iter_all(page_size=True)
+        with pytest.raises(InvalidArgumentException):
+            res.iter_all(prefetch_pages=-1)
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME, q, SearchOptions(sort=['model']))
+        with pytest.raises(InvalidArgumentException):
+            res.iter_all()
+        res = cb_env.cluster.search_query(cb_env.TEST_INDEX_NAME, q)
+        [r for r in res.rows()]
+        with pytest.raises(AlreadyQueriedException):
+            res.iter_all()
+
+    def test_search_many(self, cb_env):
+        auto_req = search.SearchRequest.create(search.TermQuery('auto'))
+        all_req = search.SearchRequest.create(search.MatchAllQuery())
+        expected = []
+        for req in [auto_req, all_req]:
+            res = cb_env.cluster.search(cb_env.TEST_INDEX_NAME, req, SearchOptions(limit=5))
+            expected.extend(res.rows())
+        expected = sorted(expected, key=lambda r: -r.score)[:5]
+
+        rows = cb_env.cluster.search_many([(cb_env.TEST_INDEX_NAME, auto_req),
+                                           (cb_env.TEST_INDEX_NAME, all_req)],
+                                          SearchManyOptions(limit=5))
+        assert all(map(lambda r: isinstance(r, SearchRow), rows)) is True
+        assert len(rows) == len(expected)
+        assert [r.score for r in rows] == [r.score for r in expected]
+
+        with pytest.raises(InvalidArgumentException):
+            cb_env.cluster.search_many([(cb_env.TEST_INDEX_NAME, auto_req, SearchOptions(sort=['-_score'])),
+                                        (cb_env.TEST_INDEX_NAME, all_req, SearchOptions(sort=['_id']))])
+        with pytest.raises(InvalidArgumentException):
+            cb_env.cluster.search_many([(cb_env.TEST_INDEX_NAME, auto_req, SearchOptions(sort=['model']))])
+
+    def test_search_many_rrf(self, cb_env):
+        auto_req = search.SearchRequest.create(search.TermQuery('auto'))
+        res = cb_env.cluster.search(cb_env.TEST_INDEX_NAME, auto_req, SearchOptions(limit=3))
+        expected = [r.id for r in res.rows()]
+
+        rows = cb_env.cluster.search_many([(cb_env.TEST_INDEX_NAME, auto_req),
+                                           (cb_env.TEST_INDEX_NAME, auto_req, SearchOptions(sort=['_id']))],
+                                          limit=3,
+                                          merge_strategy=SearchMergeStrategy.RECIPROCAL_RANK_FUSION)
+        assert len(rows) == len(expected)
+        assert len(set(r.id for r in rows)) == len(rows)
+        # a fused score sums 1 / (rrf_k + rank) over the searches that returned the row, up to the early stop
+        scores = [r.score for r in rows]
+        assert scores == sorted(scores, reverse=True)
+        assert all(map(lambda score: 1 / 64 <= score <= 2 / 61, scores)) is True
+
     @pytest.mark.parametrize('operator, query_terms, expect_rows',
                              [(search.MatchOperator.AND, "auto deal", True),
                               (search.MatchOperator.AND, "auto :random:", False),
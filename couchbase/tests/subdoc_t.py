@@ -19,6 +19,7 @@ from datetime import datetime, timedelta
 import pytest
 
 import couchbase.subdocument as SD
+from couchbase.durability import DurabilityLevel, ServerDurability
 from couchbase.exceptions import (DocumentExistsException,
                                   DocumentNotFoundException,
                                   DocumentUnretrievableException,
@@ -30,12 +31,17 @@ from couchbase.exceptions import (DocumentExistsException,
 from couchbase.options import (GetOptions,
                                LookupInAllReplicasOptions,
                                LookupInAnyReplicaOptions,
+                               LookupInMultiOptions,
                                LookupInOptions,
+                               MutateInMultiOptions,
                                MutateInOptions)
 from couchbase.result import (GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiLookupInResult,
+                              MultiMutateInResult,
                               MutateInResult)
+from couchbase.transcoder import JSONTranscoder
 from tests.environments import CollectionType
 from tests.environments.subdoc_environment import SubdocTestEnvironment
 from tests.environments.test_environment import TestEnvironment
@@ -85,6 +91,8 @@ class SubDocumentTestSuite:
         'test_lookup_in_any_replica_multiple_specs',
         'test_lookup_in_any_replica_with_timeout',
         'test_lookup_in_macros',
+        'test_lookup_in_multi',
+        'test_lookup_in_multi_per_key_specs',
         'test_lookup_in_multiple_specs',
         'test_lookup_in_one_path_not_found',
         'test_lookup_in_simple_exists',
@@ -101,6 +109,10 @@ class SubDocumentTestSuite:
         'test_mutate_in_insert_semantics_kwargs',
         'test_mutate_in_macros_insert',
         'test_mutate_in_macros_replace_upsert',
+        'test_mutate_in_multi',
+        'test_mutate_in_multi_invalid_args',
+        'test_mutate_in_multi_per_key_specs',
+        'test_mutate_in_multi_transcoder',
         'test_mutate_in_preserve_expiry',
         'test_mutate_in_preserve_expiry_fails',
         'test_mutate_in_preserve_expiry_not_used',
@@ -631,6 +643,37 @@ class SubDocumentTestSuite:
             if macro_key in ['CAS', 'seqno', 'vbucket_uuid', 'value_crc32c']:
                 assert str(macro_res_value).startswith('0x')
 
+    def test_lookup_in_multi(self, cb_env):
+        docs = dict(cb_env.get_existing_doc_by_type('vehicle') for _ in range(3))
+        missing_key = 'not-a-key'
+        result = cb_env.collection.lookup_in_multi(list(docs.keys()) + [missing_key],
+                                                   (SD.get('manufacturer'), SD.exists('qzzxy')))
+        assert isinstance(result, MultiLookupInResult)
+        assert result.all_ok is False
+        assert result.failed_keys() == [missing_key]
+        assert isinstance(result.exceptions[missing_key], DocumentNotFoundException)
+        assert sorted(result.results.keys()) == sorted(docs.keys())
+        for k, v in result.results.items():
+            assert isinstance(v, LookupInResult)
+            assert v.content_as[dict](0) == docs[k]['manufacturer']
+            assert not v.exists(1)
+
+        with pytest.raises(DocumentNotFoundException):
+            cb_env.collection.lookup_in_multi([missing_key],
+                                              (SD.get('manufacturer'),),
+                                              LookupInMultiOptions(return_exceptions=False))
+
+    def test_lookup_in_multi_per_key_specs(self, cb_env):
+        docs = dict(cb_env.get_existing_doc_by_type('vehicle') for _ in range(2))
+        key1, key2 = docs.keys()
+        result = cb_env.collection.lookup_in_multi({key1: (SD.get('make'),),
+                                                    key2: [SD.get('model'), SD.get('manufacturer')]},
+                                                   LookupInMultiOptions(timeout=timedelta(seconds=5)))
+        assert result.all_ok is True
+        assert result.results[key1].content_as[str](0) == docs[key1]['make']
+        assert result.results[key2].content_as[str](0) == docs[key2]['model']
+        assert result.results[key2].content_as[dict](1) == docs[key2]['manufacturer']
+
     @pytest.mark.usefixtures("check_xattr_supported")
     def test_lookup_in_multiple_specs(self, cb_env):
         key, value = cb_env.get_existing_doc_by_type('vehicle')
@@ -825,6 +868,98 @@ class SubDocumentTestSuite:
         else:
             assert replace_macro_res != upsert_macro_res
 
+    def test_mutate_in_multi(self, cb_env):
+        docs = dict(cb_env.get_existing_doc_by_type('vehicle') for _ in range(3))
+        result = cb_env.collection.mutate_in_multi(list(docs.keys()),
+                                                   (SD.upsert('make', 'New Make'),
+                                                    SD.array_append('tags', 'multi', create_parents=True)))
+        assert isinstance(result, MultiMutateInResult)
+        assert result.all_ok is True
+        assert sorted(result.keys()) == sorted(docs.keys())
+        assert all(cas > 0 for cas in result.cas_array())
+        for k, v in result.results.items():
+            assert isinstance(v, MutateInResult)
+            res = TestEnvironment.try_n_times(10, 3, cb_env.collection.get, k)
+            assert res.cas == v.cas
+            assert res.content_as[dict]['make'] == 'New Make'
+            assert res.content_as[dict]['tags'][-1] == 'multi'
+
+    def test_mutate_in_multi_invalid_args(self, cb_env):
+        key = cb_env.get_existing_doc_by_type('vehicle', key_only=True)
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.mutate_in_multi([key])
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.mutate_in_multi({key: (SD.upsert('make', 'New Make'),)},
+                                              (SD.upsert('model', 'New Model'),))
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.mutate_in_multi(key, (SD.upsert('make', 'New Make'),))
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.mutate_in_multi([key],
+                                              (SD.replace('make', 'New Make'),),
+                                              MutateInMultiOptions(expiry=timedelta(seconds=5),
+                                                                   preserve_expiry=True))
+
+    def test_mutate_in_multi_per_key_specs(self, cb_env):
+        docs = dict(cb_env.get_existing_doc_by_type('vehicle') for _ in range(2))
+        key1, key2 = docs.keys()
+        new_key = cb_env.get_new_doc(key_only=True)
+        per_key_opts = {new_key: MutateInOptions(store_semantics=SD.StoreSemantics.INSERT)}
+        result = cb_env.collection.mutate_in_multi({key1: (SD.upsert('make', 'New Make'),),
+                                                    key2: (SD.replace('model', 'New Model'),
+                                                           SD.remove('manufacturer')),
+                                                    new_key: (SD.upsert('name', 'inserted'),)},
+                                                   MutateInMultiOptions(per_key_options=per_key_opts))
+        assert result.all_ok is True
+        res = TestEnvironment.try_n_times(10, 3, cb_env.collection.get, key1)
+        assert res.content_as[dict]['make'] == 'New Make'
+        res = TestEnvironment.try_n_times(10, 3, cb_env.collection.get, key2)
+        assert res.content_as[dict]['model'] == 'New Model'
+        assert 'manufacturer' not in res.content_as[dict]
+        res = TestEnvironment.try_n_times(10, 3, cb_env.collection.get, new_key)
+        assert res.content_as[dict] == {'name': 'inserted'}
+
+        # the same key cannot be inserted twice
+        result = cb_env.collection.mutate_in_multi([new_key],
+                                                   (SD.upsert('name', 'inserted'),),
+                                                   store_semantics=SD.StoreSemantics.INSERT)
+        assert result.all_ok is False
+        assert isinstance(result.exceptions[new_key], DocumentExistsException)
+
+    def test_mutate_in_multi_transcoder(self, cb_env):
+        class WrappingTranscoder(JSONTranscoder):
+            def __init__(self, name):
+                super().__init__()
+                self._name = name
+
+            def encode_value(self, value):
+                return super().encode_value({self._name: value})
+
+        op_tc = WrappingTranscoder('op')
+        key_tc = WrappingTranscoder('key')
+        keys = ['key1', 'key2', 'key3']
+        durability = ServerDurability(DurabilityLevel.MAJORITY)
+        per_key_opts = {'key2': {'transcoder': key_tc}, 'key3': MutateInOptions(durability=durability)}
+        opts = MutateInMultiOptions(transcoder=op_tc, per_key_options=per_key_opts)
+        spec = (SD.upsert('make', 'New Make'),)
+        op_args, _, transcoders = cb_env.collection._get_multi_subdoc_op_args(keys,
+                                                                              spec,
+                                                                              opts,
+                                                                              opts_type=MutateInMultiOptions)
+        assert op_args['key1']['spec'][0][5] == b'{"op": "New Make"}'
+        assert op_args['key2']['spec'][0][5] == b'{"key": "New Make"}'
+        assert op_args['key3']['spec'][0][5] == b'{"op": "New Make"}'
+        assert transcoders == {'key1': op_tc, 'key2': key_tc, 'key3': op_tc}
+        assert 'transcoder' not in op_args['key2']
+        assert op_args['key3']['durability'] == DurabilityLevel.MAJORITY.value
+        # the caller's per key options are not modified
+        assert per_key_opts['key2'] == {'transcoder': key_tc}
+        assert per_key_opts['key3']['durability'] is durability
+
+        key_specs = {'key1': (SD.upsert('a', 1),), 'key2': (SD.upsert('b', 2),)}
+        op_args, _, _ = cb_env.collection._get_multi_subdoc_op_args(key_specs, opts, opts_type=MutateInMultiOptions)
+        assert op_args['key1']['spec'][0][5] == b'{"op": 1}'
+        assert op_args['key2']['spec'][0][5] == b'{"key": 2}'
+
     @pytest.mark.usefixtures('check_preserve_expiry_supported')
     def test_mutate_in_preserve_expiry(self, cb_env):
         key = cb_env.get_existing_doc_by_type('vehicle', key_only=True)
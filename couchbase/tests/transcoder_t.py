@@ -14,22 +14,33 @@
 #  limitations under the License.
 
 import json
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any, Tuple
+from typing import (Any,
+                    List,
+                    Optional,
+                    Tuple)
 
 import pytest
 
-from couchbase.constants import FMT_JSON
+from couchbase.constants import FMT_BYTES, FMT_JSON
 from couchbase.exceptions import (DocumentLockedException,
                                   DocumentNotFoundException,
+                                  InvalidArgumentException,
                                   ValueFormatException)
 from couchbase.options import (GetAndLockOptions,
                                GetAndTouchOptions,
+                               GetMultiOptions,
                                GetOptions,
                                ReplaceOptions)
-from couchbase.transcoder import (JSONTranscoder,
+from couchbase.result import ContentProxy
+from couchbase.serializer import SchemaSerializer, get_json_serializer
+from couchbase.transcoder import (FMT_COMPRESSION_MASK,
+                                  CompressingTranscoder,
+                                  JSONTranscoder,
                                   LegacyTranscoder,
                                   RawBinaryTranscoder,
+                                  RawBinaryViewTranscoder,
                                   RawJSONTranscoder,
                                   RawStringTranscoder,
                                   Transcoder)
@@ -38,6 +49,24 @@ from tests.environments.test_environment import TestEnvironment
 from tests.environments.transcoder_environment import FakeTestObj, TranscoderTestEnvironment
 
 
+@dataclass
+class SchemaGeo:
+    lat: float
+    lon: float = 0.0
+
+
+@dataclass
+class SchemaAirline:
+    name: str
+    geo: Optional[SchemaGeo] = None
+    tags: List[str] = field(default_factory=list)
+
+
+class SchemaNode:
+    __slots__ = ('name', 'children')
+    children: List['SchemaNode']
+
+
 class ZeroFlagsTranscoder(Transcoder):
     def encode_value(self,
                      value,  # type: Any
@@ -52,22 +81,71 @@ class ZeroFlagsTranscoder(Transcoder):
         return json.loads(value.decode('utf-8'))
 
 
+class DecodeCountingTranscoder(JSONTranscoder):
+    def __init__(self):
+        super().__init__()
+        self.decode_count = 0
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags  # type: int
+                     ) -> Any:
+        self.decode_count += 1
+        return super().decode_value(value, flags)
+
+
 class DefaultTranscoderTestSuite:
     TEST_MANIFEST = [
+        'test_compressing_tc_encoding',
+        'test_compressing_tc_upsert',
         'test_default_tc_binary_insert',
         'test_default_tc_binary_replace',
         'test_default_tc_binary_upsert',
         'test_default_tc_bytearray_upsert',
         'test_default_tc_decoding',
+        'test_default_tc_fast_serializer_decoding',
         'test_default_tc_flags_zero',
         'test_default_tc_json_insert',
         'test_default_tc_json_replace',
         'test_default_tc_json_upsert',
+        'test_default_tc_lazy_decode',
+        'test_default_tc_lazy_decode_multi',
+        'test_default_tc_schema_serializer',
+        'test_default_tc_schema_serializer_decode_error',
         'test_default_tc_string_insert',
         'test_default_tc_string_replace',
         'test_default_tc_string_upsert',
     ]
 
+    @pytest.mark.parametrize('algorithm', ['zlib', 'lzma', 'zstd', 'lz4'])
+    def test_compressing_tc_encoding(self, algorithm):
+        try:
+            tc = CompressingTranscoder(algorithm=algorithm, min_size=64)
+        except InvalidArgumentException:
+            pytest.skip(f'{algorithm} compression not available.')
+        small = {'foo': 'bar'}
+        value, flags = tc.encode_value(small)
+        assert flags == FMT_JSON
+        assert tc.decode_value(value, flags) == small
+
+        content = {'docs': [{'id': i, 'name': f'name-{i}', 'tags': ['a', 'b', 'c']} for i in range(100)]}
+        value, flags = tc.encode_value(content)
+        assert flags & FMT_COMPRESSION_MASK != 0
+        assert flags & ~FMT_COMPRESSION_MASK == FMT_JSON
+        assert len(value) < len(JSONTranscoder().encode_value(content)[0])
+        assert tc.decode_value(value, flags) == content
+        # uncompressed documents are still readable
+        value, flags = JSONTranscoder().encode_value(content)
+        assert tc.decode_value(value, flags) == content
+
+    def test_compressing_tc_upsert(self, cb_env):
+        key = cb_env.get_existing_doc_by_type('json', key_only=True)
+        tc = CompressingTranscoder(min_size=64)
+        content = {'docs': [{'id': i, 'name': f'name-{i}', 'tags': ['a', 'b', 'c']} for i in range(100)]}
+        cb_env.collection.upsert(key, content, transcoder=tc)
+        res = cb_env.collection.get(key, transcoder=tc)
+        assert res.content_as[dict] == content
+
     def test_default_tc_binary_insert(self, cb_env):
         key, value = cb_env.get_existing_doc_by_type('bytes')
         with pytest.raises(ValueFormatException):
@@ -98,6 +176,22 @@ class DefaultTranscoderTestSuite:
         decoded = tc.decode_value(value, 0)
         assert content == decoded
 
+    @pytest.mark.parametrize('serializer_name', ['fast', 'orjson', 'msgspec', 'ujson', 'json'])
+    def test_default_tc_fast_serializer_decoding(self, serializer_name):
+        try:
+            serializer = get_json_serializer(serializer_name)
+        except InvalidArgumentException:
+            pytest.skip(f'{serializer_name} serializer not available.')
+        tc = JSONTranscoder(serializer)
+        content = {'foo': 'bar', 'num': 1, 'nested': {'utf8': 'h\u00e9llo'}, 'list': [1, 2.5, None, True]}
+        value, flags = tc.encode_value(content)
+        assert flags == FMT_JSON
+        assert isinstance(value, bytes)
+        assert json.loads(value.decode('utf-8')) == content
+        assert tc.decode_value(value, flags) == content
+        assert tc.decode_value(bytearray(value), flags) == content
+        assert tc.decode_value(memoryview(value), flags) == content
+
     def test_default_tc_flags_zero(self, cb_env):
         key, value = cb_env.get_existing_doc_by_type('json')
         cb_env.collection.upsert(key, value, transcoder=ZeroFlagsTranscoder())
@@ -134,6 +228,54 @@ class DefaultTranscoderTestSuite:
         assert isinstance(result, dict)
         assert result == value
 
+    def test_default_tc_lazy_decode(self, cb_env):
+        key, value = cb_env.get_existing_doc_by_type('json')
+        tc = DecodeCountingTranscoder()
+        res = cb_env.collection.get(key, GetOptions(transcoder=tc, lazy_decode=True))
+        assert res.cas is not None
+        assert tc.decode_count == 0
+        assert res.content_as[dict] == value
+        assert res.value == value
+        assert tc.decode_count == 1
+
+    def test_default_tc_lazy_decode_multi(self, cb_env):
+        key, value = cb_env.get_existing_doc_by_type('json')
+        tc = DecodeCountingTranscoder()
+        res = cb_env.collection.get_multi([key], GetMultiOptions(transcoder=tc, lazy_decode=True))
+        assert res.all_ok is True
+        assert tc.decode_count == 0
+        assert res.results[key].content_as[dict] == value
+        assert res.results[key].value == value
+        assert tc.decode_count == 1
+
+    def test_default_tc_schema_serializer(self):
+        tc = JSONTranscoder(SchemaSerializer(SchemaAirline))
+        content = {'name': 'airline', 'geo': {'lat': 1.5, 'alt': 10}, 'country': 'unused'}
+        value, flags = tc.encode_value(content)
+        decoded = tc.decode_value(value, flags)
+        assert decoded == SchemaAirline(name='airline', geo=SchemaGeo(lat=1.5))
+        assert ContentProxy(decoded)[SchemaAirline] is decoded
+
+        serializer = SchemaSerializer(SchemaNode)
+        node = serializer.deserialize(b'{"name": "root", "children": [{"name": "child"}], "unused": 1}')
+        assert isinstance(node, SchemaNode)
+        assert node.name == 'root'
+        assert [(c.name, c.children) for c in node.children] == [('child', None)]
+
+        with pytest.raises(InvalidArgumentException):
+            SchemaSerializer(dict)
+
+    @pytest.mark.parametrize('serializer_name', ['json', 'msgspec'])
+    def test_default_tc_schema_serializer_decode_error(self, serializer_name):
+        try:
+            serializer = SchemaSerializer(SchemaAirline, get_json_serializer(serializer_name))
+        except InvalidArgumentException:
+            pytest.skip(f'{serializer_name} serializer not available.')
+        # missing required field, nested missing required field, malformed JSON
+        for value in [b'{"tags": []}', b'{"name": "airline", "geo": {"lon": 1.5}}', b'{"name": ']:
+            with pytest.raises(ValueFormatException):
+                serializer.deserialize(value)
+
     def test_default_tc_string_insert(self, cb_env):
         key, value = cb_env.get_new_doc_by_type('utf8')
         cb_env.collection.insert(key, value)
@@ -385,6 +527,8 @@ class RawBinaryTranscoderTestSuite:
         'test_raw_binary_tc_string_insert',
         'test_raw_binary_tc_string_replace',
         'test_raw_binary_tc_string_upsert',
+        'test_raw_binary_view_tc_encoding',
+        'test_raw_binary_view_tc_memoryview_upsert',
     ]
 
     def test_raw_binary_tc_bytes_insert(self, cb_env):
@@ -464,6 +608,33 @@ class RawBinaryTranscoderTestSuite:
         with pytest.raises(ValueFormatException):
             cb_env.collection.replace(key, value)
 
+    def test_raw_binary_view_tc_encoding(self):
+        tc = RawBinaryViewTranscoder()
+        content = bytearray(b'some binary content')
+        value, flags = tc.encode_value(content)
+        assert flags == FMT_BYTES
+        assert isinstance(value, memoryview)
+        assert value.obj is content
+        value, _ = tc.encode_value(memoryview(content)[5:])
+        assert bytes(value) == b'binary content'
+        with pytest.raises(ValueFormatException):
+            tc.encode_value('some string content')
+        with pytest.raises(ValueFormatException):
+            tc.encode_value(memoryview(content)[::2])
+        decoded = tc.decode_value(bytes(content), FMT_BYTES)
+        assert isinstance(decoded, memoryview)
+        assert decoded.readonly is True
+        assert decoded == content
+
+    def test_raw_binary_view_tc_memoryview_upsert(self, cb_env):
+        key, value = cb_env.get_new_doc_by_type('bytes')
+        tc = RawBinaryViewTranscoder()
+        cb_env.collection.upsert(key, memoryview(value), transcoder=tc)
+        res = cb_env.collection.get(key, transcoder=tc)
+        assert isinstance(res.value, memoryview)
+        assert res.value.readonly is True
+        assert value == res.content_as[bytes]
+
 
 class RawJsonTranscoderTestSuite:
     TEST_MANIFEST = [
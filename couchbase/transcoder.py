@@ -15,11 +15,14 @@
 
 from __future__ import annotations
 
-import json
+import lzma
 import pickle  # nosec
+import zlib
 from abc import ABC, abstractmethod
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
+                    Dict,
                     Optional,
                     Tuple,
                     Union)
@@ -30,9 +33,19 @@ from couchbase.constants import (FMT_BYTES,
                                  FMT_LEGACY_MASK,
                                  FMT_PICKLE,
                                  FMT_UTF8)
-from couchbase.exceptions import ValueFormatException
+from couchbase.exceptions import InvalidArgumentException, ValueFormatException
 from couchbase.serializer import DefaultJsonSerializer
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
 if TYPE_CHECKING:
     from couchbase.serializer import Serializer
 
@@ -47,6 +60,10 @@ for fl in UNIFIED_FORMATS:
     COMMON2UNIFIED[fl & FMT_COMMON_MASK] = fl
     LEGACY2UNIFIED[fl & FMT_LEGACY_MASK] = fl
 
+# the upper 3 bits of the common flags are reserved for the compression applied to the value
+FMT_COMPRESSION_SHIFT = 29
+FMT_COMPRESSION_MASK = 0x07 << FMT_COMPRESSION_SHIFT
+
 
 def get_decode_format(flags,  # type: Optional[int]
                       ) -> Optional[int]:
@@ -155,13 +172,12 @@ class RawJSONTranscoder(Transcoder):
 
     def encode_value(self,
                      value  # type: Union[str,bytes,bytearray]
-                     ) -> Tuple[bytes, int]:
+                     ) -> Tuple[Union[bytes, bytearray], int]:
 
         if isinstance(value, str):
             return value.encode('utf-8'), FMT_JSON
         elif isinstance(value, (bytes, bytearray)):
-            if isinstance(value, bytearray):
-                value = bytes(value)
+            # the core reads bytearray's buffer directly, no need to copy into a bytes object
             return value, FMT_JSON
         else:
             raise ValueFormatException("Only binary and string data supported by RawJSONTranscoder")
@@ -218,11 +234,10 @@ class RawStringTranscoder(Transcoder):
 class RawBinaryTranscoder(Transcoder):
     def encode_value(self,
                      value  # type: Union[bytes,bytearray]
-                     ) -> Tuple[bytes, int]:
+                     ) -> Tuple[Union[bytes, bytearray], int]:
 
         if isinstance(value, (bytes, bytearray)):
-            if isinstance(value, bytearray):
-                value = bytes(value)
+            # the core reads bytearray's buffer directly, no need to copy into a bytes object
             return value, FMT_BYTES
         else:
             raise ValueFormatException("Only binary data supported by RawBinaryTranscoder")
@@ -246,8 +261,62 @@ class RawBinaryTranscoder(Transcoder):
             raise ValueFormatException(f"Unrecognized format provided: {format}")
 
 
+class RawBinaryViewTranscoder(Transcoder):
+    """Binary pass-through transcoder intended for large values.
+
+    Encoding accepts any C-contiguous object supporting the buffer protocol (``bytes``, ``bytearray``,
+    ``memoryview``, ``array.array``, ``mmap``, etc.) and hands its buffer to the core as is, without building an
+    intermediate ``bytes`` object.  Decoding returns a read-only ``memoryview`` over the value received from
+    the core, so the content can be sliced and written out (e.g. ``socket.sendall()``) without further copies.
+    """
+
+    def encode_value(self,
+                     value  # type: Union[bytes, bytearray, memoryview]
+                     ) -> Tuple[Union[bytes, memoryview], int]:
+
+        if isinstance(value, bytes):
+            return value, FMT_BYTES
+
+        try:
+            view = memoryview(value)
+        except TypeError:
+            raise ValueFormatException("Only binary data supported by RawBinaryViewTranscoder") from None
+
+        if not view.c_contiguous:
+            raise ValueFormatException("Only C-contiguous buffers supported by RawBinaryViewTranscoder")
+
+        return view, FMT_BYTES
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags  # type: int
+                     ) -> memoryview:
+
+        format = get_decode_format(flags)
+
+        if format == FMT_BYTES:
+            if not isinstance(value, bytes):
+                value = bytes(value)
+            # a view over an immutable bytes object is read-only
+            return memoryview(value)
+        elif format == FMT_UTF8:
+            raise ValueFormatException("String format type not supported by RawBinaryViewTranscoder")
+        elif format == FMT_JSON:
+            raise ValueFormatException("JSON format type not supported by RawBinaryViewTranscoder")
+        else:
+            raise ValueFormatException(f"Unrecognized format provided: {format}")
+
+
 class LegacyTranscoder(Transcoder):
 
+    def __init__(self, serializer=None  # type: Serializer
+                 ):
+
+        if not serializer:
+            self._serializer = DefaultJsonSerializer()
+        else:
+            self._serializer = serializer
+
     def encode_value(self,
                      value  # type: Any
                      ) -> Tuple[bytes, int]:
@@ -274,7 +343,7 @@ class LegacyTranscoder(Transcoder):
         elif format == FMT_PICKLE:
             return pickle.dumps(value), FMT_PICKLE
         else:  # default to JSON
-            return json.dumps(value, ensure_ascii=False).encode('utf-8'), FMT_JSON
+            return self._serializer.serialize(value), FMT_JSON
 
     def decode_value(self,
                      value,  # type: bytes
@@ -286,7 +355,7 @@ class LegacyTranscoder(Transcoder):
         # flags=[0 | None] special case, attempt JSON deserialize
         if format in [FMT_JSON, 0, None]:
             try:
-                return json.loads(value.decode('utf-8'))
+                return self._serializer.deserialize(value)
             except Exception:
                 # if error encountered, assume bytes
                 return value
@@ -299,3 +368,195 @@ class LegacyTranscoder(Transcoder):
         else:
             # default to returning bytes
             return value
+
+
+def _zlib_compress(value, level):
+    return zlib.compress(value, -1 if level is None else level)
+
+
+def _lzma_compress(value, level):
+    return lzma.compress(value, preset=level)
+
+
+def _zstd_compress(value, level):
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compress(value)
+
+
+def _zstd_decompress(value):
+    return zstandard.ZstdDecompressor().decompress(value)
+
+
+def _lz4_compress(value, level):
+    return lz4_frame.compress(value, compression_level=0 if level is None else level)
+
+
+# algorithm name -> (flags value, compress(value, level), decompress(value), required module)
+# NOTE: the flags values are persisted with the documents, they must never change
+_COMPRESSION_ALGORITHMS = {
+    'zlib': (1, _zlib_compress, zlib.decompress, zlib),
+    'lzma': (2, _lzma_compress, lzma.decompress, lzma),
+    'zstd': (3, _zstd_compress, _zstd_decompress, zstandard),
+    'lz4': (4, _lz4_compress, lz4_frame.decompress if lz4_frame else None, lz4_frame),
+}  # type: Dict[str, Tuple[int, Callable[[Any, Optional[int]], bytes], Callable[[bytes], bytes], Any]]
+
+_COMPRESSION_CODES = {v[0]: k for k, v in _COMPRESSION_ALGORITHMS.items()}
+
+DEFAULT_COMPRESSION_MIN_SIZE = 1024
+
+
+class CompressingTranscoder(Transcoder):
+    """Transcoder that compresses the values encoded by another transcoder.
+
+    Values whose encoded size is at least ``min_size`` bytes are compressed, the algorithm used is recorded in the
+    reserved upper bits of the document's common flags.  Decoding inspects the flags, so documents written without
+    compression (or with any of the supported algorithms) are decoded transparently.  A value is stored
+    uncompressed if compressing it does not reduce its size.
+
+    .. note::
+        Compressed documents can only be read by a :class:`CompressingTranscoder`, other transcoders
+        (and other SDKs) will not recognize their format.
+
+    Args:
+        transcoder (:class:`Transcoder`, optional): The transcoder used to encode/decode the (uncompressed) value.
+            Defaults to :class:`JSONTranscoder`.
+        algorithm (str, optional): The compression algorithm to use when encoding, one of ``zlib``, ``lzma``,
+            ``zstd`` (requires the ``zstandard`` package) or ``lz4`` (requires the ``lz4`` package).
+            Defaults to ``zlib``.
+        min_size (int, optional): Encoded values smaller than this number of bytes are not compressed.
+            Defaults to 1024.
+        level (int, optional): The compression level passed to the compression algorithm.  Defaults to the
+            algorithm's default level.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If the algorithm is unknown or the package it
+            requires is not installed.
+    """
+
+    def __init__(self,
+                 transcoder=None,  # type: Optional[Transcoder]
+                 algorithm='zlib',  # type: Optional[str]
+                 min_size=DEFAULT_COMPRESSION_MIN_SIZE,  # type: Optional[int]
+                 level=None,  # type: Optional[int]
+                 ):
+        algorithm_info = _COMPRESSION_ALGORITHMS.get(algorithm, None)
+        if algorithm_info is None:
+            raise InvalidArgumentException(f'Unknown compression algorithm: {algorithm}.  Expected one of: '
+                                           f'{", ".join(_COMPRESSION_ALGORITHMS.keys())}.')
+        if algorithm_info[3] is None:
+            raise InvalidArgumentException(f'Compression algorithm {algorithm} is not available.  '
+                                           'The required package is not installed.')
+        if not isinstance(min_size, int) or isinstance(min_size, bool) or min_size < 0:
+            raise InvalidArgumentException('min_size must be a non-negative int.')
+
+        self._transcoder = transcoder if transcoder is not None else JSONTranscoder()
+        self._algorithm = algorithm
+        self._compression_flags = algorithm_info[0] << FMT_COMPRESSION_SHIFT
+        self._compress = algorithm_info[1]
+        self._min_size = min_size
+        self._level = level
+
+    @property
+    def algorithm(self) -> str:
+        return self._algorithm
+
+    def encode_value(self,
+                     value  # type: Any
+                     ) -> Tuple[bytes, int]:
+        encoded, flags = self._transcoder.encode_value(value)
+        size = len(encoded) if isinstance(encoded, bytes) else memoryview(encoded).nbytes
+        if size < self._min_size:
+            return encoded, flags
+
+        compressed = self._compress(encoded, self._level)
+        if len(compressed) >= size:
+            return encoded, flags
+        return compressed, (flags & ~FMT_COMPRESSION_MASK) | self._compression_flags
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags  # type: int
+                     ) -> Any:
+        if flags is None:
+            return self._transcoder.decode_value(value, flags)
+
+        code = (flags & FMT_COMPRESSION_MASK) >> FMT_COMPRESSION_SHIFT
+        if code == 0:
+            return self._transcoder.decode_value(value, flags)
+
+        algorithm = _COMPRESSION_CODES.get(code, None)
+        if algorithm is None:
+            raise ValueFormatException(f'Unrecognized compression flags provided: {code}')
+        _, _, decompress, module = _COMPRESSION_ALGORITHMS[algorithm]
+        if module is None:
+            raise ValueFormatException(f'Value is compressed with {algorithm}, but the package it requires is not '
+                                       'installed.')
+        try:
+            value = decompress(value)
+        except Exception as ex:
+            raise ValueFormatException(f'Unable to decompress {algorithm} compressed value: {ex}') from None
+        return self._transcoder.decode_value(value, flags & ~FMT_COMPRESSION_MASK)
+
+
+class LazyValue:
+    """
+    **INTERNAL**
+
+    The raw content and flags of a document, decoded by the wrapped transcoder the first time the value is requested.
+    """
+
+    __slots__ = ('_transcoder', '_value', '_flags')
+
+    def __init__(self,
+                 transcoder,  # type: Transcoder
+                 value,  # type: bytes
+                 flags  # type: int
+                 ):
+        self._transcoder = transcoder
+        self._value = value
+        self._flags = flags
+
+    @property
+    def raw_value(self) -> bytes:
+        return self._value
+
+    @property
+    def flags(self) -> int:
+        return self._flags
+
+    def decode(self) -> Any:
+        return self._transcoder.decode_value(self._value, self._flags)
+
+
+class LazyDecodingTranscoder:
+    """
+    **INTERNAL**
+
+    Wraps the operation's transcoder when ``lazy_decode`` is requested.  Encoding is delegated to the wrapped
+    transcoder, decoding is deferred until the result's value is first accessed.
+    """
+
+    def __init__(self, transcoder  # type: Transcoder
+                 ):
+        self._transcoder = transcoder
+
+    def encode_value(self,
+                     value  # type: Any
+                     ) -> Tuple[bytes, int]:
+        return self._transcoder.encode_value(value)
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags  # type: int
+                     ) -> LazyValue:
+        return LazyValue(self._transcoder, value, flags)
+
+
+def get_lazy_transcoder(transcoder,  # type: Optional[Transcoder]
+                        lazy_decode  # type: Optional[bool]
+                        ) -> Optional[Transcoder]:
+    """
+    **INTERNAL**
+    """
+    if lazy_decode is True and transcoder is not None and not isinstance(transcoder, LazyDecodingTranscoder):
+        return LazyDecodingTranscoder(transcoder)
+    return transcoder
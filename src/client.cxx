@@ -407,6 +407,17 @@ subdoc_operation(PyObject* self, PyObject* args, PyObject* kwargs)
     return res;
 }
 
+static PyObject*
+subdoc_multi_operation(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    PyObject* res = handle_subdoc_multi_op(self, args, kwargs);
+    if (res == nullptr && PyErr_Occurred() == nullptr) {
+        pycbc_set_python_exception(
+          PycbcError::UnsuccessfulOperation, __FILE__, __LINE__, "Unable to perform subdocument multi operation.");
+    }
+    return res;
+}
+
 static PyObject*
 diagnostics_operation(PyObject* self, PyObject* args, PyObject* kwargs)
 {
@@ -538,6 +549,7 @@ static struct PyMethodDef methods[] = {
       METH_VARARGS | METH_KEYWORDS,
       "Handle all key/value range scan operations" },
     { "subdoc_operation", (PyCFunction)subdoc_operation, METH_VARARGS | METH_KEYWORDS, "Handle all subdoc operations" },
+    { "subdoc_multi_operation", (PyCFunction)subdoc_multi_operation, METH_VARARGS | METH_KEYWORDS, "Handle all subdoc multi operations" },
     { "binary_operation", (PyCFunction)binary_operation, METH_VARARGS | METH_KEYWORDS, "Handle all binary operations" },
     { "binary_multi_operation", (PyCFunction)binary_multi_operation, METH_VARARGS | METH_KEYWORDS, "Handle all binary multi operations" },
     { "diagnostics_operation", (PyCFunction)diagnostics_operation, METH_VARARGS | METH_KEYWORDS, "Handle all diagnostics operations" },
@@ -800,7 +800,7 @@ prepare_and_execute_mutation_op(struct mutation_options* options,
             auto req = couchbase::core::operations::insert_request{ options->id };
             req.timeout = options->timeout_ms;
             req.value = value;
-            req.flags = static_cast<uint32_t>(PyLong_AsLong(pyObj_flags));
+            req.flags = static_cast<uint32_t>(PyLong_AsUnsignedLong(pyObj_flags));
             if (options->expiry > 0) {
                 req.expiry = options->expiry;
             }
@@ -821,7 +821,7 @@ prepare_and_execute_mutation_op(struct mutation_options* options,
             auto req = couchbase::core::operations::upsert_request{ options->id };
             req.timeout = options->timeout_ms;
             req.value = value;
-            req.flags = static_cast<uint32_t>(PyLong_AsLong(pyObj_flags));
+            req.flags = static_cast<uint32_t>(PyLong_AsUnsignedLong(pyObj_flags));
             if (options->expiry > 0) {
                 req.expiry = options->expiry;
             }
@@ -846,7 +846,7 @@ prepare_and_execute_mutation_op(struct mutation_options* options,
             req.timeout = options->timeout_ms;
             req.cas = options->cas;
             req.value = value;
-            req.flags = static_cast<uint32_t>(PyLong_AsLong(pyObj_flags));
+            req.flags = static_cast<uint32_t>(PyLong_AsUnsignedLong(pyObj_flags));
             if (options->expiry > 0) {
                 req.expiry = options->expiry;
             }
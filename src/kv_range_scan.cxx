@@ -33,15 +33,20 @@ get_scan_term(PyObject* pyObj_scan_term)
         pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, "Must provide term for ScanTerm.");
         return {};
     }
-    if (!PyUnicode_Check(pyObj_term)) {
-        pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, "Term should be a string.");
+    if (!PyUnicode_Check(pyObj_term) && !PyBytes_Check(pyObj_term)) {
+        pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, "Term should be a string or bytes.");
         return {};
     }
 
     couchbase::core::scan_term scan_term;
 
     try {
-        scan_term = couchbase::core::scan_term{ PyUnicode_AsUTF8(pyObj_term) };
+        if (PyBytes_Check(pyObj_term)) {
+            // raw bytes allow bounds that are not valid UTF-8 (i.e. the 0xFF upper bound of a partitioned prefix scan)
+            scan_term = couchbase::core::scan_term{ std::string(PyBytes_AS_STRING(pyObj_term), PyBytes_GET_SIZE(pyObj_term)) };
+        } else {
+            scan_term = couchbase::core::scan_term{ PyUnicode_AsUTF8(pyObj_term) };
+        }
     } catch (const std::exception& e) {
         pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, e.what());
         return {};
@@ -378,14 +378,39 @@ handle_n1ql_query([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwa
     }
     streamed_result* streamed_res = create_streamed_result_obj(streaming_timeout);
 
-    // TODO:  let the couchbase++ streaming stabilize a bit more...
-    // req.row_callback = [rows = streamed_res->rows](std::string&& row) {
-    //     PyGILState_STATE state = PyGILState_Ensure();
-    //     PyObject* pyObj_row = PyBytes_FromStringAndSize(row.c_str(), row.length());
-    //     rows->put(pyObj_row);
-    //     PyGILState_Release(state);
-    //     return couchbase::core::utils::json::stream_control::next_row;
-    // };
+    // When row streaming is enabled, rows are handed to the queue as the query service returns them
+    // instead of being accumulated in query_response::rows.  Once the consumer falls high-water mark rows
+    // behind, the row callback waits for it to catch up, which stops the HTTP body from being read until
+    // room is made.  The buffer is always bounded, a default high-water mark is used if one is not provided.
+    PyObject* pyObj_stream_rows = PyDict_GetItemString(pyObj_query_args, "stream_rows");
+    if (pyObj_stream_rows != nullptr && pyObj_stream_rows == Py_True) {
+        std::size_t high_water_mark = DEFAULT_STREAM_HIGH_WATER_MARK;
+        PyObject* pyObj_high_water_mark = PyDict_GetItemString(pyObj_query_args, "stream_high_water_mark");
+        if (pyObj_high_water_mark != nullptr) {
+            high_water_mark = PyLong_AsSize_t(pyObj_high_water_mark);
+            if (PyErr_Occurred()) {
+                Py_XDECREF(pyObj_errback);
+                Py_XDECREF(pyObj_callback);
+                Py_XDECREF(streamed_res);
+                PyErr_SetString(PyExc_ValueError, "stream_high_water_mark must be a non-negative int.");
+                return nullptr;
+            }
+        }
+        streamed_res->rows->set_high_water_mark(high_water_mark);
+
+        req.row_callback = [rows = streamed_res->rows](std::string&& row) {
+            // wait w/o the GIL so the Python consumer can continue to drain the queue, only a dropped
+            // iterator stops the stream
+            if (!rows->wait_for_space()) {
+                return couchbase::core::utils::json::stream_control::stop;
+            }
+            PyGILState_STATE state = PyGILState_Ensure();
+            PyObject* pyObj_row = PyBytes_FromStringAndSize(row.c_str(), row.length());
+            rows->put(pyObj_row);
+            PyGILState_Release(state);
+            return couchbase::core::utils::json::stream_control::next_row;
+        };
+    }
 
     {
         Py_BEGIN_ALLOW_THREADS conn->cluster_.execute(
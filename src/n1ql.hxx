@@ -20,6 +20,9 @@
 #include "client.hxx"
 #include "result.hxx"
 
+// the number of unconsumed rows a streamed query buffers before its row callback waits on the consumer
+#define DEFAULT_STREAM_HIGH_WATER_MARK 1000
+
 streamed_result*
 handle_n1ql_query(PyObject* self, PyObject* args, PyObject* kwargs);
 
@@ -245,10 +245,27 @@ static void
 streamed_result_dealloc([[maybe_unused]] streamed_result* self)
 {
     // CB_LOG_DEBUG("pycbc - dealloc streamed_result: result->refcnt: {}", Py_REFCNT(self));
+    // unblock a producer that might be waiting on the consumer to make room in the queue
+    if (self->rows) {
+        self->rows->cancel();
+    }
+    self->rows.reset();
     Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
-static PyMethodDef streamed_result_TABLE_methods[] = { { NULL } };
+static PyObject*
+streamed_result__buffered_rows__(streamed_result* self)
+{
+    return PyLong_FromLong(self->rows ? self->rows->size() : 0);
+}
+
+static PyMethodDef streamed_result_TABLE_methods[] = {
+    { "buffered_rows",
+      (PyCFunction)streamed_result__buffered_rows__,
+      METH_NOARGS,
+      PyDoc_STR("Get the number of rows that can be read without blocking.") },
+    { NULL }
+};
 
 PyObject*
 streamed_result_iter(PyObject* self)
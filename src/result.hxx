@@ -30,6 +30,7 @@ class rows_queue
       : rows_()
       , mut_()
       , cv_()
+      , space_cv_()
     {
     }
 
@@ -44,6 +45,37 @@ class rows_queue
         cv_.notify_one();
     }
 
+    void set_high_water_mark(std::size_t high_water_mark)
+    {
+        std::lock_guard<std::mutex> lock(mut_);
+        high_water_mark_ = high_water_mark;
+    }
+
+    // Blocks the producer while the queue holds high_water_mark_ (or more) rows, pacing the stream to the
+    // consumer.  There is no timeout, a slow consumer is waited on rather than failed.  Returns false only if
+    // streaming has been cancelled (i.e. the consumer is gone).
+    bool wait_for_space()
+    {
+        std::unique_lock<std::mutex> lock(mut_);
+        space_cv_.wait(lock, [this] {
+            return cancel_streaming_ || high_water_mark_ == 0 || rows_.size() < high_water_mark_;
+        });
+        return !cancel_streaming_;
+    }
+
+    void cancel()
+    {
+        std::lock_guard<std::mutex> lock(mut_);
+        cancel_streaming_ = true;
+        space_cv_.notify_all();
+    }
+
+    bool is_cancelled()
+    {
+        std::lock_guard<std::mutex> lock(mut_);
+        return cancel_streaming_;
+    }
+
     T get(std::chrono::milliseconds timeout_ms)
     {
         std::unique_lock<std::mutex> lock(mut_);
@@ -58,6 +90,9 @@ class rows_queue
 
         auto row = rows_.front();
         rows_.pop();
+        if (high_water_mark_ > 0 && rows_.size() < high_water_mark_) {
+            space_cv_.notify_one();
+        }
         return row;
     }
 
@@ -71,7 +106,9 @@ class rows_queue
     std::queue<T> rows_;
     std::mutex mut_;
     bool cancel_streaming_{ false };
+    std::size_t high_water_mark_{ 0 };
     std::condition_variable cv_;
+    std::condition_variable space_cv_;
 };
 
 struct result {
@@ -502,7 +502,8 @@ create_result_from_subdoc_op_response(const char* key,
                                       const T& resp,
                                       PyObject* pyObj_callback,
                                       PyObject* pyObj_errback,
-                                      std::shared_ptr<std::promise<PyObject*>> barrier)
+                                      std::shared_ptr<std::promise<PyObject*>> barrier,
+                                      result* multi_result = nullptr)
 {
     PyGILState_STATE state = PyGILState_Ensure();
     PyObject* pyObj_args = NULL;
@@ -515,7 +516,19 @@ create_result_from_subdoc_op_response(const char* key,
     if (resp.ctx.ec().value()) {
         pyObj_exc = build_exception_from_context(resp.ctx, __FILE__, __LINE__, "Subdoc operation error.");
         if (pyObj_errback == nullptr) {
-            barrier->set_value(pyObj_exc);
+            if (multi_result != nullptr) {
+                Py_INCREF(Py_False);
+                barrier->set_value(Py_False);
+                if (-1 == PyDict_SetItemString(multi_result->dict, key, pyObj_exc)) {
+                    // TODO:  not much we can do here...maybe?
+                    PyErr_Print();
+                    PyErr_Clear();
+                }
+                // won't fall into logic path where pyObj_exc is decremented later
+                Py_DECREF(pyObj_exc);
+            } else {
+                barrier->set_value(pyObj_exc);
+            }
         } else {
             pyObj_func = pyObj_errback;
             pyObj_args = PyTuple_New(1);
@@ -533,7 +546,18 @@ create_result_from_subdoc_op_response(const char* key,
             set_exception = true;
         } else {
             if (pyObj_callback == nullptr) {
-                barrier->set_value(reinterpret_cast<PyObject*>(res));
+                if (multi_result != nullptr) {
+                    Py_INCREF(Py_True);
+                    barrier->set_value(Py_True);
+                    if (-1 == PyDict_SetItemString(multi_result->dict, key, reinterpret_cast<PyObject*>(res))) {
+                        // TODO:  not much we can do here...maybe?
+                        PyErr_Print();
+                        PyErr_Clear();
+                    }
+                    Py_DECREF(reinterpret_cast<PyObject*>(res));
+                } else {
+                    barrier->set_value(reinterpret_cast<PyObject*>(res));
+                }
             } else {
                 pyObj_func = pyObj_callback;
                 pyObj_args = PyTuple_New(1);
@@ -545,7 +569,19 @@ create_result_from_subdoc_op_response(const char* key,
     if (set_exception) {
         pyObj_exc = pycbc_build_exception(PycbcError::UnableToBuildResult, __FILE__, __LINE__, "Subdoc operation error.");
         if (pyObj_errback == nullptr) {
-            barrier->set_value(pyObj_exc);
+            if (multi_result != nullptr) {
+                Py_INCREF(Py_False);
+                barrier->set_value(Py_False);
+                if (-1 == PyDict_SetItemString(multi_result->dict, key, pyObj_exc)) {
+                    // TODO:  not much we can do here...maybe?
+                    PyErr_Print();
+                    PyErr_Clear();
+                }
+                // won't fall into logic path where pyObj_exc is decremented later
+                Py_DECREF(pyObj_exc);
+            } else {
+                barrier->set_value(pyObj_exc);
+            }
         } else {
             pyObj_func = pyObj_errback;
             pyObj_args = PyTuple_New(1);
@@ -575,7 +611,8 @@ create_result_from_subdoc_op_response(const char* key,
                                       const couchbase::core::operations::lookup_in_all_replicas_response& resp,
                                       PyObject* pyObj_callback,
                                       PyObject* pyObj_errback,
-                                      std::shared_ptr<std::promise<PyObject*>> barrier)
+                                      std::shared_ptr<std::promise<PyObject*>> barrier,
+                                      [[maybe_unused]] result* multi_result)
 {
     PyGILState_STATE state = PyGILState_Ensure();
     PyObject* pyObj_args = NULL;
@@ -656,12 +693,14 @@ do_subdoc_op(connection& conn,
              Request& req,
              PyObject* pyObj_callback,
              PyObject* pyObj_errback,
-             std::shared_ptr<std::promise<PyObject*>> barrier)
+             std::shared_ptr<std::promise<PyObject*>> barrier,
+             result* multi_result = nullptr)
 {
     using response_type = typename Request::response_type;
-    Py_BEGIN_ALLOW_THREADS conn.cluster_.execute(req, [key = req.id.key(), pyObj_callback, pyObj_errback, barrier](response_type resp) {
-        create_result_from_subdoc_op_response(key.c_str(), resp, pyObj_callback, pyObj_errback, barrier);
-    });
+    Py_BEGIN_ALLOW_THREADS conn.cluster_.execute(
+      req, [key = req.id.key(), pyObj_callback, pyObj_errback, barrier, multi_result](response_type resp) {
+          create_result_from_subdoc_op_response(key.c_str(), resp, pyObj_callback, pyObj_errback, barrier, multi_result);
+      });
     Py_END_ALLOW_THREADS
 }
 
@@ -670,7 +709,8 @@ prepare_and_execute_lookup_in_op(struct lookup_in_options* options,
                                  size_t nspecs,
                                  PyObject* pyObj_callback,
                                  PyObject* pyObj_errback,
-                                 std::shared_ptr<std::promise<PyObject*>> barrier)
+                                 std::shared_ptr<std::promise<PyObject*>> barrier,
+                                 result* multi_result = nullptr)
 {
     size_t ii;
     auto specs = std::vector<couchbase::core::impl::subdoc::command>{};
@@ -726,7 +766,7 @@ prepare_and_execute_lookup_in_op(struct lookup_in_options* options,
     if (nullptr != options->span) {
         req.parent_span = std::make_shared<pycbc::request_span>(options->span);
     }
-    do_subdoc_op(*(options->conn), req, pyObj_callback, pyObj_errback, barrier);
+    do_subdoc_op(*(options->conn), req, pyObj_callback, pyObj_errback, barrier, multi_result);
     Py_RETURN_NONE;
 }
 
@@ -863,7 +903,8 @@ prepare_and_execute_mutate_in_op(struct mutate_in_options* options,
                                  size_t nspecs,
                                  PyObject* pyObj_callback,
                                  PyObject* pyObj_errback,
-                                 std::shared_ptr<std::promise<PyObject*>> barrier)
+                                 std::shared_ptr<std::promise<PyObject*>> barrier,
+                                 result* multi_result = nullptr)
 {
     size_t ii;
     auto specs = std::vector<couchbase::core::impl::subdoc::command>{};
@@ -953,11 +994,11 @@ prepare_and_execute_mutate_in_op(struct mutate_in_options* options,
     if (options->use_legacy_durability) {
         auto req_legacy_durability =
           couchbase::core::operations::mutate_in_request_with_legacy_durability{ req, options->persist_to, options->replicate_to };
-        do_subdoc_op(*(options->conn), req_legacy_durability, pyObj_callback, pyObj_errback, barrier);
+        do_subdoc_op(*(options->conn), req_legacy_durability, pyObj_callback, pyObj_errback, barrier, multi_result);
         Py_RETURN_NONE;
     }
     req.durability_level = options->durability_level;
-    do_subdoc_op(*(options->conn), req, pyObj_callback, pyObj_errback, barrier);
+    do_subdoc_op(*(options->conn), req, pyObj_callback, pyObj_errback, barrier, multi_result);
     Py_RETURN_NONE;
 }
 
@@ -1223,3 +1264,162 @@ handle_subdoc_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwar
     }
     Py_RETURN_NONE;
 }
+
+PyObject*
+handle_subdoc_multi_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    PyObject* pyObj_conn = nullptr;
+    char* bucket = nullptr;
+    char* scope = nullptr;
+    char* collection = nullptr;
+    Operations::OperationType op_type = Operations::UNKNOWN;
+    PyObject* pyObj_op_args = nullptr;
+
+    static const char* kw_list[] = { "conn", "bucket", "scope", "collection_name", "op_type", "op_args", nullptr };
+
+    const char* kw_format = "O!sssIO";
+    int ret = PyArg_ParseTupleAndKeywords(args,
+                                          kwargs,
+                                          kw_format,
+                                          const_cast<char**>(kw_list),
+                                          &PyCapsule_Type,
+                                          &pyObj_conn,
+                                          &bucket,
+                                          &scope,
+                                          &collection,
+                                          &op_type,
+                                          &pyObj_op_args);
+    if (!ret) {
+        pycbc_set_python_exception(
+          PycbcError::InvalidArgument, __FILE__, __LINE__, "Cannot perform subdoc operation.  Unable to parse args/kwargs.");
+        return nullptr;
+    }
+
+    connection* conn = nullptr;
+
+    conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+    if (nullptr == conn) {
+        pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, NULL_CONN_OBJECT);
+        return nullptr;
+    }
+
+    std::vector<std::future<PyObject*>> op_results{};
+
+    PyObject* pyObj_multi_result = create_result_obj();
+    result* multi_result = reinterpret_cast<result*>(pyObj_multi_result);
+
+    if (pyObj_op_args && PyDict_Check(pyObj_op_args)) {
+        PyObject *pyObj_doc_key, *pyObj_op_dict;
+        Py_ssize_t pos = 0;
+
+        // PyObj_key and pyObj_value are borrowed references
+        while (PyDict_Next(pyObj_op_args, &pos, &pyObj_doc_key, &pyObj_op_dict)) {
+            std::string k;
+            PyObject* pyObj_op_response = nullptr;
+            if (PyUnicode_Check(pyObj_doc_key)) {
+                k = std::string(PyUnicode_AsUTF8(pyObj_doc_key));
+            }
+            auto barrier = std::make_shared<std::promise<PyObject*>>();
+            auto f = barrier->get_future();
+            if (PyDict_Check(pyObj_op_dict) && !k.empty()) {
+                PyObject* pyObj_spec = PyDict_GetItemString(pyObj_op_dict, "spec");
+                size_t nspecs = 0;
+                if (pyObj_spec != nullptr && PyTuple_Check(pyObj_spec)) {
+                    nspecs = static_cast<size_t>(PyTuple_GET_SIZE(pyObj_spec));
+                } else if (pyObj_spec != nullptr && PyList_Check(pyObj_spec)) {
+                    nspecs = static_cast<size_t>(PyList_GET_SIZE(pyObj_spec));
+                }
+
+                if (nspecs == 0) {
+                    PyObject* pyObj_exc = pycbc_build_exception(
+                      PycbcError::InvalidArgument, __FILE__, __LINE__, "Cannot perform subdoc operation.  Need at least one command.");
+                    if (-1 == PyDict_SetItemString(multi_result->dict, k.c_str(), pyObj_exc)) {
+                        // TODO:  not much we can do here...maybe?
+                        PyErr_Print();
+                        PyErr_Clear();
+                    }
+                    Py_DECREF(pyObj_exc);
+                    Py_INCREF(Py_False);
+                    barrier->set_value(Py_False);
+                    op_results.emplace_back(std::move(f));
+                    continue;
+                }
+
+                switch (op_type) {
+                    case Operations::LOOKUP_IN: {
+                        auto opts = get_lookup_in_options(pyObj_op_dict);
+                        opts.conn = conn;
+                        opts.id = couchbase::core::document_id{ bucket, scope, collection, k };
+                        opts.op_type = op_type;
+                        opts.specs = pyObj_spec;
+                        pyObj_op_response = prepare_and_execute_lookup_in_op(&opts, nspecs, nullptr, nullptr, barrier, multi_result);
+                        break;
+                    }
+                    case Operations::MUTATE_IN: {
+                        auto opts = get_mutate_in_options(pyObj_op_dict);
+                        opts.conn = conn;
+                        opts.id = couchbase::core::document_id{ bucket, scope, collection, k };
+                        opts.op_type = op_type;
+                        opts.specs = pyObj_spec;
+                        pyObj_op_response = prepare_and_execute_mutate_in_op(&opts, nspecs, nullptr, nullptr, barrier, multi_result);
+                        break;
+                    }
+                    default: {
+                        PyObject* pyObj_exc = pycbc_build_exception(
+                          PycbcError::InvalidArgument, __FILE__, __LINE__, "Unrecognized subdoc operation passed in.");
+                        if (-1 == PyDict_SetItemString(multi_result->dict, k.c_str(), pyObj_exc)) {
+                            // TODO:  not much we can do here...maybe?
+                            PyErr_Print();
+                            PyErr_Clear();
+                        }
+                        Py_DECREF(pyObj_exc);
+                        Py_INCREF(Py_False);
+                        barrier->set_value(Py_False);
+                        pyObj_op_response = Py_None;
+                        Py_INCREF(Py_None);
+                        break;
+                    }
+                };
+
+                if (pyObj_op_response == nullptr) {
+                    // the spec could not be parsed, the barrier has already been set
+                    PyErr_Clear();
+                    PyObject* pyObj_exc =
+                      pycbc_build_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, "Unable to parse spec.");
+                    if (-1 == PyDict_SetItemString(multi_result->dict, k.c_str(), pyObj_exc)) {
+                        // TODO:  not much we can do here...maybe?
+                        PyErr_Print();
+                        PyErr_Clear();
+                    }
+                    Py_DECREF(pyObj_exc);
+                }
+            } else {
+                PyObject* pyObj_exc =
+                  pycbc_build_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, "Unable to parse subdoc operation args.");
+                barrier->set_value(pyObj_exc);
+            }
+
+            Py_XDECREF(pyObj_op_response);
+            op_results.emplace_back(std::move(f));
+        }
+    }
+
+    auto all_okay = true;
+    for (auto i = 0; i < op_results.size(); i++) {
+        PyObject* res = nullptr;
+        Py_BEGIN_ALLOW_THREADS res = op_results[i].get();
+        Py_END_ALLOW_THREADS if (res != Py_True)
+        {
+            all_okay = false;
+        }
+        Py_XDECREF(res);
+    }
+
+    if (all_okay) {
+        PyDict_SetItemString(multi_result->dict, "all_okay", Py_True);
+    } else {
+        PyDict_SetItemString(multi_result->dict, "all_okay", Py_False);
+    }
+
+    return reinterpret_cast<PyObject*>(multi_result);
+}
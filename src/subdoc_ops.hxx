@@ -98,3 +98,6 @@ struct mutate_in_options {
 
 PyObject*
 handle_subdoc_op(PyObject* self, PyObject* args, PyObject* kwargs);
+
+PyObject*
+handle_subdoc_multi_op(PyObject* self, PyObject* args, PyObject* kwargs);
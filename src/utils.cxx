@@ -20,13 +20,27 @@
 couchbase::core::utils::binary
 PyObject_to_binary(PyObject* pyObj_value)
 {
-    char* buf;
-    Py_ssize_t nbuf;
-    if (PyBytes_AsStringAndSize(pyObj_value, &buf, &nbuf) == -1) {
+    if (PyBytes_Check(pyObj_value)) {
+        char* buf;
+        Py_ssize_t nbuf;
+        if (PyBytes_AsStringAndSize(pyObj_value, &buf, &nbuf) == -1) {
+            throw std::invalid_argument("Unable to determine bytes object from provided value.");
+        }
+        auto size = py_ssize_t_to_size_t(nbuf);
+        return couchbase::core::utils::to_binary(reinterpret_cast<const char*>(buf), size);
+    }
+
+    // bytearray, memoryview, etc.: copy straight out of the object's buffer so that
+    // transcoders do not need to build an intermediate bytes object
+    Py_buffer view;
+    if (PyObject_GetBuffer(pyObj_value, &view, PyBUF_C_CONTIGUOUS) == -1) {
+        PyErr_Clear();
         throw std::invalid_argument("Unable to determine bytes object from provided value.");
     }
-    auto size = py_ssize_t_to_size_t(nbuf);
-    return couchbase::core::utils::to_binary(reinterpret_cast<const char*>(buf), size);
+    auto size = py_ssize_t_to_size_t(view.len);
+    auto value = couchbase::core::utils::to_binary(reinterpret_cast<const char*>(view.buf), size);
+    PyBuffer_Release(&view);
+    return value;
 }
 
 PyObject*
@@ -173,9 +173,10 @@ class TracingAndMetricsTestEnvironment(TestEnvironment):
             'data_provider': env.data_provider,
         }
 
-        meter = None
-        if 'create_meter' in kwargs:
+        meter = kwargs.get('meter', None)
+        if meter is None and 'create_meter' in kwargs:
             meter = BasicMeter()
+        if meter is not None:
             base_env_args['meter'] = meter
 
         tracer = None
@@ -20,6 +20,8 @@ from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
                     Iterable,
+                    List,
+                    Optional,
                     Union)
 
 from twisted.internet.defer import Deferred
@@ -32,6 +34,12 @@ from couchbase.result import (CounterResult,
                               GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiCounterResult,
+                              MultiExistsResult,
+                              MultiGetResult,
+                              MultiLookupInResult,
+                              MultiMutateInResult,
+                              MultiMutationResult,
                               MutateInResult,
                               MutationResult)
 from txcouchbase.binary_collection import BinaryCollection
@@ -41,25 +49,39 @@ if TYPE_CHECKING:
     from datetime import timedelta
 
     from couchbase._utils import JSONType
-    from couchbase.options import (AppendOptions,
+    from couchbase.options import (AppendMultiOptions,
+                                   AppendOptions,
+                                   DecrementMultiOptions,
                                    DecrementOptions,
+                                   ExistsMultiOptions,
                                    ExistsOptions,
                                    GetAllReplicasOptions,
+                                   GetAndLockMultiOptions,
                                    GetAndLockOptions,
                                    GetAndTouchOptions,
                                    GetAnyReplicaOptions,
+                                   GetMultiOptions,
                                    GetOptions,
+                                   IncrementMultiOptions,
                                    IncrementOptions,
+                                   InsertMultiOptions,
                                    InsertOptions,
                                    LookupInAllReplicasOptions,
                                    LookupInAnyReplicaOptions,
+                                   LookupInMultiOptions,
                                    LookupInOptions,
+                                   MutateInMultiOptions,
                                    MutateInOptions,
+                                   PrependMultiOptions,
                                    PrependOptions,
+                                   RemoveMultiOptions,
                                    RemoveOptions,
+                                   ReplaceMultiOptions,
                                    ReplaceOptions,
+                                   TouchMultiOptions,
                                    TouchOptions,
                                    UnlockOptions,
+                                   UpsertMultiOptions,
                                    UpsertOptions)
     from couchbase.subdocument import Spec
 
@@ -330,6 +352,90 @@ class Collection(CollectionLogic):
     ) -> MutateInResult:
         super().mutate_in(key, spec, *opts, **kwargs)
 
+    @TxWrapper.run_in_executor()
+    def get_multi(self,
+                  keys,  # type: List[str]
+                  *opts,  # type: GetMultiOptions
+                  **kwargs,  # type: Dict[str, Any]
+                  ) -> Deferred[MultiGetResult]:
+        return super().get_multi(keys, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def get_and_lock_multi(self,
+                           keys,  # type: List[str]
+                           lock_time,  # type: timedelta
+                           *opts,  # type: GetAndLockMultiOptions
+                           **kwargs,  # type: Dict[str, Any]
+                           ) -> Deferred[MultiGetResult]:
+        return super().get_and_lock_multi(keys, lock_time, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def exists_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: ExistsMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiExistsResult]:
+        return super().exists_multi(keys, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def insert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: InsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiMutationResult]:
+        return super().insert_multi(keys_and_docs, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def upsert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: UpsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiMutationResult]:
+        return super().upsert_multi(keys_and_docs, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def replace_multi(self,
+                      keys_and_docs,  # type: Dict[str, JSONType]
+                      *opts,  # type: ReplaceMultiOptions
+                      **kwargs,  # type: Dict[str, Any]
+                      ) -> Deferred[MultiMutationResult]:
+        return super().replace_multi(keys_and_docs, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def remove_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: RemoveMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiMutationResult]:
+        return super().remove_multi(keys, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def touch_multi(self,
+                    keys,  # type: List[str]
+                    expiry,  # type: timedelta
+                    *opts,  # type: TouchMultiOptions
+                    **kwargs,  # type: Dict[str, Any]
+                    ) -> Deferred[MultiMutationResult]:
+        return super().touch_multi(keys, expiry, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def lookup_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: LookupInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> Deferred[MultiLookupInResult]:
+        return super().lookup_in_multi(keys_and_specs, spec, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def mutate_in_multi(self,
+                        keys_and_specs,  # type: Union[Dict[str, Iterable[Spec]], List[str]]
+                        spec=None,  # type: Optional[Iterable[Spec]]
+                        *opts,  # type: MutateInMultiOptions
+                        **kwargs,  # type: Dict[str, Any]
+                        ) -> Deferred[MultiMutateInResult]:
+        return super().mutate_in_multi(keys_and_specs, spec, *opts, **kwargs)
+
     def binary(self) -> BinaryCollection:
         return BinaryCollection(self)
 
@@ -371,6 +477,42 @@ class Collection(CollectionLogic):
     ) -> Deferred[CounterResult]:
         super().decrement(key, *opts, **kwargs)
 
+    @TxWrapper.run_in_executor()
+    def _append_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: AppendMultiOptions
+        **kwargs,  # type: Dict[str, Any]
+    ) -> Deferred[MultiMutationResult]:
+        return super().append_multi(keys_and_values, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def _prepend_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: PrependMultiOptions
+        **kwargs,  # type: Dict[str, Any]
+    ) -> Deferred[MultiMutationResult]:
+        return super().prepend_multi(keys_and_values, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def _increment_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: IncrementMultiOptions
+        **kwargs,  # type: Dict[str, Any]
+    ) -> Deferred[MultiCounterResult]:
+        return super().increment_multi(keys, *opts, **kwargs)
+
+    @TxWrapper.run_in_executor()
+    def _decrement_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: DecrementMultiOptions
+        **kwargs,  # type: Dict[str, Any]
+    ) -> Deferred[MultiCounterResult]:
+        return super().decrement_multi(keys, *opts, **kwargs)
+
     @staticmethod
     def default_name():
         return "_default"
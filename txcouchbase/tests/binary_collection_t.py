@@ -20,7 +20,9 @@ from couchbase.options import (DecrementOptions,
                                DeltaValue,
                                IncrementOptions,
                                SignedInt64)
-from couchbase.result import CounterResult, MutationResult
+from couchbase.result import (CounterResult,
+                              MultiCounterResult,
+                              MutationResult)
 from couchbase.transcoder import RawBinaryTranscoder, RawStringTranscoder
 
 from ._test_utils import (CollectionType,
@@ -234,6 +236,16 @@ class BinaryCollectionTests:
         assert result.cas is not None
         assert result.content == value + 1
 
+    def test_counter_increment_multi(self, cb_env, counter_kvp):
+        cb = cb_env.collection
+        key = counter_kvp.key
+        value = counter_kvp.value
+
+        res = run_in_reactor_thread(cb.binary().increment_multi, [key])
+        assert isinstance(res, MultiCounterResult)
+        assert res.all_ok is True
+        assert res.results[key].content == value + 1
+
     def test_counter_decrement(self, cb_env, counter_kvp):
         cb = cb_env.collection
         key = counter_kvp.key
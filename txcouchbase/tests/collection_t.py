@@ -41,6 +41,9 @@ from couchbase.options import (GetOptions,
 from couchbase.result import (ExistsResult,
                               GetReplicaResult,
                               GetResult,
+                              MultiExistsResult,
+                              MultiGetResult,
+                              MultiMutationResult,
                               MutationResult)
 from tests.mock_server import MockServerType
 
@@ -174,6 +177,30 @@ class CollectionTests:
         with pytest.raises(DocumentNotFoundException):
             run_in_reactor_thread(cb.get, self.NO_KEY)
 
+    def test_multi_get(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        res = run_in_reactor_thread(cb.get_multi, [default_kvp.key, self.NO_KEY])
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is False
+        assert isinstance(res.results[default_kvp.key], GetResult)
+        assert res.results[default_kvp.key].content_as[dict] == default_kvp.value
+        assert isinstance(res.exceptions[self.NO_KEY], DocumentNotFoundException)
+
+    def test_multi_upsert_and_remove(self, cb_env, new_kvp):
+        cb = cb_env.collection
+        keys_and_docs = {new_kvp.key: new_kvp.value}
+        res = run_in_reactor_thread(cb.upsert_multi, keys_and_docs)
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+
+        res = run_in_reactor_thread(cb.exists_multi, list(keys_and_docs.keys()))
+        assert isinstance(res, MultiExistsResult)
+        assert res.results[new_kvp.key].exists is True
+
+        res = run_in_reactor_thread(cb.remove_multi, list(keys_and_docs.keys()))
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+
     @pytest.mark.usefixtures("check_xattr_supported")
     def test_get_with_expiry(self, cb_env, new_kvp):
         cb = cb_env.collection
@@ -36,6 +36,8 @@ from couchbase.options import (GetOptions,
 from couchbase.result import (GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiLookupInResult,
+                              MultiMutateInResult,
                               MutateInResult)
 
 from ._test_utils import (CollectionType,
@@ -408,6 +410,29 @@ class SubDocumentTests:
         result = run_in_reactor_thread(cb.get, key)
         assert value == result.content_as[dict]
 
+    @pytest.mark.usefixtures('skip_mock_mutate_in')
+    def test_mutate_in_multi(self, cb_env):
+        cb = cb_env.collection
+        key, value = cb_env.get_new_key_value()
+        keys_and_docs = {f'{key}-{i}': value for i in range(3)}
+        run_in_reactor_thread(cb.upsert_multi, keys_and_docs)
+
+        result = run_in_reactor_thread(cb.mutate_in_multi,
+                                       list(keys_and_docs.keys()),
+                                       (SD.upsert("city", "New City"),))
+        assert isinstance(result, MultiMutateInResult)
+        assert result.all_ok is True
+
+        result = run_in_reactor_thread(cb.lookup_in_multi,
+                                       list(keys_and_docs.keys()) + [self.NO_KEY],
+                                       (SD.get("city"),))
+        assert isinstance(result, MultiLookupInResult)
+        assert result.all_ok is False
+        assert isinstance(result.exceptions[self.NO_KEY], DocumentNotFoundException)
+        for v in result.results.values():
+            assert v.content_as[str](0) == "New City"
+        run_in_reactor_thread(cb.remove_multi, list(keys_and_docs.keys()))
+
     @pytest.mark.usefixtures('skip_mock_mutate_in')
     def test_mutate_in_simple_spec_as_list(self, cb_env, new_kvp):
         cb = cb_env.collection